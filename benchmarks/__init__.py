@@ -0,0 +1,10 @@
+"""
+Benchmarks do sistema de monitoramento de perdas
+
+Executar a partir da raiz do projeto:
+    python -m benchmarks --propriedades 200 --colheitas 500
+
+Os dados são sintéticos (gerador_dados) e reproduzíveis pela semente; os
+resultados são gravados em JSON em benchmarks/resultados para comparar
+execuções ao longo do tempo.
+"""
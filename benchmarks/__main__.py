@@ -0,0 +1,180 @@
+"""
+Executa os benchmarks e grava os resultados em JSON
+
+Uso:
+    python -m benchmarks [--propriedades N] [--colheitas M] [--semente S]
+                         [--repeticoes R] [--cenario NOME ...] [--saida ARQUIVO]
+                         [--comparar RESULTADO_ANTERIOR.json]
+                         [--latencia-ms MS] [--latencia-conexao-ms MS]
+"""
+
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime
+
+PASTA_RESULTADOS = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'resultados')
+
+def _versao_git():
+    """
+    Commit atual do repositório, para saber qual código gerou cada resultado
+
+    Returns:
+        str: Hash do commit ou None fora de um repositório git
+    """
+    try:
+        saida = subprocess.run(
+            ['git', 'rev-parse', '--short', 'HEAD'],
+            cwd=os.path.dirname(PASTA_RESULTADOS),
+            capture_output=True, text=True, check=True
+        )
+        return saida.stdout.strip() or None
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+def _descrever_ambiente():
+    """
+    Dados do ambiente que influenciam os tempos
+
+    Returns:
+        dict: Versões do Python/NumPy, sistema, processadores e commit
+    """
+    try:
+        import numpy
+        versao_numpy = numpy.__version__
+    except ImportError:
+        versao_numpy = None
+
+    return {
+        'python': platform.python_version(),
+        'implementacao': platform.python_implementation(),
+        'sistema': platform.platform(),
+        'processadores': os.cpu_count(),
+        'numpy': versao_numpy,
+        'commit': _versao_git()
+    }
+
+def _comparar(resultados, caminho_anterior):
+    """
+    Razão entre a mediana atual de cada cenário e a do resultado anterior
+
+    Args:
+        resultados (dict): Cenários medidos nesta execução
+        caminho_anterior (str): Arquivo JSON de uma execução anterior
+
+    Returns:
+        dict: Cenário -> razão (abaixo de 1 = mais rápido que antes)
+    """
+    with open(caminho_anterior, 'r', encoding='utf-8') as arquivo:
+        anteriores = json.load(arquivo).get('cenarios', {})
+
+    razoes = {}
+    for nome, medicao in resultados.items():
+        anterior = anteriores.get(nome)
+        if anterior and anterior.get('mediana_segundos'):
+            razoes[nome] = round(medicao['mediana_segundos'] / anterior['mediana_segundos'], 3)
+    return razoes
+
+def criar_parser():
+    from benchmarks.cenarios import CENARIOS
+
+    parser = argparse.ArgumentParser(
+        prog='python -m benchmarks',
+        description="Benchmarks do sistema de monitoramento de perdas com dados sintéticos"
+    )
+    parser.add_argument('--propriedades', type=int, default=200, help="propriedades geradas (padrão: 200)")
+    parser.add_argument('--colheitas', type=int, default=250, help="colheitas por propriedade (padrão: 250)")
+    parser.add_argument('--semente', type=int, default=42, help="semente do gerador de dados (padrão: 42)")
+    parser.add_argument('--repeticoes', type=int, default=5, help="execuções medidas por cenário (padrão: 5)")
+    parser.add_argument('--cenario', action='append', choices=list(CENARIOS),
+                        help="executa apenas este cenário (pode repetir)")
+    parser.add_argument('--saida', help="arquivo JSON de resultado (padrão: benchmarks/resultados/benchmark_<data>.json)")
+    parser.add_argument('--comparar', metavar='ARQUIVO', help="resultado anterior para calcular a razão das medianas")
+    parser.add_argument('--latencia-ms', type=float, default=0.5,
+                        help="round trip do Oracle simulado nos cenários oracle_* (padrão: 0.5)")
+    parser.add_argument('--latencia-conexao-ms', type=float, default=30.0,
+                        help="abertura de sessão do Oracle simulado (padrão: 30)")
+    return parser
+
+def main(argv=None):
+    """
+    Gera os dados, mede os cenários e grava o JSON de resultado
+
+    Args:
+        argv (list): Argumentos da linha de comando (padrão: sys.argv[1:])
+
+    Returns:
+        int: Código de saída
+    """
+    args = criar_parser().parse_args(argv)
+    if min(args.propriedades, args.colheitas, args.repeticoes) < 1:
+        print("Propriedades, colheitas e repetições devem ser maiores que zero.", file=sys.stderr)
+        return 2
+    if min(args.latencia_ms, args.latencia_conexao_ms) < 0:
+        print("As latências não podem ser negativas.", file=sys.stderr)
+        return 2
+
+    # Backups dos cenários vão para uma pasta temporária, não para scripts/data
+    with tempfile.TemporaryDirectory(prefix='smpc_benchmark_') as pasta_temporaria:
+        os.environ['SMPC_PASTA_BACKUP'] = pasta_temporaria
+        try:
+            from benchmarks.cenarios import LATENCIA_ORACLE, cenarios_disponiveis, medir_cenario
+            from benchmarks.gerador_dados import gerar_propriedades
+
+            LATENCIA_ORACLE.update(latencia_ms=args.latencia_ms, latencia_conexao_ms=args.latencia_conexao_ms)
+
+            inicio = time.perf_counter()
+            propriedades = gerar_propriedades(args.propriedades, args.colheitas, args.semente)
+            print(f"Dados gerados: {args.propriedades} propriedades x {args.colheitas} colheitas "
+                  f"em {time.perf_counter() - inicio:.2f} s", file=sys.stderr)
+
+            nomes = [nome for nome in cenarios_disponiveis() if not args.cenario or nome in args.cenario]
+            resultados = {}
+            for nome in nomes:
+                resultados[nome] = medir_cenario(nome, propriedades, args.repeticoes)
+                medicao = resultados[nome]
+                print(f"{nome:<30} mediana {medicao['mediana_segundos'] * 1000:>10.2f} ms  "
+                      f"mínimo {medicao['minimo_segundos'] * 1000:>10.2f} ms  "
+                      f"{medicao['colheitas_por_segundo']:>12,} colheitas/s"
+                      + (f"  {medicao['round_trips']:>7} round trips" if 'round_trips' in medicao else ''),
+                      file=sys.stderr)
+        finally:
+            os.environ.pop('SMPC_PASTA_BACKUP', None)
+
+    resultado = {
+        'data': datetime.now().isoformat(timespec='seconds'),
+        'parametros': {
+            'propriedades': args.propriedades,
+            'colheitas_por_propriedade': args.colheitas,
+            'semente': args.semente,
+            'repeticoes': args.repeticoes,
+            'latencia_oracle_ms': args.latencia_ms,
+            'latencia_conexao_oracle_ms': args.latencia_conexao_ms
+        },
+        'ambiente': _descrever_ambiente(),
+        'cenarios': resultados
+    }
+
+    if args.comparar:
+        resultado['comparacao'] = {'arquivo': os.path.basename(args.comparar),
+                                   'razao_mediana': _comparar(resultados, args.comparar)}
+        for nome, razao in resultado['comparacao']['razao_mediana'].items():
+            print(f"{nome:<30} {razao:.3f}x em relação a {resultado['comparacao']['arquivo']}", file=sys.stderr)
+
+    caminho_saida = args.saida
+    if caminho_saida is None:
+        os.makedirs(PASTA_RESULTADOS, exist_ok=True)
+        caminho_saida = os.path.join(PASTA_RESULTADOS, f"benchmark_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json")
+
+    with open(caminho_saida, 'w', encoding='utf-8') as arquivo:
+        json.dump(resultado, arquivo, indent=2, ensure_ascii=False)
+    print(f"Resultado gravado em {caminho_saida}", file=sys.stderr)
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
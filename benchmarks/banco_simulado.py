@@ -0,0 +1,271 @@
+"""
+Banco simulado em memória para os benchmarks de carga e sincronização
+Imita a parte da API do cx_Oracle usada por database_service (pool, cursor,
+executemany com RETURNING e batch errors, consulta do histórico) para medir
+o custo do lado do cliente - montagem dos binds, lotes e reconstrução dos
+objetos - sem um servidor Oracle. Não mede rede nem o trabalho do banco.
+"""
+
+from contextlib import contextmanager
+from datetime import datetime
+from types import SimpleNamespace
+
+from config.database_config import SQL_INSERT, SQL_SELECT
+
+class _ErroLote:
+    """Erro de uma linha em executemany(batcherrors=True)"""
+
+    def __init__(self, offset, message):
+        self.offset = offset
+        self.message = message
+
+class ErroBancoSimulado(Exception):
+    """Equivalente a cx_Oracle.DatabaseError (args = (erro,))"""
+
+    def __init__(self, mensagem):
+        super().__init__(SimpleNamespace(message=mensagem))
+
+class _VariavelSimulada:
+    """Variável de bind de saída (RETURNING ... INTO) com um valor por linha do lote"""
+
+    def __init__(self, tamanho):
+        self.valores = [None] * tamanho
+
+    def getvalue(self, posicao):
+        valor = self.valores[posicao]
+        return [valor] if valor is not None else []
+
+class BancoSimulado:
+    """
+    Tabelas em memória com o mesmo contrato das tabelas propriedades e colheitas
+
+    Args:
+        propriedades (dict): id -> (nome, area_total, localizacao, tipo_solo, data_cadastro)
+        colheitas (dict): id -> (propriedade_id, data_colheita, area, quantidade, tipo, data_registro)
+    """
+
+    def __init__(self):
+        self.propriedades = {}
+        self.colheitas = {}
+        self.nomes = {}
+        self.proximo_id = {'propriedades': 1, 'colheitas': 1}
+
+    def _novo_id(self, tabela):
+        novo_id = self.proximo_id[tabela]
+        self.proximo_id[tabela] += 1
+        return novo_id
+
+    def inserir_propriedade(self, linha, pendentes):
+        nome = linha['nome'].upper()
+        if nome in self.nomes or nome in pendentes['nomes']:
+            raise ValueError("ORA-00001: unique constraint (PROPRIEDADES.NOME) violated")
+
+        novo_id = self._novo_id('propriedades')
+        pendentes['propriedades'][novo_id] = (
+            linha['nome'], linha['area_total'], linha['localizacao'], linha['tipo_solo'], datetime.now()
+        )
+        pendentes['nomes'][nome] = novo_id
+        return novo_id
+
+    def inserir_colheita(self, linha, pendentes):
+        propriedade_id = linha['propriedade_id']
+        if propriedade_id not in self.propriedades and propriedade_id not in pendentes['propriedades']:
+            raise ValueError("ORA-02291: integrity constraint (FK_COLHEITA_PROPRIEDADE) violated - parent key not found")
+
+        novo_id = self._novo_id('colheitas')
+        pendentes['colheitas'][novo_id] = (
+            propriedade_id,
+            datetime.strptime(linha['data_colheita'], '%d/%m/%Y'),
+            linha['area_colhida'],
+            linha['quantidade_colhida'],
+            linha['tipo_colheita'],
+            datetime.now()
+        )
+        return novo_id
+
+    def historico_completo(self, data_inicio, data_fim):
+        """
+        Linhas de SQL_SELECT['historico_completo'] (LEFT JOIN ordenado por nome, id e data desc)
+
+        Args:
+            data_inicio (date): Primeiro dia do período
+            data_fim (date): Dia seguinte ao último do período
+
+        Returns:
+            list: Tuplas no layout da consulta real
+        """
+        colheitas_por_propriedade = {}
+        for colheita_id, colheita in self.colheitas.items():
+            if not data_inicio <= colheita[1].date() < data_fim:
+                continue
+            colheitas_por_propriedade.setdefault(colheita[0], []).append((colheita_id, colheita))
+
+        linhas = []
+        for propriedade_id, propriedade in sorted(self.propriedades.items(), key=lambda item: (item[1][0], item[0])):
+            dados = (propriedade_id,) + propriedade
+            colheitas = colheitas_por_propriedade.get(propriedade_id)
+            if not colheitas:
+                linhas.append(dados + (None,) * 6)
+                continue
+
+            colheitas.sort(key=lambda item: item[1][1], reverse=True)
+            for colheita_id, colheita in colheitas:
+                linhas.append(dados + (colheita_id,) + colheita[1:])
+
+        return linhas
+
+class _CursorSimulado:
+    """Cursor com execute/executemany/fetch para os comandos usados por database_service"""
+
+    def __init__(self, conexao):
+        self.conexao = conexao
+        self.arraysize = 100
+        self.prefetchrows = 2
+        self._resultado = iter(())
+        self._variaveis = {}
+        self._erros_lote = []
+
+    def var(self, tipo, arraysize=1):
+        return _VariavelSimulada(arraysize)
+
+    def setinputsizes(self, **variaveis):
+        self._variaveis = variaveis
+
+    def executemany(self, sql, linhas, batcherrors=False):
+        banco = self.conexao.banco
+        if sql == SQL_INSERT['propriedade_lote']:
+            inserir = banco.inserir_propriedade
+        elif sql == SQL_INSERT['colheita_lote']:
+            inserir = banco.inserir_colheita
+        else:
+            raise ErroBancoSimulado("ORA-00900: comando não suportado pelo banco simulado")
+
+        retorno = self._variaveis.get('id_retorno')
+        self._erros_lote = []
+        for posicao, linha in enumerate(linhas):
+            try:
+                novo_id = inserir(linha, self.conexao.pendentes)
+            except ValueError as e:
+                if not batcherrors:
+                    raise ErroBancoSimulado(str(e))
+                self._erros_lote.append(_ErroLote(posicao, str(e)))
+                continue
+            if retorno is not None:
+                retorno.valores[posicao] = novo_id
+
+    def getbatcherrors(self):
+        return self._erros_lote
+
+    def execute(self, sql, parametros=None):
+        banco = self.conexao.banco
+        if sql == SQL_SELECT['historico_completo']:
+            self._resultado = iter(banco.historico_completo(parametros['data_inicio'], parametros['data_fim']))
+        elif sql == SQL_SELECT['propriedade_por_nome']:
+            propriedade_id = banco.nomes.get(parametros['nome'].upper())
+            linhas = [(propriedade_id,) + banco.propriedades[propriedade_id]] if propriedade_id else []
+            self._resultado = iter(linhas)
+        else:
+            raise ErroBancoSimulado("ORA-00900: comando não suportado pelo banco simulado")
+
+    def fetchone(self):
+        return next(self._resultado, None)
+
+    def fetchall(self):
+        return list(self._resultado)
+
+    def __iter__(self):
+        return self._resultado
+
+    def close(self):
+        self._resultado = iter(())
+
+class _ConexaoSimulada:
+    """Conexão com transação: as linhas inseridas só entram nas tabelas no commit"""
+
+    def __init__(self, banco):
+        self.banco = banco
+        self.pendentes = None
+        self.rollback()
+
+    def cursor(self):
+        return _CursorSimulado(self)
+
+    def commit(self):
+        self.banco.propriedades.update(self.pendentes['propriedades'])
+        self.banco.nomes.update(self.pendentes['nomes'])
+        self.banco.colheitas.update(self.pendentes['colheitas'])
+        self.rollback()
+
+    def rollback(self):
+        self.pendentes = {'propriedades': {}, 'nomes': {}, 'colheitas': {}}
+
+    def close(self):
+        self.rollback()
+
+class _PoolSimulado:
+    """Pool de sessões com os atributos lidos por obter_estatisticas_pool"""
+
+    def __init__(self, banco):
+        self.banco = banco
+        self.opened = 0
+        self.busy = 0
+        self.min = 1
+        self.max = 1
+        self.increment = 1
+        self.timeout = 0
+
+    def acquire(self):
+        self.opened = max(self.opened, self.busy + 1)
+        self.busy += 1
+        return _ConexaoSimulada(self.banco)
+
+    def release(self, conexao):
+        conexao.close()
+        self.busy -= 1
+
+    def close(self, force=False):
+        self.busy = 0
+        self.opened = 0
+
+# Substituto do módulo cx_Oracle com os nomes referenciados por database_service
+DRIVER_SIMULADO = SimpleNamespace(
+    NUMBER=float,
+    DatabaseError=ErroBancoSimulado
+)
+
+@contextmanager
+def banco_simulado(banco=None):
+    """
+    Liga database_service ao banco simulado enquanto o bloco estiver ativo
+
+    O Oracle passa a ser o backend de armazenamento_service; o backend, o
+    driver, o estado de carga e o pool do módulo são restaurados ao sair.
+
+    Args:
+        banco (BancoSimulado): Tabelas já populadas (padrão: banco vazio)
+
+    Uso:
+        with banco_simulado() as banco:
+            sincronizar_com_banco_em_lote(propriedades)
+
+    Yields:
+        BancoSimulado: Tabelas em memória usadas pelas conexões
+    """
+    from src.services import armazenamento_service, database_service
+
+    banco = banco if banco is not None else BancoSimulado()
+    anteriores = (database_service.cx_Oracle, dict(database_service._driver), database_service._connection_pool,
+                  armazenamento_service._armazenamento['backend'])
+
+    database_service.cx_Oracle = DRIVER_SIMULADO
+    database_service._driver.update(carregado=True, disponivel=True, erro=None)
+    database_service._connection_pool = _PoolSimulado(banco)
+    armazenamento_service._armazenamento['backend'] = 'oracle'
+    try:
+        yield banco
+    finally:
+        database_service.cx_Oracle = anteriores[0]
+        database_service._driver.clear()
+        database_service._driver.update(anteriores[1])
+        database_service._connection_pool = anteriores[2]
+        armazenamento_service._armazenamento['backend'] = anteriores[3]
@@ -0,0 +1,266 @@
+"""
+Cenários cronometrados dos benchmarks
+Cada cenário tem uma preparação (fora da medição) e uma execução (medida).
+A preparação roda antes de cada repetição para que cenários que alteram os
+dados - como a sincronização, que atribui IDs - partam sempre do mesmo estado.
+"""
+
+import gc
+import os
+import statistics
+import time
+from contextlib import redirect_stdout
+
+from src.services.calculation_service import gerar_relatorio_perdas
+from src.services.colheita_service import obter_estatisticas_colheitas
+from src.services.database_service import buscar_historico_completo, criar_tabelas
+from src.services.file_service import (
+    obter_pasta_backup,
+    salvar_backup_json,
+    carregar_backup_json,
+    validar_estrutura_json,
+    converter_propriedade_para_dict,
+    converter_dict_para_propriedade
+)
+from src.services.sistema_integrado import sincronizar_com_banco, sincronizar_com_banco_em_lote
+from src.utils.menu_utils import definir_modo_nao_interativo
+
+from benchmarks import oracle_simulado
+from benchmarks.banco_simulado import BancoSimulado, banco_simulado
+
+# Latências do driver Oracle simulado nos cenários oracle_* (alteradas pelas opções de __main__)
+LATENCIA_ORACLE = {
+    'latencia_ms': 0.5,
+    'latencia_conexao_ms': 30.0
+}
+
+# Cenários de uma chamada por linha usam só as primeiras propriedades até somar estas colheitas
+AMOSTRA_COLHEITAS = {
+    'oracle_conexao_por_chamada': 100,
+    'oracle_pool_por_chamada': 100
+}
+
+def _total_colheitas(propriedades):
+    return sum(len(propriedade.colheitas) for propriedade in propriedades)
+
+def _copiar_propriedades(propriedades):
+    """
+    Cópias sem IDs das propriedades (a sincronização só grava o que ainda não tem ID)
+
+    Args:
+        propriedades (list): Propriedades geradas
+
+    Returns:
+        list: Novos objetos Propriedade com as mesmas colheitas
+    """
+    return [converter_dict_para_propriedade(converter_propriedade_para_dict(propriedade))
+            for propriedade in propriedades]
+
+def _cenario_relatorio(vetorizado):
+    def executar(propriedades):
+        gerar_relatorio_perdas(propriedades, detalhado=False, vetorizado=vetorizado)
+    return executar
+
+# Conjuntos de dados já conferidos contra a implementação de referência (id da lista)
+_conferidos = set()
+
+def _conferir_vetorizado(propriedades):
+    """
+    Garante, uma vez por conjunto de dados, que o motor vetorizado dá os
+    mesmos resultados da implementação de referência antes de medi-lo
+
+    Returns:
+        list: As próprias propriedades
+    """
+    if id(propriedades) not in _conferidos:
+        from src.services.analise_vetorizada import conferir_com_referencia
+
+        divergencias = conferir_com_referencia(propriedades)
+        if divergencias:
+            raise RuntimeError(f"Motor vetorizado diverge da referência em {len(divergencias)} valor(es): "
+                               + "; ".join(divergencias[:5]))
+        _conferidos.add(id(propriedades))
+    return propriedades
+
+def _preparar_backup(formato):
+    def preparar(propriedades):
+        nome_arquivo = f"benchmark{'.json' if formato == 'json' else '.jsonl'}"
+        salvar_backup_json(propriedades, nome_arquivo, formato=formato, atualizar_manifesto=False)
+        return nome_arquivo
+    return preparar
+
+def _salvar_backup(formato):
+    def executar(propriedades):
+        nome_arquivo = f"benchmark{'.json' if formato == 'json' else '.jsonl'}"
+        if not salvar_backup_json(propriedades, nome_arquivo, formato=formato, atualizar_manifesto=False):
+            raise RuntimeError(f"Falha ao salvar backup {formato}")
+    return executar
+
+def _carregar_backup(nome_arquivo):
+    if carregar_backup_json(nome_arquivo) is None:
+        raise RuntimeError(f"Falha ao carregar {nome_arquivo}")
+
+def _preparar_validacao(propriedades):
+    return {
+        'versao': '1.0',
+        'propriedades': [converter_propriedade_para_dict(propriedade) for propriedade in propriedades]
+    }
+
+def _validar_estrutura(backup_data):
+    if not validar_estrutura_json(backup_data):
+        raise RuntimeError("Estrutura gerada considerada inválida")
+
+def _sincronizar_banco(copias):
+    with banco_simulado():
+        if not sincronizar_com_banco_em_lote(copias):
+            raise RuntimeError("Falha na sincronização com o banco simulado")
+
+def _preparar_carga_banco(propriedades):
+    banco = BancoSimulado()
+    with banco_simulado(banco):
+        sincronizar_com_banco_em_lote(_copiar_propriedades(propriedades))
+    return banco
+
+def _carregar_banco(banco):
+    with banco_simulado(banco):
+        if buscar_historico_completo() is None:
+            raise RuntimeError("Falha ao carregar o histórico do banco simulado")
+
+def _banco_oracle_simulado():
+    return os.path.join(obter_pasta_backup(), 'oracle_simulado.db')
+
+def _oracle(reutilizar_sessoes=True):
+    return oracle_simulado.oracle_simulado(arquivo=_banco_oracle_simulado(),
+                                           reutilizar_sessoes=reutilizar_sessoes, **LATENCIA_ORACLE)
+
+def _preparar_oracle(propriedades):
+    """
+    Banco simulado vazio, com as tabelas criadas, e cópias sem IDs das propriedades
+
+    Returns:
+        list: Cópias das propriedades
+    """
+    oracle_simulado.remover_banco(_banco_oracle_simulado())
+    with _oracle():
+        criar_tabelas()
+    return _copiar_propriedades(propriedades)
+
+def _sincronizar_oracle(em_lote, reutilizar_sessoes=True):
+    # Inclui a criação do pool (sessões mínimas), como no primeiro acesso de um processo
+    def executar(copias):
+        with _oracle(reutilizar_sessoes):
+            if not sincronizar_com_banco(copias, em_lote=em_lote):
+                raise RuntimeError("Falha na sincronização com o Oracle simulado")
+    return executar
+
+def _preparar_historico_oracle(propriedades):
+    copias = _preparar_oracle(propriedades)
+    with _oracle():
+        sincronizar_com_banco_em_lote(copias)
+
+def _carregar_historico_oracle(_):
+    with _oracle():
+        if buscar_historico_completo() is None:
+            raise RuntimeError("Falha ao carregar o histórico do Oracle simulado")
+
+def _amostra(propriedades, limite_colheitas):
+    """
+    Primeiras propriedades até somar limite_colheitas colheitas (ao menos uma propriedade)
+
+    Returns:
+        list: Propriedades da amostra
+    """
+    amostra = []
+    total = 0
+    for propriedade in propriedades:
+        if amostra and total + len(propriedade.colheitas) > limite_colheitas:
+            break
+        amostra.append(propriedade)
+        total += len(propriedade.colheitas)
+    return amostra
+
+# Cenários na ordem de execução: nome -> (preparar, executar)
+# preparar(propriedades) devolve o argumento de executar; None = as próprias propriedades
+CENARIOS = {
+    'relatorio_perdas': (None, _cenario_relatorio(False)),
+    'relatorio_perdas_vetorizado': (_conferir_vetorizado, _cenario_relatorio(True)),
+    'estatisticas_colheitas': (None, obter_estatisticas_colheitas),
+    'salvar_backup_jsonl': (None, _salvar_backup('jsonl')),
+    'carregar_backup_jsonl': (_preparar_backup('jsonl'), _carregar_backup),
+    'salvar_backup_json': (None, _salvar_backup('json')),
+    'carregar_backup_json': (_preparar_backup('json'), _carregar_backup),
+    'validar_estrutura_json': (_preparar_validacao, _validar_estrutura),
+    'sincronizar_banco_lote': (_copiar_propriedades, _sincronizar_banco),
+    'carregar_historico_banco': (_preparar_carga_banco, _carregar_banco),
+    # Padrões de acesso ao Oracle simulado (SQLite + latência por round trip e por sessão)
+    'oracle_conexao_por_chamada': (_preparar_oracle, _sincronizar_oracle(False, reutilizar_sessoes=False)),
+    'oracle_pool_por_chamada': (_preparar_oracle, _sincronizar_oracle(False)),
+    'oracle_pool_em_lote': (_preparar_oracle, _sincronizar_oracle(True)),
+    'oracle_carregar_historico': (_preparar_historico_oracle, _carregar_historico_oracle)
+}
+
+def cenarios_disponiveis():
+    """
+    Nomes dos cenários que podem rodar neste ambiente
+
+    Returns:
+        list: Nomes dos cenários (o vetorizado exige NumPy)
+    """
+    from src.services.analise_vetorizada import NUMPY_DISPONIVEL
+
+    return [nome for nome in CENARIOS if NUMPY_DISPONIVEL or nome != 'relatorio_perdas_vetorizado']
+
+def medir_cenario(nome, propriedades, repeticoes):
+    """
+    Executa um cenário várias vezes e mede cada execução
+
+    A saída dos serviços (relatórios, mensagens) é descartada para que o
+    tempo de escrita no terminal não entre na medição.
+
+    Args:
+        nome (str): Nome do cenário (chave de CENARIOS)
+        propriedades (list): Dados sintéticos
+        repeticoes (int): Quantidade de execuções medidas
+
+    Nos cenários oracle_* também são registrados os round trips e as
+    sessões abertas pelo driver simulado (da última execução).
+
+    Returns:
+        dict: Tempos (s), mínimo, mediana, itens processados e itens/s pela mediana
+    """
+    preparar, executar = CENARIOS[nome]
+    if nome in AMOSTRA_COLHEITAS:
+        propriedades = _amostra(propriedades, AMOSTRA_COLHEITAS[nome])
+    tempos = []
+    acessos = None
+
+    definir_modo_nao_interativo(silencioso=True)
+    try:
+        with open(os.devnull, 'w', encoding='utf-8') as descarte, redirect_stdout(descarte):
+            for _ in range(repeticoes):
+                argumento = preparar(propriedades) if preparar else propriedades
+                gc.collect()
+
+                oracle_simulado.zerar_estatisticas()
+                inicio = time.perf_counter()
+                executar(argumento)
+                tempos.append(time.perf_counter() - inicio)
+                acessos = oracle_simulado.obter_estatisticas()
+    finally:
+        definir_modo_nao_interativo(False)
+
+    mediana = statistics.median(tempos)
+    itens = _total_colheitas(propriedades)
+    resultado = {
+        'repeticoes': repeticoes,
+        'tempos_segundos': [round(tempo, 6) for tempo in tempos],
+        'minimo_segundos': round(min(tempos), 6),
+        'mediana_segundos': round(mediana, 6),
+        'colheitas': itens,
+        'colheitas_por_segundo': round(itens / mediana) if mediana > 0 else 0
+    }
+    if acessos and acessos['round_trips']:
+        resultado['round_trips'] = acessos['round_trips']
+        resultado['sessoes_abertas'] = acessos['sessoes_abertas']
+        resultado['espera_simulada_segundos'] = round(acessos['tempo_espera_segundos'], 6)
+    return resultado
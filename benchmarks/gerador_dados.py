@@ -0,0 +1,119 @@
+"""
+Gerador de dados sintéticos para os benchmarks
+Produz propriedades e colheitas plausíveis (mistura de solos, safras de abril
+a novembro, produtividade em torno da esperada para o solo) a partir de uma
+semente, para que duas execuções com os mesmos parâmetros sejam comparáveis.
+"""
+
+import random
+from datetime import date, timedelta
+
+from src.models.propriedade import Propriedade, Solos
+from src.models.colheita import Colheita
+from src.services.calculation_service import PRODUTIVIDADE_ESPERADA_POR_SOLO
+
+# Participação aproximada de cada solo (chave de Solos.obter_tipos_solo) nas propriedades geradas
+PESOS_SOLO = {
+    1: 30,   # Latossolo vermelho
+    2: 8,    # Nitossolo
+    3: 18,   # Argissolo
+    4: 12,   # Neossolo Quartzarênico
+    5: 8,    # Cambissolo
+    6: 3,    # Neossolo Litólico
+    7: 3,    # Planossolo
+    8: 3,    # Gleissolo
+    9: 4,    # Cambissolo
+    10: 4,   # Vertissolo
+    11: 2,   # Organossolo
+    12: 5    # Outros
+}
+
+MUNICIPIOS = (
+    'Ribeirão Preto - SP', 'Sertãozinho - SP', 'Piracicaba - SP', 'Jaboticabal - SP',
+    'Araraquara - SP', 'Barretos - SP', 'Catanduva - SP', 'Jaú - SP',
+    'Assis - SP', 'Presidente Prudente - SP', 'Rio Verde - GO', 'Uberaba - MG'
+)
+
+# Safra do centro-sul: colheita de abril a novembro
+INICIO_SAFRA = (4, 1)
+DIAS_SAFRA = 240
+
+PROPORCAO_MECANICA = 0.7
+
+def _produtividade_esperada(tipo_solo):
+    """
+    Produtividade esperada (t/ha) para o solo, com a mesma regra de calculation_service
+
+    Args:
+        tipo_solo (str): Nome do solo
+
+    Returns:
+        float: Produtividade esperada em t/ha
+    """
+    return PRODUTIVIDADE_ESPERADA_POR_SOLO.get(tipo_solo.lower(), PRODUTIVIDADE_ESPERADA_POR_SOLO['outros'])
+
+def _gerar_colheita(aleatorio, propriedade, ano_final, n_anos):
+    """
+    Gera uma colheita para a propriedade
+
+    A perda segue uma distribuição beta (média perto de 10%, com cauda até
+    perdas críticas); colheitas mecânicas perdem um pouco mais que as manuais.
+
+    Args:
+        aleatorio (random.Random): Gerador com a semente da execução
+        propriedade (Propriedade): Propriedade dona da colheita
+        ano_final (int): Última safra gerada
+        n_anos (int): Quantidade de safras cobertas
+
+    Returns:
+        Colheita: Colheita gerada
+    """
+    ano = ano_final - aleatorio.randrange(n_anos)
+    data = date(ano, *INICIO_SAFRA) + timedelta(days=aleatorio.randrange(DIAS_SAFRA))
+
+    mecanica = aleatorio.random() < PROPORCAO_MECANICA
+    area = round(propriedade.area_total * aleatorio.uniform(0.05, 0.6), 2) or 0.01
+
+    perda = aleatorio.betavariate(2.0, 20.0) + (0.03 if mecanica else 0.0)
+    produtividade = _produtividade_esperada(propriedade.tipo_solo) * (1 - perda) * aleatorio.gauss(1.0, 0.05)
+    quantidade = round(max(area * produtividade, 0.01), 2)
+
+    return Colheita(data.strftime('%d/%m/%Y'), area, quantidade, 'mecanica' if mecanica else 'manual')
+
+def gerar_propriedades(n_propriedades, n_colheitas, semente=42, ano_final=2024, n_anos=5):
+    """
+    Gera N propriedades com M colheitas cada
+
+    Args:
+        n_propriedades (int): Quantidade de propriedades
+        n_colheitas (int): Colheitas por propriedade
+        semente (int): Semente do gerador (mesma semente = mesmos dados)
+        ano_final (int): Última safra das colheitas
+        n_anos (int): Quantidade de safras cobertas
+
+    Returns:
+        list: Lista de objetos Propriedade com as colheitas
+    """
+    aleatorio = random.Random(semente)
+    tipos_solo = Solos.obter_tipos_solo()
+    chaves_solo = list(PESOS_SOLO)
+    pesos_solo = [PESOS_SOLO[chave] for chave in chaves_solo]
+
+    propriedades = []
+    for i in range(1, n_propriedades + 1):
+        tipo_solo = tipos_solo[aleatorio.choices(chaves_solo, pesos_solo)[0]]
+        # Área log-normal: muitas propriedades médias e poucas usinas grandes (mediana ~ 400 ha)
+        area_total = round(min(aleatorio.lognormvariate(6.0, 0.8), 20000.0), 2)
+
+        propriedade = Propriedade(
+            f"Fazenda Sintética {i:05d}",
+            area_total,
+            aleatorio.choice(MUNICIPIOS),
+            tipo_solo
+        )
+        for _ in range(n_colheitas):
+            propriedade.adicionar_colheita(_gerar_colheita(aleatorio, propriedade, ano_final, n_anos))
+
+        propriedades.append(propriedade)
+
+    return propriedades
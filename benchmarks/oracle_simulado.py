@@ -0,0 +1,558 @@
+"""
+Driver Oracle simulado sobre SQLite, com latência configurável
+Implementa a parte da API do cx_Oracle usada por database_service (connect,
+SessionPool, cursor, execute, executemany com batch errors e RETURNING,
+var, fetchone/fetchall, commit/rollback e o formato de DatabaseError) e
+traduz o SQL Oracle do projeto para SQLite, inclusive as consultas a
+user_tables e user_indexes. Cada round trip e cada sessão aberta esperam
+a latência configurada, para medir quanto o padrão de acesso (conexão por
+chamada, pool, lotes) custa sem um servidor Oracle.
+
+Uso no sistema inteiro (menu ou linha de comando):
+    SMPC_DRIVER_ORACLE=benchmarks.oracle_simulado SMPC_INSTRUMENTACAO=1 python main.py
+
+Variáveis de ambiente:
+    SMPC_ORACLE_SIMULADO_ARQUIVO      banco SQLite usado (padrão: smpc_oracle_simulado.db na pasta temporária)
+    SMPC_ORACLE_SIMULADO_LATENCIA_MS  espera por round trip (padrão: 0.5)
+    SMPC_ORACLE_SIMULADO_CONEXAO_MS   espera para abrir uma sessão (padrão: 30)
+"""
+
+import os
+import re
+import sqlite3
+import tempfile
+import threading
+import time
+from contextlib import contextmanager
+from datetime import date, datetime
+
+from config.database_config import CONFIG_SQLITE, SQL_CREATE_TABLES_SQLITE
+
+# Constantes da API do cx_Oracle lidas por database_service
+NUMBER = float
+STRING = str
+DATETIME = datetime
+SPOOL_ATTRVAL_WAIT = 1
+SPOOL_ATTRVAL_NOWAIT = 0
+SPOOL_ATTRVAL_TIMEDWAIT = 3
+
+version = '8.3.0-simulado'
+
+_configuracao = {
+    'arquivo': os.getenv('SMPC_ORACLE_SIMULADO_ARQUIVO')
+               or os.path.join(tempfile.gettempdir(), 'smpc_oracle_simulado.db'),
+    'latencia_ms': float(os.getenv('SMPC_ORACLE_SIMULADO_LATENCIA_MS', '0.5')),
+    'latencia_conexao_ms': float(os.getenv('SMPC_ORACLE_SIMULADO_CONEXAO_MS', '30')),
+    # False: o pool fecha a sessão ao devolvê-la, como se cada chamada abrisse uma conexão
+    'reutilizar_sessoes': True
+}
+
+_estatisticas = {
+    'round_trips': 0,
+    'sessoes_abertas': 0,
+    'tempo_espera_segundos': 0.0
+}
+
+_trava = threading.Lock()
+
+class Error(Exception):
+    """Base dos erros do driver"""
+
+class DatabaseError(Error):
+    """Erro do banco: args = (erro,), com erro.message, erro.code e erro.offset"""
+
+class IntegrityError(DatabaseError):
+    """Violação de restrição (ORA-00001, ORA-02291, ORA-02290, ORA-01400)"""
+
+class _Erro:
+    """Objeto de erro no formato do cx_Oracle (_Error)"""
+
+    def __init__(self, code, message, offset=0):
+        self.code = code
+        self.message = message
+        self.offset = offset
+
+    def __str__(self):
+        return self.message
+
+def _erro_oracle(erro_sqlite, offset=0):
+    """
+    Converte um erro do SQLite no erro Oracle equivalente
+
+    Args:
+        erro_sqlite (sqlite3.Error): Erro original
+        offset (int): Linha do lote (executemany)
+
+    Returns:
+        DatabaseError: Erro com args = (_Erro,)
+    """
+    texto = str(erro_sqlite)
+    if isinstance(erro_sqlite, sqlite3.IntegrityError):
+        if texto.startswith('UNIQUE'):
+            codigo, mensagem = 1, f"ORA-00001: unique constraint violated ({texto})"
+        elif texto.startswith('FOREIGN KEY'):
+            codigo, mensagem = 2291, "ORA-02291: integrity constraint (FK_COLHEITA_PROPRIEDADE) violated - parent key not found"
+        elif texto.startswith('CHECK'):
+            codigo, mensagem = 2290, f"ORA-02290: check constraint violated ({texto})"
+        else:
+            codigo, mensagem = 1400, f"ORA-01400: cannot insert NULL ({texto})"
+        return IntegrityError(_Erro(codigo, mensagem, offset))
+    if texto.startswith('no such table'):
+        return DatabaseError(_Erro(942, f"ORA-00942: table or view does not exist ({texto})", offset))
+    return DatabaseError(_Erro(900, f"ORA-00900: {texto}", offset))
+
+def configurar(arquivo=None, latencia_ms=None, latencia_conexao_ms=None, reutilizar_sessoes=None):
+    """
+    Altera o banco e as latências simuladas (valores None não mudam)
+
+    Args:
+        arquivo (str): Banco SQLite que guarda as tabelas
+        latencia_ms (float): Espera por round trip
+        latencia_conexao_ms (float): Espera para abrir uma sessão
+        reutilizar_sessoes (bool): O pool mantém as sessões devolvidas abertas
+    """
+    for chave, valor in (('arquivo', arquivo), ('latencia_ms', latencia_ms),
+                         ('latencia_conexao_ms', latencia_conexao_ms),
+                         ('reutilizar_sessoes', reutilizar_sessoes)):
+        if valor is not None:
+            _configuracao[chave] = valor
+
+def obter_configuracao():
+    """
+    Returns:
+        dict: Cópia da configuração atual
+    """
+    return dict(_configuracao)
+
+def zerar_estatisticas():
+    """
+    Zera os contadores de round trips, sessões e espera
+    """
+    with _trava:
+        _estatisticas.update(round_trips=0, sessoes_abertas=0, tempo_espera_segundos=0.0)
+
+def obter_estatisticas():
+    """
+    Returns:
+        dict: 'round_trips', 'sessoes_abertas' e 'tempo_espera_segundos' desde a última zerada
+    """
+    with _trava:
+        return dict(_estatisticas)
+
+def _esperar(latencia_ms, contador):
+    with _trava:
+        _estatisticas[contador] += 1
+        _estatisticas['tempo_espera_segundos'] += latencia_ms / 1000
+    if latencia_ms > 0:
+        time.sleep(latencia_ms / 1000)
+
+def _round_trip():
+    _esperar(_configuracao['latencia_ms'], 'round_trips')
+
+# Funções Oracle sem equivalente direto no SQLite
+def _to_date(texto, formato):
+    if texto is None:
+        return None
+    formato_python = (formato.upper().replace('DD', '%d').replace('MM', '%m')
+                      .replace('YYYY', '%Y').replace('HH24', '%H').replace('MI', '%M').replace('SS', '%S'))
+    return datetime.strptime(texto, formato_python).strftime('%Y-%m-%d %H:%M:%S'
+                                                              if '%H' in formato_python else '%Y-%m-%d')
+
+def _nvl(valor, padrao):
+    return padrao if valor is None else valor
+
+_RETURNING = re.compile(r'\s+RETURNING\s+\w+\s+INTO\s+:(\w+)\s*$', re.IGNORECASE)
+_FETCH_FIRST = re.compile(r'FETCH\s+FIRST\s+(:\w+|\d+)\s+ROWS\s+ONLY', re.IGNORECASE)
+_FROM_DUAL = re.compile(r'\s+FROM\s+DUAL\b', re.IGNORECASE)
+_SYSDATE = re.compile(r'\bSYSDATE\b', re.IGNORECASE)
+_USER_TABLES = re.compile(r'\bFROM\s+user_tables\b', re.IGNORECASE)
+_USER_INDEXES = re.compile(r'\bFROM\s+user_indexes\b', re.IGNORECASE)
+_USER_MVIEWS = re.compile(r'\bFROM\s+user_mviews\b', re.IGNORECASE)
+_MVIEW_LOG = re.compile(r'^\s*CREATE\s+MATERIALIZED\s+VIEW\s+LOG\b', re.IGNORECASE)
+_MVIEW = re.compile(r'^\s*CREATE\s+MATERIALIZED\s+VIEW\s+(\w+)\b.*?\bAS\b', re.IGNORECASE | re.DOTALL)
+_DBMS_MVIEW = re.compile(r'^\s*BEGIN\s+DBMS_MVIEW\.', re.IGNORECASE)
+_USER_PART_TABLES = re.compile(r'\bFROM\s+user_part_tables\b', re.IGNORECASE)
+_INDICE_LOCAL = re.compile(r'\s+LOCAL\s*$', re.IGNORECASE)
+_REBUILD = re.compile(r'^\s*ALTER\s+INDEX\s+(\w+)\s+REBUILD\s*$', re.IGNORECASE)
+_CREATE_UNIQUE_INDEX = re.compile(r'^\s*CREATE\s+UNIQUE\s+INDEX\b', re.IGNORECASE)
+_CREATE_TABLE = re.compile(r'^\s*CREATE\s+TABLE\s+(\w+)', re.IGNORECASE)
+_CREATE_SEQUENCE = re.compile(r'^\s*CREATE\s+SEQUENCE\b', re.IGNORECASE)
+_DATA_TEXTO = re.compile(r'^\d{4}-\d{2}-\d{2}( \d{2}:\d{2}:\d{2})?$')
+
+# SQL Oracle -> (SQL SQLite ou None para ignorar, nome do bind de RETURNING)
+_traducoes = {}
+
+def _traduzir(sql):
+    """
+    Traduz um comando Oracle do projeto para SQLite (resultado guardado em cache)
+
+    CREATE TABLE usa o esquema de SQL_CREATE_TABLES_SQLITE; sequences são
+    ignoradas (IDs vêm do AUTOINCREMENT); RETURNING ... INTO é resolvido
+    com lastrowid. Não há partições: índices LOCAL viram índices comuns e
+    user_part_tables é sempre vazia. Visões materializadas viram visões
+    comuns (sempre atualizadas, mas calculadas a cada leitura) e os logs e
+    refreshes são ignorados.
+
+    Args:
+        sql (str): Comando Oracle
+
+    Returns:
+        tuple: (comando SQLite ou None, nome do bind de RETURNING ou None)
+    """
+    traducao = _traducoes.get(sql)
+    if traducao is not None:
+        return traducao
+
+    retorno = None
+    tabela = _CREATE_TABLE.match(sql)
+    if tabela:
+        comando = SQL_CREATE_TABLES_SQLITE[tabela.group(1).lower()]
+    elif _CREATE_SEQUENCE.match(sql) or _MVIEW_LOG.match(sql) or _DBMS_MVIEW.match(sql):
+        comando = None
+    elif _MVIEW.match(sql):
+        comando = _MVIEW.sub(r'CREATE VIEW \1 AS', sql.strip(), count=1)
+    elif _REBUILD.match(sql):
+        comando = f"REINDEX {_REBUILD.match(sql).group(1)}"
+    else:
+        comando = sql.strip()
+        encontrado = _RETURNING.search(comando)
+        if encontrado:
+            retorno = encontrado.group(1)
+            comando = comando[:encontrado.start()]
+        comando = _INDICE_LOCAL.sub('', comando)
+        comando = _FETCH_FIRST.sub(r'LIMIT \1', comando)
+        comando = _FROM_DUAL.sub('', comando)
+        comando = _SYSDATE.sub("datetime('now', 'localtime')", comando)
+        comando = _USER_TABLES.sub("FROM (SELECT UPPER(name) AS table_name FROM sqlite_master "
+                                   "WHERE type = 'table')", comando)
+        comando = _USER_INDEXES.sub("FROM (SELECT UPPER(name) AS index_name, UPPER(tbl_name) AS table_name, "
+                                    "'VALID' AS status FROM sqlite_master WHERE type = 'index')", comando)
+        comando = _USER_MVIEWS.sub("FROM (SELECT UPPER(name) AS mview_name FROM sqlite_master "
+                                   "WHERE type = 'view')", comando)
+        comando = _USER_PART_TABLES.sub("FROM (SELECT NULL AS table_name, NULL AS partitioning_type, "
+                                        "NULL AS interval WHERE 0)", comando)
+
+    traducao = _traducoes[sql] = (comando, retorno)
+    return traducao
+
+def _valor_bind(valor):
+    if isinstance(valor, datetime):
+        return valor.strftime('%Y-%m-%d %H:%M:%S')
+    if isinstance(valor, date):
+        return valor.isoformat()
+    return valor
+
+def _binds(parametros):
+    """
+    Binds para o SQLite: sem as variáveis de saída e com datas em texto
+
+    Args:
+        parametros (dict): Binds no formato do cx_Oracle
+
+    Returns:
+        dict: Binds aceitos pelo sqlite3
+    """
+    if not parametros:
+        return {}
+    return {nome: _valor_bind(valor) for nome, valor in parametros.items()
+            if not isinstance(valor, Variavel)}
+
+def _valor_lido(valor):
+    # Colunas DATE voltam como datetime, como no Oracle
+    if isinstance(valor, str) and _DATA_TEXTO.match(valor):
+        return datetime.fromisoformat(valor)
+    return valor
+
+class Variavel:
+    """Variável de bind (cursor.var), com um valor por linha do lote"""
+
+    def __init__(self, tipo, arraysize=1):
+        self.type = tipo
+        self.valores = [[] for _ in range(max(1, arraysize))]
+
+    def getvalue(self, posicao=0):
+        return self.valores[posicao]
+
+    def setvalue(self, posicao, valor):
+        self.valores[posicao] = valor
+
+class Cursor:
+    """Cursor: execute/executemany com um round trip; leitura em blocos de arraysize linhas"""
+
+    def __init__(self, conexao):
+        self.connection = conexao
+        self.arraysize = 100
+        self.prefetchrows = 2
+        self.rowcount = 0
+        self.description = None
+        self._cursor = conexao._sqlite.cursor()
+        self._buffer = []
+        self._esgotado = True
+        self._entradas = {}
+        self._erros_lote = []
+
+    def var(self, tipo, arraysize=1):
+        return Variavel(tipo, arraysize)
+
+    def setinputsizes(self, **variaveis):
+        self._entradas = {nome: valor for nome, valor in variaveis.items() if isinstance(valor, Variavel)}
+
+    def _executar(self, comando, parametros):
+        self._cursor.execute(comando, _binds(parametros))
+        self.description = self._cursor.description
+
+    def execute(self, sql, parametros=None, **kwargs):
+        parametros = dict(parametros or {}, **kwargs)
+        comando, retorno = _traduzir(sql)
+        _round_trip()
+
+        self._buffer = []
+        self._esgotado = True
+        if comando is None:
+            return None
+
+        try:
+            self._executar(comando, parametros)
+        except sqlite3.IntegrityError as e:
+            if _CREATE_UNIQUE_INDEX.match(comando):
+                raise DatabaseError(_Erro(1452, "ORA-01452: cannot CREATE UNIQUE INDEX; duplicate keys found"))
+            raise _erro_oracle(e)
+        except sqlite3.Error as e:
+            raise _erro_oracle(e)
+
+        if retorno is not None:
+            variavel = parametros.get(retorno) or self._entradas.get(retorno)
+            if variavel is not None:
+                variavel.setvalue(0, [self._cursor.lastrowid])
+
+        if self.description is None:
+            self.rowcount = self._cursor.rowcount
+            return None
+
+        # A execução já traz as primeiras prefetchrows linhas
+        self._esgotado = False
+        self.rowcount = 0
+        self._ler_bloco(self.prefetchrows)
+        return self
+
+    def executemany(self, sql, linhas, batcherrors=False, **kwargs):
+        comando, retorno = _traduzir(sql)
+        _round_trip()
+
+        variavel = self._entradas.get(retorno) if retorno else None
+        self._erros_lote = []
+        self._buffer = []
+        self._esgotado = True
+        self.rowcount = 0
+        if comando is None:
+            return
+
+        for posicao, linha in enumerate(linhas):
+            try:
+                self._executar(comando, linha)
+            except sqlite3.Error as e:
+                erro = _erro_oracle(e, posicao)
+                if not batcherrors:
+                    raise erro
+                self._erros_lote.append(erro.args[0])
+                continue
+
+            self.rowcount += 1
+            if variavel is not None:
+                variavel.setvalue(posicao, [self._cursor.lastrowid])
+
+    def getbatcherrors(self):
+        return list(self._erros_lote)
+
+    def _ler_bloco(self, quantidade):
+        if self._esgotado or quantidade <= 0:
+            return
+        linhas = self._cursor.fetchmany(quantidade)
+        if len(linhas) < quantidade:
+            self._esgotado = True
+        self.rowcount += len(linhas)
+        self._buffer.extend(tuple(_valor_lido(valor) for valor in linha) for linha in linhas)
+
+    def _buscar(self):
+        # Um round trip por bloco de arraysize linhas
+        if not self._buffer and not self._esgotado:
+            _round_trip()
+            self._ler_bloco(max(1, self.arraysize))
+
+    def fetchone(self):
+        self._buscar()
+        return self._buffer.pop(0) if self._buffer else None
+
+    def fetchmany(self, quantidade=None):
+        quantidade = quantidade or self.arraysize
+        linhas = []
+        while len(linhas) < quantidade:
+            self._buscar()
+            if not self._buffer:
+                break
+            parte = self._buffer[:quantidade - len(linhas)]
+            del self._buffer[:len(parte)]
+            linhas.extend(parte)
+        return linhas
+
+    def fetchall(self):
+        linhas = []
+        while True:
+            self._buscar()
+            if not self._buffer:
+                return linhas
+            linhas.extend(self._buffer)
+            self._buffer = []
+
+    def __iter__(self):
+        while True:
+            self._buscar()
+            if not self._buffer:
+                return
+            bloco, self._buffer = self._buffer, []
+            yield from bloco
+
+    def close(self):
+        self._buffer = []
+        self._esgotado = True
+        self._cursor.close()
+
+class Connection:
+    """Sessão: uma conexão SQLite ao banco compartilhado, com transação própria"""
+
+    def __init__(self, user=None, password=None, dsn=None, **kwargs):
+        _esperar(_configuracao['latencia_conexao_ms'], 'sessoes_abertas')
+        self.username = user
+        self.dsn = dsn
+        self._sqlite = sqlite3.connect(_configuracao['arquivo'], check_same_thread=False)
+        for pragma, valor in CONFIG_SQLITE.items():
+            self._sqlite.execute(f"PRAGMA {pragma} = {valor}")
+        self._sqlite.create_function('TO_DATE', 2, _to_date, deterministic=True)
+        self._sqlite.create_function('NVL', 2, _nvl, deterministic=True)
+
+    def cursor(self):
+        return Cursor(self)
+
+    def commit(self):
+        _round_trip()
+        self._sqlite.commit()
+
+    def rollback(self):
+        _round_trip()
+        self._sqlite.rollback()
+
+    def ping(self):
+        _round_trip()
+
+    def close(self):
+        self._sqlite.rollback()
+        self._sqlite.close()
+
+def connect(user=None, password=None, dsn=None, **kwargs):
+    """
+    Abre uma sessão (espera a latência de conexão)
+
+    Returns:
+        Connection: Sessão aberta
+    """
+    return Connection(user, password, dsn, **kwargs)
+
+class SessionPool:
+    """
+    Pool de sessões: acquire reaproveita sessões livres e só abre uma nova quando não há
+    """
+
+    def __init__(self, user=None, password=None, dsn=None, min=1, max=2, increment=1, **kwargs):
+        self._parametros = {'user': user, 'password': password, 'dsn': dsn}
+        self.min = min
+        self.max = max
+        self.increment = increment
+        self.timeout = 0
+        self._livres = [Connection(**self._parametros) for _ in range(min)]
+        self._ocupadas = set()
+
+    @property
+    def opened(self):
+        return len(self._livres) + len(self._ocupadas)
+
+    @property
+    def busy(self):
+        return len(self._ocupadas)
+
+    def acquire(self):
+        if self._livres:
+            conexao = self._livres.pop()
+        elif self.opened < self.max:
+            conexao = Connection(**self._parametros)
+        else:
+            raise DatabaseError(_Erro(24418, "ORA-24418: Cannot open further sessions."))
+        self._ocupadas.add(conexao)
+        return conexao
+
+    def release(self, conexao):
+        self._ocupadas.discard(conexao)
+        # Transação pendente é desfeita ao devolver a sessão, como no Oracle
+        conexao._sqlite.rollback()
+        if _configuracao['reutilizar_sessoes']:
+            self._livres.append(conexao)
+        else:
+            conexao.close()
+
+    def close(self, force=False):
+        for conexao in self._livres + list(self._ocupadas):
+            conexao.close()
+        self._livres = []
+        self._ocupadas = set()
+
+def remover_banco(arquivo=None):
+    """
+    Apaga o banco SQLite do driver simulado (com os arquivos -wal e -shm)
+
+    Args:
+        arquivo (str): Banco a apagar (padrão: o configurado)
+    """
+    arquivo = arquivo or _configuracao['arquivo']
+    for sufixo in ('', '-wal', '-shm'):
+        if os.path.exists(arquivo + sufixo):
+            os.remove(arquivo + sufixo)
+
+@contextmanager
+def oracle_simulado(**configuracao):
+    """
+    Liga database_service a este driver enquanto o bloco estiver ativo
+
+    O pool é criado de novo dentro do bloco (pelo próprio database_service)
+    e o Oracle passa a ser o backend de armazenamento_service; o estado
+    anterior e a configuração do driver são restaurados ao sair.
+
+    Args:
+        **configuracao: Parâmetros de configurar (arquivo, latencia_ms, ...)
+
+    Uso:
+        with oracle_simulado(arquivo=caminho, latencia_ms=1.0):
+            sincronizar_com_banco(propriedades)
+    """
+    import sys
+    from src.services import armazenamento_service, database_service, sistema_integrado
+
+    anteriores = (database_service.cx_Oracle, dict(database_service._driver), database_service._connection_pool,
+                  armazenamento_service._armazenamento['backend'], sistema_integrado._banco_disponivel,
+                  dict(_configuracao))
+
+    configurar(**configuracao)
+    database_service.cx_Oracle = sys.modules[__name__]
+    database_service._driver.update(carregado=True, disponivel=True, erro=None)
+    database_service._connection_pool = None
+    armazenamento_service._armazenamento['backend'] = 'oracle'
+    sistema_integrado._banco_disponivel = True
+    try:
+        yield sys.modules[__name__]
+    finally:
+        database_service.encerrar_pool()
+        database_service.cx_Oracle = anteriores[0]
+        database_service._driver.clear()
+        database_service._driver.update(anteriores[1])
+        database_service._connection_pool = anteriores[2]
+        armazenamento_service._armazenamento['backend'] = anteriores[3]
+        sistema_integrado._banco_disponivel = anteriores[4]
+        _configuracao.update(anteriores[5])
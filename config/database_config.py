@@ -4,6 +4,7 @@ Contém configurações e parâmetros de conexão
 """
 
 import os
+from datetime import date, timedelta
 
 def obter_config_banco():
     """
@@ -61,7 +62,38 @@ CONFIG_AVANCADA = {
     'retry_count': 3,  # Número de tentativas de reconexão
     'pool_min': 1,  # Mínimo de conexões no pool
     'pool_max': 5,  # Máximo de conexões no pool
-    'pool_increment': 1  # Incremento do pool
+    'pool_increment': 1,  # Incremento do pool
+    'pool_timeout_ocioso': 300,  # Sessões ociosas acima do mínimo são fechadas após N segundos
+    'arraysize': 1000,  # Linhas buscadas por round trip em consultas grandes
+    'prefetchrows': 1000,  # Linhas pré-carregadas junto com a execução da consulta
+    'tamanho_lote': 1000  # Linhas por lote (uma transação por lote) na sincronização em massa
+}
+
+def obter_config_armazenamento():
+    """
+    Retorna o backend de armazenamento escolhido e o arquivo do banco local
+    
+    SMPC_ARMAZENAMENTO: 'oracle', 'sqlite' ou 'auto' (Oracle se disponível,
+    senão o banco SQLite local). SMPC_SQLITE_ARQUIVO: caminho do banco local.
+    
+    Returns:
+        dict: {'backend': str, 'arquivo_sqlite': str}
+    """
+    base_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    
+    return {
+        'backend': os.getenv('SMPC_ARMAZENAMENTO', 'auto').strip().lower(),
+        'arquivo_sqlite': os.getenv('SMPC_SQLITE_ARQUIVO') or os.path.join(base_dir, 'scripts', 'data', 'smpc.db')
+    }
+
+# Parâmetros do banco SQLite local (PRAGMAs aplicados a cada conexão)
+CONFIG_SQLITE = {
+    'journal_mode': 'WAL',  # Leitores não bloqueiam o escritor; commit sem reescrever o arquivo
+    'synchronous': 'NORMAL',  # Seguro com WAL: só o último commit pode se perder em queda de energia
+    'busy_timeout': 5000,  # Espera (ms) por outro processo que esteja gravando
+    'cache_size': -65536,  # Cache de páginas em KiB (negativo = tamanho, não páginas): 64 MiB
+    'temp_store': 'MEMORY',
+    'foreign_keys': 'ON'
 }
 
 # SQL para criação das tabelas
@@ -96,9 +128,149 @@ SQL_CREATE_TABLES = {
     'sequences': [
         "CREATE SEQUENCE seq_propriedades START WITH 1 INCREMENT BY 1",
         "CREATE SEQUENCE seq_colheitas START WITH 1 INCREMENT BY 1"
-    ]
+    ],
+    
+    # Índices criados por criar_tabelas (também em instalações antigas): nome -> DDL
+    'indices': {
+        # Busca por nome sem diferenciar maiúsculas (propriedade_por_nome) e unicidade nesse critério
+        'idx_propriedades_nome_upper': "CREATE UNIQUE INDEX idx_propriedades_nome_upper ON propriedades (UPPER(nome))",
+        # Colheitas de uma propriedade ordenadas por data, JOINs e o ON DELETE CASCADE da FK
+        'idx_colheitas_propriedade_data': "CREATE INDEX idx_colheitas_propriedade_data "
+                                          "ON colheitas (propriedade_id, data_colheita)",
+        # Marcas d'água da carga incremental (propriedades_desde, colheitas_desde)
+        'idx_propriedades_data_cadastro': "CREATE INDEX idx_propriedades_data_cadastro ON propriedades (data_cadastro)",
+        'idx_colheitas_data_registro': "CREATE INDEX idx_colheitas_data_registro ON colheitas (data_registro)",
+        # Perdas críticas do relatório (percentual_perda > 15 ORDER BY percentual_perda DESC)
+        'idx_colheitas_percentual_perda': "CREATE INDEX idx_colheitas_percentual_perda ON colheitas (percentual_perda)"
+    },
+    
+    # Alternativa quando já há nomes que só diferem em maiúsculas/minúsculas (ORA-01452)
+    'indice_nome_sem_unicidade': "CREATE INDEX idx_propriedades_nome_upper ON propriedades (UPPER(nome))",
+    
+    # Totais de colheitas por propriedade mantidos pelo Oracle a cada commit (REFRESH FAST ON COMMIT),
+    # lidos por obter_estatisticas_banco em vez de agregar o histórico inteiro.
+    # SUM exige o COUNT da mesma coluna para o refresh rápido aceitar UPDATE/DELETE.
+    'estatisticas': {
+        'log_colheitas': """
+            CREATE MATERIALIZED VIEW LOG ON colheitas
+            WITH ROWID, SEQUENCE (propriedade_id, area_colhida, quantidade_colhida, produtividade, percentual_perda)
+            INCLUDING NEW VALUES
+        """,
+        'visao': """
+            CREATE MATERIALIZED VIEW estatisticas_propriedades
+            BUILD IMMEDIATE
+            REFRESH FAST ON COMMIT
+            AS
+            SELECT propriedade_id,
+                   COUNT(*) AS total_colheitas,
+                   COUNT(area_colhida) AS qtd_area_colhida,
+                   SUM(area_colhida) AS area_colhida,
+                   COUNT(quantidade_colhida) AS qtd_quantidade_colhida,
+                   SUM(quantidade_colhida) AS quantidade_colhida,
+                   COUNT(produtividade) AS qtd_produtividade,
+                   SUM(produtividade) AS soma_produtividade,
+                   COUNT(percentual_perda) AS qtd_percentual_perda,
+                   SUM(percentual_perda) AS soma_percentual_perda
+            FROM colheitas
+            GROUP BY propriedade_id
+        """,
+        # Troca de partições (arquivar_particoes_colheitas) não passa pelo log: recálculo completo
+        'recalcular': "BEGIN DBMS_MVIEW.REFRESH('ESTATISTICAS_PROPRIEDADES', 'C'); END;"
+    }
+}
+
+# Particionamento opcional de colheitas por data_colheita (SMPC_PARTICIONAMENTO=mensal|safra)
+# O Oracle cria cada partição (INTERVAL) na primeira colheita do período
+PARTICIONAMENTO_COLHEITAS = {
+    'mensal': {
+        'intervalo': "NUMTOYMINTERVAL(1, 'MONTH')",
+        'limite_inicial': "DATE '2000-01-01'"
+    },
+    # Safra do centro-sul: de abril a março do ano seguinte
+    'safra': {
+        'intervalo': "NUMTOYMINTERVAL(12, 'MONTH')",
+        'limite_inicial': "DATE '2000-04-01'"
+    }
 }
 
+# Índices de colheitas que, com a tabela particionada, são LOCAL (uma partição de índice por partição)
+INDICES_LOCAIS_COLHEITAS = (
+    'idx_colheitas_propriedade_data',
+    'idx_colheitas_data_registro',
+    'idx_colheitas_percentual_perda'
+)
+
+# Período usado nas consultas por data quando nenhum limite é informado
+PERIODO_COMPLETO = (date(1900, 1, 1), date(9999, 12, 31))
+
+def obter_periodo(data_inicio=None, data_fim=None):
+    """
+    Limites dos binds :data_inicio e :data_fim das consultas por período
+    
+    A coluna é comparada diretamente com os binds (data_colheita >= :data_inicio
+    AND data_colheita < :data_fim), o que permite ao Oracle ler apenas as
+    partições do período.
+    
+    Args:
+        data_inicio (date): Primeiro dia incluído (None = sem limite)
+        data_fim (date): Último dia incluído (None = sem limite)
+        
+    Returns:
+        tuple: (início, fim exclusivo) como date
+    """
+    inicio = data_inicio or PERIODO_COMPLETO[0]
+    # O último dia de PERIODO_COMPLETO já é o limite (não há dia seguinte a date.max)
+    if data_fim is None or data_fim >= PERIODO_COMPLETO[1]:
+        fim = PERIODO_COMPLETO[1]
+    else:
+        fim = data_fim + timedelta(days=1)
+    return inicio, fim
+
+def obter_modo_particionamento():
+    """
+    Retorna o modo de particionamento de colheitas escolhido em SMPC_PARTICIONAMENTO
+    
+    Returns:
+        str: 'mensal', 'safra' ou None (tabela sem particionamento, padrão)
+    """
+    modo = os.getenv('SMPC_PARTICIONAMENTO', '').strip().lower()
+    return modo if modo in PARTICIONAMENTO_COLHEITAS else None
+
+def obter_ddl_colheitas(modo=None):
+    """
+    Retorna o CREATE TABLE de colheitas, particionado por intervalo se houver modo
+    
+    Args:
+        modo (str): Chave de PARTICIONAMENTO_COLHEITAS ou None
+        
+    Returns:
+        str: Comando DDL
+    """
+    if modo is None:
+        return SQL_CREATE_TABLES['colheitas']
+    
+    particionamento = PARTICIONAMENTO_COLHEITAS[modo]
+    return f"""{SQL_CREATE_TABLES['colheitas'].rstrip()}
+        PARTITION BY RANGE (data_colheita) INTERVAL ({particionamento['intervalo']})
+        (PARTITION colheitas_inicial VALUES LESS THAN ({particionamento['limite_inicial']}))
+    """
+
+def obter_ddl_indices(modo=None):
+    """
+    Retorna os índices de SQL_CREATE_TABLES['indices'], com os de colheitas LOCAL se houver modo
+    
+    Args:
+        modo (str): Chave de PARTICIONAMENTO_COLHEITAS ou None
+        
+    Returns:
+        dict: Nome do índice -> comando DDL
+    """
+    if modo is None:
+        return dict(SQL_CREATE_TABLES['indices'])
+    
+    return {nome: f"{comando} LOCAL" if nome in INDICES_LOCAIS_COLHEITAS else comando
+            for nome, comando in SQL_CREATE_TABLES['indices'].items()}
+
 # SQL para inserção de dados
 SQL_INSERT = {
     'propriedade': """
@@ -111,6 +283,21 @@ SQL_INSERT = {
                               quantidade_colhida, tipo_colheita, produtividade, percentual_perda)
         VALUES (:propriedade_id, TO_DATE(:data_colheita, 'DD/MM/YYYY'), :area_colhida,
                 :quantidade_colhida, :tipo_colheita, :produtividade, :percentual_perda)
+    """,
+    
+    # Variantes com RETURNING para inserção em lote (executemany + array bind)
+    'propriedade_lote': """
+        INSERT INTO propriedades (nome, area_total, localizacao, tipo_solo)
+        VALUES (:nome, :area_total, :localizacao, :tipo_solo)
+        RETURNING id INTO :id_retorno
+    """,
+    
+    'colheita_lote': """
+        INSERT INTO colheitas (propriedade_id, data_colheita, area_colhida, 
+                              quantidade_colhida, tipo_colheita, produtividade, percentual_perda)
+        VALUES (:propriedade_id, TO_DATE(:data_colheita, 'DD/MM/YYYY'), :area_colhida,
+                :quantidade_colhida, :tipo_colheita, :produtividade, :percentual_perda)
+        RETURNING id INTO :id_retorno
     """
 }
 
@@ -151,6 +338,98 @@ SQL_SELECT = {
         ORDER BY c.data_colheita DESC
     """,
     
+    'historico_completo': """
+        SELECT p.id, p.nome, p.area_total, p.localizacao, p.tipo_solo, p.data_cadastro,
+               c.id, c.data_colheita, c.area_colhida, c.quantidade_colhida,
+               c.tipo_colheita, c.data_registro
+        FROM propriedades p
+        LEFT JOIN colheitas c ON c.propriedade_id = p.id
+            AND c.data_colheita >= :data_inicio AND c.data_colheita < :data_fim
+        ORDER BY p.nome, p.id, c.data_colheita DESC
+    """,
+    
+    'propriedades_desde': """
+        SELECT id, nome, area_total, localizacao, tipo_solo, data_cadastro
+        FROM propriedades
+        WHERE data_cadastro >= :desde
+        ORDER BY data_cadastro
+    """,
+    
+    'colheitas_desde': """
+        SELECT id, propriedade_id, data_colheita, area_colhida, quantidade_colhida,
+               tipo_colheita, produtividade, percentual_perda, data_registro
+        FROM colheitas
+        WHERE data_registro >= :desde
+        ORDER BY data_registro
+    """,
+    
+    'data_servidor': """
+        SELECT SYSDATE FROM DUAL
+    """,
+    
+    'tabela_particionada': """
+        SELECT partitioning_type, interval
+        FROM user_part_tables
+        WHERE table_name = 'COLHEITAS'
+    """,
+    
+    # high_value é LONG: o limite da partição chega como texto (TO_DATE(' 2024-05-01 00:00:00', ...))
+    'particoes_colheitas': """
+        SELECT partition_name, high_value
+        FROM user_tab_partitions
+        WHERE table_name = 'COLHEITAS'
+        ORDER BY partition_position
+    """,
+    
+    # Tabelas de arquivo criadas por arquivamentos anteriores (o _ é curinga no LIKE: escapado)
+    'tabelas_arquivo_colheitas': r"""
+        SELECT table_name
+        FROM user_tables
+        WHERE table_name LIKE 'COLHEITAS\_ARQ\_%' ESCAPE '\'
+    """,
+    
+    'visao_estatisticas': """
+        SELECT mview_name
+        FROM user_mviews
+        WHERE mview_name = 'ESTATISTICAS_PROPRIEDADES'
+    """,
+    
+    'indices_existentes': """
+        SELECT index_name, status
+        FROM user_indexes
+        WHERE table_name IN ('PROPRIEDADES', 'COLHEITAS')
+    """,
+    
+    # Relatório de perdas agregado no servidor (limites iguais aos de classificar_perda)
+    'relatorio_perdas_resumo': """
+        SELECT
+            COUNT(*) as total_colheitas,
+            ROUND(AVG(NVL(percentual_perda, 0)), 2) as perda_media,
+            MIN(NVL(percentual_perda, 0)) as perda_minima,
+            MAX(NVL(percentual_perda, 0)) as perda_maxima,
+            SUM(CASE WHEN NVL(percentual_perda, 0) <= 5 THEN 1 ELSE 0 END) as qtd_baixa,
+            SUM(CASE WHEN percentual_perda > 5 AND percentual_perda <= 10 THEN 1 ELSE 0 END) as qtd_media,
+            SUM(CASE WHEN percentual_perda > 10 AND percentual_perda <= 15 THEN 1 ELSE 0 END) as qtd_alta,
+            SUM(CASE WHEN percentual_perda > 15 THEN 1 ELSE 0 END) as qtd_critica,
+            SUM(CASE WHEN tipo_colheita = 'manual' THEN 1 ELSE 0 END) as qtd_manual,
+            ROUND(AVG(CASE WHEN tipo_colheita = 'manual' THEN NVL(percentual_perda, 0) END), 2) as perda_manual,
+            SUM(CASE WHEN tipo_colheita = 'mecanica' THEN 1 ELSE 0 END) as qtd_mecanica,
+            ROUND(AVG(CASE WHEN tipo_colheita = 'mecanica' THEN NVL(percentual_perda, 0) END), 2) as perda_mecanica
+        FROM colheitas
+        WHERE data_colheita >= :data_inicio AND data_colheita < :data_fim
+    """,
+    
+    'relatorio_perdas_criticas': """
+        SELECT p.nome, p.tipo_solo, c.data_colheita, c.area_colhida, c.quantidade_colhida,
+               c.tipo_colheita, c.produtividade, c.percentual_perda
+        FROM colheitas c
+        JOIN propriedades p ON c.propriedade_id = p.id
+        WHERE c.percentual_perda > 15
+          AND c.data_colheita >= :data_inicio AND c.data_colheita < :data_fim
+        ORDER BY c.percentual_perda DESC
+        FETCH FIRST :limite ROWS ONLY
+    """,
+    
     'estatisticas_gerais': """
         SELECT 
             COUNT(DISTINCT p.id) as total_propriedades,
@@ -161,9 +440,194 @@ SQL_SELECT = {
             AVG(c.percentual_perda) as perda_media
         FROM propriedades p
         LEFT JOIN colheitas c ON p.id = c.propriedade_id
+    """,
+    
+    # Mesmas colunas de estatisticas_gerais a partir dos totais por propriedade
+    # (custo proporcional às propriedades, não ao histórico de colheitas)
+    'estatisticas_resumo': """
+        SELECT 
+            (SELECT COUNT(*) FROM propriedades) as total_propriedades,
+            SUM(total_colheitas) as total_colheitas,
+            SUM(area_colhida) as area_total_colhida,
+            SUM(quantidade_colhida) as quantidade_total_colhida,
+            SUM(soma_produtividade) / NULLIF(SUM(qtd_produtividade), 0) as produtividade_media,
+            SUM(soma_percentual_perda) / NULLIF(SUM(qtd_percentual_perda), 0) as perda_media
+        FROM estatisticas_propriedades
+    """
+}
+
+# Corpo dos gatilhos de estatisticas_propriedades no SQLite (NEW = colheita incluída, OLD = removida)
+_SOMAR_ESTATISTICAS = """
+    INSERT INTO estatisticas_propriedades VALUES (
+        NEW.propriedade_id, 1,
+        NEW.area_colhida IS NOT NULL, IFNULL(NEW.area_colhida, 0),
+        NEW.quantidade_colhida IS NOT NULL, IFNULL(NEW.quantidade_colhida, 0),
+        NEW.produtividade IS NOT NULL, IFNULL(NEW.produtividade, 0),
+        NEW.percentual_perda IS NOT NULL, IFNULL(NEW.percentual_perda, 0)
+    )
+    ON CONFLICT (propriedade_id) DO UPDATE SET
+        total_colheitas = total_colheitas + 1,
+        qtd_area_colhida = qtd_area_colhida + excluded.qtd_area_colhida,
+        area_colhida = area_colhida + excluded.area_colhida,
+        qtd_quantidade_colhida = qtd_quantidade_colhida + excluded.qtd_quantidade_colhida,
+        quantidade_colhida = quantidade_colhida + excluded.quantidade_colhida,
+        qtd_produtividade = qtd_produtividade + excluded.qtd_produtividade,
+        soma_produtividade = soma_produtividade + excluded.soma_produtividade,
+        qtd_percentual_perda = qtd_percentual_perda + excluded.qtd_percentual_perda,
+        soma_percentual_perda = soma_percentual_perda + excluded.soma_percentual_perda;
+"""
+
+_SUBTRAIR_ESTATISTICAS = """
+    UPDATE estatisticas_propriedades SET
+        total_colheitas = total_colheitas - 1,
+        qtd_area_colhida = qtd_area_colhida - (OLD.area_colhida IS NOT NULL),
+        area_colhida = area_colhida - IFNULL(OLD.area_colhida, 0),
+        qtd_quantidade_colhida = qtd_quantidade_colhida - (OLD.quantidade_colhida IS NOT NULL),
+        quantidade_colhida = quantidade_colhida - IFNULL(OLD.quantidade_colhida, 0),
+        qtd_produtividade = qtd_produtividade - (OLD.produtividade IS NOT NULL),
+        soma_produtividade = soma_produtividade - IFNULL(OLD.produtividade, 0),
+        qtd_percentual_perda = qtd_percentual_perda - (OLD.percentual_perda IS NOT NULL),
+        soma_percentual_perda = soma_percentual_perda - IFNULL(OLD.percentual_perda, 0)
+    WHERE propriedade_id = OLD.propriedade_id;
+    DELETE FROM estatisticas_propriedades WHERE propriedade_id = OLD.propriedade_id AND total_colheitas = 0;
+"""
+
+# Mesmo esquema de SQL_CREATE_TABLES no dialeto do SQLite (datas em texto ISO 8601)
+SQL_CREATE_TABLES_SQLITE = {
+    'propriedades': """
+        CREATE TABLE IF NOT EXISTS propriedades (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            nome TEXT NOT NULL UNIQUE,
+            area_total REAL NOT NULL CHECK (area_total > 0),
+            localizacao TEXT NOT NULL,
+            tipo_solo TEXT NOT NULL,
+            data_cadastro TEXT NOT NULL DEFAULT (datetime('now', 'localtime'))
+        )
+    """,
+    
+    'colheitas': """
+        CREATE TABLE IF NOT EXISTS colheitas (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            propriedade_id INTEGER NOT NULL,
+            data_colheita TEXT NOT NULL,
+            area_colhida REAL NOT NULL CHECK (area_colhida > 0),
+            quantidade_colhida REAL NOT NULL CHECK (quantidade_colhida > 0),
+            tipo_colheita TEXT NOT NULL CHECK (tipo_colheita IN ('manual', 'mecanica')),
+            produtividade REAL,
+            percentual_perda REAL,
+            data_registro TEXT NOT NULL DEFAULT (datetime('now', 'localtime')),
+            CONSTRAINT fk_colheita_propriedade
+                FOREIGN KEY (propriedade_id) REFERENCES propriedades(id) ON DELETE CASCADE
+        )
+    """,
+    
+    # Mesmos índices de SQL_CREATE_TABLES['indices']
+    'indices': {
+        'idx_propriedades_nome_upper': "CREATE UNIQUE INDEX IF NOT EXISTS idx_propriedades_nome_upper "
+                                       "ON propriedades (UPPER(nome))",
+        'idx_colheitas_propriedade_data': "CREATE INDEX IF NOT EXISTS idx_colheitas_propriedade_data "
+                                          "ON colheitas (propriedade_id, data_colheita)",
+        'idx_propriedades_data_cadastro': "CREATE INDEX IF NOT EXISTS idx_propriedades_data_cadastro "
+                                          "ON propriedades (data_cadastro)",
+        'idx_colheitas_data_registro': "CREATE INDEX IF NOT EXISTS idx_colheitas_data_registro ON colheitas (data_registro)",
+        'idx_colheitas_percentual_perda': "CREATE INDEX IF NOT EXISTS idx_colheitas_percentual_perda "
+                                          "ON colheitas (percentual_perda)"
+    },
+    
+    'indice_nome_sem_unicidade': "CREATE INDEX IF NOT EXISTS idx_propriedades_nome_upper ON propriedades (UPPER(nome))",
+    
+    # Equivalente à visão materializada estatisticas_propriedades: tabela mantida por gatilhos
+    'estatisticas': {
+        'tabela': """
+            CREATE TABLE IF NOT EXISTS estatisticas_propriedades (
+                propriedade_id INTEGER PRIMARY KEY,
+                total_colheitas INTEGER NOT NULL,
+                qtd_area_colhida INTEGER NOT NULL,
+                area_colhida REAL NOT NULL,
+                qtd_quantidade_colhida INTEGER NOT NULL,
+                quantidade_colhida REAL NOT NULL,
+                qtd_produtividade INTEGER NOT NULL,
+                soma_produtividade REAL NOT NULL,
+                qtd_percentual_perda INTEGER NOT NULL,
+                soma_percentual_perda REAL NOT NULL
+            )
+        """,
+        'gatilho_inserir': f"""
+            CREATE TRIGGER IF NOT EXISTS trg_estatisticas_inserir AFTER INSERT ON colheitas
+            BEGIN {_SOMAR_ESTATISTICAS} END
+        """,
+        'gatilho_remover': f"""
+            CREATE TRIGGER IF NOT EXISTS trg_estatisticas_remover AFTER DELETE ON colheitas
+            BEGIN {_SUBTRAIR_ESTATISTICAS} END
+        """,
+        'gatilho_atualizar': f"""
+            CREATE TRIGGER IF NOT EXISTS trg_estatisticas_atualizar
+            AFTER UPDATE OF propriedade_id, area_colhida, quantidade_colhida, produtividade, percentual_perda
+            ON colheitas
+            BEGIN {_SUBTRAIR_ESTATISTICAS} {_SOMAR_ESTATISTICAS} END
+        """
+    },
+    
+    # Carga inicial da tabela de estatísticas em um banco que já tinha colheitas
+    'estatisticas_carga': """
+        INSERT INTO estatisticas_propriedades
+        SELECT propriedade_id, COUNT(*),
+               COUNT(area_colhida), IFNULL(SUM(area_colhida), 0),
+               COUNT(quantidade_colhida), IFNULL(SUM(quantidade_colhida), 0),
+               COUNT(produtividade), IFNULL(SUM(produtividade), 0),
+               COUNT(percentual_perda), IFNULL(SUM(percentual_perda), 0)
+        FROM colheitas
+        GROUP BY propriedade_id
+    """
+}
+
+SQL_INSERT_SQLITE = {
+    'propriedade': SQL_INSERT['propriedade'],
+    
+    # Data já convertida para AAAA-MM-DD antes do bind
+    'colheita': """
+        INSERT INTO colheitas (propriedade_id, data_colheita, area_colhida,
+                              quantidade_colhida, tipo_colheita, produtividade, percentual_perda)
+        VALUES (:propriedade_id, :data_colheita, :area_colhida,
+                :quantidade_colhida, :tipo_colheita, :produtividade, :percentual_perda)
     """
 }
 
+# Consultas de SQL_SELECT que dependem do dialeto; as demais valem para os dois bancos
+SQL_SELECT_SQLITE = dict(
+    SQL_SELECT,
+    data_servidor="""
+        SELECT datetime('now', 'localtime')
+    """,
+    relatorio_perdas_resumo="""
+        SELECT
+            COUNT(*) as total_colheitas,
+            ROUND(AVG(IFNULL(percentual_perda, 0)), 2) as perda_media,
+            MIN(IFNULL(percentual_perda, 0)) as perda_minima,
+            MAX(IFNULL(percentual_perda, 0)) as perda_maxima,
+            SUM(CASE WHEN IFNULL(percentual_perda, 0) <= 5 THEN 1 ELSE 0 END) as qtd_baixa,
+            SUM(CASE WHEN percentual_perda > 5 AND percentual_perda <= 10 THEN 1 ELSE 0 END) as qtd_media,
+            SUM(CASE WHEN percentual_perda > 10 AND percentual_perda <= 15 THEN 1 ELSE 0 END) as qtd_alta,
+            SUM(CASE WHEN percentual_perda > 15 THEN 1 ELSE 0 END) as qtd_critica,
+            SUM(CASE WHEN tipo_colheita = 'manual' THEN 1 ELSE 0 END) as qtd_manual,
+            ROUND(AVG(CASE WHEN tipo_colheita = 'manual' THEN IFNULL(percentual_perda, 0) END), 2) as perda_manual,
+            SUM(CASE WHEN tipo_colheita = 'mecanica' THEN 1 ELSE 0 END) as qtd_mecanica,
+            ROUND(AVG(CASE WHEN tipo_colheita = 'mecanica' THEN IFNULL(percentual_perda, 0) END), 2) as perda_mecanica
+        FROM colheitas
+        WHERE data_colheita >= :data_inicio AND data_colheita < :data_fim
+    """,
+    relatorio_perdas_criticas="""
+        SELECT p.nome, p.tipo_solo, c.data_colheita, c.area_colhida, c.quantidade_colhida,
+               c.tipo_colheita, c.produtividade, c.percentual_perda
+        FROM colheitas c
+        JOIN propriedades p ON c.propriedade_id = p.id
+        WHERE c.percentual_perda > 15
+          AND c.data_colheita >= :data_inicio AND c.data_colheita < :data_fim
+        ORDER BY c.percentual_perda DESC
+        LIMIT :limite
+    """
+)
+
 def exibir_configuracao():
     """
     Exibe as configurações atuais do banco (sem mostrar senha)
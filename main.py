@@ -1,3 +1,12 @@
+import sys
+
+# Com argumentos, executa o comando sem o menu (ex: python main.py report --format json).
+# O despacho vem antes das importações do menu para que a linha de comando só carregue
+# os módulos que o comando usa.
+if __name__ == "__main__" and len(sys.argv) > 1:
+    from src.cli import executar_cli
+    sys.exit(executar_cli(sys.argv[1:]))
+
 from colorama import Fore, Style
 from src.utils.menu_utils import (
     exibir_menu_principal, 
@@ -6,13 +15,14 @@ from src.utils.menu_utils import (
     exibir_mensagem_info,
     exibir_cabecalho,
     pausar_execucao,
-    confirmar_acao,
     limpar_tela,
-    exibir_rodape
+    exibir_rodape,
+    inicializar_terminal
 )
 
 from src.services import (
     inicializar_sistema,
+    finalizar_sistema,
     cadastrar_propriedade_integrado,
     registrar_colheita_integrado,
     gerar_relatorio_integrado,
@@ -23,6 +33,7 @@ from src.services import (
     exibir_status_sistema,
     exibir_resumo_colheitas
 )
+from src.services.propriedade_service import mesclar_propriedades
 
 # Lista global para armazenar propriedades (temporariamente)
 propriedades_cadastradas = []
@@ -71,10 +82,17 @@ def processar_opcao_menu(opcao):
         exibir_cabecalho("Importar Backup")
         propriedades_importadas = importar_backup_integrado()
         if propriedades_importadas:
-            if confirmar_acao("Deseja substituir os dados atuais pelos dados importados?"):
+            print("\n1. Substituir todos os dados atuais pelos importados")
+            print("2. Mesclar (substitui só as propriedades importadas, mantém as demais)")
+            print("0. Manter os dados atuais")
+            escolha = input("Escolha uma opção: ").strip()
+            if escolha == '1':
                 propriedades_cadastradas.clear()
                 propriedades_cadastradas.extend(propriedades_importadas)
                 exibir_mensagem_sucesso("Dados importados com sucesso!")
+            elif escolha == '2':
+                substituidas, adicionadas = mesclar_propriedades(propriedades_cadastradas, propriedades_importadas)
+                exibir_mensagem_sucesso(f"Dados mesclados: {substituidas} substituída(s), {adicionadas} adicionada(s).")
             else:
                 exibir_mensagem_info("Dados não foram alterados.")
         pausar_execucao()
@@ -98,6 +116,8 @@ def main():
     """
     Função principal do sistema - Loop principal do menu
     """
+    inicializar_terminal()
+    
     # Limpar tela e exibir boas-vindas
     limpar_tela()
     
@@ -136,6 +156,9 @@ def main():
             print(f"{Fore.YELLOW}🔄 Reiniciando o menu...")
             pausar_execucao()
     
+    # Liberar conexões do pool antes de sair
+    finalizar_sistema()
+    
     # Exibir rodapé de despedida
     exibir_rodape()
 
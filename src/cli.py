@@ -0,0 +1,575 @@
+"""
+Módulo da linha de comando (execução não interativa)
+Permite gerar relatórios, backups, importações e sincronizações sem o menu,
+por exemplo em tarefas agendadas:
+
+    python main.py report --backup backup_colheitas.jsonl.gz --format json
+    python main.py report --no-servidor --inicio 01/04/2024 --fim 31/03/2025
+    python main.py backup --compressao gzip --incremental
+    python main.py import escritorio_a.jsonl escritorio_b.jsonl colheitas.csv --salvar consolidado
+    python main.py sync consolidado.jsonl
+    python main.py stats --format csv
+    python main.py archive --ate 01/04/2020
+    python main.py startup --format json -- report --backup backup_colheitas.jsonl.gz
+
+O resultado vai para stdout; mensagens e erros vão para stderr.
+"""
+
+import argparse
+import csv
+import json
+import os
+import sys
+from datetime import datetime
+
+from src.utils.menu_utils import definir_modo_nao_interativo
+from src.utils.instrumentacao import ativar_instrumentacao, exportar_trace_chrome
+
+# Códigos de saída
+CODIGO_SUCESSO = 0
+CODIGO_ERRO = 1
+CODIGO_USO_INVALIDO = 2          # Usado pelo argparse para argumentos inválidos
+CODIGO_BANCO_INDISPONIVEL = 3
+CODIGO_DADOS_INVALIDOS = 4       # Arquivo ausente, backup/CSV inválido
+CODIGO_PERDAS_CRITICAS = 5       # report --falhar-com-criticas encontrou perdas críticas
+
+FORMATOS_SAIDA = ('text', 'json', 'csv')
+
+class _ErroCli(Exception):
+    """
+    Erro que encerra o comando com um código de saída específico
+    """
+
+    def __init__(self, mensagem, codigo=CODIGO_ERRO):
+        super().__init__(mensagem)
+        self.codigo = codigo
+
+def _exigir_banco():
+    """
+    Garante que o banco de dados (Oracle ou SQLite local) está disponível
+
+    Raises:
+        _ErroCli: Com CODIGO_BANCO_INDISPONIVEL se não houver conexão
+    """
+    from src.services.sistema_integrado import verificar_banco_disponivel
+
+    if not verificar_banco_disponivel():
+        raise _ErroCli("banco de dados não disponível", CODIGO_BANCO_INDISPONIVEL)
+
+def _carregar_propriedades(nome_backup):
+    """
+    Carrega as propriedades de um backup ou, se nenhum for informado, do banco
+
+    Args:
+        nome_backup (str): Nome do backup em scripts/data (ou caminho) ou None
+
+    Returns:
+        list: Propriedades carregadas
+    """
+    if nome_backup is None:
+        _exigir_banco()
+        from src.services.repositorio_service import carregar_repositorio
+
+        propriedades = carregar_repositorio()
+        if propriedades is None:
+            raise _ErroCli("erro ao carregar os dados do banco")
+        return propriedades
+
+    from src.services.file_service import restaurar_backup, obter_pasta_backup
+
+    if not os.path.exists(os.path.join(obter_pasta_backup(), nome_backup)):
+        raise _ErroCli(f"backup não encontrado: {nome_backup}", CODIGO_DADOS_INVALIDOS)
+
+    try:
+        return restaurar_backup(nome_backup)
+    except (ValueError, OSError, EOFError) as e:
+        raise _ErroCli(f"backup inválido ({nome_backup}): {e}", CODIGO_DADOS_INVALIDOS)
+
+def _data_argumento(texto):
+    """
+    Converte um argumento DD/MM/AAAA em date (type do argparse)
+
+    Args:
+        texto (str): Data informada
+
+    Returns:
+        date: Data convertida
+    """
+    from src.utils.validation import validar_data
+
+    valida, mensagem = validar_data(texto)
+    if not valida:
+        raise argparse.ArgumentTypeError(mensagem)
+    return datetime.strptime(texto.strip(), '%d/%m/%Y').date()
+
+def _converter_criticas(criticas):
+    """
+    Converte a lista de perdas críticas do relatório em dicionários simples
+
+    Args:
+        criticas (list): Perdas críticas (formato de obter_relatorio_perdas_oracle)
+
+    Returns:
+        list: Dicionários sem objetos Colheita
+    """
+    from src.services.file_service import converter_colheita_para_dict
+
+    return [{
+        'propriedade': critica['propriedade'],
+        'tipo_solo': critica['tipo_solo'],
+        **converter_colheita_para_dict(critica['colheita']),
+        'percentual_perda': critica['percentual_perda']
+    } for critica in criticas]
+
+def comando_report(argumentos):
+    """
+    Relatório de perdas (resumo e perdas críticas)
+
+    Returns:
+        tuple: (dados, código de saída)
+    """
+    from src.services.calculation_service import calcular_relatorio_perdas
+
+    periodo = argumentos.inicio is not None or argumentos.fim is not None
+    if periodo and not (argumentos.no_servidor and argumentos.backup is None):
+        raise _ErroCli("--inicio/--fim exigem --no-servidor (filtro feito no banco)", CODIGO_USO_INVALIDO)
+    if argumentos.inicio and argumentos.fim and argumentos.inicio > argumentos.fim:
+        raise _ErroCli("--inicio deve ser anterior ou igual a --fim", CODIGO_USO_INVALIDO)
+
+    if argumentos.no_servidor and argumentos.backup is None:
+        _exigir_banco()
+        from src.services.armazenamento_service import obter_relatorio_perdas_oracle, backend_em_uso
+
+        relatorio = obter_relatorio_perdas_oracle(argumentos.limite_criticas, argumentos.inicio, argumentos.fim)
+        if relatorio is None:
+            raise _ErroCli("erro ao gerar o relatório no banco")
+        origem = backend_em_uso()
+    else:
+        relatorio = calcular_relatorio_perdas(_carregar_propriedades(argumentos.backup), argumentos.limite_criticas)
+        if argumentos.backup is not None:
+            origem = argumentos.backup
+        else:
+            # Sem --backup as propriedades vêm do banco (cálculo em memória)
+            from src.services.armazenamento_service import backend_em_uso
+            origem = backend_em_uso()
+
+    dados = {
+        'origem': origem,
+        'periodo': {
+            'inicio': argumentos.inicio.isoformat() if argumentos.inicio else None,
+            'fim': argumentos.fim.isoformat() if argumentos.fim else None
+        },
+        'resumo': relatorio['resumo'],
+        'criticas': _converter_criticas(relatorio['criticas'])
+    }
+
+    codigo = CODIGO_SUCESSO
+    if argumentos.falhar_com_criticas and relatorio['resumo']['distribuicao'].get('Crítica'):
+        codigo = CODIGO_PERDAS_CRITICAS
+
+    return dados, codigo
+
+def comando_archive(argumentos):
+    """
+    Arquiva as partições de colheitas anteriores a uma data (Oracle particionado)
+
+    Returns:
+        tuple: (dados, código de saída)
+    """
+    _exigir_banco()
+    from src.services.armazenamento_service import arquivar_particoes_colheitas
+
+    arquivadas = arquivar_particoes_colheitas(argumentos.ate)
+    if arquivadas is None:
+        raise _ErroCli("não foi possível arquivar as partições")
+
+    return {
+        'ate': argumentos.ate.isoformat(),
+        'particoes': [dict(particao, limite=particao['limite'].isoformat()) for particao in arquivadas],
+        'colheitas_arquivadas': sum(particao['colheitas'] for particao in arquivadas)
+    }, CODIGO_SUCESSO
+
+def comando_backup(argumentos):
+    """
+    Backup completo ou incremental dos dados do banco (ou conversão de um backup)
+
+    Returns:
+        tuple: (dados, código de saída)
+    """
+    from src.services.file_service import (
+        salvar_backup_json,
+        salvar_backup_incremental,
+        carregar_manifesto,
+        carregar_catalogo,
+        obter_pasta_backup
+    )
+
+    propriedades = _carregar_propriedades(argumentos.backup)
+    manifesto = carregar_manifesto()
+    ultimo_anterior = manifesto['ultimo'] if manifesto else None
+
+    if argumentos.incremental:
+        sucesso = salvar_backup_incremental(propriedades, argumentos.compressao, argumentos.nivel)
+    else:
+        sucesso = salvar_backup_json(propriedades, argumentos.arquivo, argumentos.formato,
+                                     argumentos.compressao, argumentos.nivel)
+    if not sucesso:
+        raise _ErroCli("erro ao salvar o backup")
+
+    # O manifesto aponta para o último backup gravado
+    manifesto = carregar_manifesto()
+    nome = manifesto['ultimo'] if manifesto else None
+    if nome is None or (argumentos.incremental and nome == ultimo_anterior):
+        return {'arquivo': None, 'alteracoes': False}, CODIGO_SUCESSO
+
+    entrada = carregar_catalogo(obter_pasta_backup()).get(nome, {'nome': nome})
+    return {**entrada, 'alteracoes': True}, CODIGO_SUCESSO
+
+def _importar_arquivos(argumentos):
+    """
+    Lê e mescla backups e CSVs de colheitas (base dos comandos import e sync)
+
+    Backups são lidos em paralelo e mesclados; os CSVs são aplicados em
+    seguida, sobre as propriedades mescladas.
+
+    Returns:
+        tuple: (propriedades, dados do resultado)
+    """
+    from src.services.importacao_lote_service import mesclar_backups
+    from src.services.importacao_csv_service import importar_colheitas_csv
+
+    csvs = [arquivo for arquivo in argumentos.arquivos if arquivo.lower().endswith('.csv')]
+    backups = [arquivo for arquivo in argumentos.arquivos if not arquivo.lower().endswith('.csv')]
+
+    dados = {}
+    if backups:
+        propriedades, relatorio = mesclar_backups(backups, argumentos.processos)
+        if relatorio['falhas']:
+            raise _ErroCli("; ".join(f"{arquivo}: {erro}" for arquivo, erro in relatorio['falhas']),
+                           CODIGO_DADOS_INVALIDOS)
+        dados['backups'] = {chave: valor for chave, valor in relatorio.items() if chave != 'falhas'}
+    else:
+        propriedades = _carregar_propriedades(argumentos.base)
+
+    dados['csv'] = []
+    for caminho_csv in csvs:
+        try:
+            relatorio = importar_colheitas_csv(caminho_csv, propriedades,
+                                               rejeitar_suspeitas=argumentos.rejeitar_suspeitas)
+        except (ValueError, OSError, UnicodeDecodeError, csv.Error) as e:
+            raise _ErroCli(f"CSV inválido ({caminho_csv}): {e}", CODIGO_DADOS_INVALIDOS)
+        dados['csv'].append({'arquivo': caminho_csv, **relatorio})
+
+    dados['total_propriedades'] = len(propriedades)
+    dados['total_colheitas'] = sum(len(propriedade.colheitas) for propriedade in propriedades)
+
+    return propriedades, dados
+
+def comando_import(argumentos):
+    """
+    Importa backups/CSVs e, opcionalmente, grava o resultado como um novo backup
+
+    Returns:
+        tuple: (dados, código de saída)
+    """
+    propriedades, dados = _importar_arquivos(argumentos)
+
+    if argumentos.salvar:
+        from src.services.file_service import salvar_backup_json
+
+        if not salvar_backup_json(propriedades, argumentos.salvar, atualizar_manifesto=False):
+            raise _ErroCli("erro ao salvar o backup consolidado")
+        dados['backup_salvo'] = argumentos.salvar
+
+    return dados, CODIGO_SUCESSO
+
+def comando_sync(argumentos):
+    """
+    Importa backups/CSVs e grava no banco com inserção em lote
+
+    Returns:
+        tuple: (dados, código de saída)
+    """
+    _exigir_banco()
+    propriedades, dados = _importar_arquivos(argumentos)
+
+    from src.services.sistema_integrado import sincronizar_com_banco
+
+    dados['sincronizado'] = sincronizar_com_banco(propriedades, em_lote=True, tamanho_lote=argumentos.tamanho_lote)
+    return dados, CODIGO_SUCESSO if dados['sincronizado'] else CODIGO_ERRO
+
+def comando_stats(argumentos):
+    """
+    Estatísticas gerais do banco de dados ou de um backup
+
+    Returns:
+        tuple: (dados, código de saída)
+    """
+    if argumentos.backup is not None:
+        from src.services.colheita_service import obter_estatisticas_colheitas
+
+        propriedades = _carregar_propriedades(argumentos.backup)
+        return {
+            'origem': argumentos.backup,
+            'total_propriedades': len(propriedades),
+            **obter_estatisticas_colheitas(propriedades)
+        }, CODIGO_SUCESSO
+
+    _exigir_banco()
+    from src.services.armazenamento_service import (
+        obter_estatisticas_banco, obter_estatisticas_pool, backend_em_uso
+    )
+
+    estatisticas = obter_estatisticas_banco(argumentos.exato)
+    if estatisticas is None:
+        raise _ErroCli("erro ao obter estatísticas do banco")
+
+    dados = {'origem': backend_em_uso(), **estatisticas}
+    pool = obter_estatisticas_pool()
+    if pool:
+        dados['pool'] = pool
+    return dados, CODIGO_SUCESSO
+
+def _ler_importtime(saida_erro):
+    """
+    Interpreta as linhas de 'python -X importtime' (microssegundos, indentação = profundidade)
+
+    Args:
+        saida_erro (str): stderr do processo medido
+
+    Returns:
+        list: Dicionários com 'modulo', 'profundidade', 'proprio_us' e 'acumulado_us'
+    """
+    modulos = []
+    for linha in saida_erro.splitlines():
+        if not linha.startswith('import time:'):
+            continue
+        proprio, acumulado, nome = linha[len('import time:'):].split('|')
+        if not proprio.strip().isdigit():
+            continue  # cabeçalho da tabela
+        modulos.append({
+            'modulo': nome.strip(),
+            'profundidade': (len(nome) - len(nome.lstrip()) - 1) // 2,
+            'proprio_us': int(proprio),
+            'acumulado_us': int(acumulado)
+        })
+    return modulos
+
+def comando_startup(argumentos):
+    """
+    Mede a inicialização de um comando (tempo total e importações, como -X importtime)
+
+    Returns:
+        tuple: (dados, código de saída)
+    """
+    import subprocess
+    import time
+
+    raiz = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    comando = [arg for arg in argumentos.comando if arg != '--']
+    if comando:
+        processo = [sys.executable, '-X', 'importtime', '-m', 'src.cli', *comando]
+    else:
+        processo = [sys.executable, '-X', 'importtime', '-c', 'import src.cli']
+
+    inicio = time.perf_counter()
+    resultado = subprocess.run(processo, cwd=raiz, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE,
+                               text=True, encoding='utf-8', errors='replace')
+    tempo_total = (time.perf_counter() - inicio) * 1000
+
+    modulos = _ler_importtime(resultado.stderr)
+    mais_lentos = sorted(modulos, key=lambda modulo: modulo['acumulado_us'], reverse=True)[:argumentos.top]
+
+    return {
+        'comando': ' '.join(comando) or 'import src.cli',
+        'codigo_saida': resultado.returncode,
+        'tempo_total_ms': round(tempo_total, 1),
+        'tempo_importacoes_ms': round(sum(m['acumulado_us'] for m in modulos if m['profundidade'] == 0) / 1000, 1),
+        'modulos_importados': len(modulos),
+        'limite_ms': argumentos.limite_ms,
+        'dentro_do_limite': tempo_total <= argumentos.limite_ms,
+        'mais_lentos': [{
+            'modulo': modulo['modulo'],
+            'proprio_ms': round(modulo['proprio_us'] / 1000, 2),
+            'acumulado_ms': round(modulo['acumulado_us'] / 1000, 2)
+        } for modulo in mais_lentos]
+    }, CODIGO_SUCESSO
+
+def _achatar(dados, prefixo=''):
+    """
+    Achata dicionários e listas aninhados em pares (campo, valor)
+
+    Args:
+        dados: Dicionário, lista ou valor simples
+        prefixo (str): Caminho do campo até aqui (ex: 'resumo.comparacao')
+
+    Returns:
+        list: Pares (campo, valor), com campos no formato 'a.b.0.c'
+    """
+    if isinstance(dados, dict):
+        itens = dados.items()
+    elif isinstance(dados, list):
+        itens = enumerate(dados)
+    else:
+        return [(prefixo, dados)]
+
+    pares = []
+    for chave, valor in itens:
+        campo = f"{prefixo}.{chave}" if prefixo else str(chave)
+        pares.extend(_achatar(valor, campo))
+    return pares
+
+def emitir_resultado(dados, formato, saida=None):
+    """
+    Escreve o resultado de um comando em text, json ou csv
+
+    Args:
+        dados (dict): Resultado do comando
+        formato (str): Um de FORMATOS_SAIDA
+        saida: Arquivo texto de saída (padrão: sys.stdout)
+    """
+    saida = saida or sys.stdout
+
+    if formato == 'json':
+        json.dump(dados, saida, ensure_ascii=False, indent=2, default=str)
+        saida.write('\n')
+    elif formato == 'csv':
+        escritor = csv.writer(saida, lineterminator='\n')
+        escritor.writerow(['campo', 'valor'])
+        escritor.writerows(_achatar(dados))
+    else:
+        for campo, valor in _achatar(dados):
+            saida.write(f"{campo}: {'' if valor is None else valor}\n")
+
+def criar_parser():
+    """
+    Monta o parser de argumentos com os subcomandos
+
+    Returns:
+        argparse.ArgumentParser: Parser configurado
+    """
+    comum = argparse.ArgumentParser(add_help=False)
+    comum.add_argument('--format', dest='formato_saida', choices=FORMATOS_SAIDA, default='text',
+                       help="formato do resultado em stdout (padrão: text)")
+    comum.add_argument('--quiet', action='store_true',
+                       help="não exibir mensagens informativas em stderr (erros continuam)")
+    comum.add_argument('--trace', metavar='ARQUIVO',
+                       help="medir o comando e gravar um trace do Chrome (chrome://tracing, Perfetto)")
+    comum.add_argument('--armazenamento', choices=('auto', 'oracle', 'sqlite'), default=None,
+                       help="banco usado: Oracle, SQLite local ou auto (padrão: SMPC_ARMAZENAMENTO ou auto)")
+
+    parser = argparse.ArgumentParser(
+        prog='main.py',
+        description="Sistema de monitoramento de perdas na colheita de cana-de-açúcar (modo não interativo). "
+                    "Sem argumentos, main.py abre o menu interativo."
+    )
+    subparsers = parser.add_subparsers(dest='comando', required=True, metavar='comando')
+
+    report = subparsers.add_parser('report', parents=[comum], help="relatório de perdas")
+    report.add_argument('--backup', help="calcular a partir de um backup (padrão: dados do banco)")
+    report.add_argument('--no-servidor', action='store_true', help="calcular o relatório no banco (GROUP BY)")
+    report.add_argument('--limite-criticas', type=int, default=100, help="máximo de perdas críticas listadas")
+    report.add_argument('--falhar-com-criticas', action='store_true',
+                        help=f"sair com código {CODIGO_PERDAS_CRITICAS} se houver perdas críticas")
+    report.add_argument('--inicio', type=_data_argumento, metavar='DD/MM/AAAA',
+                        help="apenas colheitas a partir desta data (com --no-servidor)")
+    report.add_argument('--fim', type=_data_argumento, metavar='DD/MM/AAAA',
+                        help="apenas colheitas até esta data, inclusive (com --no-servidor)")
+    report.set_defaults(funcao=comando_report)
+
+    backup = subparsers.add_parser('backup', parents=[comum], help="backup dos dados do banco")
+    backup.add_argument('--backup', help="ler de um backup existente em vez do banco (ex: converter formato)")
+    backup.add_argument('--arquivo', help="nome do arquivo (padrão: backup_colheitas_<data>)")
+    backup.add_argument('--formato', choices=('jsonl', 'json', 'snapshot'), default=None)
+    backup.add_argument('--compressao', choices=('gzip', 'lzma'), default=None)
+    backup.add_argument('--nivel', type=int, default=None, help="nível de compressão")
+    backup.add_argument('--incremental', action='store_true', help="gravar só o que mudou desde o último backup")
+    backup.set_defaults(funcao=comando_backup)
+
+    for nome, funcao, ajuda in (('import', comando_import, "mesclar backups e CSVs de colheitas"),
+                                ('sync', comando_sync, "mesclar backups/CSVs e gravar no banco")):
+        importacao = subparsers.add_parser(nome, parents=[comum], help=ajuda)
+        importacao.add_argument('arquivos', nargs='+', help="backups (scripts/data ou caminho) e arquivos .csv")
+        importacao.add_argument('--processos', type=int, default=None, help="processos de leitura (padrão: núcleos)")
+        importacao.add_argument('--base', help="backup com as propriedades dos CSVs, se nenhum backup for informado "
+                                               "(padrão: dados do banco)")
+        importacao.add_argument('--rejeitar-suspeitas', action='store_true',
+                                help="rejeitar linhas de CSV com produtividade suspeita")
+        if nome == 'import':
+            importacao.add_argument('--salvar', help="gravar o resultado mesclado como backup com este nome")
+        else:
+            importacao.add_argument('--tamanho-lote', type=int, default=None, help="linhas por lote no banco")
+        importacao.set_defaults(funcao=funcao)
+
+    stats = subparsers.add_parser('stats', parents=[comum], help="estatísticas gerais")
+    stats.add_argument('--backup', help="estatísticas de um backup (padrão: banco de dados)")
+    stats.add_argument('--exato', action='store_true',
+                       help="agregar todas as colheitas em vez de ler os totais mantidos pelo banco")
+    stats.set_defaults(funcao=comando_stats)
+
+    archive = subparsers.add_parser('archive', parents=[comum],
+                                    help="arquivar partições antigas de colheitas (Oracle particionado)")
+    archive.add_argument('--ate', type=_data_argumento, required=True, metavar='DD/MM/AAAA',
+                         help="arquivar as partições que terminam até esta data")
+    archive.set_defaults(funcao=comando_archive)
+
+    startup = subparsers.add_parser('startup', parents=[comum],
+                                    help="medir a inicialização de um comando (ex: startup -- report --backup x)")
+    startup.add_argument('comando', nargs=argparse.REMAINDER, help="comando a medir (padrão: só importar a CLI)")
+    startup.add_argument('--top', type=int, default=15, help="quantidade de módulos mais lentos listados")
+    startup.add_argument('--limite-ms', type=float, default=100.0, help="meta de tempo total de inicialização")
+    startup.set_defaults(funcao=comando_startup)
+
+    return parser
+
+def executar_cli(argv=None):
+    """
+    Executa um comando da linha de comando
+
+    Args:
+        argv (list): Argumentos (padrão: sys.argv[1:])
+
+    Returns:
+        int: Código de saída
+    """
+    argumentos = criar_parser().parse_args(argv)
+    definir_modo_nao_interativo(True, silencioso=argumentos.quiet)
+
+    # Lido por armazenamento_service na primeira operação com o banco
+    if getattr(argumentos, 'armazenamento', None):
+        os.environ['SMPC_ARMAZENAMENTO'] = argumentos.armazenamento
+
+    trace = getattr(argumentos, 'trace', None)
+    if trace:
+        ativar_instrumentacao(trace=True)
+
+    try:
+        dados, codigo = argumentos.funcao(argumentos)
+    except _ErroCli as e:
+        print(f"ERRO: {e}", file=sys.stderr)
+        return e.codigo
+    except KeyboardInterrupt:
+        print("ERRO: interrompido pelo usuário", file=sys.stderr)
+        return CODIGO_ERRO
+    except Exception as e:
+        print(f"ERRO: erro inesperado: {e}", file=sys.stderr)
+        return CODIGO_ERRO
+    finally:
+        # Só há conexões a encerrar se algum comando usou o banco
+        banco = sys.modules.get('src.services.armazenamento_service')
+        if banco is not None:
+            banco.encerrar_pool()
+        if trace:
+            eventos = exportar_trace_chrome(trace)
+            print(f"Trace com {eventos} chamada(s) gravado em {trace}", file=sys.stderr)
+
+    try:
+        emitir_resultado(dados, argumentos.formato_saida)
+        sys.stdout.flush()
+    except BrokenPipeError:
+        # Saída fechada pelo consumidor (ex: | head): descartar o restante sem erro
+        os.dup2(os.open(os.devnull, os.O_WRONLY), sys.stdout.fileno())
+    return codigo
+
+if __name__ == '__main__':
+    sys.exit(executar_cli())
@@ -2,11 +2,61 @@
 Módulo que define a classe Colheita para representar dados de colheita de cana-de-açúcar
 """
 
+import sys
+from datetime import date
+from enum import Enum
+
+class TipoColheita(Enum):
+    """
+    Tipos de colheita reconhecidos pelo sistema
+
+    Cada membro é único no processo, então todas as colheitas do mesmo tipo
+    compartilham o mesmo objeto e a comparação é feita por identidade.
+    """
+    MANUAL = 'manual'
+    MECANICA = 'mecanica'
+
+    @classmethod
+    def converter(cls, tipo):
+        """
+        Converte um texto (ex: 'Manual', ' mecanica ') para o membro correspondente
+
+        Args:
+            tipo (str): Tipo de colheita informado
+
+        Returns:
+            TipoColheita: Membro correspondente ou None se o tipo não for reconhecido
+        """
+        if isinstance(tipo, cls):
+            return tipo
+        return _TIPOS_POR_TEXTO.get(str(tipo).lower().strip())
+
+_TIPOS_POR_TEXTO = {tipo.value: tipo for tipo in TipoColheita}
+
+def converter_data(data_texto):
+    """
+    Converte uma data no formato DD/MM/AAAA para datetime.date
+
+    Args:
+        data_texto (str): Data no formato DD/MM/AAAA
+
+    Returns:
+        date: Data convertida ou None se o texto não for uma data válida
+    """
+    try:
+        dia, mes, ano = data_texto.strip().split('/')
+        return date(int(ano), int(mes), int(dia))
+    except (ValueError, AttributeError):
+        return None
+
 class Colheita:
     """
     Classe que representa uma colheita de cana-de-açúcar
 
-    
+    Usa __slots__ para reduzir a memória por objeto. A data é convertida uma
+    única vez na criação, o tipo é guardado como TipoColheita e a produtividade
+    é calculada quando área ou quantidade mudam, não a cada acesso.
+
     Args:
         data (str): Data da colheita no formato DD/MM/AAAA
         area_colhida (float): Área colhida em hectares
@@ -14,11 +64,22 @@ class Colheita:
         tipo_colheita (str): Tipo de colheita ('manual' ou 'mecanica')
         produtividade (float): Produtividade calculada em t/ha
     """
-    
+
+    __slots__ = (
+        '_data',
+        '_data_colheita',
+        '_area_colhida',
+        '_quantidade_colhida',
+        '_tipo',
+        '_produtividade',
+        'id'
+    )
+
     def __init__(self, data: str, area_colhida: float, quantidade_colhida: float, tipo_colheita: str):
         self.data = data
-        self.area_colhida = area_colhida
-        self.quantidade_colhida = quantidade_colhida
+        self._area_colhida = area_colhida
+        self._quantidade_colhida = quantidade_colhida
+        self._atualizar_produtividade()
         self.tipo_colheita = tipo_colheita
 
     def __str__(self):
@@ -30,55 +91,153 @@ Quantidade Colhida: {self.quantidade_colhida}
 Tipo Colheita: {self.tipo_colheita}
         """
 
+    @property
+    def data(self):
+        """
+        Data da colheita no formato DD/MM/AAAA
+
+        Returns:
+            str: Data da colheita
+        """
+        return self._data
+
+    @data.setter
+    def data(self, valor):
+        if isinstance(valor, date):
+            self._data_colheita = valor
+            self._data = valor.strftime('%d/%m/%Y')
+        else:
+            self._data = valor
+            self._data_colheita = converter_data(valor)
+
+    @property
+    def data_colheita(self):
+        """
+        Data da colheita já convertida
+
+        Returns:
+            date: Data da colheita ou None se o texto original não for uma data válida
+        """
+        return self._data_colheita
+
+    @property
+    def data_ordinal(self):
+        """
+        Data da colheita como número ordinal (date.toordinal), útil para ordenar e filtrar
+
+        Returns:
+            int: Ordinal da data ou 0 se a data for inválida
+        """
+        return self._data_colheita.toordinal() if self._data_colheita else 0
+
+    @property
+    def area_colhida(self):
+        """
+        Returns:
+            float: Área colhida em hectares
+        """
+        return self._area_colhida
+
+    @area_colhida.setter
+    def area_colhida(self, valor):
+        self._area_colhida = valor
+        self._atualizar_produtividade()
+
+    @property
+    def quantidade_colhida(self):
+        """
+        Returns:
+            float: Quantidade colhida em toneladas
+        """
+        return self._quantidade_colhida
+
+    @quantidade_colhida.setter
+    def quantidade_colhida(self, valor):
+        self._quantidade_colhida = valor
+        self._atualizar_produtividade()
+
+    @property
+    def tipo(self):
+        """
+        Tipo da colheita como membro de TipoColheita
+
+        Returns:
+            TipoColheita: Tipo da colheita ou None se não for reconhecido
+        """
+        tipo = self._tipo
+        return tipo if tipo.__class__ is TipoColheita else None
+
+    @property
+    def tipo_colheita(self):
+        """
+        Tipo da colheita em texto ('manual' ou 'mecanica')
+
+        Returns:
+            str: Tipo da colheita
+        """
+        tipo = self._tipo
+        return tipo.value if tipo.__class__ is TipoColheita else tipo
+
+    @tipo_colheita.setter
+    def tipo_colheita(self, valor):
+        tipo = TipoColheita.converter(valor)
+        # Tipos não reconhecidos são mantidos como texto (internado)
+        self._tipo = tipo if tipo is not None else sys.intern(str(valor))
+
+    def _atualizar_produtividade(self):
+        """
+        Recalcula a produtividade armazenada (quantidade ÷ área)
+        """
+        if self._area_colhida > 0:
+            self._produtividade = round(self._quantidade_colhida / self._area_colhida, 2)
+        else:
+            self._produtividade = 0.0
+
     @property
     def produtividade(self):
         """
         Propriedade que retorna a produtividade da colheita (quantidade ÷ área)
-        
+
         Returns:
             float: Produtividade em toneladas por hectare
         """
-        if self.area_colhida > 0:
-            return round(self.quantidade_colhida / self.area_colhida, 2)
-        return 0.0
+        return self._produtividade
 
     def calcular_produtividade(self):
         """
         Calcula a produtividade da colheita (quantidade ÷ área)
-        
+
         Returns:
             float: Produtividade em toneladas por hectare
         """
-        if self.area_colhida > 0:
-            return round(self.quantidade_colhida / self.area_colhida, 2)
-        return 0.0
+        return self._produtividade
 
     def obter_eficiencia(self):
         """
         Retorna uma classificação da eficiência baseada no tipo de colheita
-        
+
         Returns:
             str: Classificação da eficiência
         """
-        if self.tipo_colheita.lower() == 'manual':
+        if self._tipo is TipoColheita.MANUAL:
             return "Alta eficiência (colheita manual)"
         else:
             return "Eficiência padrão (colheita mecânica)"
-    
+
     def eh_colheita_manual(self):
         """
         Verifica se a colheita foi realizada manualmente
-        
+
         Returns:
             bool: True se for colheita manual, False caso contrário
         """
-        return self.tipo_colheita.lower() == 'manual'
-    
+        return self._tipo is TipoColheita.MANUAL
+
     def eh_colheita_mecanica(self):
         """
         Verifica se a colheita foi realizada mecanicamente
-        
+
         Returns:
             bool: True se for colheita mecânica, False caso contrário
         """
-        return self.tipo_colheita.lower() == 'mecanica'
\ No newline at end of file
+        return self._tipo is TipoColheita.MECANICA
@@ -0,0 +1,209 @@
+"""
+Módulo que define o armazenamento colunar das colheitas de uma propriedade
+Guarda cada campo em um array compacto em vez de um objeto Colheita por registro
+"""
+
+from array import array
+from datetime import date
+from src.models.colheita import Colheita, TipoColheita
+
+# Códigos da coluna de tipo (os mesmos usados pela análise vetorizada)
+CODIGO_MANUAL = 0
+CODIGO_MECANICA = 1
+CODIGO_OUTRO = 2
+
+_CODIGOS_TIPO = {TipoColheita.MANUAL: CODIGO_MANUAL, TipoColheita.MECANICA: CODIGO_MECANICA}
+_TIPOS_POR_CODIGO = {CODIGO_MANUAL: TipoColheita.MANUAL, CODIGO_MECANICA: TipoColheita.MECANICA}
+
+class ColheitasColunares:
+    """
+    Coleção de colheitas armazenada em colunas (array)
+
+    Comporta-se como uma lista de Colheita (len, iteração, índice, append),
+    mas cada colheita ocupa poucos bytes: área e quantidade em array('d'),
+    data como ordinal em array('i'), tipo como código em array('b') e ID em
+    array('q'). Objetos Colheita são criados apenas quando acessados.
+    Os totais de área e quantidade são mantidos a cada inclusão.
+
+    Attr:
+        areas (array): Áreas colhidas em hectares
+        quantidades (array): Quantidades colhidas em toneladas
+        datas (array): Datas como date.toordinal() (0 = data inválida, ver textos)
+        tipos (array): Códigos de tipo (CODIGO_MANUAL, CODIGO_MECANICA, CODIGO_OUTRO)
+        ids (array): IDs no banco (0 = ainda não gravada)
+        area_total (float): Soma das áreas
+        quantidade_total (float): Soma das quantidades
+    """
+
+    __slots__ = ('areas', 'quantidades', 'datas', 'tipos', 'ids', '_textos', 'area_total', 'quantidade_total')
+
+    def __init__(self, colheitas=()):
+        self.areas = array('d')
+        self.quantidades = array('d')
+        self.datas = array('i')
+        self.tipos = array('b')
+        self.ids = array('q')
+        # Valores que não cabem nas colunas (datas inválidas, tipos desconhecidos), por posição
+        self._textos = {}
+        self.area_total = 0.0
+        self.quantidade_total = 0.0
+
+        for colheita in colheitas:
+            self.append(colheita)
+
+    @classmethod
+    def de_colunas(cls, areas, quantidades, datas, tipos, ids, textos=None, area_total=None, quantidade_total=None):
+        """
+        Cria a coleção diretamente a partir de colunas já prontas (sem objetos Colheita)
+
+        Args:
+            areas, quantidades, datas, tipos, ids (array): Colunas nos tipos de ColheitasColunares
+            textos (dict): Datas inválidas e tipos desconhecidos, chaveados por ('data'|'tipo', posição)
+            area_total (float): Soma das áreas, se já conhecida
+            quantidade_total (float): Soma das quantidades, se já conhecida
+
+        Returns:
+            ColheitasColunares: Coleção usando as colunas informadas
+        """
+        colheitas = cls()
+        colheitas.areas = areas
+        colheitas.quantidades = quantidades
+        colheitas.datas = datas
+        colheitas.tipos = tipos
+        colheitas.ids = ids
+        colheitas._textos = textos or {}
+        colheitas.area_total = sum(areas) if area_total is None else area_total
+        colheitas.quantidade_total = sum(quantidades) if quantidade_total is None else quantidade_total
+        return colheitas
+
+    def __len__(self):
+        return len(self.areas)
+
+    def __iter__(self):
+        for indice in range(len(self.areas)):
+            yield self._criar_colheita(indice)
+
+    def __getitem__(self, indice):
+        if isinstance(indice, slice):
+            return [self._criar_colheita(i) for i in range(*indice.indices(len(self.areas)))]
+
+        if indice < 0:
+            indice += len(self.areas)
+        if not 0 <= indice < len(self.areas):
+            raise IndexError("índice de colheita fora do intervalo")
+
+        return self._criar_colheita(indice)
+
+    def append(self, colheita):
+        """
+        Adiciona uma colheita às colunas e atualiza os totais
+
+        Args:
+            colheita (Colheita): Colheita a ser armazenada
+        """
+        indice = len(self.areas)
+
+        self.areas.append(colheita.area_colhida)
+        self.quantidades.append(colheita.quantidade_colhida)
+
+        if colheita.data_colheita is not None:
+            self.datas.append(colheita.data_ordinal)
+        else:
+            self.datas.append(0)
+            self._textos[('data', indice)] = colheita.data
+
+        codigo = _CODIGOS_TIPO.get(colheita.tipo, CODIGO_OUTRO)
+        self.tipos.append(codigo)
+        if codigo == CODIGO_OUTRO:
+            self._textos[('tipo', indice)] = colheita.tipo_colheita
+
+        self.ids.append(getattr(colheita, 'id', 0) or 0)
+
+        self.area_total += colheita.area_colhida
+        self.quantidade_total += colheita.quantidade_colhida
+
+    def extend(self, colheitas):
+        """
+        Adiciona várias colheitas
+
+        Args:
+            colheitas (iterable): Colheitas a serem armazenadas
+        """
+        for colheita in colheitas:
+            self.append(colheita)
+
+    def copiar_colheita(self, origem, indice):
+        """
+        Adiciona uma colheita de outra coleção colunar, copiando as colunas (sem criar Colheita)
+
+        Args:
+            origem (ColheitasColunares): Coleção de onde a colheita é copiada
+            indice (int): Posição da colheita na origem
+        """
+        destino = len(self.areas)
+
+        area = origem.areas[indice]
+        quantidade = origem.quantidades[indice]
+        self.areas.append(area)
+        self.quantidades.append(quantidade)
+        self.datas.append(origem.datas[indice])
+        self.tipos.append(origem.tipos[indice])
+        self.ids.append(origem.ids[indice])
+
+        for campo in ('data', 'tipo'):
+            if (campo, indice) in origem._textos:
+                self._textos[(campo, destino)] = origem._textos[(campo, indice)]
+
+        self.area_total += area
+        self.quantidade_total += quantidade
+
+    def chaves(self):
+        """
+        Gera a chave (data, área, quantidade, tipo) de cada colheita, sem criar objetos
+
+        Colheitas com a mesma chave são consideradas idênticas (o ID no banco não entra).
+
+        Yields:
+            tuple: Data (ordinal ou texto), área, quantidade e tipo (código ou texto)
+        """
+        textos = self._textos
+        for indice, (ordinal, area, quantidade, codigo) in enumerate(
+                zip(self.datas, self.areas, self.quantidades, self.tipos)):
+            yield (
+                ordinal or textos[('data', indice)],
+                area,
+                quantidade,
+                codigo if codigo != CODIGO_OUTRO else textos[('tipo', indice)]
+            )
+
+    def definir_id(self, indice, colheita_id):
+        """
+        Registra o ID no banco de uma colheita armazenada
+
+        Args:
+            indice (int): Posição da colheita
+            colheita_id (int): ID gerado pelo banco
+        """
+        self.ids[indice] = colheita_id
+
+    def _criar_colheita(self, indice):
+        """
+        Cria o objeto Colheita correspondente a uma posição das colunas
+
+        Args:
+            indice (int): Posição da colheita
+
+        Returns:
+            Colheita: Objeto criado a partir das colunas
+        """
+        ordinal = self.datas[indice]
+        data = date.fromordinal(ordinal) if ordinal else self._textos[('data', indice)]
+
+        codigo = self.tipos[indice]
+        tipo = _TIPOS_POR_CODIGO[codigo] if codigo != CODIGO_OUTRO else self._textos[('tipo', indice)]
+
+        colheita = Colheita(data, self.areas[indice], self.quantidades[indice], tipo)
+        if self.ids[indice]:
+            colheita.id = self.ids[indice]
+
+        return colheita
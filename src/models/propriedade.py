@@ -2,23 +2,45 @@
 Módulo que define a classe Propriedade para representar propriedades rurais
 """
 
+from src.models.colheitas_colunares import ColheitasColunares
+
+# Propriedades com pelo menos esta quantidade de colheitas passam a usar armazenamento colunar
+LIMITE_COLHEITAS_COLUNAR = 1000
+
 class Propriedade:
     """
     Classe que representa uma propriedade rural produtora de cana-de-açúcar
 
+    Os totais de área e quantidade colhidas são mantidos a cada
+    adicionar_colheita, então as consultas de totais são O(1).
+
     Attr:
         nome (str): Nome da propriedade
         area_total (float): Área total da propriedade em hectares
         localizacao (str): Localizacao da propriedade
         tipo_solo (str): Tipo de solo da propriedade
+        colheitas (list | ColheitasColunares): Colheitas da propriedade
     """
 
-    def __init__(self, nome: str, area_total: float, localizacao: str, tipo_solo: str):
+    __slots__ = (
+        'nome',
+        'area_total',
+        'localizacao',
+        'tipo_solo',
+        '_colheitas',
+        '_area_colhida_total',
+        '_quantidade_colhida_total',
+        '_colheitas_contabilizadas',
+        'id'
+    )
+
+    def __init__(self, nome: str, area_total: float, localizacao: str, tipo_solo: str,
+                 armazenamento_colunar: bool = False):
         self.nome = nome
         self.area_total = area_total
         self.localizacao = localizacao
         self.tipo_solo = tipo_solo
-        self.colheitas = []
+        self.colheitas = ColheitasColunares() if armazenamento_colunar else []
 
     def __str__(self):
         return f"""
@@ -30,6 +52,41 @@ Tipo Solo: {self.tipo_solo}
 ==========================
         """
 
+    @property
+    def colheitas(self):
+        """
+        Returns:
+            list | ColheitasColunares: Colheitas da propriedade
+        """
+        return self._colheitas
+
+    @colheitas.setter
+    def colheitas(self, colheitas):
+        self._colheitas = colheitas
+        self._recalcular_totais()
+
+    def _recalcular_totais(self):
+        """
+        Recalcula os totais acumulados a partir das colheitas armazenadas
+        """
+        if isinstance(self._colheitas, ColheitasColunares):
+            self._area_colhida_total = self._colheitas.area_total
+            self._quantidade_colhida_total = self._colheitas.quantidade_total
+            self._colheitas_contabilizadas = len(self._colheitas)
+            return
+
+        self._area_colhida_total = sum(colheita.area_colhida for colheita in self._colheitas)
+        self._quantidade_colhida_total = sum(colheita.quantidade_colhida for colheita in self._colheitas)
+        self._colheitas_contabilizadas = len(self._colheitas)
+
+    def _totais_atualizados(self):
+        """
+        Garante que os totais acumulados refletem a lista de colheitas
+        (necessário se a lista foi alterada diretamente, sem adicionar_colheita)
+        """
+        if self._colheitas_contabilizadas != len(self._colheitas):
+            self._recalcular_totais()
+
     def adicionar_colheita(self, colheita):
         """
         Adiciona uma colheita à lista de colheitas da propriedade
@@ -37,7 +94,58 @@ Tipo Solo: {self.tipo_solo}
         Args:
             colheita: Objeto da classe Colheita
         """
-        self.colheitas.append(colheita)
+        self._totais_atualizados()
+        self._colheitas.append(colheita)
+        self._area_colhida_total += colheita.area_colhida
+        self._quantidade_colhida_total += colheita.quantidade_colhida
+        self._colheitas_contabilizadas += 1
+
+    def usa_armazenamento_colunar(self):
+        """
+        Indica se as colheitas estão em armazenamento colunar
+
+        Returns:
+            bool: True se as colheitas estão em ColheitasColunares
+        """
+        return isinstance(self._colheitas, ColheitasColunares)
+
+    def compactar_colheitas(self, minimo=0):
+        """
+        Converte a lista de colheitas para armazenamento colunar
+
+        Args:
+            minimo (int): Só converte se houver pelo menos esta quantidade de colheitas
+
+        Returns:
+            bool: True se as colheitas estão em armazenamento colunar ao final
+        """
+        if not self.usa_armazenamento_colunar() and len(self._colheitas) >= minimo:
+            self.colheitas = ColheitasColunares(self._colheitas)
+        return self.usa_armazenamento_colunar()
+
+    def definir_id_colheita(self, indice, colheita_id):
+        """
+        Registra o ID no banco da colheita em uma posição (funciona nos dois armazenamentos)
+
+        Args:
+            indice (int): Posição da colheita
+            colheita_id (int): ID gerado pelo banco
+        """
+        if self.usa_armazenamento_colunar():
+            self._colheitas.definir_id(indice, colheita_id)
+        else:
+            self._colheitas[indice].id = colheita_id
+
+    def obter_ids_colheitas(self):
+        """
+        Retorna os IDs no banco das colheitas já gravadas
+
+        Returns:
+            set: IDs das colheitas
+        """
+        if self.usa_armazenamento_colunar():
+            return {colheita_id for colheita_id in self._colheitas.ids if colheita_id}
+        return {colheita.id for colheita in self._colheitas if hasattr(colheita, 'id')}
     
     def obter_total_colheitas(self):
         """
@@ -46,25 +154,27 @@ Tipo Solo: {self.tipo_solo}
         Returns:
             int: Número de colheitas
         """
-        return len(self.colheitas)
+        return len(self._colheitas)
     
     def obter_area_total_colhida(self):
         """
-        Calcula a área total já colhida em todas as colheitas
+        Retorna a área total já colhida em todas as colheitas
         
         Returns:
             float: Área total colhida em hectares
         """
-        return sum(colheita.area_colhida for colheita in self.colheitas)
+        self._totais_atualizados()
+        return self._area_colhida_total
     
     def obter_quantidade_total_colhida(self):
         """
-        Calcula a quantidade total colhida em todas as colheitas
+        Retorna a quantidade total colhida em todas as colheitas
         
         Returns:
             float: Quantidade total colhida em toneladas
         """
-        return sum(colheita.quantidade_colhida for colheita in self.colheitas)
+        self._totais_atualizados()
+        return self._quantidade_colhida_total
 
 
 class Solos:
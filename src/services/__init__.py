@@ -1,21 +1,31 @@
-from src.services.colheita_service import (
-    exibir_resumo_colheitas
-)
+"""
+Pacote de serviços do sistema
 
-from src.services.sistema_integrado import (
-    inicializar_sistema,
-    cadastrar_propriedade_integrado,
-    registrar_colheita_integrado,
-    gerar_relatorio_integrado,
-    fazer_backup_integrado,
-    importar_backup_integrado,
-    carregar_dados_banco,
-    menu_configuracao_banco,
-    exibir_status_sistema
-)
+Os nomes abaixo são carregados sob demanda (PEP 562): importar um serviço
+específico (ex: src.services.file_service) não carrega os demais, nem o
+acesso ao banco.
+"""
+
+from importlib import import_module
+
+# Nome exportado -> módulo que o define
+_EXPORTACOES = {
+    'exibir_resumo_colheitas': 'src.services.colheita_service',
+    'inicializar_sistema': 'src.services.sistema_integrado',
+    'finalizar_sistema': 'src.services.sistema_integrado',
+    'cadastrar_propriedade_integrado': 'src.services.sistema_integrado',
+    'registrar_colheita_integrado': 'src.services.sistema_integrado',
+    'gerar_relatorio_integrado': 'src.services.sistema_integrado',
+    'fazer_backup_integrado': 'src.services.sistema_integrado',
+    'importar_backup_integrado': 'src.services.sistema_integrado',
+    'carregar_dados_banco': 'src.services.sistema_integrado',
+    'menu_configuracao_banco': 'src.services.sistema_integrado',
+    'exibir_status_sistema': 'src.services.sistema_integrado'
+}
 
 __all__ = [
     'inicializar_sistema',
+    'finalizar_sistema',
     'cadastrar_propriedade_integrado',
     'registrar_colheita_integrado',
     'gerar_relatorio_integrado',
@@ -25,4 +35,16 @@ __all__ = [
     'menu_configuracao_banco',
     'exibir_status_sistema',
     'exibir_resumo_colheitas'
-]
\ No newline at end of file
+]
+
+def __getattr__(nome):
+    modulo = _EXPORTACOES.get(nome)
+    if modulo is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {nome!r}")
+
+    valor = getattr(import_module(modulo), nome)
+    globals()[nome] = valor
+    return valor
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,290 @@
+"""
+Módulo de análise de perdas vetorizada (NumPy)
+Calcula produtividade, perdas e classificações de todas as colheitas de uma vez,
+a partir de colunas (arrays) em vez de um dicionário por colheita.
+
+A implementação por colheita em calculation_service (analisar_colheita,
+calcular_resumo_geral) continua sendo a referência dos resultados.
+"""
+
+from array import array
+
+try:
+    import numpy as np
+    NUMPY_DISPONIVEL = True
+except ImportError:
+    np = None
+    NUMPY_DISPONIVEL = False
+
+from src.models.colheita import TipoColheita
+from src.models.colheitas_colunares import CODIGO_MANUAL, CODIGO_MECANICA, CODIGO_OUTRO
+from src.services.calculation_service import (
+    PRODUTIVIDADE_ESPERADA_POR_SOLO,
+    calcular_produtividade_esperada
+)
+
+# Classificações na ordem dos códigos usados nas colunas
+CLASSIFICACOES = ('Baixa', 'Média', 'Alta', 'Crítica')
+
+# Limites superiores (inclusivos) das classes Baixa, Média e Alta (ver classificar_perda)
+LIMITES_CLASSIFICACAO = (5.0, 10.0, 15.0)
+
+# Códigos da coluna de tipo de colheita (os mesmos do armazenamento colunar)
+TIPO_MANUAL = CODIGO_MANUAL
+TIPO_MECANICA = CODIGO_MECANICA
+TIPO_OUTRO = CODIGO_OUTRO
+
+_CODIGOS_TIPO = {TipoColheita.MANUAL: TIPO_MANUAL, TipoColheita.MECANICA: TIPO_MECANICA}
+
+def construir_colunas(lista_propriedades):
+    """
+    Converte as colheitas de todas as propriedades em colunas NumPy
+
+    Snapshots binários (snapshot_service.SnapshotColunar) já guardam as
+    colunas e as entregam diretamente, sem criar objetos.
+
+    Args:
+        lista_propriedades (list): Lista de propriedades com colheitas
+
+    Returns:
+        dict: Colunas 'area', 'quantidade', 'solo', 'tipo', a tabela
+              'esperada_por_solo', os 'inicios' de cada propriedade nas colunas
+              e a lista de 'propriedades' de origem
+    """
+    if hasattr(lista_propriedades, 'obter_colunas'):
+        return lista_propriedades.obter_colunas()
+
+    areas = array('d')
+    quantidades = array('d')
+    solos = array('i')
+    tipos = array('b')
+    inicios = array('q')
+
+    codigos_solo = {}
+    total = 0
+
+    for propriedade in lista_propriedades:
+        inicios.append(total)
+        colheitas = propriedade.colheitas
+        n = len(colheitas)
+        if n == 0:
+            continue
+
+        solo = propriedade.tipo_solo.lower().strip()
+        codigo_solo = codigos_solo.setdefault(solo, len(codigos_solo))
+
+        if propriedade.usa_armazenamento_colunar():
+            # Colunas já prontas: cópia direta dos arrays, sem criar objetos Colheita
+            areas.extend(colheitas.areas)
+            quantidades.extend(colheitas.quantidades)
+            tipos.extend(colheitas.tipos)
+        else:
+            areas.extend(colheita.area_colhida for colheita in colheitas)
+            quantidades.extend(colheita.quantidade_colhida for colheita in colheitas)
+            tipos.extend(_CODIGOS_TIPO.get(colheita.tipo, TIPO_OUTRO) for colheita in colheitas)
+        solos.extend(array('i', [codigo_solo]) * n)
+        total += n
+
+    esperada_por_solo = [
+        calcular_produtividade_esperada(0, solo) for solo in codigos_solo
+    ] or [PRODUTIVIDADE_ESPERADA_POR_SOLO['outros']]
+
+    return {
+        'area': np.frombuffer(areas, dtype=np.float64),
+        'quantidade': np.frombuffer(quantidades, dtype=np.float64),
+        'solo': np.frombuffer(solos, dtype=np.intc),
+        'tipo': np.frombuffer(tipos, dtype=np.int8),
+        'inicios': np.frombuffer(inicios, dtype=np.int64),
+        'esperada_por_solo': np.array(esperada_por_solo, dtype=np.float64),
+        'propriedades': list(lista_propriedades)
+    }
+
+def _arredondar(valores):
+    """
+    Arredonda para 2 casas com o mesmo resultado de round(valor, 2)
+
+    np.round multiplica por 100 e arredonda empates para o par, o que
+    diverge de round() quando valor * 100 fica perto de ,5 (ex: 575.45 / 10
+    dá 57.54 em vez de 57.55). Só esses casos, raros, passam por round().
+
+    Args:
+        valores (ndarray): Valores float64
+
+    Returns:
+        ndarray: Valores arredondados
+    """
+    arredondados = np.round(valores, 2)
+    escalados = valores * 100
+    for indice in np.flatnonzero(np.abs(escalados - np.floor(escalados) - 0.5) < 1e-6):
+        arredondados[indice] = round(float(valores[indice]), 2)
+    return arredondados
+
+def _media(valores):
+    """
+    Média com a mesma soma sequencial de calcular_resumo_geral (sum() do Python)
+    """
+    return sum(valores.tolist()) / valores.size
+
+def analisar_colunas(colunas):
+    """
+    Calcula produtividade real/esperada, perda e classificação de todas as colheitas
+
+    Args:
+        colunas (dict): Colunas geradas por construir_colunas
+
+    Returns:
+        dict: Arrays 'produtividade_real', 'produtividade_esperada',
+              'percentual_perda' e 'classe' (índice em CLASSIFICACOES)
+    """
+    area = colunas['area']
+    quantidade = colunas['quantidade']
+
+    produtividade = np.zeros_like(area)
+    np.divide(quantidade, area, out=produtividade, where=area > 0)
+    produtividade = _arredondar(produtividade)
+
+    esperada = colunas['esperada_por_solo'][colunas['solo']]
+
+    # Só há perda quando a produtividade real fica abaixo da esperada
+    com_perda = (esperada > 0) & (produtividade < esperada)
+    perda = np.zeros_like(area)
+    # Mesma ordem de operações de calcular_percentual_perda
+    np.divide(esperada - produtividade, esperada, out=perda, where=com_perda)
+    perda = _arredondar(perda * 100)
+
+    classe = np.searchsorted(np.array(LIMITES_CLASSIFICACAO), perda, side='left')
+
+    return {
+        'produtividade_real': produtividade,
+        'produtividade_esperada': esperada,
+        'percentual_perda': perda,
+        'classe': classe
+    }
+
+def resumir_analise(colunas, analise):
+    """
+    Monta o resumo geral (mesmo formato de calcular_resumo_geral)
+
+    Args:
+        colunas (dict): Colunas geradas por construir_colunas
+        analise (dict): Resultado de analisar_colunas
+
+    Returns:
+        dict: Resumo com totais, distribuição por classificação e comparação por tipo
+    """
+    perda = analise['percentual_perda']
+    total = int(perda.size)
+
+    contagem = np.bincount(analise['classe'], minlength=len(CLASSIFICACOES))
+    distribuicao = {
+        classe: int(quantidade)
+        for classe, quantidade in zip(CLASSIFICACOES, contagem) if quantidade
+    }
+
+    comparacao = {}
+    for nome, codigo in (('manual', TIPO_MANUAL), ('mecanica', TIPO_MECANICA)):
+        perdas_tipo = perda[colunas['tipo'] == codigo]
+        comparacao[nome] = {
+            'quantidade': int(perdas_tipo.size),
+            'perda_media': round(_media(perdas_tipo), 2) if perdas_tipo.size else None
+        }
+
+    return {
+        'total_colheitas': total,
+        'perda_media': round(_media(perda), 2) if total else 0.0,
+        'perda_minima': float(perda.min()) if total else 0.0,
+        'perda_maxima': float(perda.max()) if total else 0.0,
+        'distribuicao': distribuicao,
+        'comparacao': comparacao
+    }
+
+def localizar_colheita(colunas, indice, montadas=None):
+    """
+    Retorna a propriedade e a colheita correspondentes a uma posição das colunas
+
+    Args:
+        colunas (dict): Colunas geradas por construir_colunas
+        indice (int): Posição da colheita nas colunas
+        montadas (dict): Propriedades já obtidas por posição, reaproveitadas entre
+                         chamadas (um snapshot monta a propriedade a cada acesso)
+
+    Returns:
+        tuple: (Propriedade, Colheita)
+    """
+    posicao = int(np.searchsorted(colunas['inicios'], indice, side='right')) - 1
+    if montadas is None:
+        propriedade = colunas['propriedades'][posicao]
+    else:
+        propriedade = montadas.get(posicao)
+        if propriedade is None:
+            propriedade = montadas[posicao] = colunas['propriedades'][posicao]
+    return propriedade, propriedade.colheitas[indice - int(colunas['inicios'][posicao])]
+
+def obter_analises_criticas(colunas, analise):
+    """
+    Monta as análises (no formato de analisar_colheita, mais o nome da
+    'propriedade') apenas das perdas críticas
+
+    Args:
+        colunas (dict): Colunas geradas por construir_colunas
+        analise (dict): Resultado de analisar_colunas
+
+    Returns:
+        list: Lista de dicionários de análise das colheitas com perda crítica
+    """
+    codigo_critica = CLASSIFICACOES.index('Crítica')
+    criticas = []
+    montadas = {}
+
+    for indice in np.flatnonzero(analise['classe'] == codigo_critica):
+        propriedade, colheita = localizar_colheita(colunas, indice, montadas)
+        criticas.append({
+            'colheita': colheita,
+            'produtividade_real': float(analise['produtividade_real'][indice]),
+            'produtividade_esperada': float(analise['produtividade_esperada'][indice]),
+            'percentual_perda': float(analise['percentual_perda'][indice]),
+            'classificacao': 'Crítica',
+            'tipo_solo': propriedade.tipo_solo,
+            'propriedade': propriedade.nome
+        })
+
+    return criticas
+
+def conferir_com_referencia(lista_propriedades):
+    """
+    Compara o motor vetorizado com a implementação de referência
+    (analisar_colheita e calcular_resumo_geral), colheita a colheita
+
+    Args:
+        lista_propriedades (list): Lista de propriedades com colheitas
+
+    Returns:
+        list: Descrição de cada divergência (vazia se os resultados são iguais)
+    """
+    from src.services.calculation_service import analisar_colheita, calcular_resumo_geral
+
+    colunas = construir_colunas(lista_propriedades)
+    analise = analisar_colunas(colunas)
+    referencias = [
+        analisar_colheita(colheita, propriedade.tipo_solo)
+        for propriedade in lista_propriedades for colheita in propriedade.colheitas
+    ]
+
+    divergencias = []
+    for indice, referencia in enumerate(referencias):
+        for campo in ('produtividade_real', 'produtividade_esperada', 'percentual_perda'):
+            valor = float(analise[campo][indice])
+            if valor != referencia[campo]:
+                divergencias.append(f"colheita {indice}: {campo} {valor} != {referencia[campo]}")
+        classificacao = CLASSIFICACOES[analise['classe'][indice]]
+        if classificacao != referencia['classificacao']:
+            divergencias.append(f"colheita {indice}: classificação {classificacao} != {referencia['classificacao']}")
+
+    if referencias:
+        resumo = resumir_analise(colunas, analise)
+        resumo_referencia = calcular_resumo_geral(referencias)
+        for campo, valor in resumo_referencia.items():
+            if resumo[campo] != valor:
+                divergencias.append(f"resumo: {campo} {resumo[campo]} != {valor}")
+
+    return divergencias
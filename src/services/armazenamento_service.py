@@ -0,0 +1,137 @@
+"""
+Módulo de seleção do backend de armazenamento
+Expõe as funções de database_service e repassa cada chamada ao backend
+ativo: o Oracle ou o banco SQLite local (sqlite_service). O backend é
+escolhido na primeira chamada a partir de SMPC_ARMAZENAMENTO:
+    oracle - apenas Oracle
+    sqlite - apenas o banco local
+    auto   - Oracle se o driver estiver instalado e a conexão funcionar,
+             senão o banco local (padrão)
+"""
+
+from importlib import import_module
+
+from config.database_config import obter_config_armazenamento
+from src.utils.menu_utils import exibir_mensagem_erro, exibir_mensagem_info
+
+# Nome do backend -> (módulo, nome exibido)
+BACKENDS = {
+    'oracle': ('src.services.database_service', 'Oracle'),
+    'sqlite': ('src.services.sqlite_service', 'SQLite local')
+}
+
+OPCOES_BACKEND = ('auto',) + tuple(BACKENDS)
+
+# Backend escolhido (definido na primeira chamada ou por definir_backend)
+_armazenamento = {
+    'backend': None
+}
+
+def _escolher_backend():
+    """
+    Escolhe o backend conforme a configuração
+
+    Returns:
+        str: 'oracle' ou 'sqlite'
+    """
+    preferido = obter_config_armazenamento()['backend']
+    if preferido in BACKENDS:
+        return preferido
+
+    if preferido != 'auto':
+        exibir_mensagem_erro(f"SMPC_ARMAZENAMENTO inválido: {preferido} (use {', '.join(OPCOES_BACKEND)})")
+
+    from src.services.database_service import oracle_disponivel, conectar_oracle, fechar_conexao
+
+    if oracle_disponivel():
+        conexao = conectar_oracle()
+        if conexao:
+            fechar_conexao(conexao)
+            return 'oracle'
+
+    exibir_mensagem_info("Usando o banco SQLite local.")
+    return 'sqlite'
+
+def definir_backend(nome):
+    """
+    Define o backend ativo, encerrando as conexões do anterior
+
+    Args:
+        nome (str): 'oracle', 'sqlite' ou 'auto' (escolher de novo na próxima chamada)
+    """
+    anterior = _armazenamento['backend']
+    if anterior is not None:
+        import_module(BACKENDS[anterior][0]).encerrar_pool()
+
+    _armazenamento['backend'] = nome if nome in BACKENDS else None
+
+def obter_backend():
+    """
+    Módulo do backend ativo (escolhido na primeira chamada)
+
+    Returns:
+        module: database_service ou sqlite_service
+    """
+    if _armazenamento['backend'] is None:
+        _armazenamento['backend'] = _escolher_backend()
+    return import_module(BACKENDS[_armazenamento['backend']][0])
+
+def obter_nome_backend():
+    """
+    Nome do backend ativo para as mensagens ao usuário
+
+    Returns:
+        str: 'Oracle' ou 'SQLite local'
+    """
+    obter_backend()
+    return BACKENDS[_armazenamento['backend']][1]
+
+def backend_em_uso():
+    """
+    Backend já escolhido, sem provocar a escolha (nem conexões)
+
+    Returns:
+        str: 'oracle', 'sqlite' ou None se nenhuma função de banco foi chamada
+    """
+    return _armazenamento['backend']
+
+def _repassar(nome):
+    """
+    Cria a função que repassa a chamada para a função de mesmo nome do backend ativo
+
+    Args:
+        nome (str): Nome da função em database_service/sqlite_service
+
+    Returns:
+        callable: Função de repasse
+    """
+    def repassar(*args, **kwargs):
+        return getattr(obter_backend(), nome)(*args, **kwargs)
+
+    repassar.__name__ = repassar.__qualname__ = nome
+    repassar.__doc__ = f"Executa {nome} no backend ativo (ver database_service.{nome})"
+    return repassar
+
+testar_conexao = _repassar('testar_conexao')
+criar_tabelas = _repassar('criar_tabelas')
+salvar_propriedade_oracle = _repassar('salvar_propriedade_oracle')
+salvar_colheita_oracle = _repassar('salvar_colheita_oracle')
+salvar_propriedades_lote_oracle = _repassar('salvar_propriedades_lote_oracle')
+salvar_colheitas_lote_oracle = _repassar('salvar_colheitas_lote_oracle')
+buscar_propriedades_oracle = _repassar('buscar_propriedades_oracle')
+buscar_colheitas_por_propriedade = _repassar('buscar_colheitas_por_propriedade')
+buscar_historico_completo = _repassar('buscar_historico_completo')
+obter_data_servidor = _repassar('obter_data_servidor')
+buscar_alteracoes_desde = _repassar('buscar_alteracoes_desde')
+obter_estatisticas_banco = _repassar('obter_estatisticas_banco')
+obter_relatorio_perdas_oracle = _repassar('obter_relatorio_perdas_oracle')
+obter_estatisticas_pool = _repassar('obter_estatisticas_pool')
+arquivar_particoes_colheitas = _repassar('arquivar_particoes_colheitas')
+limpar_dados_banco = _repassar('limpar_dados_banco')
+
+def encerrar_pool():
+    """
+    Encerra as conexões do backend em uso (não escolhe um backend se nenhum foi usado)
+    """
+    if _armazenamento['backend'] is not None:
+        obter_backend().encerrar_pool()
@@ -8,6 +8,7 @@ from src.utils.menu_utils import (
     exibir_mensagem_info,
     exibir_mensagem_erro
 )
+from src.utils.instrumentacao import medir
 
 # Dicionário com produtividades esperadas por tipo de solo (em t/ha)
 # Baseado em dados científicos de instituições brasileiras de pesquisa
@@ -27,6 +28,10 @@ PRODUTIVIDADE_ESPERADA_POR_SOLO = {
     'outros': 75.0                   # Média nacional (UNICA, 2023)
 }
 
+# Abaixo desta quantidade de colheitas o cálculo em Python puro termina antes
+# do que levaria só a importação do NumPy (~100 ms)
+LIMITE_COLHEITAS_VETORIZADO = 1000
+
 # Referências científicas utilizadas:
 REFERENCIAS_CIENTIFICAS = {
     'embrapa': {
@@ -162,12 +167,85 @@ def analisar_colheita(colheita, tipo_solo):
         'tipo_solo': tipo_solo
     }
 
-def gerar_relatorio_perdas(lista_propriedades):
+def exibir_analise_colheita(indice, colheita, analise):
+    """
+    Exibe os dados e a análise de perda de uma colheita no relatório
+    
+    Args:
+        indice (int): Número da colheita dentro da propriedade
+        colheita: Objeto Colheita
+        analise (dict): Análise com produtividade real/esperada, perda e classificação
+    """
+    print(f"\n{Fore.BLUE}--- 🚜 COLHEITA {indice} ---")
+    print(f"{Fore.CYAN}📅 Data: {Fore.WHITE}{colheita.data}")
+    print(f"{Fore.CYAN}📏 Área Colhida: {Fore.WHITE}{colheita.area_colhida} ha")
+    print(f"{Fore.CYAN}⚖️  Quantidade: {Fore.WHITE}{colheita.quantidade_colhida} t")
+    print(f"{Fore.CYAN}🔧 Tipo: {Fore.WHITE}{colheita.tipo_colheita.title()}")
+    print(f"{Fore.CYAN}📈 Produtividade Real: {Fore.WHITE}{analise['produtividade_real']} t/ha")
+    print(f"{Fore.CYAN}🎯 Produtividade Esperada: {Fore.WHITE}{analise['produtividade_esperada']} t/ha")
+    
+    # Colorir a perda baseada na classificação
+    cor_perda = Fore.GREEN if analise['classificacao'] == 'Baixa' else \
+               Fore.YELLOW if analise['classificacao'] in ['Média', 'Alta'] else Fore.RED
+    
+    simbolo = obter_cor_classificacao(analise['classificacao'])
+    print(f"{Fore.CYAN}📉 Perda: {cor_perda}{Style.BRIGHT}{analise['percentual_perda']}% - {analise['classificacao']} {simbolo}")
+    
+    # Marcar perdas críticas
+    if analise['classificacao'] == 'Crítica':
+        print(f"{Fore.RED}{Style.BRIGHT}🚨 >>> ATENÇÃO: PERDA CRÍTICA! <<<")
+    
+    print(f"{Fore.BLUE}{'-' * 40}")
+
+def exibir_cabecalho_propriedade(propriedade):
+    """
+    Exibe o cabeçalho de uma propriedade no relatório de perdas
+    
+    Args:
+        propriedade: Objeto Propriedade
+    """
+    print(f"\n{Fore.CYAN}{'='*70}")
+    print(f"{Fore.WHITE}{Style.BRIGHT}🏡 PROPRIEDADE: {propriedade.nome.upper()}")
+    print(f"{Fore.CYAN}📍 Localização: {Fore.WHITE}{propriedade.localizacao}")
+    print(f"{Fore.CYAN}🌱 Tipo de Solo: {Fore.WHITE}{propriedade.tipo_solo}")
+    print(f"{Fore.CYAN}📏 Área Total: {Fore.WHITE}{propriedade.area_total} ha")
+    print(f"{Fore.CYAN}{'='*70}")
+
+def _usar_motor_vetorizado(lista_propriedades, vetorizado):
+    """
+    Decide se o relatório usa o motor NumPy
+    
+    Sem escolha explícita, o NumPy só é importado a partir de
+    LIMITE_COLHEITAS_VETORIZADO colheitas.
+    
+    Args:
+        lista_propriedades (list): Lista de propriedades (ou snapshot colunar)
+        vetorizado (bool): Escolha explícita (None = decidir pela quantidade de colheitas)
+        
+    Returns:
+        bool: True para usar o motor NumPy
+    """
+    if vetorizado is not None:
+        return vetorizado
+    
+    total_colheitas = getattr(lista_propriedades, 'total_colheitas', None)
+    if total_colheitas is None:
+        total_colheitas = sum(len(prop.colheitas) for prop in lista_propriedades)
+    if total_colheitas < LIMITE_COLHEITAS_VETORIZADO:
+        return False
+    
+    from src.services.analise_vetorizada import NUMPY_DISPONIVEL
+    return NUMPY_DISPONIVEL
+
+@medir
+def gerar_relatorio_perdas(lista_propriedades, detalhado=True, vetorizado=None):
     """
     Gera relatório completo de perdas para todas as propriedades
     
     Args:
         lista_propriedades (list): Lista de propriedades com colheitas
+        detalhado (bool): Exibe cada colheita; se False, apenas resumo e alertas
+        vetorizado (bool): Usa o motor NumPy (None = decidir pela quantidade de colheitas)
     """
     if not lista_propriedades:
         exibir_mensagem_erro("Nenhuma propriedade cadastrada.")
@@ -184,44 +262,30 @@ def gerar_relatorio_perdas(lista_propriedades):
     print(f"{Fore.YELLOW}{Style.BRIGHT}    📊 RELATÓRIO DE ANÁLISE DE PERDAS")
     print(f"{Fore.MAGENTA}{'='*70}")
     
+    if _usar_motor_vetorizado(lista_propriedades, vetorizado):
+        _gerar_relatorio_vetorizado(lista_propriedades, detalhado)
+        return
+    
     todas_analises = []
     perdas_criticas = []
     
     for propriedade in lista_propriedades:
         if not propriedade.colheitas:
             continue
-            
-        print(f"\n{Fore.CYAN}{'='*70}")
-        print(f"{Fore.WHITE}{Style.BRIGHT}🏡 PROPRIEDADE: {propriedade.nome.upper()}")
-        print(f"{Fore.CYAN}📍 Localização: {Fore.WHITE}{propriedade.localizacao}")
-        print(f"{Fore.CYAN}🌱 Tipo de Solo: {Fore.WHITE}{propriedade.tipo_solo}")
-        print(f"{Fore.CYAN}📏 Área Total: {Fore.WHITE}{propriedade.area_total} ha")
-        print(f"{Fore.CYAN}{'='*70}")
+        
+        if detalhado:
+            exibir_cabecalho_propriedade(propriedade)
         
         for i, colheita in enumerate(propriedade.colheitas, 1):
             analise = analisar_colheita(colheita, propriedade.tipo_solo)
             todas_analises.append(analise)
             
-            print(f"\n{Fore.BLUE}--- 🚜 COLHEITA {i} ---")
-            print(f"{Fore.CYAN}📅 Data: {Fore.WHITE}{colheita.data}")
-            print(f"{Fore.CYAN}📏 Área Colhida: {Fore.WHITE}{colheita.area_colhida} ha")
-            print(f"{Fore.CYAN}⚖️  Quantidade: {Fore.WHITE}{colheita.quantidade_colhida} t")
-            print(f"{Fore.CYAN}🔧 Tipo: {Fore.WHITE}{colheita.tipo_colheita.title()}")
-            print(f"{Fore.CYAN}📈 Produtividade Real: {Fore.WHITE}{analise['produtividade_real']} t/ha")
-            print(f"{Fore.CYAN}🎯 Produtividade Esperada: {Fore.WHITE}{analise['produtividade_esperada']} t/ha")
-            
-            # Colorir a perda baseada na classificação
-            cor_perda = Fore.GREEN if analise['classificacao'] == 'Baixa' else \
-                       Fore.YELLOW if analise['classificacao'] in ['Média', 'Alta'] else Fore.RED
-            
-            print(f"{Fore.CYAN}📉 Perda: {cor_perda}{Style.BRIGHT}{analise['percentual_perda']}% - {analise['classificacao']} {analise['simbolo']}")
+            if detalhado:
+                exibir_analise_colheita(i, colheita, analise)
             
             # Marcar perdas críticas
             if analise['classificacao'] == 'Crítica':
                 perdas_criticas.append(analise)
-                print(f"{Fore.RED}{Style.BRIGHT}🚨 >>> ATENÇÃO: PERDA CRÍTICA! <<<")
-            
-            print(f"{Fore.BLUE}{'-' * 40}")
     
     # Resumo geral
     if todas_analises:
@@ -231,29 +295,177 @@ def gerar_relatorio_perdas(lista_propriedades):
     if perdas_criticas:
         exibir_alertas_perdas_criticas(perdas_criticas)
 
-def gerar_resumo_geral(todas_analises):
+def _gerar_relatorio_vetorizado(lista_propriedades, detalhado):
     """
-    Gera resumo estatístico geral das análises
+    Corpo do relatório de perdas usando o motor vetorizado (analise_vetorizada)
+    
+    Args:
+        lista_propriedades (list): Lista de propriedades com colheitas
+        detalhado (bool): Exibe cada colheita
+    """
+    from src.services.analise_vetorizada import (
+        CLASSIFICACOES,
+        construir_colunas,
+        analisar_colunas,
+        resumir_analise,
+        obter_analises_criticas
+    )
+    
+    colunas = construir_colunas(lista_propriedades)
+    analise = analisar_colunas(colunas)
+    
+    if detalhado:
+        for propriedade, inicio in zip(colunas['propriedades'], colunas['inicios'].tolist()):
+            if not propriedade.colheitas:
+                continue
+            
+            exibir_cabecalho_propriedade(propriedade)
+            
+            for i, colheita in enumerate(propriedade.colheitas):
+                posicao = inicio + i
+                exibir_analise_colheita(i + 1, colheita, {
+                    'produtividade_real': float(analise['produtividade_real'][posicao]),
+                    'produtividade_esperada': float(analise['produtividade_esperada'][posicao]),
+                    'percentual_perda': float(analise['percentual_perda'][posicao]),
+                    'classificacao': CLASSIFICACOES[analise['classe'][posicao]]
+                })
+    
+    exibir_resumo_geral(resumir_analise(colunas, analise))
+    
+    perdas_criticas = obter_analises_criticas(colunas, analise)
+    if perdas_criticas:
+        exibir_alertas_perdas_criticas(perdas_criticas)
+
+def exibir_relatorio_agregado(relatorio):
+    """
+    Exibe o relatório de perdas calculado no banco (somente resumo e alertas)
+    
+    Args:
+        relatorio (dict): Resultado de obter_relatorio_perdas_oracle
+    """
+    resumo = relatorio['resumo']
+    
+    if resumo['total_colheitas'] == 0:
+        exibir_mensagem_info("Nenhuma colheita registrada ainda.")
+        exibir_mensagem_info("Registre algumas colheitas para gerar o relatório de perdas.")
+        return
+    
+    print(f"\n{Fore.MAGENTA}{'='*70}")
+    print(f"{Fore.YELLOW}{Style.BRIGHT}    📊 RELATÓRIO DE ANÁLISE DE PERDAS (CALCULADO NO BANCO)")
+    print(f"{Fore.MAGENTA}{'='*70}")
+    
+    exibir_resumo_geral(resumo)
+    
+    perdas_criticas = []
+    for critica in relatorio['criticas']:
+        perdas_criticas.append({
+            'colheita': critica['colheita'],
+            'produtividade_real': critica['produtividade_real'],
+            'produtividade_esperada': calcular_produtividade_esperada(
+                critica['colheita'].area_colhida, critica['tipo_solo']
+            ),
+            'percentual_perda': critica['percentual_perda'],
+            'classificacao': 'Crítica',
+            'tipo_solo': critica['tipo_solo']
+        })
+    
+    if perdas_criticas:
+        exibir_alertas_perdas_criticas(perdas_criticas, resumo['distribuicao'].get('Crítica'))
+
+@medir
+def calcular_relatorio_perdas(lista_propriedades, limite_criticas=100, vetorizado=None):
+    """
+    Calcula o relatório de perdas em memória, sem exibir nada
+    
+    Mesmo formato de obter_relatorio_perdas_oracle, para que quem consome
+    o relatório (ex: a linha de comando) não dependa de onde ele foi calculado.
+    
+    Args:
+        lista_propriedades (list): Lista de propriedades com colheitas
+        limite_criticas (int): Quantidade máxima de perdas críticas listadas (as maiores)
+        vetorizado (bool): Usa o motor NumPy (None = decidir pela quantidade de colheitas)
+        
+    Returns:
+        dict: {'resumo': dict no formato de calcular_resumo_geral,
+               'criticas': lista de dicionários}
+    """
+    if _usar_motor_vetorizado(lista_propriedades, vetorizado):
+        from src.services.analise_vetorizada import (
+            construir_colunas,
+            analisar_colunas,
+            resumir_analise,
+            obter_analises_criticas
+        )
+        colunas = construir_colunas(lista_propriedades)
+        analise = analisar_colunas(colunas)
+        resumo = resumir_analise(colunas, analise)
+        perdas_criticas = obter_analises_criticas(colunas, analise)
+    else:
+        todas_analises = []
+        perdas_criticas = []
+        for propriedade in lista_propriedades:
+            for colheita in propriedade.colheitas:
+                analise = analisar_colheita(colheita, propriedade.tipo_solo)
+                analise['propriedade'] = propriedade.nome
+                todas_analises.append(analise)
+                if analise['classificacao'] == 'Crítica':
+                    perdas_criticas.append(analise)
+        
+        resumo = calcular_resumo_geral(todas_analises) if todas_analises else {
+            'total_colheitas': 0,
+            'perda_media': 0.0,
+            'perda_minima': 0.0,
+            'perda_maxima': 0.0,
+            'distribuicao': {},
+            'comparacao': calcular_comparacao_tipos([])
+        }
+    
+    perdas_criticas.sort(key=lambda analise: analise['percentual_perda'], reverse=True)
+    
+    return {
+        'resumo': resumo,
+        'criticas': [{
+            'propriedade': analise['propriedade'],
+            'tipo_solo': analise['tipo_solo'],
+            'colheita': analise['colheita'],
+            'produtividade_real': analise['produtividade_real'],
+            'percentual_perda': analise['percentual_perda']
+        } for analise in perdas_criticas[:limite_criticas]]
+    }
+
+def calcular_comparacao_tipos(todas_analises):
+    """
+    Calcula quantidade e perda média das colheitas manuais e mecânicas
     
     Args:
         todas_analises (list): Lista de análises de colheitas
+        
+    Returns:
+        dict: {'manual': {...}, 'mecanica': {...}} com 'quantidade' e 'perda_media' (None se vazio)
     """
-    print(f"\n{'='*60}")
-    print("RESUMO GERAL")
-    print(f"{'='*60}")
+    manuais = [a for a in todas_analises if a['colheita'].eh_colheita_manual()]
+    mecanicas = [a for a in todas_analises if a['colheita'].eh_colheita_mecanica()]
     
-    total_colheitas = len(todas_analises)
-    perdas = [analise['percentual_perda'] for analise in todas_analises]
+    comparacao = {}
+    for nome, analises in (('manual', manuais), ('mecanica', mecanicas)):
+        comparacao[nome] = {
+            'quantidade': len(analises),
+            'perda_media': round(sum(a['percentual_perda'] for a in analises) / len(analises), 2) if analises else None
+        }
     
-    # Estatísticas básicas
-    perda_media = round(sum(perdas) / len(perdas), 2)
-    perda_maxima = max(perdas)
-    perda_minima = min(perdas)
+    return comparacao
+
+def calcular_resumo_geral(todas_analises):
+    """
+    Calcula o resumo estatístico geral das análises (implementação de referência)
     
-    print(f"Total de Colheitas Analisadas: {total_colheitas}")
-    print(f"Perda Média: {perda_media}%")
-    print(f"Perda Mínima: {perda_minima}%")
-    print(f"Perda Máxima: {perda_maxima}%")
+    Args:
+        todas_analises (list): Lista de análises de colheitas
+        
+    Returns:
+        dict: Resumo com totais, distribuição por classificação e comparação por tipo
+    """
+    perdas = [analise['percentual_perda'] for analise in todas_analises]
     
     # Distribuição por classificação
     classificacoes = {}
@@ -261,14 +473,50 @@ def gerar_resumo_geral(todas_analises):
         classe = analise['classificacao']
         classificacoes[classe] = classificacoes.get(classe, 0) + 1
     
+    return {
+        'total_colheitas': len(todas_analises),
+        'perda_media': round(sum(perdas) / len(perdas), 2),
+        'perda_minima': min(perdas),
+        'perda_maxima': max(perdas),
+        'distribuicao': classificacoes,
+        'comparacao': calcular_comparacao_tipos(todas_analises)
+    }
+
+def gerar_resumo_geral(todas_analises):
+    """
+    Gera resumo estatístico geral das análises
+    
+    Args:
+        todas_analises (list): Lista de análises de colheitas
+    """
+    exibir_resumo_geral(calcular_resumo_geral(todas_analises))
+
+def exibir_resumo_geral(resumo):
+    """
+    Exibe o resumo estatístico geral
+    
+    Args:
+        resumo (dict): Resumo no formato de calcular_resumo_geral
+    """
+    print(f"\n{'='*60}")
+    print("RESUMO GERAL")
+    print(f"{'='*60}")
+    
+    total_colheitas = resumo['total_colheitas']
+    
+    print(f"Total de Colheitas Analisadas: {total_colheitas}")
+    print(f"Perda Média: {resumo['perda_media']}%")
+    print(f"Perda Mínima: {resumo['perda_minima']}%")
+    print(f"Perda Máxima: {resumo['perda_maxima']}%")
+    
     print(f"\nDISTRIBUIÇÃO POR CLASSIFICAÇÃO:")
-    for classe, quantidade in classificacoes.items():
+    for classe, quantidade in resumo['distribuicao'].items():
         percentual = round((quantidade / total_colheitas) * 100, 1)
         simbolo = obter_cor_classificacao(classe)
         print(f"  {simbolo} {classe}: {quantidade} colheitas ({percentual}%)")
     
     # Comparação manual vs mecânica
-    comparar_tipos_colheita(todas_analises)
+    exibir_comparacao_tipos(resumo['comparacao'])
 
 def comparar_tipos_colheita(todas_analises):
     """
@@ -277,25 +525,34 @@ def comparar_tipos_colheita(todas_analises):
     Args:
         todas_analises (list): Lista de análises de colheitas
     """
-    manuais = [a for a in todas_analises if a['colheita'].eh_colheita_manual()]
-    mecanicas = [a for a in todas_analises if a['colheita'].eh_colheita_mecanica()]
+    exibir_comparacao_tipos(calcular_comparacao_tipos(todas_analises))
+
+def exibir_comparacao_tipos(comparacao):
+    """
+    Exibe a comparação de perdas entre colheita manual e mecânica
+    
+    Args:
+        comparacao (dict): Comparação no formato de calcular_comparacao_tipos
+    """
+    manual = comparacao['manual']
+    mecanica = comparacao['mecanica']
     
     print(f"\nCOMPARAÇÃO MANUAL vs MECÂNICA:")
     
-    if manuais:
-        perda_media_manual = round(sum(a['percentual_perda'] for a in manuais) / len(manuais), 2)
-        print(f"  Manual: {len(manuais)} colheitas - Perda média: {perda_media_manual}%")
+    if manual['quantidade']:
+        print(f"  Manual: {manual['quantidade']} colheitas - Perda média: {manual['perda_media']}%")
     else:
         print(f"  Manual: Nenhuma colheita manual registrada")
     
-    if mecanicas:
-        perda_media_mecanica = round(sum(a['percentual_perda'] for a in mecanicas) / len(mecanicas), 2)
-        print(f"  Mecânica: {len(mecanicas)} colheitas - Perda média: {perda_media_mecanica}%")
+    if mecanica['quantidade']:
+        print(f"  Mecânica: {mecanica['quantidade']} colheitas - Perda média: {mecanica['perda_media']}%")
     else:
         print(f"  Mecânica: Nenhuma colheita mecânica registrada")
     
     # Análise comparativa
-    if manuais and mecanicas:
+    if manual['quantidade'] and mecanica['quantidade']:
+        perda_media_manual = manual['perda_media']
+        perda_media_mecanica = mecanica['perda_media']
         diferenca = abs(perda_media_mecanica - perda_media_manual)
         if perda_media_manual < perda_media_mecanica:
             print(f"  ✓ Colheita manual tem {diferenca}% menos perda que a mecânica")
@@ -304,18 +561,22 @@ def comparar_tipos_colheita(todas_analises):
         else:
             print(f"  = Perdas similares entre os dois métodos")
 
-def exibir_alertas_perdas_criticas(perdas_criticas):
+def exibir_alertas_perdas_criticas(perdas_criticas, total_criticas=None):
     """
     Exibe alertas específicos para perdas críticas
     
     Args:
         perdas_criticas (list): Lista de análises com perdas críticas
+        total_criticas (int): Total de perdas críticas, quando a lista é apenas parcial
     """
     print(f"\n{'='*60}")
     print("⚠⚠ ALERTAS - PERDAS CRÍTICAS ⚠⚠")
     print(f"{'='*60}")
     
-    print(f"Foram identificadas {len(perdas_criticas)} colheitas com perdas críticas (>15%):")
+    total_criticas = total_criticas or len(perdas_criticas)
+    print(f"Foram identificadas {total_criticas} colheitas com perdas críticas (>15%):")
+    if total_criticas > len(perdas_criticas):
+        print(f"(exibindo as {len(perdas_criticas)} maiores perdas)")
     
     for i, analise in enumerate(perdas_criticas, 1):
         colheita = analise['colheita']
@@ -0,0 +1,118 @@
+"""
+Módulo do catálogo de backups
+Mantém um índice (scripts/data/catalogo_backups.json) com nome, data, tamanhos,
+totais e checksum de cada backup, atualizado a cada gravação, para que a
+listagem não precise abrir nem inspecionar os arquivos.
+"""
+
+import hashlib
+import io
+import json
+import os
+
+NOME_CATALOGO = 'catalogo_backups.json'
+VERSAO_CATALOGO = '1.0'
+
+# Tamanho dos blocos lidos ao calcular o checksum de um arquivo existente
+TAMANHO_BLOCO_CHECKSUM = 1024 * 1024
+
+class ArquivoComHash(io.RawIOBase):
+    """
+    Arquivo binário de escrita que calcula o SHA-256 e o tamanho do que é gravado
+
+    Fica entre o arquivo em disco e as camadas de compressão/texto, então o
+    checksum corresponde exatamente aos bytes do arquivo, sem uma segunda leitura.
+
+    Attr:
+        tamanho (int): Bytes gravados
+    """
+
+    def __init__(self, destino):
+        super().__init__()
+        self._destino = destino
+        self._hash = hashlib.sha256()
+        self.tamanho = 0
+
+    def writable(self):
+        return True
+
+    def write(self, dados):
+        self._destino.write(dados)
+        self._hash.update(dados)
+        self.tamanho += len(dados)
+        return len(dados)
+
+    def close(self):
+        if not self.closed:
+            self._destino.close()
+        super().close()
+
+    @property
+    def checksum(self):
+        """
+        Returns:
+            str: SHA-256 (hexadecimal) dos bytes gravados
+        """
+        return self._hash.hexdigest()
+
+def calcular_checksum(caminho_arquivo):
+    """
+    Calcula o SHA-256 de um arquivo lendo-o em blocos
+
+    Args:
+        caminho_arquivo (str): Caminho do arquivo
+
+    Returns:
+        str: SHA-256 em hexadecimal
+    """
+    hash_arquivo = hashlib.sha256()
+    with open(caminho_arquivo, 'rb') as arquivo:
+        for bloco in iter(lambda: arquivo.read(TAMANHO_BLOCO_CHECKSUM), b''):
+            hash_arquivo.update(bloco)
+    return hash_arquivo.hexdigest()
+
+def carregar_catalogo(pasta_backup):
+    """
+    Carrega o catálogo de backups
+
+    Args:
+        pasta_backup (str): Pasta dos backups
+
+    Returns:
+        dict: Entradas do catálogo indexadas pelo nome do arquivo (vazio se não existir)
+    """
+    try:
+        with open(os.path.join(pasta_backup, NOME_CATALOGO), 'r', encoding='utf-8') as arquivo:
+            catalogo = json.load(arquivo)
+    except (OSError, json.JSONDecodeError):
+        return {}
+
+    backups = catalogo.get('backups') if isinstance(catalogo, dict) else None
+    return backups if isinstance(backups, dict) else {}
+
+def salvar_catalogo(pasta_backup, backups):
+    """
+    Grava o catálogo de backups (arquivo temporário renomeado ao final)
+
+    Args:
+        pasta_backup (str): Pasta dos backups
+        backups (dict): Entradas indexadas pelo nome do arquivo
+    """
+    caminho_catalogo = os.path.join(pasta_backup, NOME_CATALOGO)
+    caminho_temporario = caminho_catalogo + '.tmp'
+
+    with open(caminho_temporario, 'w', encoding='utf-8') as arquivo:
+        json.dump({'versao': VERSAO_CATALOGO, 'backups': backups}, arquivo, indent=2, ensure_ascii=False)
+    os.replace(caminho_temporario, caminho_catalogo)
+
+def registrar_backup(pasta_backup, entrada):
+    """
+    Inclui (ou substitui) a entrada de um backup no catálogo
+
+    Args:
+        pasta_backup (str): Pasta dos backups
+        entrada (dict): Dados do backup; 'nome' é a chave no catálogo
+    """
+    backups = carregar_catalogo(pasta_backup)
+    backups[entrada['nome']] = entrada
+    salvar_catalogo(pasta_backup, backups)
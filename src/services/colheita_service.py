@@ -19,6 +19,7 @@ from src.utils.menu_utils import (
     confirmar_acao,
     exibir_lista_numerada
 )
+from src.utils.instrumentacao import medir
 from src.services.propriedade_service import selecionar_propriedade
 
 def listar_propriedades(lista_propriedades):
@@ -191,6 +192,7 @@ def listar_colheitas_propriedade(propriedade):
         print(f"Produtividade: {colheita.produtividade} t/ha")
         print("-" * 30)
 
+@medir
 def obter_estatisticas_colheitas(lista_propriedades):
     """
     Calcula estatísticas gerais das colheitas
@@ -3,28 +3,20 @@ Módulo de serviços para conexão e operações com banco de dados Oracle
 Contém funções para CRUD e gerenciamento de dados
 """
 
-try:
-    from dotenv import load_dotenv
-    import cx_Oracle
-    import os
-
-    # Carregar as variáveis de ambiente
-    load_dotenv()
-
-    instant_client_path = os.getenv('ORACLE_CLIENT_PATH')
-    if os.path.exists(instant_client_path):
-        os.environ["PATH"] = instant_client_path + ";" + os.environ["PATH"]
-        os.add_dll_directory(instant_client_path)
-    else:
-        print("⚠️ Caminho do Oracle Client não encontrado. Instale o Oracle Client em https://www.oracle.com/database/technologies/instant-client/downloads.html")
-    ORACLE_DISPONIVEL = True
-except ImportError as e:
-    print(f'ERROR {e}')
-    ORACLE_DISPONIVEL = False
-    cx_Oracle = None
+import os
+import re
+import time
+from contextlib import contextmanager
+from datetime import date
+from importlib import import_module
 
 from config.database_config import (
     obter_string_conexao,
+    obter_modo_particionamento,
+    obter_ddl_colheitas,
+    obter_ddl_indices,
+    obter_periodo,
+    CONFIG_AVANCADA,
     SQL_CREATE_TABLES,
     SQL_INSERT,
     SQL_SELECT
@@ -34,34 +26,218 @@ from src.utils.menu_utils import (
     exibir_mensagem_erro,
     exibir_mensagem_info
 )
-from src.models.propriedade import Propriedade
+from src.models.propriedade import Propriedade, LIMITE_COLHEITAS_COLUNAR
 from src.models.colheita import Colheita
+from src.utils.instrumentacao import medir, contar, instrumentacao_ativa
+
+# Driver Oracle (cx_Oracle), carregado apenas quando o banco é usado pela primeira vez
+cx_Oracle = None
+
+# Estado da carga do driver: importar este módulo não faz I/O nem carrega bibliotecas nativas
+_driver = {
+    'carregado': False,
+    'disponivel': False,
+    'erro': None
+}
 
 # Variável global para conexão (pool de conexões)
 _connection_pool = None
 
+# Quantidade de conexões entregues pelo pool desde o início do processo
+_total_aquisicoes = 0
+
+class _CursorMedido:
+    """
+    Cursor que conta round trips (execute, executemany, fetch) e linhas lidas
+
+    Usado apenas com a instrumentação ligada; os demais atributos e
+    métodos são repassados ao cursor do driver.
+    """
+
+    __slots__ = ('_cursor',)
+
+    def __init__(self, cursor):
+        object.__setattr__(self, '_cursor', cursor)
+
+    def __getattr__(self, nome):
+        return getattr(self._cursor, nome)
+
+    def __setattr__(self, nome, valor):
+        setattr(self._cursor, nome, valor)
+
+    def execute(self, *args, **kwargs):
+        contar('round_trips')
+        return self._cursor.execute(*args, **kwargs)
+
+    def executemany(self, sql, linhas, *args, **kwargs):
+        contar('round_trips')
+        contar('linhas_gravadas', len(linhas))
+        return self._cursor.executemany(sql, linhas, *args, **kwargs)
+
+    def fetchone(self):
+        contar('round_trips')
+        linha = self._cursor.fetchone()
+        if linha is not None:
+            contar('linhas_lidas')
+        return linha
+
+    def fetchall(self):
+        contar('round_trips')
+        linhas = self._cursor.fetchall()
+        contar('linhas_lidas', len(linhas))
+        return linhas
+
+    def __iter__(self):
+        # Leitura em blocos de arraysize linhas: um round trip por bloco
+        lidas = 0
+        try:
+            for linha in self._cursor:
+                lidas += 1
+                yield linha
+        finally:
+            contar('linhas_lidas', lidas)
+            contar('round_trips', lidas // max(1, self._cursor.arraysize) + 1)
+
+class _ConexaoMedida:
+    """
+    Conexão que entrega cursores medidos e conta commits/rollbacks como round trips
+    """
+
+    __slots__ = ('conexao',)
+
+    def __init__(self, conexao):
+        self.conexao = conexao
+
+    def __getattr__(self, nome):
+        return getattr(self.conexao, nome)
+
+    def cursor(self):
+        return _CursorMedido(self.conexao.cursor())
+
+    def commit(self):
+        contar('round_trips')
+        return self.conexao.commit()
+
+    def rollback(self):
+        contar('round_trips')
+        return self.conexao.rollback()
+
+def _configurar_oracle_client(caminho_cliente):
+    """
+    Torna as bibliotecas do Oracle Instant Client visíveis para o cx_Oracle
+    
+    Sem ORACLE_CLIENT_PATH, o Instant Client precisa estar no PATH/LD_LIBRARY_PATH.
+    
+    Args:
+        caminho_cliente (str): Pasta do Instant Client ou None
+    """
+    if not caminho_cliente:
+        return
+    
+    if not os.path.isdir(caminho_cliente):
+        exibir_mensagem_info("Caminho do Oracle Client não encontrado. Instale o Oracle Client em "
+                             "https://www.oracle.com/database/technologies/instant-client/downloads.html")
+        return
+    
+    os.environ["PATH"] = caminho_cliente + os.pathsep + os.environ.get("PATH", "")
+    # add_dll_directory só existe no Windows
+    if hasattr(os, 'add_dll_directory'):
+        os.add_dll_directory(caminho_cliente)
+
+def oracle_disponivel():
+    """
+    Indica se o driver Oracle pode ser usado, carregando-o na primeira chamada
+    
+    Carrega o .env, configura o Instant Client e importa o cx_Oracle apenas
+    uma vez; as chamadas seguintes só consultam o resultado. SMPC_DRIVER_ORACLE
+    troca o módulo importado por outro com a mesma API (ex: o driver simulado
+    benchmarks.oracle_simulado, para medir round trips sem um servidor).
+    
+    Returns:
+        bool: True se o driver foi carregado
+    """
+    global cx_Oracle
+    
+    if _driver['carregado']:
+        return _driver['disponivel']
+    _driver['carregado'] = True
+    
+    try:
+        from dotenv import load_dotenv
+    except ImportError as e:
+        _driver['erro'] = str(e)
+        return False
+    
+    # Carregar as variáveis de ambiente
+    load_dotenv()
+    _configurar_oracle_client(os.getenv('ORACLE_CLIENT_PATH'))
+    
+    try:
+        driver = import_module(os.getenv('SMPC_DRIVER_ORACLE', 'cx_Oracle'))
+    except ImportError as e:
+        _driver['erro'] = str(e)
+        return False
+    
+    cx_Oracle = driver
+    _driver['disponivel'] = True
+    return True
+
+@medir
+def _criar_pool():
+    """
+    Cria o pool de sessões Oracle usando os parâmetros de CONFIG_AVANCADA
+    
+    Returns:
+        cx_Oracle.SessionPool: Pool criado
+    """
+    config_conexao = obter_string_conexao()
+    tentativas = max(1, CONFIG_AVANCADA['retry_count'])
+    
+    for tentativa in range(1, tentativas + 1):
+        try:
+            pool = cx_Oracle.SessionPool(
+                user=config_conexao['user'],
+                password=config_conexao['password'],
+                dsn=config_conexao['dsn'],
+                min=CONFIG_AVANCADA['pool_min'],
+                max=CONFIG_AVANCADA['pool_max'],
+                increment=CONFIG_AVANCADA['pool_increment'],
+                encoding=config_conexao['encoding'],
+                threaded=True,
+                getmode=cx_Oracle.SPOOL_ATTRVAL_TIMEDWAIT,
+                wait_timeout=CONFIG_AVANCADA['timeout'] * 1000
+            )
+            # Sessões ociosas acima do mínimo são encerradas após este tempo
+            pool.timeout = CONFIG_AVANCADA['pool_timeout_ocioso']
+            return pool
+        except cx_Oracle.DatabaseError:
+            if tentativa == tentativas:
+                raise
+
+@medir
 def conectar_oracle():
     """
-    Estabelece conexão com banco Oracle
+    Obtém uma conexão do pool de sessões Oracle (o pool é criado na primeira chamada)
     
     Returns:
         cx_Oracle.Connection: Objeto de conexão ou None se falhar
     """
-    if not ORACLE_DISPONIVEL:
+    global _connection_pool, _total_aquisicoes
+    
+    if not oracle_disponivel():
         exibir_mensagem_info("Biblioteca cx_Oracle não instalada. Banco Oracle não disponível.")
         return None
     
     try:
-        config_conexao = obter_string_conexao()
-
-        # Tentar conectar
-        conexao = cx_Oracle.connect(
-            user=config_conexao['user'],
-            password=config_conexao['password'],
-            dsn=config_conexao['dsn'],
-            encoding=config_conexao['encoding']
-        )
+        if _connection_pool is None:
+            _connection_pool = _criar_pool()
+        
+        conexao = _connection_pool.acquire()
+        _total_aquisicoes += 1
         
+        if instrumentacao_ativa():
+            contar('conexoes_obtidas')
+            return _ConexaoMedida(conexao)
         return conexao
         
     except cx_Oracle.DatabaseError as e:
@@ -72,19 +248,88 @@ def conectar_oracle():
         exibir_mensagem_erro(f"Erro ao conectar com Oracle: {e}")
         return None
 
+@medir
 def fechar_conexao(conexao):
     """
-    Fecha conexão com o banco Oracle
+    Devolve a conexão ao pool (ou fecha, se ela não veio de um pool)
     
     Args:
         conexao: Objeto de conexão Oracle
     """
+    if isinstance(conexao, _ConexaoMedida):
+        conexao = conexao.conexao
+    
     try:
         if conexao:
-            conexao.close()
+            if _connection_pool is not None:
+                _connection_pool.release(conexao)
+            else:
+                conexao.close()
     except Exception as e:
         exibir_mensagem_erro(f"Erro ao fechar conexão: {e}")
 
+@contextmanager
+def obter_conexao():
+    """
+    Gerenciador de contexto que obtém uma conexão do pool e a devolve ao final
+    
+    Uso:
+        with obter_conexao() as conexao:
+            if conexao:
+                ...
+    
+    Yields:
+        cx_Oracle.Connection: Conexão do pool ou None se o banco não estiver disponível
+    """
+    conexao = conectar_oracle()
+    try:
+        yield conexao
+    finally:
+        fechar_conexao(conexao)
+
+@medir
+def obter_estatisticas_pool():
+    """
+    Retorna informações sobre o uso do pool de sessões
+    
+    Returns:
+        dict: Estatísticas do pool ou None se o pool ainda não foi criado
+    """
+    if _connection_pool is None:
+        return None
+    
+    try:
+        return {
+            'abertas': _connection_pool.opened,
+            'em_uso': _connection_pool.busy,
+            'minimo': _connection_pool.min,
+            'maximo': _connection_pool.max,
+            'incremento': _connection_pool.increment,
+            'timeout_ocioso': _connection_pool.timeout,
+            'total_aquisicoes': _total_aquisicoes
+        }
+    except Exception as e:
+        exibir_mensagem_erro(f"Erro ao obter estatísticas do pool: {e}")
+        return None
+
+@medir
+def encerrar_pool():
+    """
+    Fecha o pool de sessões e todas as conexões abertas
+    """
+    global _connection_pool
+    
+    if _connection_pool is None:
+        return
+    
+    try:
+        _connection_pool.close(force=True)
+    except Exception as e:
+        exibir_mensagem_erro(f"Erro ao encerrar pool de conexões: {e}")
+    finally:
+        _connection_pool = None
+
+@medir
 def testar_conexao():
     """
     Testa a conexão com o banco Oracle
@@ -92,7 +337,7 @@ def testar_conexao():
     Returns:
         bool: True se conexão foi bem-sucedida, False caso contrário
     """
-    if not ORACLE_DISPONIVEL:
+    if not oracle_disponivel():
         exibir_mensagem_info("cx_Oracle não instalado. Para usar Oracle:")
         exibir_mensagem_info("1. Instale Oracle Database")
         exibir_mensagem_info("2. Execute: pip install cx_Oracle")
@@ -100,14 +345,16 @@ def testar_conexao():
     
     exibir_mensagem_info("Testando conexão com Oracle...")
     
-    conexao = conectar_oracle()
-    if conexao:
+    with obter_conexao() as conexao:
+        if not conexao:
+            exibir_mensagem_erro("Não foi possível conectar ao Oracle")
+            return False
+        
         try:
             cursor = conexao.cursor()
             cursor.execute("SELECT 'Conexão OK' FROM DUAL")
             resultado = cursor.fetchone()
             cursor.close()
-            fechar_conexao(conexao)
             
             exibir_mensagem_sucesso("Conexão com Oracle estabelecida com sucesso!")
             exibir_mensagem_info(f"Resultado do teste: {resultado[0]}")
@@ -115,27 +362,103 @@ def testar_conexao():
             
         except Exception as e:
             exibir_mensagem_erro(f"Erro no teste de conexão: {e}")
-            fechar_conexao(conexao)
             return False
-    else:
-        exibir_mensagem_erro("Não foi possível conectar ao Oracle")
+
+def _criar_indices(cursor, indices):
+    """
+    Cria os índices que ainda não existem e confere o resultado
+    
+    Idempotente: em instalações antigas cria só o que falta e reconstrói
+    índices inutilizáveis (UNUSABLE). Se nomes já repetidos com outra
+    capitalização impedirem o índice único por UPPER(nome) (ORA-01452),
+    cria a versão sem unicidade.
+    
+    Args:
+        cursor: Cursor Oracle
+        indices (dict): Nome do índice -> DDL (ver obter_ddl_indices)
+        
+    Returns:
+        list: Índices que continuam ausentes ou inválidos (vazia se todos estão prontos)
+    """
+    cursor.execute(SQL_SELECT['indices_existentes'])
+    existentes = {nome.lower(): status for nome, status in cursor.fetchall()}
+    
+    for nome, comando in indices.items():
+        try:
+            if existentes.get(nome) == 'UNUSABLE':
+                cursor.execute(f"ALTER INDEX {nome} REBUILD")
+                exibir_mensagem_info(f"Índice {nome.upper()} reconstruído")
+            elif nome not in existentes:
+                cursor.execute(comando)
+                exibir_mensagem_sucesso(f"Índice {nome.upper()} criado com sucesso!")
+        except cx_Oracle.DatabaseError as e:
+            error, = e.args
+            if nome == 'idx_propriedades_nome_upper' and error.code == 1452:
+                exibir_mensagem_info("Nomes repetidos em maiúsculas/minúsculas: índice sem unicidade")
+                cursor.execute(SQL_CREATE_TABLES['indice_nome_sem_unicidade'])
+            else:
+                exibir_mensagem_erro(f"Erro ao criar índice {nome.upper()}: {error.message}")
+    
+    # Índices particionados têm status N/A (o status fica em cada partição)
+    cursor.execute(SQL_SELECT['indices_existentes'])
+    prontos = {nome.lower() for nome, status in cursor.fetchall() if status in ('VALID', 'N/A')}
+    return [nome for nome in indices if nome not in prontos]
+
+def _criar_visao_estatisticas(cursor):
+    """
+    Cria a visão materializada estatisticas_propriedades (e o log em colheitas), se ainda não existir
+    
+    Sem ela (ex: usuário sem o privilégio CREATE MATERIALIZED VIEW) o sistema
+    continua funcionando: obter_estatisticas_banco usa a consulta completa.
+    
+    Args:
+        cursor: Cursor Oracle
+        
+    Returns:
+        bool: True se a visão existe ao final
+    """
+    cursor.execute(SQL_SELECT['visao_estatisticas'])
+    if cursor.fetchone() is not None:
+        return True
+    
+    try:
+        try:
+            cursor.execute(SQL_CREATE_TABLES['estatisticas']['log_colheitas'])
+        except cx_Oracle.DatabaseError as e:
+            error, = e.args
+            if error.code != 12000:  # Log já existe (visão removida ou criação anterior interrompida)
+                raise
+        cursor.execute(SQL_CREATE_TABLES['estatisticas']['visao'])
+        exibir_mensagem_sucesso("Visão materializada ESTATISTICAS_PROPRIEDADES criada com sucesso!")
+        return True
+    except cx_Oracle.DatabaseError as e:
+        error, = e.args
+        exibir_mensagem_info(f"Estatísticas sem visão materializada ({error.message}): usando a consulta completa")
         return False
 
+@medir
 def criar_tabelas():
     """
-    Cria as tabelas necessárias no banco Oracle
+    Cria as tabelas e os índices necessários no banco Oracle
+    
+    Pode ser chamada a cada inicialização: só cria o que ainda não existe,
+    o que também atualiza instalações antigas (tabelas sem os índices).
+    Com SMPC_PARTICIONAMENTO, colheitas é criada particionada por intervalo
+    de data_colheita (mês ou safra), com índices locais.
     
     Returns:
-        bool: True se tabelas foram criadas, False caso contrário
+        bool: True se as tabelas existem ao final, False caso contrário
     """
     conexao = conectar_oracle()
     if not conexao:
         return False
     
+    modo_particionamento = obter_modo_particionamento()
+    
     try:
         cursor = conexao.cursor()
         
-        exibir_mensagem_info("Criando tabelas no banco Oracle...")
+        exibir_mensagem_info("Verificando tabelas e índices no banco Oracle...")
         
         # Verificar se tabelas já existem
         cursor.execute("""
@@ -146,9 +469,6 @@ def criar_tabelas():
         
         if 'PROPRIEDADES' in tabelas_existentes and 'COLHEITAS' in tabelas_existentes:
             exibir_mensagem_info("Tabelas já existem no banco de dados.")
-            cursor.close()
-            fechar_conexao(conexao)
-            return True
         
         # Criar tabela propriedades
         if 'PROPRIEDADES' not in tabelas_existentes:
@@ -157,15 +477,33 @@ def criar_tabelas():
         
         # Criar tabela colheitas
         if 'COLHEITAS' not in tabelas_existentes:
-            cursor.execute(SQL_CREATE_TABLES['colheitas'])
-            exibir_mensagem_sucesso("Tabela COLHEITAS criada com sucesso!")
+            cursor.execute(obter_ddl_colheitas(modo_particionamento))
+            exibir_mensagem_sucesso("Tabela COLHEITAS criada com sucesso!"
+                                    + (f" (partições por {modo_particionamento})" if modo_particionamento else ""))
+        elif modo_particionamento:
+            cursor.execute(SQL_SELECT['tabela_particionada'])
+            if cursor.fetchone() is None:
+                # Converter uma tabela grande é uma operação planejada, não automática
+                exibir_mensagem_info("COLHEITAS já existe sem partições; para particionar, use "
+                                     "ALTER TABLE colheitas MODIFY PARTITION BY ... ONLINE (Oracle 12.2+)")
+                modo_particionamento = None
+        
+        # Índices das consultas (criados também em instalações que já tinham as tabelas)
+        indices_pendentes = _criar_indices(cursor, obter_ddl_indices(modo_particionamento))
+        
+        # Totais por propriedade para o status (obter_estatisticas_banco)
+        _criar_visao_estatisticas(cursor)
         
         # Commit das alterações
         conexao.commit()
         cursor.close()
         fechar_conexao(conexao)
         
-        exibir_mensagem_sucesso("Todas as tabelas foram criadas com sucesso!")
+        if indices_pendentes:
+            # As tabelas funcionam sem os índices, só com consultas mais lentas
+            exibir_mensagem_erro(f"Índices ausentes ou inválidos: {', '.join(indices_pendentes)}")
+        else:
+            exibir_mensagem_sucesso("Tabelas e índices prontos!")
         return True
         
     except cx_Oracle.DatabaseError as e:
@@ -182,6 +520,7 @@ def criar_tabelas():
         fechar_conexao(conexao)
         return False
 
+@medir
 def salvar_propriedade_oracle(propriedade):
     """
     Salva uma propriedade no banco Oracle
@@ -244,6 +583,7 @@ def salvar_propriedade_oracle(propriedade):
         fechar_conexao(conexao)
         return None
 
+@medir
 def salvar_colheita_oracle(colheita, propriedade_id, tipo_solo):
     """
     Salva uma colheita no banco Oracle
@@ -314,6 +654,200 @@ def salvar_colheita_oracle(colheita, propriedade_id, tipo_solo):
         fechar_conexao(conexao)
         return None
 
+@medir
+def _inserir_em_lotes(conexao, sql, linhas, tamanho_lote):
+    """
+    Executa um INSERT ... RETURNING id INTO :id_retorno em lotes com executemany
+    
+    Cada lote é uma transação: linhas com erro são registradas (batch errors)
+    sem impedir a gravação das demais linhas do lote.
+    
+    Args:
+        conexao: Conexão Oracle
+        sql (str): Comando INSERT com RETURNING id INTO :id_retorno
+        linhas (list): Lista de dicionários com os binds de cada linha
+        tamanho_lote (int): Quantidade de linhas por lote
+        
+    Returns:
+        tuple: (ids, falhas) - lista de IDs alinhada com as linhas (None se falhou)
+               e lista de tuplas (indice, mensagem)
+    """
+    ids = [None] * len(linhas)
+    falhas = []
+    cursor = conexao.cursor()
+    
+    try:
+        for inicio in range(0, len(linhas), tamanho_lote):
+            lote = linhas[inicio:inicio + tamanho_lote]
+            
+            id_var = cursor.var(cx_Oracle.NUMBER, arraysize=len(lote))
+            cursor.setinputsizes(id_retorno=id_var)
+            
+            try:
+                cursor.executemany(sql, lote, batcherrors=True)
+                
+                erros = {erro.offset: erro.message for erro in cursor.getbatcherrors()}
+                for i in range(len(lote)):
+                    if i in erros:
+                        falhas.append((inicio + i, erros[i]))
+                    else:
+                        valores = id_var.getvalue(i)
+                        ids[inicio + i] = int(valores[0]) if valores else None
+                
+                conexao.commit()
+                
+            except cx_Oracle.DatabaseError as e:
+                error, = e.args
+                conexao.rollback()
+                for i in range(len(lote)):
+                    ids[inicio + i] = None
+                    falhas.append((inicio + i, error.message))
+    finally:
+        cursor.close()
+    
+    return ids, falhas
+
+def montar_relatorio_lote(ids, falhas, inicio):
+    """
+    Monta o relatório de uma gravação em lote
+    
+    Args:
+        ids (list): IDs gerados (None para linhas com falha)
+        falhas (list): Tuplas (indice, mensagem)
+        inicio (float): Instante de início (time.perf_counter)
+        
+    Returns:
+        dict: Relatório com IDs, falhas, tempo e taxa de gravação
+    """
+    tempo = time.perf_counter() - inicio
+    inseridos = sum(1 for id_gerado in ids if id_gerado is not None)
+    
+    return {
+        'ids': ids,
+        'falhas': falhas,
+        'total': len(ids),
+        'inseridos': inseridos,
+        'tempo_segundos': round(tempo, 3),
+        'linhas_por_segundo': round(inseridos / tempo, 1) if tempo > 0 else 0.0
+    }
+
+@medir
+def salvar_propriedades_lote_oracle(propriedades, tamanho_lote=None):
+    """
+    Salva várias propriedades no banco Oracle com inserção em lote
+    
+    Propriedades que já existem (mesmo nome) não são duplicadas: o ID
+    existente é reaproveitado e a posição é listada em 'reaproveitados'.
+    
+    Args:
+        propriedades (list): Lista de objetos Propriedade
+        tamanho_lote (int): Linhas por lote (padrão: CONFIG_AVANCADA['tamanho_lote'])
+        
+    Returns:
+        dict: Relatório da gravação (ver montar_relatorio_lote) ou None se não conectou
+    """
+    tamanho_lote = tamanho_lote or CONFIG_AVANCADA['tamanho_lote']
+    inicio = time.perf_counter()
+    
+    conexao = conectar_oracle()
+    if not conexao:
+        return None
+    
+    try:
+        linhas = [{
+            'nome': propriedade.nome,
+            'area_total': propriedade.area_total,
+            'localizacao': propriedade.localizacao,
+            'tipo_solo': propriedade.tipo_solo
+        } for propriedade in propriedades]
+        
+        ids, falhas = _inserir_em_lotes(conexao, SQL_INSERT['propriedade_lote'], linhas, tamanho_lote)
+        
+        # Violação de UNIQUE (ORA-00001): propriedade já cadastrada, reaproveitar ID
+        falhas_restantes = []
+        reaproveitados = []
+        cursor = conexao.cursor()
+        for indice, mensagem in falhas:
+            if mensagem.startswith('ORA-00001'):
+                cursor.execute(SQL_SELECT['propriedade_por_nome'], {'nome': linhas[indice]['nome']})
+                existente = cursor.fetchone()
+                if existente:
+                    ids[indice] = existente[0]
+                    reaproveitados.append(indice)
+                    continue
+            falhas_restantes.append((indice, mensagem))
+        cursor.close()
+        
+        fechar_conexao(conexao)
+        relatorio = montar_relatorio_lote(ids, falhas_restantes, inicio)
+        relatorio['reaproveitados'] = reaproveitados
+        return relatorio
+        
+    except cx_Oracle.DatabaseError as e:
+        error, = e.args
+        exibir_mensagem_erro(f"Erro ao salvar propriedades em lote: {error.message}")
+        conexao.rollback()
+        fechar_conexao(conexao)
+        return None
+    except Exception as e:
+        exibir_mensagem_erro(f"Erro inesperado ao salvar propriedades em lote: {e}")
+        conexao.rollback()
+        fechar_conexao(conexao)
+        return None
+
+@medir
+def salvar_colheitas_lote_oracle(registros, tamanho_lote=None):
+    """
+    Salva várias colheitas no banco Oracle com inserção em lote
+    
+    Args:
+        registros (list): Lista de tuplas (colheita, propriedade_id, tipo_solo)
+        tamanho_lote (int): Linhas por lote (padrão: CONFIG_AVANCADA['tamanho_lote'])
+        
+    Returns:
+        dict: Relatório da gravação (ver montar_relatorio_lote) ou None se não conectou
+    """
+    from src.services.calculation_service import calcular_produtividade_esperada, calcular_percentual_perda
+    
+    tamanho_lote = tamanho_lote or CONFIG_AVANCADA['tamanho_lote']
+    inicio = time.perf_counter()
+    
+    conexao = conectar_oracle()
+    if not conexao:
+        return None
+    
+    try:
+        linhas = []
+        for colheita, propriedade_id, tipo_solo in registros:
+            produtividade_esperada = calcular_produtividade_esperada(colheita.area_colhida, tipo_solo)
+            linhas.append({
+                'propriedade_id': propriedade_id,
+                'data_colheita': colheita.data,
+                'area_colhida': colheita.area_colhida,
+                'quantidade_colhida': colheita.quantidade_colhida,
+                'tipo_colheita': colheita.tipo_colheita,
+                'produtividade': colheita.produtividade,
+                'percentual_perda': calcular_percentual_perda(colheita.produtividade, produtividade_esperada)
+            })
+        
+        ids, falhas = _inserir_em_lotes(conexao, SQL_INSERT['colheita_lote'], linhas, tamanho_lote)
+        
+        fechar_conexao(conexao)
+        return montar_relatorio_lote(ids, falhas, inicio)
+        
+    except cx_Oracle.DatabaseError as e:
+        error, = e.args
+        exibir_mensagem_erro(f"Erro ao salvar colheitas em lote: {error.message}")
+        conexao.rollback()
+        fechar_conexao(conexao)
+        return None
+    except Exception as e:
+        exibir_mensagem_erro(f"Erro inesperado ao salvar colheitas em lote: {e}")
+        conexao.rollback()
+        fechar_conexao(conexao)
+        return None
+
+@medir
 def buscar_propriedades_oracle():
     """
     Busca todas as propriedades do banco Oracle
@@ -358,6 +892,7 @@ def buscar_propriedades_oracle():
         fechar_conexao(conexao)
         return None
 
+@medir
 def buscar_colheitas_por_propriedade(propriedade_id):
     """
     Busca colheitas de uma propriedade específica
@@ -408,30 +943,197 @@ def buscar_colheitas_por_propriedade(propriedade_id):
         fechar_conexao(conexao)
         return None
 
-def buscar_historico_completo():
+@medir
+def buscar_historico_completo(data_inicio=None, data_fim=None):
     """
     Busca histórico completo de propriedades e colheitas
     
+    Usa uma única consulta (LEFT JOIN, mantendo propriedades sem colheitas) e
+    agrupa as linhas em objetos Propriedade/Colheita em uma só passada pelo cursor,
+    em vez de uma consulta de colheitas por propriedade. Com um período, só as
+    colheitas (e, na tabela particionada, só as partições) desse período são lidas.
+    
+    Args:
+        data_inicio (date): Primeiro dia das colheitas (None = desde o início)
+        data_fim (date): Último dia das colheitas (None = até hoje)
+        
     Returns:
         list: Lista de propriedades com colheitas carregadas ou None se houver erro
     """
-    # Buscar todas as propriedades
-    propriedades = buscar_propriedades_oracle()
-    if propriedades is None:
+    conexao = conectar_oracle()
+    if not conexao:
         return None
     
-    # Para cada propriedade, buscar suas colheitas
-    for propriedade in propriedades:
-        colheitas = buscar_colheitas_por_propriedade(propriedade.id)
-        if colheitas:
-            propriedade.colheitas = colheitas
+    try:
+        cursor = conexao.cursor()
+        cursor.arraysize = CONFIG_AVANCADA['arraysize']
+        cursor.prefetchrows = CONFIG_AVANCADA['prefetchrows']
+        inicio, fim = obter_periodo(data_inicio, data_fim)
+        cursor.execute(SQL_SELECT['historico_completo'], {'data_inicio': inicio, 'data_fim': fim})
+        
+        propriedades = []
+        propriedade = None
+        
+        # Linhas chegam ordenadas por propriedade: basta detectar a troca de ID
+        for row in cursor:
+            if propriedade is None or propriedade.id != row[0]:
+                propriedade = Propriedade(
+                    nome=row[1],
+                    area_total=float(row[2]),
+                    localizacao=row[3],
+                    tipo_solo=row[4]
+                )
+                propriedade.id = row[0]
+                propriedades.append(propriedade)
+            
+            # Propriedade sem colheitas (lado direito do LEFT JOIN vazio)
+            if row[6] is None:
+                continue
+            
+            data_colheita = row[7].strftime('%d/%m/%Y') if row[7] else ''
+            
+            colheita = Colheita(
+                data=data_colheita,
+                area_colhida=float(row[8]),
+                quantidade_colhida=float(row[9]),
+                tipo_colheita=row[10]
+            )
+            colheita.id = row[6]
+            propriedade.adicionar_colheita(colheita)
+        
+        cursor.close()
+        fechar_conexao(conexao)
+        
+        # Propriedades com muitas colheitas passam para o armazenamento colunar
+        for propriedade in propriedades:
+            propriedade.compactar_colheitas(LIMITE_COLHEITAS_COLUNAR)
+        
+        return propriedades
+        
+    except cx_Oracle.DatabaseError as e:
+        error, = e.args
+        exibir_mensagem_erro(f"Erro ao buscar histórico: {error.message}")
+        cursor.close()
+        fechar_conexao(conexao)
+        return None
+    except Exception as e:
+        exibir_mensagem_erro(f"Erro inesperado ao buscar histórico: {e}")
+        cursor.close()
+        fechar_conexao(conexao)
+        return None
+
+@medir
+def obter_data_servidor():
+    """
+    Obtém a data/hora atual do servidor Oracle (SYSDATE)
+    
+    Returns:
+        datetime: Data/hora do servidor ou None se houver erro
+    """
+    conexao = conectar_oracle()
+    if not conexao:
+        return None
     
-    return propriedades
+    try:
+        cursor = conexao.cursor()
+        cursor.execute(SQL_SELECT['data_servidor'])
+        data_servidor = cursor.fetchone()[0]
+        
+        cursor.close()
+        fechar_conexao(conexao)
+        
+        return data_servidor
+        
+    except cx_Oracle.DatabaseError as e:
+        error, = e.args
+        exibir_mensagem_erro(f"Erro ao obter data do servidor: {error.message}")
+        cursor.close()
+        fechar_conexao(conexao)
+        return None
+    except Exception as e:
+        exibir_mensagem_erro(f"Erro inesperado ao obter data do servidor: {e}")
+        cursor.close()
+        fechar_conexao(conexao)
+        return None
 
-def obter_estatisticas_banco():
+@medir
+def buscar_alteracoes_desde(desde_propriedades, desde_colheitas):
+    """
+    Busca propriedades e colheitas gravadas a partir das marcas informadas
+    
+    Usa data_cadastro (propriedades) e data_registro (colheitas) como marca d'água.
+    
+    Args:
+        desde_propriedades (datetime): Marca para propriedades
+        desde_colheitas (datetime): Marca para colheitas
+        
+    Returns:
+        tuple: (propriedades, colheitas) - lista de Propriedade e lista de tuplas
+               (propriedade_id, Colheita), ou None se houver erro
+    """
+    conexao = conectar_oracle()
+    if not conexao:
+        return None
+    
+    try:
+        cursor = conexao.cursor()
+        
+        cursor.execute(SQL_SELECT['propriedades_desde'], {'desde': desde_propriedades})
+        propriedades = []
+        for row in cursor:
+            propriedade = Propriedade(
+                nome=row[1],
+                area_total=float(row[2]),
+                localizacao=row[3],
+                tipo_solo=row[4]
+            )
+            propriedade.id = row[0]
+            propriedades.append(propriedade)
+        
+        cursor.execute(SQL_SELECT['colheitas_desde'], {'desde': desde_colheitas})
+        colheitas = []
+        for row in cursor:
+            data_colheita = row[2].strftime('%d/%m/%Y') if row[2] else ''
+            
+            colheita = Colheita(
+                data=data_colheita,
+                area_colhida=float(row[3]),
+                quantidade_colhida=float(row[4]),
+                tipo_colheita=row[5]
+            )
+            colheita.id = row[0]
+            colheitas.append((row[1], colheita))
+        
+        cursor.close()
+        fechar_conexao(conexao)
+        
+        return propriedades, colheitas
+        
+    except cx_Oracle.DatabaseError as e:
+        error, = e.args
+        exibir_mensagem_erro(f"Erro ao buscar alterações: {error.message}")
+        cursor.close()
+        fechar_conexao(conexao)
+        return None
+    except Exception as e:
+        exibir_mensagem_erro(f"Erro inesperado ao buscar alterações: {e}")
+        cursor.close()
+        fechar_conexao(conexao)
+        return None
+
+@medir
+def obter_estatisticas_banco(exato=False):
     """
     Obtém estatísticas gerais do banco de dados
     
+    Por padrão lê os totais por propriedade da visão materializada
+    estatisticas_propriedades, atualizada pelo Oracle a cada commit: o custo
+    não cresce com o histórico de colheitas. Se a visão não existir, agrega
+    as tabelas como com exato=True.
+    
+    Args:
+        exato (bool): Agregar todas as colheitas em vez de ler a visão materializada
+        
     Returns:
         dict: Dicionário com estatísticas ou None se houver erro
     """
@@ -441,7 +1143,16 @@ def obter_estatisticas_banco():
     
     try:
         cursor = conexao.cursor()
-        cursor.execute(SQL_SELECT['estatisticas_gerais'])
+        if not exato:
+            try:
+                cursor.execute(SQL_SELECT['estatisticas_resumo'])
+            except cx_Oracle.DatabaseError as e:
+                error, = e.args
+                if error.code != 942:  # ORA-00942: visão não criada
+                    raise
+                exato = True
+        if exato:
+            cursor.execute(SQL_SELECT['estatisticas_gerais'])
         
         row = cursor.fetchone()
         if row:
@@ -480,6 +1191,235 @@ def obter_estatisticas_banco():
         fechar_conexao(conexao)
         return None
 
+@medir
+def obter_relatorio_perdas_oracle(limite_criticas=100, data_inicio=None, data_fim=None):
+    """
+    Calcula o relatório de perdas no próprio Oracle (GROUP BY / CASE)
+    
+    Apenas o resultado agregado e a lista de perdas críticas trafegam pela rede.
+    O período vira um filtro direto em data_colheita, que permite ao Oracle
+    ignorar as partições fora dele.
+    
+    Args:
+        limite_criticas (int): Quantidade máxima de perdas críticas listadas
+        data_inicio (date): Primeiro dia das colheitas (None = desde o início)
+        data_fim (date): Último dia das colheitas (None = até hoje)
+        
+    Returns:
+        dict: {'resumo': dict no formato de calcular_resumo_geral,
+               'criticas': lista de dicionários} ou None se houver erro
+    """
+    conexao = conectar_oracle()
+    if not conexao:
+        return None
+    
+    # Falhas em obter_periodo ou em cursor() acontecem antes de haver cursor para fechar
+    cursor = None
+    try:
+        inicio, fim = obter_periodo(data_inicio, data_fim)
+        periodo = {'data_inicio': inicio, 'data_fim': fim}
+        
+        cursor = conexao.cursor()
+        cursor.execute(SQL_SELECT['relatorio_perdas_resumo'], periodo)
+        row = cursor.fetchone()
+        
+        total = int(row[0]) if row and row[0] else 0
+        contagens = zip(('Baixa', 'Média', 'Alta', 'Crítica'), row[4:8]) if total else []
+        
+        resumo = {
+            'total_colheitas': total,
+            'perda_media': float(row[1]) if total else 0.0,
+            'perda_minima': float(row[2]) if total else 0.0,
+            'perda_maxima': float(row[3]) if total else 0.0,
+            'distribuicao': {classe: int(qtd) for classe, qtd in contagens if qtd},
+            'comparacao': {
+                'manual': {
+                    'quantidade': int(row[8] or 0) if total else 0,
+                    'perda_media': float(row[9]) if total and row[9] is not None else None
+                },
+                'mecanica': {
+                    'quantidade': int(row[10] or 0) if total else 0,
+                    'perda_media': float(row[11]) if total and row[11] is not None else None
+                }
+            }
+        }
+        
+        criticas = []
+        cursor.execute(SQL_SELECT['relatorio_perdas_criticas'], dict(periodo, limite=limite_criticas))
+        for row in cursor:
+            colheita = Colheita(
+                data=row[2].strftime('%d/%m/%Y') if row[2] else '',
+                area_colhida=float(row[3]),
+                quantidade_colhida=float(row[4]),
+                tipo_colheita=row[5]
+            )
+            criticas.append({
+                'propriedade': row[0],
+                'tipo_solo': row[1],
+                'colheita': colheita,
+                'produtividade_real': float(row[6]) if row[6] is not None else colheita.produtividade,
+                'percentual_perda': float(row[7])
+            })
+        
+        cursor.close()
+        fechar_conexao(conexao)
+        
+        return {'resumo': resumo, 'criticas': criticas}
+        
+    except cx_Oracle.DatabaseError as e:
+        error, = e.args
+        exibir_mensagem_erro(f"Erro ao gerar relatório no banco: {error.message}")
+        if cursor is not None:
+            cursor.close()
+        fechar_conexao(conexao)
+        return None
+    except Exception as e:
+        exibir_mensagem_erro(f"Erro inesperado ao gerar relatório no banco: {e}")
+        if cursor is not None:
+            cursor.close()
+        fechar_conexao(conexao)
+        return None
+
+# Nomes de objetos aceitos em DDL montado com o nome (identificadores Oracle sem aspas)
+_NOME_SIMPLES = re.compile(r'^[A-Z][A-Z0-9_$#]{0,29}$')
+
+def _nome_tabela_arquivo(particao, existentes):
+    """
+    Nome da tabela de arquivo de uma partição, sem repetir uma tabela existente
+    
+    Um novo arquivamento da mesma partição (colheitas incluídas depois do
+    anterior) vai para colheitas_arq_<partição>_2, _3...: trocar com a
+    tabela antiga devolveria as colheitas já arquivadas para colheitas.
+    
+    Args:
+        particao (str): Nome da partição (já validado)
+        existentes (set): Nomes (maiúsculos) das tabelas de arquivo existentes
+        
+    Returns:
+        str: Nome em maiúsculas com no máximo 30 caracteres
+    """
+    base = f"COLHEITAS_ARQ_{particao}"
+    nome = base[:30]
+    sequencia = 1
+    while nome in existentes:
+        sequencia += 1
+        sufixo = f"_{sequencia}"
+        nome = base[:30 - len(sufixo)] + sufixo
+    return nome
+
+def _limite_particao(high_value):
+    """
+    Data do limite superior de uma partição (coluna LONG high_value como texto)
+    
+    Args:
+        high_value (str): Ex: "TO_DATE(' 2024-05-01 00:00:00', 'SYYYY-MM-DD HH24:MI:SS', ...)"
+        
+    Returns:
+        date: Limite (exclusivo) da partição ou None se não for uma data
+    """
+    encontrado = re.search(r"(\d{4})-(\d{2})-(\d{2})", high_value or '')
+    if encontrado is None:
+        return None
+    return date(*(int(parte) for parte in encontrado.groups()))
+
+@medir
+def arquivar_particoes_colheitas(data_limite):
+    """
+    Arquiva as partições de colheitas que terminam até data_limite
+    
+    Cada partição é trocada (ALTER TABLE ... EXCHANGE PARTITION) com uma
+    tabela vazia de mesma estrutura, colheitas_arq_<partição>: o Oracle só
+    troca os segmentos, sem copiar nem apagar linhas, e a partição fica
+    vazia em colheitas. Para desfazer, basta trocar de novo. Exige a tabela
+    criada com SMPC_PARTICIONAMENTO e Oracle 18c+ (CREATE TABLE ... FOR EXCHANGE).
+    
+    Args:
+        data_limite (date): Partições com todas as colheitas antes desta data são arquivadas
+        
+    Returns:
+        list: Dicionários com 'particao', 'tabela_arquivo', 'limite' e 'colheitas'
+              ou None se houver erro ou se a tabela não for particionada
+    """
+    conexao = conectar_oracle()
+    if not conexao:
+        return None
+    
+    try:
+        cursor = conexao.cursor()
+        
+        cursor.execute(SQL_SELECT['tabela_particionada'])
+        if cursor.fetchone() is None:
+            exibir_mensagem_erro("A tabela COLHEITAS não é particionada (veja SMPC_PARTICIONAMENTO)")
+            cursor.close()
+            fechar_conexao(conexao)
+            return None
+        
+        cursor.execute(SQL_SELECT['particoes_colheitas'])
+        particoes = [(nome, _limite_particao(high_value)) for nome, high_value in cursor.fetchall()]
+        
+        cursor.execute(SQL_SELECT['tabelas_arquivo_colheitas'])
+        existentes = {row[0] for row in cursor.fetchall()}
+        
+        arquivadas = []
+        for nome, limite in particoes:
+            if limite is None or limite > data_limite:
+                continue
+            
+            # Nomes vão direto no DDL: só identificadores simples do dicionário de dados
+            if not _NOME_SIMPLES.match(nome):
+                exibir_mensagem_erro(f"Partição ignorada (nome inesperado): {nome!r}")
+                continue
+            
+            # Partições vazias (a inicial ou já arquivadas) não geram tabela de arquivo
+            cursor.execute(f"SELECT COUNT(*) FROM colheitas PARTITION ({nome})")
+            quantidade = cursor.fetchone()[0]
+            if not quantidade:
+                continue
+            
+            tabela_arquivo = _nome_tabela_arquivo(nome, existentes)
+            existentes.add(tabela_arquivo)
+            cursor.execute(f"CREATE TABLE {tabela_arquivo} FOR EXCHANGE WITH TABLE colheitas")
+            cursor.execute(f"ALTER TABLE colheitas EXCHANGE PARTITION {nome} WITH TABLE {tabela_arquivo} "
+                           "EXCLUDING INDEXES WITHOUT VALIDATION UPDATE GLOBAL INDEXES")
+            # A partição agora vazia volta a ter índices locais utilizáveis
+            cursor.execute(f"ALTER TABLE colheitas MODIFY PARTITION {nome} REBUILD UNUSABLE LOCAL INDEXES")
+            
+            arquivadas.append({
+                'particao': nome,
+                'tabela_arquivo': tabela_arquivo,
+                'limite': limite,
+                'colheitas': int(quantidade)
+            })
+            exibir_mensagem_sucesso(f"Partição {nome} ({quantidade} colheitas) arquivada em {tabela_arquivo}")
+        
+        if arquivadas:
+            # A troca de partições não passa pelo log da visão materializada
+            try:
+                cursor.execute(SQL_CREATE_TABLES['estatisticas']['recalcular'])
+            except cx_Oracle.DatabaseError as e:
+                error, = e.args
+                exibir_mensagem_info(f"Visão de estatísticas não recalculada: {error.message}")
+        
+        cursor.close()
+        fechar_conexao(conexao)
+        
+        if not arquivadas:
+            exibir_mensagem_info("Nenhuma partição com colheitas anteriores à data informada.")
+        return arquivadas
+        
+    except cx_Oracle.DatabaseError as e:
+        error, = e.args
+        exibir_mensagem_erro(f"Erro ao arquivar partições: {error.message}")
+        cursor.close()
+        fechar_conexao(conexao)
+        return None
+    except Exception as e:
+        exibir_mensagem_erro(f"Erro inesperado ao arquivar partições: {e}")
+        cursor.close()
+        fechar_conexao(conexao)
+        return None
+
+@medir
 def limpar_dados_banco():
     """
     Remove todos os dados das tabelas (apenas para desenvolvimento/teste)
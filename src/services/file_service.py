@@ -3,140 +3,1540 @@ Módulo de serviços para manipulação de arquivos JSON
 Contém funções para backup e restauração de dados
 """
 
+import gzip
+import hashlib
+import io
 import json
+import lzma
 import os
+from bisect import bisect_right
 from datetime import datetime
-from src.models.propriedade import Propriedade
+from src.models.propriedade import Propriedade, LIMITE_COLHEITAS_COLUNAR
 from src.models.colheita import Colheita
+from src.services.snapshot_service import (
+    EXTENSAO_SNAPSHOT,
+    VERSAO_SNAPSHOT,
+    gravar_snapshot,
+    abrir_snapshot,
+    eh_snapshot
+)
+from src.services.catalogo_backup_service import (
+    NOME_CATALOGO,
+    ArquivoComHash,
+    calcular_checksum,
+    carregar_catalogo,
+    salvar_catalogo,
+    registrar_backup
+)
 from src.utils.menu_utils import (
     exibir_mensagem_sucesso,
     exibir_mensagem_erro,
     exibir_mensagem_info,
     confirmar_acao
 )
+from src.utils.instrumentacao import medir, contar
+
+# Formato de backup em fluxo (JSON Lines): um registro por linha
+#   {"tipo": "cabecalho", "versao": "2.0", ...}
+#   {"tipo": "propriedade", ...}   seguido das suas colheitas
+#   {"tipo": "colheita", ...}
+#   {"tipo": "rodape", "total_propriedades": N, "total_colheitas": M}
+VERSAO_BACKUP_STREAM = '2.0'
+EXTENSAO_BACKUP_STREAM = '.jsonl'
+
+# Formato usado por salvar_backup_json quando nenhum é informado ('jsonl', 'json' ou 'snapshot')
+FORMATO_BACKUP_PADRAO = 'jsonl'
+
+# Versão registrada no catálogo para cada formato
+VERSOES_FORMATO = {'json': '1.0', 'jsonl': VERSAO_BACKUP_STREAM, 'snapshot': f"snapshot {VERSAO_SNAPSHOT}"}
+
+# Compressão opcional dos backups: extensão acrescentada ao nome e assinatura (magic bytes)
+EXTENSOES_COMPRESSAO = {'gzip': '.gz', 'lzma': '.xz'}
+ASSINATURAS_COMPRESSAO = {'gzip': b'\x1f\x8b', 'lzma': b'\xfd7zXZ\x00'}
+
+# Nível usado quando nenhum é informado (gzip: 1-9, lzma: preset 0-9)
+NIVEL_COMPRESSAO_PADRAO = 6
+
+# Backups em fluxo compactados são gravados em blocos independentes (membros gzip /
+# streams xz) deste tamanho descompactado, para que uma propriedade possa ser lida
+# descompactando apenas os blocos que a contêm
+TAMANHO_BLOCO_COMPRESSAO = 1024 * 1024
+
+# Índice de deslocamentos (propriedade -> faixa de bytes) gravado ao lado do backup
+EXTENSAO_INDICE = '.idx'
+VERSAO_INDICE = '1.0'
+
+# Backups incrementais: registros de propriedade trazem a operação a aplicar sobre o anterior
+#   'anexar'     colheitas seguintes são acrescentadas às que a propriedade já tinha
+#   'substituir' propriedade e colheitas seguintes substituem as anteriores
+#   'remover'    propriedade excluída desde o backup anterior
+OPERACOES_INCREMENTAIS = (None, 'anexar', 'substituir', 'remover')
+
+# Manifesto com os hashes do último backup, base para o próximo incremental
+NOME_MANIFESTO = 'manifesto_incremental.json'
+
+CAMPOS_PROPRIEDADE = ['nome', 'area_total', 'localizacao', 'tipo_solo']
+CAMPOS_COLHEITA = ['data', 'area_colhida', 'quantidade_colhida', 'tipo_colheita']
+
+def obter_pasta_backup():
+    """
+    Retorna o caminho absoluto da pasta de backups (scripts/data)
+    
+    A variável de ambiente SMPC_PASTA_BACKUP substitui a pasta padrão
+    (usada pelos benchmarks para não misturar arquivos de teste aos backups).
+    
+    Returns:
+        str: Caminho da pasta de backups
+    """
+    pasta = os.getenv('SMPC_PASTA_BACKUP')
+    if pasta:
+        return os.path.abspath(pasta)
+    
+    base_dir = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    return os.path.join(base_dir, "scripts", "data")
+
+def converter_propriedade_para_dict(propriedade):
+    """
+    Converte um objeto Propriedade para dicionário
+    
+    Args:
+        propriedade (Propriedade): Objeto propriedade a ser convertido
+        
+    Returns:
+        dict: Dicionário com dados da propriedade
+    """
+    colheitas_dict = []
+    for colheita in propriedade.colheitas:
+        colheitas_dict.append(converter_colheita_para_dict(colheita))
+    
+    propriedade_dict = {
+        'nome': propriedade.nome,
+        'area_total': propriedade.area_total,
+        'localizacao': propriedade.localizacao,
+        'tipo_solo': propriedade.tipo_solo,
+        'colheitas': colheitas_dict
+    }
+    
+    return propriedade_dict
+
+def converter_dict_para_propriedade(dict_propriedade):
+    """
+    Converte um dicionário para objeto Propriedade
+    
+    Args:
+        dict_propriedade (dict): Dicionário com dados da propriedade
+        
+    Returns:
+        Propriedade: Objeto propriedade criado
+    """
+    # Criar propriedade
+    propriedade = Propriedade(
+        dict_propriedade['nome'],
+        dict_propriedade['area_total'],
+        dict_propriedade['localizacao'],
+        dict_propriedade['tipo_solo']
+    )
+    
+    # Adicionar colheitas se existirem
+    if 'colheitas' in dict_propriedade:
+        for colheita_dict in dict_propriedade['colheitas']:
+            propriedade.adicionar_colheita(converter_dict_para_colheita(colheita_dict))
+    
+    propriedade.compactar_colheitas(LIMITE_COLHEITAS_COLUNAR)
+    
+    return propriedade
+
+def converter_dict_para_colheita(colheita_dict):
+    """
+    Converte um dicionário para objeto Colheita
+    
+    Args:
+        colheita_dict (dict): Dicionário com dados da colheita
+        
+    Returns:
+        Colheita: Objeto colheita criado
+    """
+    return Colheita(
+        colheita_dict['data'],
+        colheita_dict['area_colhida'],
+        colheita_dict['quantidade_colhida'],
+        colheita_dict['tipo_colheita']
+    )
+
+def converter_colheita_para_dict(colheita):
+    """
+    Converte um objeto Colheita para dicionário
+    
+    Args:
+        colheita (Colheita): Objeto colheita a ser convertido
+        
+    Returns:
+        dict: Dicionário com dados da colheita
+    """
+    return {
+        'data': colheita.data,
+        'area_colhida': colheita.area_colhida,
+        'quantidade_colhida': colheita.quantidade_colhida,
+        'tipo_colheita': colheita.tipo_colheita,
+        'produtividade': colheita.produtividade
+    }
+
+def escrever_backup_stream(propriedades, arquivo):
+    """
+    Escreve um backup no formato em fluxo, um registro por linha
+    
+    Nenhuma estrutura intermediária com todo o backup é montada: cada
+    propriedade e cada colheita são serializadas e gravadas na sequência.
+    
+    Args:
+        propriedades (iterable): Propriedades a gravar (lista ou gerador)
+        arquivo: Arquivo texto aberto para escrita
+        
+    Returns:
+        tuple: (total_propriedades, total_colheitas) gravados
+    """
+    cabecalho = {
+        'tipo': 'cabecalho',
+        'versao': VERSAO_BACKUP_STREAM,
+        'data_backup': datetime.now().isoformat()
+    }
+    # Totais no cabeçalho só quando conhecidos de antemão (listas); o rodapé sempre os traz
+    if isinstance(propriedades, list):
+        cabecalho['total_propriedades'] = len(propriedades)
+        cabecalho['total_colheitas'] = sum(len(prop.colheitas) for prop in propriedades)
+    
+    registros = ((None, propriedade, propriedade.colheitas) for propriedade in propriedades)
+    return _escrever_registros_stream(arquivo, cabecalho, registros)
+
+def _escrever_registros_stream(arquivo, cabecalho, registros):
+    """
+    Grava cabeçalho, registros de propriedade/colheita e rodapé de um backup em fluxo
+    
+    Args:
+        arquivo: Arquivo texto aberto para escrita
+        cabecalho (dict): Registro de cabeçalho
+        registros (iterable): Tuplas (operacao, propriedade, colheitas); operacao
+                              None em backups completos. Em 'remover' só o nome é gravado.
+        
+    Returns:
+        tuple: (total_propriedades, total_colheitas) gravados
+    """
+    def escrever(registro):
+        arquivo.write(json.dumps(registro, ensure_ascii=False, separators=(',', ':')))
+        arquivo.write('\n')
+    
+    # Arquivos indexados (_EscritorIndexado) registram onde começa cada propriedade
+    marcar_propriedade = getattr(arquivo, 'marcar_propriedade', None) or (lambda nome, operacao=None: None)
+    
+    escrever(cabecalho)
+    
+    total_propriedades = 0
+    total_colheitas = 0
+    
+    for operacao, propriedade, colheitas in registros:
+        marcar_propriedade(propriedade if operacao == 'remover' else propriedade.nome, operacao)
+        
+        if operacao == 'remover':
+            escrever({'tipo': 'propriedade', 'operacao': operacao, 'nome': propriedade})
+            total_propriedades += 1
+            continue
+        
+        registro = {
+            'tipo': 'propriedade',
+            'nome': propriedade.nome,
+            'area_total': propriedade.area_total,
+            'localizacao': propriedade.localizacao,
+            'tipo_solo': propriedade.tipo_solo
+        }
+        if operacao is not None:
+            registro['operacao'] = operacao
+        escrever(registro)
+        total_propriedades += 1
+        
+        for colheita in colheitas:
+            escrever({'tipo': 'colheita', **converter_colheita_para_dict(colheita)})
+            total_colheitas += 1
+    
+    marcar_propriedade(None)
+    escrever({
+        'tipo': 'rodape',
+        'total_propriedades': total_propriedades,
+        'total_colheitas': total_colheitas
+    })
+    
+    return total_propriedades, total_colheitas
+
+def _validar_campos(registro, campos, descricao, numero_linha):
+    """
+    Verifica se um registro tem todos os campos obrigatórios
+    
+    Raises:
+        ValueError: Se algum campo estiver ausente
+    """
+    for campo in campos:
+        if campo not in registro:
+            raise ValueError(f"linha {numero_linha}: {descricao} sem o campo '{campo}'")
+
+def iterar_backup_stream(arquivo, cabecalho=None):
+    """
+    Lê um backup em fluxo, gerando uma propriedade (com suas colheitas) por vez
+    
+    Validação e criação dos objetos acontecem na mesma passada: a memória
+    usada é a de uma propriedade, independentemente do tamanho do backup.
+    
+    Args:
+        arquivo: Arquivo texto aberto para leitura
+        cabecalho (dict): Se informado, recebe os dados do cabeçalho e do rodapé
+        
+    Yields:
+        Propriedade: Propriedades do backup, na ordem em que foram gravadas
+        
+    Raises:
+        ValueError: Se algum registro for inválido ou o arquivo estiver incompleto
+    """
+    for operacao, _, propriedade in _ler_registros_stream(arquivo, cabecalho):
+        if operacao is not None:
+            raise ValueError("backup incremental: use restaurar_cadeia_incremental")
+        yield propriedade
+
+def _ler_registros_stream(arquivo, cabecalho=None):
+    """
+    Lê os registros de um backup em fluxo (completo ou incremental)
+    
+    Yields:
+        tuple: (operacao, nome, propriedade); operacao é None em backups
+               completos e propriedade é None quando a operação é 'remover'
+        
+    Raises:
+        ValueError: Se algum registro for inválido ou o arquivo estiver incompleto
+    """
+    atual = None
+    total_propriedades = 0
+    total_colheitas = 0
+    rodape = None
+    
+    for numero_linha, linha in enumerate(arquivo, 1):
+        if not linha.strip():
+            continue
+        
+        try:
+            registro = json.loads(linha)
+        except json.JSONDecodeError as e:
+            raise ValueError(f"linha {numero_linha}: JSON inválido ({e})")
+        
+        tipo = registro.get('tipo') if isinstance(registro, dict) else None
+        
+        if numero_linha == 1:
+            if tipo != 'cabecalho' or 'versao' not in registro:
+                raise ValueError("linha 1: cabeçalho do backup ausente")
+            if cabecalho is not None:
+                cabecalho.update(registro)
+            continue
+        
+        if rodape is not None:
+            raise ValueError(f"linha {numero_linha}: registro após o rodapé")
+        
+        if tipo == 'propriedade':
+            if atual is not None:
+                yield _concluir_registro(atual)
+            total_propriedades += 1
+            atual = _converter_registro_propriedade(registro, numero_linha)
+            
+        elif tipo == 'colheita':
+            _validar_campos(registro, CAMPOS_COLHEITA, "colheita", numero_linha)
+            if atual is None or atual[2] is None:
+                raise ValueError(f"linha {numero_linha}: colheita sem propriedade")
+            atual[2].adicionar_colheita(converter_dict_para_colheita(registro))
+            total_colheitas += 1
+            
+        elif tipo == 'rodape':
+            rodape = registro
+            
+        else:
+            raise ValueError(f"linha {numero_linha}: tipo de registro desconhecido '{tipo}'")
+    
+    if rodape is None:
+        raise ValueError("backup incompleto (rodapé ausente)")
+    
+    if (rodape.get('total_propriedades') != total_propriedades or
+            rodape.get('total_colheitas') != total_colheitas):
+        raise ValueError("totais do rodapé não conferem com os registros lidos")
+    
+    if cabecalho is not None:
+        cabecalho['total_propriedades'] = total_propriedades
+        cabecalho['total_colheitas'] = total_colheitas
+    
+    if atual is not None:
+        yield _concluir_registro(atual)
+
+def _converter_registro_propriedade(registro, numero_linha):
+    """
+    Valida um registro de propriedade e cria o objeto correspondente
+    
+    Returns:
+        tuple: (operacao, nome, propriedade); propriedade é None quando a operação é 'remover'
+        
+    Raises:
+        ValueError: Se a operação for desconhecida ou faltar algum campo
+    """
+    operacao = registro.get('operacao')
+    if operacao not in OPERACOES_INCREMENTAIS:
+        raise ValueError(f"linha {numero_linha}: operação desconhecida '{operacao}'")
+    
+    if operacao == 'remover':
+        _validar_campos(registro, ['nome'], "propriedade", numero_linha)
+        return operacao, registro['nome'], None
+    
+    _validar_campos(registro, CAMPOS_PROPRIEDADE, "propriedade", numero_linha)
+    return operacao, registro['nome'], Propriedade(
+        registro['nome'],
+        registro['area_total'],
+        registro['localizacao'],
+        registro['tipo_solo']
+    )
+
+def _concluir_registro(registro):
+    """
+    Compacta as colheitas da propriedade lida antes de entregá-la
+    """
+    propriedade = registro[2]
+    if propriedade is not None:
+        propriedade.compactar_colheitas(LIMITE_COLHEITAS_COLUNAR)
+    return registro
+
+def detectar_compressao(caminho_arquivo):
+    """
+    Identifica a compressão de um arquivo de backup
+    
+    A assinatura (magic bytes) no início do arquivo tem prioridade; a extensão
+    só é usada quando o arquivo é curto demais para ter assinatura.
+    
+    Args:
+        caminho_arquivo (str): Caminho do arquivo
+        
+    Returns:
+        str: 'gzip', 'lzma' ou None se o arquivo não estiver compactado
+    """
+    with open(caminho_arquivo, 'rb') as arquivo:
+        inicio = arquivo.read(6)
+    
+    for compressao, assinatura in ASSINATURAS_COMPRESSAO.items():
+        if inicio.startswith(assinatura):
+            return compressao
+    
+    if len(inicio) < 6:
+        for compressao, extensao in EXTENSOES_COMPRESSAO.items():
+            if caminho_arquivo.endswith(extensao):
+                return compressao
+    
+    return None
+
+def remover_extensao_compressao(nome_arquivo):
+    """
+    Retorna o nome do arquivo sem a extensão de compressão (.gz, .xz)
+    
+    Args:
+        nome_arquivo (str): Nome do arquivo
+        
+    Returns:
+        str: Nome com a extensão do formato (.json, .jsonl) no final
+    """
+    for extensao in EXTENSOES_COMPRESSAO.values():
+        if nome_arquivo.endswith(extensao):
+            return nome_arquivo[:-len(extensao)]
+    return nome_arquivo
+
+def abrir_backup_leitura(caminho_arquivo):
+    """
+    Abre um arquivo de backup para leitura em texto, descompactando em fluxo se necessário
+    
+    Args:
+        caminho_arquivo (str): Caminho do arquivo
+        
+    Returns:
+        file: Arquivo texto aberto para leitura
+    """
+    compressao = detectar_compressao(caminho_arquivo)
+    
+    if compressao == 'gzip':
+        return gzip.open(caminho_arquivo, 'rt', encoding='utf-8')
+    if compressao == 'lzma':
+        return lzma.open(caminho_arquivo, 'rt', encoding='utf-8')
+    return open(caminho_arquivo, 'r', encoding='utf-8')
+
+def abrir_backup_escrita(destino, compressao=None, nivel=None):
+    """
+    Abre um arquivo de backup para escrita em texto, compactando em fluxo se solicitado
+    
+    Args:
+        destino (str | file): Caminho do arquivo ou arquivo binário já aberto
+        compressao (str): 'gzip', 'lzma' ou None
+        nivel (int): Nível de compressão (padrão NIVEL_COMPRESSAO_PADRAO)
+        
+    Returns:
+        file: Arquivo texto aberto para escrita
+    """
+    nivel = NIVEL_COMPRESSAO_PADRAO if nivel is None else nivel
+    
+    if compressao == 'gzip':
+        return gzip.open(destino, 'wt', compresslevel=nivel, encoding='utf-8')
+    if compressao == 'lzma':
+        return lzma.open(destino, 'wt', preset=nivel, encoding='utf-8')
+    if isinstance(destino, str):
+        return open(destino, 'w', encoding='utf-8')
+    return io.TextIOWrapper(destino, encoding='utf-8')
+
+def _ler_inteiro_variavel(dados, posicao):
+    """
+    Lê um inteiro de tamanho variável do formato xz (7 bits por byte)
+    
+    Returns:
+        tuple: (valor, posição seguinte)
+    """
+    valor = 0
+    deslocamento = 0
+    while True:
+        byte = dados[posicao]
+        posicao += 1
+        valor |= (byte & 0x7F) << deslocamento
+        if not byte & 0x80:
+            return valor, posicao
+        deslocamento += 7
+
+def _tamanho_descompactado_xz(arquivo):
+    """
+    Soma os tamanhos descompactados registrados nos índices de um arquivo xz
+    
+    Percorre os streams do fim para o início lendo apenas rodapés e índices,
+    sem descompactar nenhum bloco.
+    """
+    arquivo.seek(0, os.SEEK_END)
+    fim = arquivo.tell()
+    total = 0
+    
+    while fim > 0:
+        # Stream padding: grupos de 4 bytes nulos entre streams
+        arquivo.seek(fim - 4)
+        if arquivo.read(4) == b'\x00' * 4:
+            fim -= 4
+            continue
+        
+        arquivo.seek(fim - 12)
+        rodape = arquivo.read(12)
+        if rodape[10:] != b'YZ':
+            raise ValueError("rodapé xz inválido")
+        
+        tamanho_indice = (int.from_bytes(rodape[4:8], 'little') + 1) * 4
+        arquivo.seek(fim - 12 - tamanho_indice)
+        indice = arquivo.read(tamanho_indice)
+        
+        registros, posicao = _ler_inteiro_variavel(indice, 1)
+        tamanho_blocos = 0
+        for _ in range(registros):
+            tamanho_sem_preenchimento, posicao = _ler_inteiro_variavel(indice, posicao)
+            tamanho_original, posicao = _ler_inteiro_variavel(indice, posicao)
+            tamanho_blocos += (tamanho_sem_preenchimento + 3) & ~3
+            total += tamanho_original
+        
+        # Cabeçalho (12) + blocos + índice + rodapé (12)
+        fim -= 12 + tamanho_blocos + tamanho_indice + 12
+    
+    return total
+
+def obter_tamanho_descompactado(caminho_arquivo, compressao):
+    """
+    Obtém o tamanho original de um backup compactado que não foi gravado por esta versão
+    
+    gzip: descompacta o arquivo uma vez, contando os bytes (o campo ISIZE do
+    trailer só vale para o último membro e guarda o tamanho módulo 2^32).
+    xz: soma dos tamanhos registrados nos índices dos streams, sem descompactar.
+    
+    Args:
+        caminho_arquivo (str): Caminho do arquivo
+        compressao (str): 'gzip' ou 'lzma'
+        
+    Returns:
+        int: Tamanho descompactado em bytes ou None se não puder ser obtido
+    """
+    try:
+        with open(caminho_arquivo, 'rb') as arquivo:
+            if compressao == 'gzip':
+                total = 0
+                with gzip.GzipFile(fileobj=arquivo) as descompactado:
+                    for bloco in iter(lambda: descompactado.read(TAMANHO_BLOCO_COMPRESSAO), b''):
+                        total += len(bloco)
+                return total
+            if compressao == 'lzma':
+                return _tamanho_descompactado_xz(arquivo)
+    except (OSError, EOFError, ValueError, IndexError):
+        pass
+    return None
+
+class _EscritorIndexado:
+    """
+    Arquivo texto de escrita que registra a faixa de bytes de cada propriedade
+    
+    Sem compressão os bytes vão direto para o destino. Com compressão, o texto
+    é acumulado e compactado em blocos independentes de TAMANHO_BLOCO_COMPRESSAO
+    bytes; o arquivo resultante continua legível por gzip/lzma (membros/streams
+    concatenados), mas cada bloco também pode ser descompactado isoladamente.
+    
+    Attr:
+        propriedades (list): [nome, início, tamanho, operação] de cada propriedade
+                             (posições em bytes descompactados)
+        blocos (list): [posição no arquivo, tamanho compactado, início descompactado] de cada bloco
+        tamanho_descompactado (int): Total de bytes de texto gravados
+    """
+    
+    def __init__(self, destino, compressao=None, nivel=None):
+        self._destino = destino
+        self._compressao = compressao
+        self._nivel = NIVEL_COMPRESSAO_PADRAO if nivel is None else nivel
+        self._bloco = bytearray()
+        self._inicio_bloco = 0
+        self._posicao_arquivo = 0
+        self._propriedade_atual = None
+        self.propriedades = []
+        self.blocos = []
+        self.tamanho_descompactado = 0
+    
+    def write(self, texto):
+        dados = texto.encode('utf-8')
+        self.tamanho_descompactado += len(dados)
+        
+        if self._compressao is None:
+            self._destino.write(dados)
+        else:
+            self._bloco += dados
+            if len(self._bloco) >= TAMANHO_BLOCO_COMPRESSAO:
+                self._fechar_bloco()
+        
+        return len(texto)
+    
+    def marcar_propriedade(self, nome, operacao=None):
+        """
+        Encerra a faixa da propriedade anterior e, se nome for informado, inicia a próxima
+        
+        Args:
+            nome (str): Nome da propriedade cujo registro será escrito a seguir (ou None)
+            operacao (str): Operação do registro em backups incrementais
+        """
+        if self._propriedade_atual is not None:
+            self._propriedade_atual[2] = self.tamanho_descompactado - self._propriedade_atual[1]
+            self._propriedade_atual = None
+        
+        if nome is not None:
+            self._propriedade_atual = [nome, self.tamanho_descompactado, 0, operacao]
+            self.propriedades.append(self._propriedade_atual)
+    
+    def _fechar_bloco(self):
+        """
+        Compacta o bloco acumulado como um membro/stream independente
+        """
+        if not self._bloco:
+            return
+        
+        if self._compressao == 'gzip':
+            compactado = gzip.compress(bytes(self._bloco), compresslevel=self._nivel, mtime=0)
+        else:
+            compactado = lzma.compress(bytes(self._bloco), preset=self._nivel)
+        
+        self._destino.write(compactado)
+        self.blocos.append([self._posicao_arquivo, len(compactado), self._inicio_bloco])
+        self._posicao_arquivo += len(compactado)
+        self._inicio_bloco += len(self._bloco)
+        self._bloco.clear()
+    
+    def flush(self):
+        pass
+    
+    def close(self):
+        self.marcar_propriedade(None)
+        if self._compressao is not None:
+            self._fechar_bloco()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, *_):
+        self.close()
+    
+    def gravar_indice(self, caminho_backup):
+        """
+        Grava o índice de deslocamentos ao lado do backup (arquivo .idx)
+        
+        Args:
+            caminho_backup (str): Caminho do arquivo de backup já gravado
+        """
+        indice = {
+            'versao': VERSAO_INDICE,
+            'arquivo': os.path.basename(caminho_backup),
+            'tamanho_arquivo': os.path.getsize(caminho_backup),
+            'compressao': self._compressao,
+            'tamanho_descompactado': self.tamanho_descompactado,
+            'blocos': self.blocos,
+            'propriedades': self.propriedades
+        }
+        
+        caminho_indice = caminho_backup + EXTENSAO_INDICE
+        caminho_temporario = caminho_indice + '.tmp'
+        with open(caminho_temporario, 'w', encoding='utf-8') as arquivo:
+            json.dump(indice, arquivo, ensure_ascii=False, separators=(',', ':'))
+        os.replace(caminho_temporario, caminho_indice)
+
+def ler_indice_backup(nome_arquivo):
+    """
+    Lê o índice de deslocamentos de um backup em fluxo
+    
+    Args:
+        nome_arquivo (str): Nome do arquivo de backup
+        
+    Returns:
+        dict: Índice ou None se não existir ou não corresponder ao arquivo atual
+    """
+    caminho_arquivo = os.path.join(obter_pasta_backup(), nome_arquivo)
+    
+    try:
+        with open(caminho_arquivo + EXTENSAO_INDICE, 'r', encoding='utf-8') as arquivo:
+            indice = json.load(arquivo)
+        if indice.get('tamanho_arquivo') != os.path.getsize(caminho_arquivo):
+            return None
+    except (OSError, ValueError, AttributeError):
+        return None
+    
+    return indice
+
+class _LeitorIndexado:
+    """
+    Lê faixas de bytes descompactados de um backup usando o índice de deslocamentos
+    
+    Com compressão, descompacta apenas os blocos que contêm a faixa pedida
+    (o último bloco lido fica em cache para propriedades vizinhas).
+    """
+    
+    def __init__(self, arquivo, indice):
+        self._arquivo = arquivo
+        self._compressao = indice['compressao']
+        self._blocos = indice['blocos']
+        self._inicios = [bloco[2] for bloco in self._blocos]
+        self._cache = (None, b'')
+    
+    def _descompactar_bloco(self, posicao):
+        if self._cache[0] != posicao:
+            inicio_arquivo, tamanho, _ = self._blocos[posicao]
+            self._arquivo.seek(inicio_arquivo)
+            compactado = self._arquivo.read(tamanho)
+            if self._compressao == 'gzip':
+                self._cache = (posicao, gzip.decompress(compactado))
+            else:
+                self._cache = (posicao, lzma.decompress(compactado))
+        return self._cache[1]
+    
+    def ler(self, inicio, tamanho):
+        """
+        Lê uma faixa de bytes descompactados
+        
+        Args:
+            inicio (int): Posição inicial no conteúdo descompactado
+            tamanho (int): Quantidade de bytes
+            
+        Returns:
+            bytes: Conteúdo da faixa
+        """
+        if self._compressao is None:
+            self._arquivo.seek(inicio)
+            return self._arquivo.read(tamanho)
+        
+        dados = bytearray()
+        posicao = bisect_right(self._inicios, inicio) - 1
+        atual = inicio
+        
+        while len(dados) < tamanho and 0 <= posicao < len(self._blocos):
+            bloco = self._descompactar_bloco(posicao)
+            deslocamento = atual - self._blocos[posicao][2]
+            parte = bloco[deslocamento:deslocamento + tamanho - len(dados)]
+            dados += parte
+            atual += len(parte)
+            posicao += 1
+        
+        if len(dados) != tamanho:
+            raise ValueError("índice de deslocamentos não corresponde ao conteúdo do backup")
+        
+        return bytes(dados)
+
+def _converter_faixa_propriedade(texto):
+    """
+    Converte os registros de uma propriedade (registro da propriedade seguido das colheitas)
+    
+    Args:
+        texto (str): Linhas JSON da faixa lida pelo índice
+        
+    Returns:
+        tuple: (operacao, nome, propriedade) como em _ler_registros_stream
+    """
+    registros = [json.loads(linha) for linha in texto.splitlines() if linha.strip()]
+    
+    if not registros or registros[0].get('tipo') != 'propriedade':
+        raise ValueError("faixa do índice não começa em um registro de propriedade")
+    
+    operacao, nome, propriedade = _converter_registro_propriedade(registros[0], 1)
+    
+    for numero_linha, registro in enumerate(registros[1:], 2):
+        if registro.get('tipo') != 'colheita' or propriedade is None:
+            raise ValueError(f"linha {numero_linha} da faixa: registro inesperado")
+        _validar_campos(registro, CAMPOS_COLHEITA, "colheita", numero_linha)
+        propriedade.adicionar_colheita(converter_dict_para_colheita(registro))
+    
+    return _concluir_registro((operacao, nome, propriedade))
+
+def _iterar_registros_selecionados(nome_arquivo, chaves):
+    """
+    Gera os registros (operacao, nome, propriedade) das propriedades escolhidas de um backup
+    
+    Com índice, lê apenas as faixas das propriedades escolhidas; sem índice
+    (backups antigos ou JSON 1.0), percorre o arquivo descartando as demais.
+    
+    Args:
+        nome_arquivo (str): Nome do arquivo de backup
+        chaves (set): Nomes das propriedades em minúsculas
+    """
+    caminho_arquivo = os.path.join(obter_pasta_backup(), nome_arquivo)
+    indice = ler_indice_backup(nome_arquivo)
+    
+    if indice is not None:
+        with open(caminho_arquivo, 'rb') as arquivo:
+            leitor = _LeitorIndexado(arquivo, indice)
+            for nome, inicio, tamanho, _ in indice['propriedades']:
+                if nome.lower() in chaves:
+                    yield _converter_faixa_propriedade(leitor.ler(inicio, tamanho).decode('utf-8'))
+        return
+    
+    if remover_extensao_compressao(nome_arquivo).endswith(EXTENSAO_BACKUP_STREAM):
+        with abrir_backup_leitura(caminho_arquivo) as arquivo:
+            for operacao, nome, propriedade in _ler_registros_stream(arquivo):
+                if nome.lower() in chaves:
+                    yield operacao, nome, propriedade
+        return
+    
+    for propriedade in iterar_backup(nome_arquivo):
+        if propriedade.nome.lower() in chaves:
+            yield None, propriedade.nome, propriedade
+
+def iterar_backup(nome_arquivo, cabecalho=None):
+    """
+    Gera as propriedades de um arquivo de backup (formato em fluxo ou JSON 1.0,
+    compactado ou não, ou snapshot binário)
+    
+    Args:
+        nome_arquivo (str): Nome do arquivo na pasta de backups (ou caminho completo)
+        cabecalho (dict): Se informado, recebe versão, data e totais do backup
+        
+    Yields:
+        Propriedade: Propriedades do backup
+        
+    Raises:
+        ValueError: Se a estrutura do backup for inválida
+    """
+    caminho_arquivo = os.path.join(obter_pasta_backup(), nome_arquivo)
+    
+    if eh_snapshot(caminho_arquivo):
+        with abrir_snapshot(caminho_arquivo) as snapshot:
+            if cabecalho is not None:
+                cabecalho.update({
+                    'versao': VERSOES_FORMATO['snapshot'],
+                    'data_backup': snapshot.data_criacao.isoformat(),
+                    'total_propriedades': snapshot.total_propriedades,
+                    'total_colheitas': snapshot.total_colheitas
+                })
+            yield from snapshot
+        return
+    
+    with abrir_backup_leitura(caminho_arquivo) as arquivo:
+        if remover_extensao_compressao(caminho_arquivo).endswith(EXTENSAO_BACKUP_STREAM):
+            yield from iterar_backup_stream(arquivo, cabecalho)
+            return
+        
+        # Formato 1.0: documento JSON único
+        backup_data = json.load(arquivo)
+        if not validar_estrutura_json(backup_data):
+            raise ValueError("estrutura do arquivo de backup inválida")
+        
+        if cabecalho is not None:
+            cabecalho.update({chave: valor for chave, valor in backup_data.items() if chave != 'propriedades'})
+        
+        for prop_dict in backup_data['propriedades']:
+            yield converter_dict_para_propriedade(prop_dict)
+
+def _normalizar_nome_backup(nome_arquivo, extensao, compressao):
+    """
+    Garante que o nome do arquivo tenha a extensão do formato (e a da compressão)
+    """
+    nome_arquivo = remover_extensao_compressao(nome_arquivo)
+    if not nome_arquivo.endswith(extensao):
+        nome_arquivo += extensao
+    if compressao is not None:
+        nome_arquivo += EXTENSOES_COMPRESSAO[compressao]
+    return nome_arquivo
+
+def _gerar_nome_backup(prefixo, extensao, compressao):
+    """
+    Nome com data e hora para um novo backup, sem repetir um arquivo existente
+    
+    Dois backups no mesmo segundo (ex: tarefas agendadas em sequência)
+    recebem um sufixo numérico em vez de sobrescrever o anterior.
+    
+    Args:
+        prefixo (str): Início do nome (ex: 'backup_colheitas')
+        extensao (str): Extensão do formato
+        compressao (str): 'gzip', 'lzma' ou None
+        
+    Returns:
+        str: Nome de arquivo ainda não usado na pasta de backups
+    """
+    base = f"{prefixo}_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+    nome_arquivo = _normalizar_nome_backup(base, extensao, compressao)
+    sequencia = 1
+    while os.path.exists(os.path.join(obter_pasta_backup(), nome_arquivo)):
+        sequencia += 1
+        nome_arquivo = _normalizar_nome_backup(f"{base}_{sequencia}", extensao, compressao)
+    return nome_arquivo
+
+@medir
+def _gravar_backup(nome_arquivo, compressao, nivel, escrever, binario=False, metadados=None, indexar=False):
+    """
+    Grava um arquivo de backup na pasta de backups de forma atômica e o registra no catálogo
+    
+    O conteúdo vai para um arquivo temporário renomeado ao final: um backup
+    interrompido nunca substitui um arquivo válido. O checksum é calculado
+    sobre os bytes gravados, na mesma passada da escrita.
+    
+    Args:
+        nome_arquivo (str): Nome final do arquivo
+        compressao (str): 'gzip', 'lzma' ou None
+        nivel (int): Nível de compressão
+        escrever (callable): Função que recebe o arquivo aberto e grava o conteúdo,
+                             retornando (total_propriedades, total_colheitas)
+        binario (bool): Abre o arquivo em modo binário, sem compressão (snapshot)
+        metadados (dict): Campos adicionais da entrada no catálogo (formato, versão...)
+        indexar (bool): Grava o índice de deslocamentos por propriedade (backups em fluxo)
+        
+    Returns:
+        tuple: (caminho do arquivo, valor retornado por escrever)
+    """
+    pasta_data = obter_pasta_backup()
+    
+    # Caminho completo do arquivo
+    caminho_arquivo = os.path.join(pasta_data, nome_arquivo)
+    
+    # Criar pasta data se não existir
+    os.makedirs(pasta_data, exist_ok=True)
+    
+    caminho_temporario = caminho_arquivo + '.tmp'
+    tamanho_texto = None
+    try:
+        com_hash = ArquivoComHash(open(caminho_temporario, 'wb'))
+        with com_hash:
+            buffer = io.BufferedWriter(com_hash)
+            if binario:
+                arquivo = buffer
+            elif indexar:
+                arquivo = _EscritorIndexado(buffer, compressao, nivel)
+            else:
+                arquivo = abrir_backup_escrita(buffer, compressao, nivel)
+            with arquivo:
+                resultado = escrever(arquivo)
+                if compressao is not None and not indexar:
+                    # Em escrita, tell() do gzip/lzma é a posição no fluxo descompactado
+                    arquivo.flush()
+                    tamanho_texto = arquivo.buffer.tell()
+            # gzip/lzma não fecham o arquivo de destino: fechar o buffer aqui
+            buffer.close()
+        os.replace(caminho_temporario, caminho_arquivo)
+    finally:
+        if os.path.exists(caminho_temporario):
+            os.remove(caminho_temporario)
+    
+    contar('bytes_gravados', com_hash.tamanho)
+    
+    # Índice de um arquivo anterior com o mesmo nome não vale mais
+    caminho_indice = caminho_arquivo + EXTENSAO_INDICE
+    if os.path.exists(caminho_indice):
+        os.remove(caminho_indice)
+    
+    total_propriedades, total_colheitas = resultado
+    tamanho_original = com_hash.tamanho
+    if indexar:
+        arquivo.gravar_indice(caminho_arquivo)
+        tamanho_original = arquivo.tamanho_descompactado
+    elif compressao is not None:
+        tamanho_original = tamanho_texto
+    
+    entrada = {
+        'nome': nome_arquivo,
+        'data_backup': datetime.now().isoformat(),
+        'tamanho': com_hash.tamanho,
+        'tamanho_original': tamanho_original,
+        'compressao': compressao,
+        'total_propriedades': total_propriedades,
+        'total_colheitas': total_colheitas,
+        'sha256': com_hash.checksum,
+        'anterior': None
+    }
+    entrada.update(metadados or {})
+    registrar_backup(pasta_data, entrada)
+    
+    return caminho_arquivo, resultado
+
+@medir
+def salvar_backup_json(lista_propriedades, nome_arquivo=None, formato=None, compressao=None, nivel=None,
+                       atualizar_manifesto=True):
+    """
+    Salva backup das propriedades em arquivo JSON
+    
+    Args:
+        lista_propriedades (list): Lista de propriedades a serem salvas
+        nome_arquivo (str): Nome do arquivo (opcional)
+        formato (str): 'jsonl' (em fluxo, padrão), 'json' (documento único, versão 1.0)
+                       ou 'snapshot' (binário colunar, carga via mmap)
+        compressao (str): 'gzip', 'lzma' ou None para gravar sem compressão
+        nivel (int): Nível de compressão (gzip 1-9, lzma 0-9)
+        atualizar_manifesto (bool): Torna este backup a base dos próximos incrementais
+        
+    Returns:
+        bool: True se salvou com sucesso, False caso contrário
+    """
+    formato = formato or FORMATO_BACKUP_PADRAO
+    extensao = {'jsonl': EXTENSAO_BACKUP_STREAM, 'snapshot': EXTENSAO_SNAPSHOT}.get(formato, '.json')
+    
+    if compressao is not None and compressao not in EXTENSOES_COMPRESSAO:
+        exibir_mensagem_erro(f"Compressão não suportada: {compressao}")
+        return False
+    
+    if compressao is not None and formato == 'snapshot':
+        exibir_mensagem_erro("O snapshot binário é mapeado em memória e não pode ser compactado.")
+        return False
+    
+    def escrever_json(arquivo):
+        # Converter propriedades para dicionários
+        propriedades_dict = []
+        for propriedade in lista_propriedades:
+            propriedades_dict.append(converter_propriedade_para_dict(propriedade))
+        
+        # Estrutura do backup
+        backup_data = {
+            'versao': '1.0',
+            'data_backup': datetime.now().isoformat(),
+            'total_propriedades': len(lista_propriedades),
+            'total_colheitas': sum(len(prop.colheitas) for prop in lista_propriedades),
+            'propriedades': propriedades_dict
+        }
+        json.dump(backup_data, arquivo, indent=2, ensure_ascii=False)
+        return backup_data['total_propriedades'], backup_data['total_colheitas']
+    
+    def escrever_stream(arquivo):
+        return escrever_backup_stream(lista_propriedades, arquivo)
+    
+    def escrever_snapshot(arquivo):
+        return gravar_snapshot(lista_propriedades, arquivo)
+    
+    escritores = {'jsonl': escrever_stream, 'snapshot': escrever_snapshot}
+    
+    try:
+        # Definir nome do arquivo se não fornecido
+        if nome_arquivo is None:
+            nome_arquivo = _gerar_nome_backup("backup_colheitas", extensao, compressao)
+        else:
+            nome_arquivo = _normalizar_nome_backup(nome_arquivo, extensao, compressao)
+        
+        caminho_arquivo, (total_propriedades, total_colheitas) = _gravar_backup(
+            nome_arquivo, compressao, nivel,
+            escritores.get(formato, escrever_json),
+            binario=formato == 'snapshot',
+            metadados={'formato': formato, 'versao': VERSOES_FORMATO[formato]},
+            indexar=formato == 'jsonl'
+        )
+        
+        if atualizar_manifesto:
+            salvar_manifesto(nome_arquivo, nome_arquivo, gerar_entradas_manifesto(lista_propriedades))
+        
+        exibir_mensagem_sucesso(f"Backup salvo com sucesso!")
+        exibir_mensagem_info(f"Arquivo: {caminho_arquivo}")
+        exibir_mensagem_info(f"Propriedades: {total_propriedades}")
+        exibir_mensagem_info(f"Colheitas: {total_colheitas}")
+        if compressao is not None:
+            exibir_mensagem_info(f"Tamanho compactado ({compressao}): {formatar_tamanho(os.path.getsize(caminho_arquivo))}")
+        
+        return True
+        
+    except Exception as e:
+        exibir_mensagem_erro(f"Erro ao salvar backup: {e}")
+        return False
+
+def _hash_dados_propriedade(propriedade):
+    """
+    Hash dos dados cadastrais de uma propriedade (sem as colheitas)
+    """
+    dados = [propriedade.nome, float(propriedade.area_total), propriedade.localizacao, propriedade.tipo_solo]
+    return hashlib.sha256(json.dumps(dados, ensure_ascii=False).encode('utf-8')).hexdigest()
+
+def _calcular_entrada_manifesto(propriedade, tamanho_prefixo=None):
+    """
+    Calcula a entrada de manifesto de uma propriedade
+    
+    O hash das colheitas é acumulado na ordem de registro, então o hash dos
+    primeiros N registros sai da mesma passada: se ele bater com o manifesto
+    anterior, as colheitas antigas não mudaram e basta anexar as novas.
+    
+    Args:
+        propriedade (Propriedade): Propriedade a ser resumida
+        tamanho_prefixo (int): Quantidade de colheitas do backup anterior (opcional)
+        
+    Returns:
+        tuple: (entrada do manifesto, hash das primeiras tamanho_prefixo colheitas)
+    """
+    hash_colheitas = hashlib.sha256()
+    hash_prefixo = hash_colheitas.hexdigest() if tamanho_prefixo == 0 else None
+    total = 0
+    
+    for colheita in propriedade.colheitas:
+        hash_colheitas.update(
+            f"{colheita.data}\x1f{float(colheita.area_colhida)!r}\x1f{float(colheita.quantidade_colhida)!r}\x1f"
+            f"{colheita.tipo_colheita}\n".encode('utf-8')
+        )
+        total += 1
+        if total == tamanho_prefixo:
+            hash_prefixo = hash_colheitas.hexdigest()
+    
+    entrada = {
+        'nome': propriedade.nome,
+        'hash_dados': _hash_dados_propriedade(propriedade),
+        'total_colheitas': total,
+        'hash_colheitas': hash_colheitas.hexdigest()
+    }
+    return entrada, hash_prefixo
+
+def gerar_entradas_manifesto(lista_propriedades):
+    """
+    Gera as entradas de manifesto de todas as propriedades
+    
+    Args:
+        lista_propriedades (list): Lista de propriedades
+        
+    Returns:
+        dict: Entradas indexadas pelo nome da propriedade em minúsculas
+    """
+    return {
+        propriedade.nome.lower(): _calcular_entrada_manifesto(propriedade)[0]
+        for propriedade in lista_propriedades
+    }
+
+def carregar_manifesto():
+    """
+    Carrega o manifesto do último backup
+    
+    Returns:
+        dict: Manifesto ou None se não existir ou estiver ilegível
+    """
+    caminho_manifesto = os.path.join(obter_pasta_backup(), NOME_MANIFESTO)
+    
+    try:
+        with open(caminho_manifesto, 'r', encoding='utf-8') as arquivo:
+            manifesto = json.load(arquivo)
+    except (OSError, json.JSONDecodeError):
+        return None
+    
+    if not isinstance(manifesto, dict) or 'propriedades' not in manifesto or 'ultimo' not in manifesto:
+        return None
+    
+    return manifesto
+
+def salvar_manifesto(base, ultimo, entradas):
+    """
+    Grava o manifesto com a situação do último backup
+    
+    Args:
+        base (str): Arquivo do backup completo que inicia a cadeia
+        ultimo (str): Último arquivo gravado na cadeia (completo ou incremental)
+        entradas (dict): Entradas por propriedade (ver gerar_entradas_manifesto)
+    """
+    manifesto = {
+        'versao': '1.0',
+        'data_atualizacao': datetime.now().isoformat(),
+        'base': base,
+        'ultimo': ultimo,
+        'propriedades': entradas
+    }
+    
+    caminho_manifesto = os.path.join(obter_pasta_backup(), NOME_MANIFESTO)
+    caminho_temporario = caminho_manifesto + '.tmp'
+    
+    with open(caminho_temporario, 'w', encoding='utf-8') as arquivo:
+        json.dump(manifesto, arquivo, indent=2, ensure_ascii=False)
+    os.replace(caminho_temporario, caminho_manifesto)
+
+def calcular_alteracoes(lista_propriedades, entradas_anteriores):
+    """
+    Compara as propriedades com o manifesto do último backup
+    
+    Args:
+        lista_propriedades (list): Lista de propriedades atual
+        entradas_anteriores (dict): Entradas do manifesto anterior
+        
+    Returns:
+        tuple: (alterações, novas entradas); alterações é uma lista de tuplas
+               (operacao, propriedade ou nome, colheitas a gravar)
+    """
+    alteracoes = []
+    entradas = {}
+    
+    for propriedade in lista_propriedades:
+        chave = propriedade.nome.lower()
+        anterior = entradas_anteriores.get(chave)
+        tamanho_prefixo = anterior['total_colheitas'] if anterior else None
+        
+        entrada, hash_prefixo = _calcular_entrada_manifesto(propriedade, tamanho_prefixo)
+        entradas[chave] = entrada
+        
+        if anterior is None or entrada['hash_dados'] != anterior['hash_dados'] or \
+                hash_prefixo != anterior['hash_colheitas']:
+            alteracoes.append(('substituir', propriedade, propriedade.colheitas))
+        elif entrada['total_colheitas'] > tamanho_prefixo:
+            alteracoes.append(('anexar', propriedade, propriedade.colheitas[tamanho_prefixo:]))
+    
+    for chave, anterior in entradas_anteriores.items():
+        if chave not in entradas:
+            alteracoes.append(('remover', anterior['nome'], ()))
+    
+    return alteracoes, entradas
 
-def converter_propriedade_para_dict(propriedade):
+@medir
+def salvar_backup_incremental(lista_propriedades, compressao=None, nivel=None):
     """
-    Converte um objeto Propriedade para dicionário
+    Salva apenas o que mudou desde o último backup (completo ou incremental)
+    
+    Sem manifesto (ou com o último arquivo da cadeia ausente) é feito um
+    backup completo, que passa a ser a base dos próximos incrementais.
     
     Args:
-        propriedade (Propriedade): Objeto propriedade a ser convertido
+        lista_propriedades (list): Lista de propriedades
+        compressao (str): 'gzip', 'lzma' ou None
+        nivel (int): Nível de compressão
         
     Returns:
-        dict: Dicionário com dados da propriedade
+        bool: True se salvou com sucesso (ou não havia alterações), False caso contrário
     """
-    colheitas_dict = []
-    for colheita in propriedade.colheitas:
-        colheita_dict = {
-            'data': colheita.data,
-            'area_colhida': colheita.area_colhida,
-            'quantidade_colhida': colheita.quantidade_colhida,
-            'tipo_colheita': colheita.tipo_colheita,
-            'produtividade': colheita.produtividade
+    manifesto = carregar_manifesto()
+    
+    if manifesto is None or not os.path.exists(os.path.join(obter_pasta_backup(), manifesto['ultimo'])):
+        exibir_mensagem_info("Nenhum backup base encontrado: será feito um backup completo.")
+        return salvar_backup_json(lista_propriedades, compressao=compressao, nivel=nivel)
+    
+    if compressao is not None and compressao not in EXTENSOES_COMPRESSAO:
+        exibir_mensagem_erro(f"Compressão não suportada: {compressao}")
+        return False
+    
+    try:
+        alteracoes, entradas = calcular_alteracoes(lista_propriedades, manifesto['propriedades'])
+        
+        if not alteracoes:
+            exibir_mensagem_info("Nenhuma alteração desde o último backup.")
+            return True
+        
+        nome_arquivo = _gerar_nome_backup("backup_incremental", EXTENSAO_BACKUP_STREAM, compressao)
+        if nome_arquivo == manifesto['ultimo']:
+            # Sobrescrever o anterior apagaria um elo da cadeia e a tornaria circular
+            exibir_mensagem_erro(f"O backup incremental substituiria o anterior ({nome_arquivo}).")
+            return False
+        
+        cabecalho = {
+            'tipo': 'cabecalho',
+            'versao': VERSAO_BACKUP_STREAM,
+            'data_backup': datetime.now().isoformat(),
+            'incremental': True,
+            'base': manifesto['base'],
+            'anterior': manifesto['ultimo']
         }
-        colheitas_dict.append(colheita_dict)
+        
+        caminho_arquivo, (total_propriedades, total_colheitas) = _gravar_backup(
+            nome_arquivo, compressao, nivel,
+            lambda arquivo: _escrever_registros_stream(arquivo, cabecalho, alteracoes),
+            metadados={
+                'formato': 'jsonl',
+                'versao': VERSAO_BACKUP_STREAM,
+                'incremental': True,
+                'anterior': manifesto['ultimo']
+            },
+            indexar=True
+        )
+        
+        salvar_manifesto(manifesto['base'], nome_arquivo, entradas)
+        
+        exibir_mensagem_sucesso("Backup incremental salvo com sucesso!")
+        exibir_mensagem_info(f"Arquivo: {caminho_arquivo}")
+        exibir_mensagem_info(f"Backup anterior: {manifesto['ultimo']}")
+        exibir_mensagem_info(f"Propriedades alteradas: {total_propriedades}")
+        exibir_mensagem_info(f"Colheitas gravadas: {total_colheitas}")
+        
+        return True
+        
+    except Exception as e:
+        exibir_mensagem_erro(f"Erro ao salvar backup incremental: {e}")
+        return False
+
+def ler_cabecalho_backup(nome_arquivo):
+    """
+    Lê apenas o cabeçalho de um backup em fluxo (primeira linha)
     
-    propriedade_dict = {
-        'nome': propriedade.nome,
-        'area_total': propriedade.area_total,
-        'localizacao': propriedade.localizacao,
-        'tipo_solo': propriedade.tipo_solo,
-        'colheitas': colheitas_dict
-    }
+    Args:
+        nome_arquivo (str): Nome do arquivo na pasta de backups
+        
+    Returns:
+        dict: Cabeçalho do backup (vazio para backups JSON 1.0 ou ilegíveis)
+    """
+    if not remover_extensao_compressao(nome_arquivo).endswith(EXTENSAO_BACKUP_STREAM):
+        return {}
     
-    return propriedade_dict
+    try:
+        with abrir_backup_leitura(os.path.join(obter_pasta_backup(), nome_arquivo)) as arquivo:
+            cabecalho = json.loads(arquivo.readline())
+    except (OSError, EOFError, ValueError, lzma.LZMAError):
+        return {}
+    
+    return cabecalho if isinstance(cabecalho, dict) else {}
 
-def converter_dict_para_propriedade(dict_propriedade):
+def obter_cadeia_incremental(nome_arquivo):
     """
-    Converte um dicionário para objeto Propriedade
+    Monta a cadeia de restauração de um backup: a base completa e os incrementais até ele
     
     Args:
-        dict_propriedade (dict): Dicionário com dados da propriedade
+        nome_arquivo (str): Backup a restaurar (completo ou incremental)
         
     Returns:
-        Propriedade: Objeto propriedade criado
+        list: Nomes dos arquivos, da base ao backup informado
+        
+    Raises:
+        ValueError: Se algum arquivo da cadeia estiver ausente
     """
-    # Criar propriedade
-    propriedade = Propriedade(
-        dict_propriedade['nome'],
-        dict_propriedade['area_total'],
-        dict_propriedade['localizacao'],
-        dict_propriedade['tipo_solo']
-    )
+    cadeia = [nome_arquivo]
+    cabecalho = ler_cabecalho_backup(nome_arquivo)
     
-    # Adicionar colheitas se existirem
-    if 'colheitas' in dict_propriedade:
-        for colheita_dict in dict_propriedade['colheitas']:
-            colheita = Colheita(
-                colheita_dict['data'],
-                colheita_dict['area_colhida'],
-                colheita_dict['quantidade_colhida'],
-                colheita_dict['tipo_colheita']
-            )
-            propriedade.adicionar_colheita(colheita)
+    while cabecalho.get('incremental'):
+        anterior = cabecalho.get('anterior')
+        if not anterior or not os.path.exists(os.path.join(obter_pasta_backup(), anterior)):
+            raise ValueError(f"backup anterior da cadeia não encontrado: {anterior}")
+        if anterior in cadeia:
+            raise ValueError(f"cadeia de backups circular em {anterior}")
+        cadeia.insert(0, anterior)
+        cabecalho = ler_cabecalho_backup(anterior)
     
-    return propriedade
+    return cadeia
 
-def salvar_backup_json(lista_propriedades, nome_arquivo=None):
+def restaurar_cadeia_incremental(cadeia, cabecalho=None):
     """
-    Salva backup das propriedades em arquivo JSON
+    Restaura um backup completo aplicando, em ordem, os incrementais seguintes
     
     Args:
-        lista_propriedades (list): Lista de propriedades a serem salvas
-        nome_arquivo (str): Nome do arquivo (opcional)
+        cadeia (list): Nomes dos arquivos (ver obter_cadeia_incremental)
+        cabecalho (dict): Se informado, recebe o cabeçalho do último arquivo da cadeia
         
     Returns:
-        bool: True se salvou com sucesso, False caso contrário
+        list: Lista de propriedades restauradas
+        
+    Raises:
+        ValueError: Se algum arquivo for inválido ou não se encaixar no anterior
     """
-    try:
-        # Definir nome do arquivo se não fornecido
-        if nome_arquivo is None:
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            nome_arquivo = f"backup_colheitas_{timestamp}.json"
+    propriedades = {propriedade.nome.lower(): propriedade for propriedade in iterar_backup(cadeia[0], cabecalho)}
+    
+    for nome_arquivo in cadeia[1:]:
+        caminho_arquivo = os.path.join(obter_pasta_backup(), nome_arquivo)
         
-        # Garantir que o arquivo tenha extensão .json
-        if not nome_arquivo.endswith('.json'):
-            nome_arquivo += '.json'
+        with abrir_backup_leitura(caminho_arquivo) as arquivo:
+            for registro in _ler_registros_stream(arquivo, cabecalho):
+                _aplicar_registro(propriedades, registro, nome_arquivo)
+    
+    if cabecalho is not None:
+        cabecalho['total_propriedades'] = len(propriedades)
+        cabecalho['total_colheitas'] = sum(len(prop.colheitas) for prop in propriedades.values())
+    
+    return list(propriedades.values())
+
+def _aplicar_registro(propriedades, registro, nome_arquivo):
+    """
+    Aplica um registro de backup (completo ou incremental) às propriedades restauradas
+    
+    Args:
+        propriedades (dict): Propriedades indexadas pelo nome em minúsculas (alterado no lugar)
+        registro (tuple): (operacao, nome, propriedade) lido do backup
+        nome_arquivo (str): Arquivo de origem, para mensagens de erro
+    """
+    operacao, nome, propriedade = registro
+    chave = nome.lower()
+    
+    if operacao == 'remover':
+        propriedades.pop(chave, None)
+    elif operacao == 'anexar':
+        existente = propriedades.get(chave)
+        if existente is None:
+            raise ValueError(f"{nome_arquivo}: colheitas anexadas a propriedade inexistente '{nome}'")
+        for colheita in propriedade.colheitas:
+            existente.adicionar_colheita(colheita)
+        existente.compactar_colheitas(LIMITE_COLHEITAS_COLUNAR)
+    else:
+        propriedades[chave] = propriedade
+
+def listar_propriedades_backup(nome_arquivo):
+    """
+    Lista os nomes das propriedades de um backup
+    
+    Usa o índice de deslocamentos (ou a tabela do snapshot) quando disponível;
+    backups sem índice são percorridos por completo.
+    
+    Args:
+        nome_arquivo (str): Nome do arquivo de backup (completo ou incremental)
         
-        # Caminho completo do arquivo
-        base_dir = os.path.dirname(os.path.dirname(os.path.dirname(__file__)))
-        caminho_arquivo = os.path.join(base_dir, "scripts", "data", nome_arquivo)
+    Returns:
+        list: Nomes das propriedades que o backup restaura
         
-        # Criar pasta data se não existir
-        os.makedirs(os.path.dirname(caminho_arquivo), exist_ok=True)
+    Raises:
+        ValueError: Se algum arquivo da cadeia for inválido
+    """
+    caminho_arquivo = os.path.join(obter_pasta_backup(), nome_arquivo)
+    
+    if eh_snapshot(caminho_arquivo):
+        with abrir_snapshot(caminho_arquivo) as snapshot:
+            return snapshot.obter_nomes()
+    
+    nomes = {}
+    for arquivo_cadeia in obter_cadeia_incremental(nome_arquivo):
+        indice = ler_indice_backup(arquivo_cadeia)
         
-        # Converter propriedades para dicionários
-        propriedades_dict = []
-        for propriedade in lista_propriedades:
-            propriedades_dict.append(converter_propriedade_para_dict(propriedade))
+        if indice is None:
+            # Sem índice: leitura completa apenas para obter os nomes
+            caminho_cadeia = os.path.join(obter_pasta_backup(), arquivo_cadeia)
+            if remover_extensao_compressao(arquivo_cadeia).endswith(EXTENSAO_BACKUP_STREAM):
+                with abrir_backup_leitura(caminho_cadeia) as arquivo:
+                    registros = [(operacao, nome) for operacao, nome, _ in _ler_registros_stream(arquivo)]
+            else:
+                registros = [(None, propriedade.nome) for propriedade in iterar_backup(arquivo_cadeia)]
+        else:
+            registros = [(operacao, nome) for nome, _, _, operacao in indice['propriedades']]
         
-        # Estrutura do backup
-        backup_data = {
-            'versao': '1.0',
-            'data_backup': datetime.now().isoformat(),
-            'total_propriedades': len(lista_propriedades),
-            'total_colheitas': sum(len(prop.colheitas) for prop in lista_propriedades),
-            'propriedades': propriedades_dict
-        }
+        for operacao, nome in registros:
+            if operacao == 'remover':
+                nomes.pop(nome.lower(), None)
+            else:
+                nomes.setdefault(nome.lower(), nome)
+    
+    return list(nomes.values())
+
+@medir
+def restaurar_propriedades(nome_arquivo, nomes_propriedades, cabecalho=None):
+    """
+    Restaura apenas as propriedades escolhidas de um backup
+    
+    Com o índice de deslocamentos, só as faixas dessas propriedades são lidas
+    e convertidas; em backups incrementais o mesmo vale para cada arquivo da cadeia.
+    
+    Args:
+        nome_arquivo (str): Nome do arquivo de backup (completo, incremental ou snapshot)
+        nomes_propriedades (iterable): Nomes das propriedades (sem diferenciar maiúsculas)
+        cabecalho (dict): Se informado, recebe os totais restaurados
         
-        # Salvar arquivo JSON
-        with open(caminho_arquivo, 'w', encoding='utf-8') as arquivo:
-            json.dump(backup_data, arquivo, indent=2, ensure_ascii=False)
+    Returns:
+        list: Propriedades restauradas, na ordem do backup
         
-        exibir_mensagem_sucesso(f"Backup salvo com sucesso!")
-        exibir_mensagem_info(f"Arquivo: {caminho_arquivo}")
-        exibir_mensagem_info(f"Propriedades: {backup_data['total_propriedades']}")
-        exibir_mensagem_info(f"Colheitas: {backup_data['total_colheitas']}")
+    Raises:
+        ValueError: Se algum arquivo for inválido
+    """
+    chaves = {nome.lower() for nome in nomes_propriedades}
+    caminho_arquivo = os.path.join(obter_pasta_backup(), nome_arquivo)
+    
+    if eh_snapshot(caminho_arquivo):
+        with abrir_snapshot(caminho_arquivo) as snapshot:
+            propriedades = [
+                snapshot[posicao] for posicao, nome in enumerate(snapshot.obter_nomes())
+                if nome.lower() in chaves
+            ]
+    else:
+        restauradas = {}
+        for arquivo_cadeia in obter_cadeia_incremental(nome_arquivo):
+            for registro in _iterar_registros_selecionados(arquivo_cadeia, chaves):
+                _aplicar_registro(restauradas, registro, arquivo_cadeia)
+        propriedades = list(restauradas.values())
+    
+    if cabecalho is not None:
+        cabecalho['total_propriedades'] = len(propriedades)
+        cabecalho['total_colheitas'] = sum(len(prop.colheitas) for prop in propriedades)
+    
+    return propriedades
+
+def carregar_propriedades_selecionadas(nome_arquivo, nomes_propriedades):
+    """
+    Restaura propriedades escolhidas de um backup, exibindo o resultado
+    
+    Args:
+        nome_arquivo (str): Nome do arquivo de backup
+        nomes_propriedades (list): Nomes das propriedades a restaurar
         
-        return True
+    Returns:
+        list: Propriedades restauradas ou None se houver erro
+    """
+    try:
+        cabecalho = {}
+        propriedades = restaurar_propriedades(nome_arquivo, nomes_propriedades, cabecalho)
+        
+        encontradas = {propriedade.nome.lower() for propriedade in propriedades}
+        ausentes = [nome for nome in nomes_propriedades if nome.lower() not in encontradas]
+        
+        exibir_mensagem_sucesso(f"Propriedades restauradas: {len(propriedades)}")
+        exibir_mensagem_info(f"Colheitas restauradas: {cabecalho['total_colheitas']}")
+        if ausentes:
+            exibir_mensagem_info(f"Não encontradas no backup: {', '.join(ausentes)}")
         
+        return propriedades
+        
+    except ValueError as e:
+        exibir_mensagem_erro(f"Estrutura do arquivo de backup inválida: {e}")
+        return None
+    except (OSError, EOFError, lzma.LZMAError) as e:
+        exibir_mensagem_erro(f"Arquivo de backup compactado corrompido ou incompleto: {e}")
+        return None
     except Exception as e:
-        exibir_mensagem_erro(f"Erro ao salvar backup: {e}")
-        return False
+        exibir_mensagem_erro(f"Erro ao restaurar propriedades: {e}")
+        return None
+
+@medir
+def restaurar_backup(nome_arquivo, cabecalho=None):
+    """
+    Restaura todas as propriedades de um backup, sem exibir mensagens
+    
+    Backups incrementais são restaurados com toda a cadeia.
+    
+    Args:
+        nome_arquivo (str): Nome do arquivo (ou caminho completo)
+        cabecalho (dict): Se informado, recebe o cabeçalho/totais e a 'cadeia' restaurada
+        
+    Returns:
+        list: Propriedades restauradas
+        
+    Raises:
+        ValueError: Se algum arquivo da cadeia for inválido
+    """
+    cadeia = obter_cadeia_incremental(nome_arquivo)
+    if cabecalho is not None:
+        cabecalho['cadeia'] = cadeia
+    
+    if len(cadeia) > 1:
+        return restaurar_cadeia_incremental(cadeia, cabecalho)
+    return list(iterar_backup(nome_arquivo, cabecalho))
 
+@medir
 def carregar_backup_json(nome_arquivo):
     """
-    Carrega backup de arquivo JSON
+    Carrega backup de arquivo JSON (formato em fluxo ou versão 1.0)
+    
+    Backups incrementais são restaurados com toda a cadeia: a base completa
+    e os incrementais gravados até o arquivo escolhido.
     
     Args:
         nome_arquivo (str): Nome do arquivo a ser carregado
@@ -146,32 +1546,24 @@ def carregar_backup_json(nome_arquivo):
     """
     try:
         # Caminho completo do arquivo
-        caminho_arquivo = os.path.join("scripts", "data", nome_arquivo)
+        caminho_arquivo = os.path.join(obter_pasta_backup(), nome_arquivo)
         
         # Verificar se arquivo existe
         if not os.path.exists(caminho_arquivo):
             exibir_mensagem_erro(f"Arquivo não encontrado: {caminho_arquivo}")
             return None
         
-        # Carregar arquivo JSON
-        with open(caminho_arquivo, 'r', encoding='utf-8') as arquivo:
-            backup_data = json.load(arquivo)
-        
-        # Validar estrutura do backup
-        if not validar_estrutura_json(backup_data):
-            exibir_mensagem_erro("Estrutura do arquivo de backup inválida")
-            return None
-        
-        # Converter dicionários para objetos
-        propriedades_carregadas = []
-        for prop_dict in backup_data['propriedades']:
-            propriedade = converter_dict_para_propriedade(prop_dict)
-            propriedades_carregadas.append(propriedade)
+        # Ler, validar e converter em uma única passada
+        cabecalho = {}
+        propriedades_carregadas = restaurar_backup(nome_arquivo, cabecalho)
+        cadeia = cabecalho['cadeia']
         
         exibir_mensagem_sucesso(f"Backup carregado com sucesso!")
         exibir_mensagem_info(f"Arquivo: {nome_arquivo}")
-        exibir_mensagem_info(f"Versão: {backup_data.get('versao', 'N/A')}")
-        exibir_mensagem_info(f"Data do backup: {backup_data.get('data_backup', 'N/A')}")
+        if len(cadeia) > 1:
+            exibir_mensagem_info(f"Cadeia restaurada: base {cadeia[0]} + {len(cadeia) - 1} incremental(is)")
+        exibir_mensagem_info(f"Versão: {cabecalho.get('versao', 'N/A')}")
+        exibir_mensagem_info(f"Data do backup: {cabecalho.get('data_backup', 'N/A')}")
         exibir_mensagem_info(f"Propriedades carregadas: {len(propriedades_carregadas)}")
         
         return propriedades_carregadas
@@ -179,10 +1571,17 @@ def carregar_backup_json(nome_arquivo):
     except json.JSONDecodeError as e:
         exibir_mensagem_erro(f"Erro ao ler arquivo JSON: {e}")
         return None
+    except ValueError as e:
+        exibir_mensagem_erro(f"Estrutura do arquivo de backup inválida: {e}")
+        return None
+    except (OSError, EOFError, lzma.LZMAError) as e:
+        exibir_mensagem_erro(f"Arquivo de backup compactado corrompido ou incompleto: {e}")
+        return None
     except Exception as e:
         exibir_mensagem_erro(f"Erro ao carregar backup: {e}")
         return None
 
+@medir
 def validar_estrutura_json(backup_data):
     """
     Valida se a estrutura do JSON está correta
@@ -206,8 +1605,7 @@ def validar_estrutura_json(backup_data):
         
         # Verificar estrutura de cada propriedade
         for propriedade in backup_data['propriedades']:
-            campos_propriedade = ['nome', 'area_total', 'localizacao', 'tipo_solo']
-            for campo in campos_propriedade:
+            for campo in CAMPOS_PROPRIEDADE:
                 if campo not in propriedade:
                     return False
             
@@ -217,8 +1615,7 @@ def validar_estrutura_json(backup_data):
                     return False
                 
                 for colheita in propriedade['colheitas']:
-                    campos_colheita = ['data', 'area_colhida', 'quantidade_colhida', 'tipo_colheita']
-                    for campo in campos_colheita:
+                    for campo in CAMPOS_COLHEITA:
                         if campo not in colheita:
                             return False
         
@@ -227,38 +1624,173 @@ def validar_estrutura_json(backup_data):
     except Exception:
         return False
 
+def formatar_tamanho(tamanho):
+    """
+    Formata um tamanho em bytes para exibição (B, KB, MB, GB)
+    
+    Args:
+        tamanho (int): Tamanho em bytes
+        
+    Returns:
+        str: Tamanho formatado
+    """
+    for unidade in ('B', 'KB', 'MB'):
+        if tamanho < 1024:
+            return f"{tamanho:.0f} {unidade}" if unidade == 'B' else f"{tamanho:.1f} {unidade}"
+        tamanho /= 1024
+    return f"{tamanho:.1f} GB"
+
+def eh_arquivo_backup(nome_arquivo):
+    """
+    Indica se um nome de arquivo da pasta de backups corresponde a um backup
+    
+    Args:
+        nome_arquivo (str): Nome do arquivo
+        
+    Returns:
+        bool: True para .json/.jsonl (compactados ou não) e .snapshot
+    """
+    if nome_arquivo in (NOME_MANIFESTO, NOME_CATALOGO):
+        return False
+    return remover_extensao_compressao(nome_arquivo).endswith(('.json', EXTENSAO_BACKUP_STREAM, EXTENSAO_SNAPSHOT))
+
+def _catalogar_arquivo(nome_arquivo):
+    """
+    Monta a entrada de catálogo de um backup que não foi gravado por esta versão
+    (arquivos antigos ou copiados para a pasta). Feito uma única vez por arquivo.
+    
+    Args:
+        nome_arquivo (str): Nome do arquivo na pasta de backups
+        
+    Returns:
+        dict: Entrada do catálogo
+    """
+    caminho_arquivo = os.path.join(obter_pasta_backup(), nome_arquivo)
+    tamanho = os.path.getsize(caminho_arquivo)
+    compressao = detectar_compressao(caminho_arquivo)
+    data_modificacao = datetime.fromtimestamp(os.path.getmtime(caminho_arquivo)).isoformat()
+    
+    entrada = {
+        'nome': nome_arquivo,
+        'data_backup': data_modificacao,
+        'tamanho': tamanho,
+        'tamanho_original': obter_tamanho_descompactado(caminho_arquivo, compressao) if compressao else tamanho,
+        'compressao': compressao,
+        'total_propriedades': None,
+        'total_colheitas': None,
+        'sha256': calcular_checksum(caminho_arquivo),
+        'anterior': None,
+        'formato': None,
+        'versao': None
+    }
+    
+    try:
+        if eh_snapshot(caminho_arquivo):
+            with abrir_snapshot(caminho_arquivo) as snapshot:
+                entrada.update({
+                    'formato': 'snapshot',
+                    'versao': VERSOES_FORMATO['snapshot'],
+                    'data_backup': snapshot.data_criacao.isoformat(),
+                    'total_propriedades': snapshot.total_propriedades,
+                    'total_colheitas': snapshot.total_colheitas
+                })
+        elif remover_extensao_compressao(nome_arquivo).endswith(EXTENSAO_BACKUP_STREAM):
+            cabecalho = ler_cabecalho_backup(nome_arquivo)
+            entrada['formato'] = 'jsonl'
+            for campo in ('versao', 'data_backup', 'total_propriedades', 'total_colheitas', 'anterior'):
+                if campo in cabecalho:
+                    entrada[campo] = cabecalho[campo]
+            if cabecalho.get('incremental'):
+                entrada['incremental'] = True
+        else:
+            # Formato 1.0: os totais estão no próprio documento
+            with abrir_backup_leitura(caminho_arquivo) as arquivo:
+                backup_data = json.load(arquivo)
+            entrada['formato'] = 'json'
+            for campo in ('versao', 'data_backup', 'total_propriedades', 'total_colheitas'):
+                if campo in backup_data:
+                    entrada[campo] = backup_data[campo]
+    except (OSError, EOFError, ValueError, lzma.LZMAError):
+        # Arquivo ilegível: listado sem totais, o erro aparece ao importar
+        pass
+    
+    # O catálogo guarda a data em ISO 8601; datas em outro formato dão lugar à do arquivo
+    if _converter_data_backup(entrada['data_backup']) is None:
+        entrada['data_backup'] = data_modificacao
+    
+    return entrada
+
+def _converter_data_backup(data_backup):
+    """
+    Converte a data de uma entrada do catálogo (ISO 8601)
+    
+    Args:
+        data_backup (str): Data registrada no catálogo
+        
+    Returns:
+        datetime: Data convertida ou None se ausente ou fora do formato ISO
+    """
+    try:
+        return datetime.fromisoformat(data_backup)
+    except (TypeError, ValueError):
+        return None
+
+@medir
 def listar_arquivos_backup():
     """
     Lista todos os arquivos de backup disponíveis na pasta scripts/data
     
+    Os dados vêm do catálogo de backups; um único os.listdir reconcilia o
+    catálogo com a pasta (arquivos removidos saem, arquivos novos são
+    catalogados uma vez).
+    
     Returns:
-        list: Lista de dicionários contendo informações dos arquivos de backup
+        list: Lista de dicionários contendo informações dos arquivos de backup,
+              do mais recente para o mais antigo
     """
     try:
-        # Caminho absoluto até a pasta smcp/
-        base_dir = os.path.dirname(os.path.dirname(os.path.dirname(__file__)))
-        pasta_data = os.path.join(base_dir, "scripts", "data")
+        pasta_data = obter_pasta_backup()
         
         # Se a pasta não existir, retorna lista vazia
         if not os.path.exists(pasta_data):
             return []
         
+        catalogo = carregar_catalogo(pasta_data)
+        presentes = {arquivo for arquivo in os.listdir(pasta_data) if eh_arquivo_backup(arquivo)}
+        alterado = False
+        
+        for nome in list(catalogo):
+            if nome not in presentes:
+                del catalogo[nome]
+                alterado = True
+        
+        for nome in presentes - catalogo.keys():
+            catalogo[nome] = _catalogar_arquivo(nome)
+            alterado = True
+        
+        if alterado:
+            salvar_catalogo(pasta_data, catalogo)
+        
         arquivos = []
-        for arquivo in os.listdir(pasta_data):
-            if arquivo.endswith('.json'):
-                caminho_completo = os.path.join(pasta_data, arquivo)
-                tamanho = os.path.getsize(caminho_completo)
-                modificacao = os.path.getmtime(caminho_completo)
-                data_modificacao = datetime.fromtimestamp(modificacao).strftime("%d/%m/%Y %H:%M")
-                
-                arquivos.append({
-                    'nome': arquivo,
-                    'tamanho': tamanho,
-                    'data_modificacao': data_modificacao
-                })
+        for entrada in catalogo.values():
+            tamanho = entrada.get('tamanho')
+            tamanho_original = entrada.get('tamanho_original')
+            compressao = entrada.get('compressao')
+            
+            arquivo = dict(entrada)
+            data_backup = _converter_data_backup(entrada.get('data_backup'))
+            # Entradas antigas com data fora do formato ISO são listadas com a data como está
+            arquivo['data_modificacao'] = (
+                data_backup.strftime("%d/%m/%Y %H:%M") if data_backup else str(entrada.get('data_backup') or '-')
+            )
+            arquivo['taxa_compressao'] = (
+                round(tamanho_original / tamanho, 2) if compressao and tamanho and tamanho_original else None
+            )
+            arquivo.setdefault('anterior', None)
+            arquivos.append(arquivo)
         
-        # Ordena por data de modificação (opcional: mais recentes primeiro)
-        arquivos.sort(key=lambda x: x['data_modificacao'], reverse=True)
+        # Ordena pela data do backup (ISO 8601), mais recentes primeiro
+        arquivos.sort(key=lambda x: str(x.get('data_backup') or ''), reverse=True)
         
         return arquivos
         
@@ -266,6 +1798,52 @@ def listar_arquivos_backup():
         exibir_mensagem_erro(f"Erro ao listar arquivos: {e}")
         return []
 
+@medir
+def verificar_integridade_backup(nome_arquivo):
+    """
+    Confere o checksum de um backup com o registrado no catálogo
+    
+    Args:
+        nome_arquivo (str): Nome do arquivo na pasta de backups
+        
+    Returns:
+        bool: True se confere (ou não há checksum registrado), False se divergir
+    """
+    pasta_data = obter_pasta_backup()
+    entrada = carregar_catalogo(pasta_data).get(nome_arquivo)
+    
+    if not entrada or not entrada.get('sha256'):
+        return True
+    
+    return calcular_checksum(os.path.join(pasta_data, nome_arquivo)) == entrada['sha256']
+
+def _confirmar_integridade_cadeia(nome_arquivo):
+    """
+    Confere o checksum de todos os arquivos necessários para restaurar um backup
+    (a base e os incrementais até ele) e pergunta se deve continuar se algum divergir
+    
+    Args:
+        nome_arquivo (str): Backup escolhido
+        
+    Returns:
+        bool: True para prosseguir com a importação
+    """
+    try:
+        cadeia = obter_cadeia_incremental(nome_arquivo)
+    except ValueError as e:
+        exibir_mensagem_erro(f"Não é possível restaurar este backup: {e}")
+        return False
+    
+    corrompidos = [arquivo for arquivo in cadeia if not verificar_integridade_backup(arquivo)]
+    if not corrompidos:
+        return True
+    
+    exibir_mensagem_erro("O checksum não confere com o catálogo (arquivo alterado ou corrompido).")
+    for arquivo in corrompidos:
+        exibir_mensagem_info(f"Arquivo: {arquivo}")
+    exibir_mensagem_info("Se apenas algumas propriedades estiverem danificadas, restaure as demais pela opção 2.")
+    return confirmar_acao("Importar mesmo assim?")
+
 def fazer_backup_interativo(lista_propriedades):
     """
     Função interativa para fazer backup
@@ -287,7 +1865,28 @@ def fazer_backup_interativo(lista_propriedades):
     print(f"• Colheitas: {total_colheitas}")
     
     if confirmar_acao("Deseja fazer o backup destes dados?"):
-        return salvar_backup_json(lista_propriedades)
+        incremental = False
+        manifesto = carregar_manifesto()
+        if manifesto is not None:
+            print(f"\nÚltimo backup: {manifesto['ultimo']}")
+            print("1. Completo")
+            print("2. Incremental (apenas o que mudou desde o último backup)")
+            incremental = input("Escolha o tipo de backup (1-2, Enter = completo): ").strip() == '2'
+        
+        print("\nFORMATO DO ARQUIVO:")
+        print("1. JSON Lines")
+        print("2. JSON Lines + gzip (.gz)")
+        print("3. JSON Lines + lzma (.xz - menor arquivo, mais lento)")
+        if not incremental:
+            print("4. Snapshot binário (.snapshot - carga mais rápida, sem compressão)")
+        opcao = input("Escolha o formato (Enter = JSON Lines): ").strip()
+        compressao = {'2': 'gzip', '3': 'lzma'}.get(opcao)
+        
+        if incremental:
+            return salvar_backup_incremental(lista_propriedades, compressao=compressao)
+        if opcao == '4':
+            return salvar_backup_json(lista_propriedades, formato='snapshot')
+        return salvar_backup_json(lista_propriedades, compressao=compressao)
     else:
         exibir_mensagem_info("Backup cancelado pelo usuário.")
         return False
@@ -303,7 +1902,7 @@ def importar_backup_interativo():
     
     if not arquivos:
         exibir_mensagem_erro("Nenhum arquivo de backup encontrado na pasta 'scripts/data'.")
-        exibir_mensagem_info("Coloque arquivos .json na pasta 'scripts/data' para importar.")
+        exibir_mensagem_info("Coloque arquivos .json, .jsonl (opcionalmente .gz/.xz) ou .snapshot na pasta 'scripts/data' para importar.")
         return None
     
     print(f"\nARQUIVOS DE BACKUP DISPONÍVEIS:")
@@ -311,8 +1910,21 @@ def importar_backup_interativo():
     
     for i, arquivo in enumerate(arquivos, 1):
         print(f"{i}. {arquivo['nome']}")
-        print(f"   Tamanho: {arquivo['tamanho']} bytes")
-        print(f"   Modificado: {arquivo['data_modificacao']}")
+        if arquivo['compressao'] is not None:
+            print(f"   Tamanho: {formatar_tamanho(arquivo['tamanho'])} ({arquivo['compressao']})", end="")
+            if arquivo['taxa_compressao']:
+                print(f" - original {formatar_tamanho(arquivo['tamanho_original'])}, taxa {arquivo['taxa_compressao']:.1f}:1")
+            else:
+                print()
+        else:
+            print(f"   Tamanho: {arquivo['tamanho']} bytes")
+        print(f"   Data: {arquivo['data_modificacao']}")
+        if arquivo.get('total_propriedades') is not None:
+            # Um incremental guarda só o que mudou: os totais não são os do backup restaurado
+            rotulo = "Alterações - propriedades" if arquivo['anterior'] else "Propriedades"
+            print(f"   {rotulo}: {arquivo['total_propriedades']} | Colheitas: {arquivo['total_colheitas']}")
+        if arquivo['anterior']:
+            print(f"   Incremental sobre: {arquivo['anterior']}")
         print()
     
     try:
@@ -327,6 +1939,15 @@ def importar_backup_interativo():
             arquivo_selecionado = arquivos[indice]['nome']
             
             if confirmar_acao(f"Importar backup do arquivo '{arquivo_selecionado}'?"):
+                # Vale para as duas opções: ambas leem a cadeia inteira de um incremental
+                if not _confirmar_integridade_cadeia(arquivo_selecionado):
+                    return None
+                
+                print("\n1. Restaurar todas as propriedades")
+                print("2. Restaurar apenas propriedades selecionadas")
+                if input("Escolha (1-2, Enter = todas): ").strip() == '2':
+                    return importar_propriedades_selecionadas(arquivo_selecionado)
+                
                 return carregar_backup_json(arquivo_selecionado)
             else:
                 exibir_mensagem_info("Importação cancelada.")
@@ -340,4 +1961,46 @@ def importar_backup_interativo():
         return None
     except Exception as e:
         exibir_mensagem_erro(f"Erro durante importação: {e}")
-        return None
\ No newline at end of file
+        return None
+
+def importar_propriedades_selecionadas(nome_arquivo):
+    """
+    Função interativa para restaurar apenas algumas propriedades de um backup
+    
+    Args:
+        nome_arquivo (str): Nome do arquivo de backup
+        
+    Returns:
+        list: Propriedades restauradas ou None se cancelado
+    """
+    try:
+        nomes = listar_propriedades_backup(nome_arquivo)
+    except (ValueError, OSError, EOFError, lzma.LZMAError) as e:
+        exibir_mensagem_erro(f"Não foi possível listar as propriedades do backup: {e}")
+        return None
+    
+    if not nomes:
+        exibir_mensagem_info("O backup não contém propriedades.")
+        return None
+    
+    print("\nPROPRIEDADES NO BACKUP:")
+    print("-" * 60)
+    for i, nome in enumerate(nomes, 1):
+        print(f"{i}. {nome}")
+    
+    opcoes = input("\nNúmeros das propriedades separados por vírgula (ex: 1,3) ou 0 para cancelar: ").strip()
+    if opcoes in ('', '0'):
+        exibir_mensagem_info("Importação cancelada.")
+        return None
+    
+    try:
+        indices = [int(opcao) - 1 for opcao in opcoes.split(',') if opcao.strip()]
+    except ValueError:
+        exibir_mensagem_erro("Digite apenas números separados por vírgula.")
+        return None
+    
+    if not all(0 <= indice < len(nomes) for indice in indices):
+        exibir_mensagem_erro(f"Opção inválida. Digite números entre 1 e {len(nomes)}")
+        return None
+    
+    return carregar_propriedades_selecionadas(nome_arquivo, [nomes[indice] for indice in dict.fromkeys(indices)])
@@ -0,0 +1,360 @@
+"""
+Módulo de importação de colheitas a partir de arquivos CSV
+Lê o arquivo linha a linha, valida cada registro com as mesmas regras do
+cadastro interativo e grava as linhas válidas em lotes (memória ou Oracle).
+Linhas inválidas vão para um arquivo de rejeitados com o motivo.
+"""
+
+import csv
+import os
+import time
+from datetime import datetime
+
+from config.database_config import CONFIG_AVANCADA
+from src.models.colheita import Colheita
+from src.utils.validation import (
+    validar_data,
+    validar_area_propriedade,
+    validar_quantidade_colheita,
+    validar_tipo_colheita,
+    validar_produtividade_suspeita
+)
+from src.utils.menu_utils import (
+    exibir_mensagem_sucesso,
+    exibir_mensagem_erro,
+    exibir_mensagem_info,
+    confirmar_acao
+)
+from src.utils.instrumentacao import medir
+
+# Colunas obrigatórias do CSV (cabeçalho na primeira linha, em qualquer ordem)
+COLUNAS_CSV = ('propriedade', 'data', 'area_colhida', 'quantidade_colhida', 'tipo_colheita')
+
+# Sufixo do arquivo de linhas rejeitadas, gravado ao lado do CSV importado
+SUFIXO_REJEITADOS = '_rejeitados.csv'
+
+DESTINOS_CSV = ('memoria', 'oracle')
+
+def _detectar_delimitador(arquivo):
+    """
+    Detecta se o CSV usa vírgula ou ponto e vírgula (padrão de planilhas em português)
+
+    Args:
+        arquivo: Arquivo texto aberto, posicionado no início
+
+    Returns:
+        str: Delimitador detectado
+    """
+    primeira_linha = arquivo.readline()
+    arquivo.seek(0)
+    return ';' if primeira_linha.count(';') > primeira_linha.count(',') else ','
+
+def _normalizar_numero(texto):
+    """
+    Aceita vírgula decimal (ex: '12,5') convertendo para o formato dos validadores
+
+    Args:
+        texto (str): Número lido do CSV
+
+    Returns:
+        str: Número com ponto decimal
+    """
+    texto = (texto or '').strip()
+    if ',' in texto and '.' not in texto:
+        return texto.replace(',', '.')
+    return texto
+
+def validar_linha_csv(linha, indice_propriedades, rejeitar_suspeitas=False):
+    """
+    Valida uma linha do CSV e monta a colheita correspondente
+
+    Args:
+        linha (dict): Linha lida pelo csv.DictReader
+        indice_propriedades (dict): Propriedades indexadas pelo nome em minúsculas
+        rejeitar_suspeitas (bool): Rejeita linhas com produtividade fora do normal
+
+    Returns:
+        tuple: (propriedade, colheita, suspeita, motivo) - colheita é None se a linha for rejeitada
+    """
+    nome = (linha.get('propriedade') or '').strip()
+    propriedade = indice_propriedades.get(nome.lower())
+    if propriedade is None:
+        return None, None, False, f"Propriedade não cadastrada: '{nome}'"
+
+    data = (linha.get('data') or '').strip()
+    valido, mensagem = validar_data(data)
+    if not valido:
+        return propriedade, None, False, mensagem
+    try:
+        # validar_data só confere os limites de dia e mês (aceita 31/02)
+        datetime.strptime(data, '%d/%m/%Y')
+    except ValueError:
+        return propriedade, None, False, f"Data inexistente no calendário: {data}"
+
+    area = _normalizar_numero(linha.get('area_colhida'))
+    valido, mensagem = validar_area_propriedade(area)
+    if not valido:
+        return propriedade, None, False, mensagem
+    area_colhida = float(area)
+
+    if area_colhida > propriedade.area_total:
+        return propriedade, None, False, (f"Área colhida ({area_colhida} ha) maior que a área total "
+                                          f"da propriedade ({propriedade.area_total} ha)")
+
+    quantidade = _normalizar_numero(linha.get('quantidade_colhida'))
+    valido, mensagem = validar_quantidade_colheita(quantidade)
+    if not valido:
+        return propriedade, None, False, mensagem
+    quantidade_colhida = float(quantidade)
+
+    tipo = (linha.get('tipo_colheita') or '').strip()
+    valido, mensagem = validar_tipo_colheita(tipo)
+    if not valido:
+        return propriedade, None, False, mensagem
+
+    suspeita, mensagem, _ = validar_produtividade_suspeita(area_colhida, quantidade_colhida)
+    if suspeita and rejeitar_suspeitas:
+        return propriedade, None, True, mensagem
+
+    colheita = Colheita(data, area_colhida, quantidade_colhida, tipo.lower())
+    if colheita.data_colheita is None:
+        return propriedade, None, False, f"Data inválida: {data}"
+
+    return propriedade, colheita, suspeita, None
+
+class _ArquivoRejeitados:
+    """
+    Arquivo CSV de linhas rejeitadas, criado apenas na primeira rejeição
+
+    Mantém as colunas originais e acrescenta 'linha' (número no CSV de origem)
+    e 'motivo', para que o arquivo possa ser corrigido e importado de novo.
+    """
+
+    def __init__(self, caminho, colunas):
+        self.caminho = caminho
+        self._colunas = list(colunas) + ['linha', 'motivo']
+        self._arquivo = None
+        self._escritor = None
+        self.total = 0
+
+    def registrar(self, linha, numero_linha, motivo):
+        """
+        Grava uma linha rejeitada
+
+        Args:
+            linha (dict): Linha original do CSV
+            numero_linha (int): Número da linha no CSV de origem
+            motivo (str): Mensagem do validador ou do banco
+        """
+        if self._escritor is None:
+            self._arquivo = open(self.caminho, 'w', newline='', encoding='utf-8')
+            self._escritor = csv.DictWriter(self._arquivo, fieldnames=self._colunas, extrasaction='ignore')
+            self._escritor.writeheader()
+
+        self._escritor.writerow({**linha, 'linha': numero_linha, 'motivo': motivo})
+        self.total += 1
+
+    def fechar(self):
+        """
+        Fecha o arquivo, se alguma linha foi rejeitada
+        """
+        if self._arquivo is not None:
+            self._arquivo.close()
+
+def _gravar_lote_memoria(lote):
+    """
+    Grava um lote de colheitas validadas nas propriedades em memória
+
+    Args:
+        lote (list): Tuplas (propriedade, colheita, linha, numero_linha)
+
+    Returns:
+        list: Tuplas (linha, numero_linha, motivo) das linhas não gravadas
+    """
+    for propriedade, colheita, _, _ in lote:
+        propriedade.adicionar_colheita(colheita)
+    return []
+
+def _gravar_lote_oracle(lote):
+    """
+    Grava um lote no Oracle (executemany) e, para as linhas gravadas, também em memória
+
+    Args:
+        lote (list): Tuplas (propriedade, colheita, linha, numero_linha)
+
+    Returns:
+        list: Tuplas (linha, numero_linha, motivo) das linhas não gravadas
+    """
+    from src.services.armazenamento_service import salvar_colheitas_lote_oracle
+
+    registros = [(colheita, propriedade.id, propriedade.tipo_solo) for propriedade, colheita, _, _ in lote]
+    relatorio = salvar_colheitas_lote_oracle(registros, len(registros))
+    if relatorio is None:
+        return [(linha, numero_linha, "Erro de conexão com o banco de dados") for _, _, linha, numero_linha in lote]
+
+    mensagens = dict(relatorio['falhas'])
+    falhas = []
+    for indice, ((propriedade, colheita, linha, numero_linha), colheita_id) in enumerate(zip(lote, relatorio['ids'])):
+        if colheita_id is None:
+            falhas.append((linha, numero_linha, mensagens.get(indice, "Falha ao gravar no banco de dados")))
+            continue
+        propriedade.adicionar_colheita(colheita)
+        propriedade.definir_id_colheita(len(propriedade.colheitas) - 1, colheita_id)
+
+    return falhas
+
+@medir
+def importar_colheitas_csv(caminho_csv, lista_propriedades, destino='memoria', tamanho_lote=None,
+                           caminho_rejeitados=None, rejeitar_suspeitas=False):
+    """
+    Importa colheitas de um arquivo CSV em fluxo, gravando as linhas válidas em lotes
+
+    O CSV precisa das colunas de COLUNAS_CSV. As propriedades são localizadas
+    pelo nome (sem diferenciar maiúsculas) em um índice montado uma única vez.
+
+    Args:
+        caminho_csv (str): Caminho do arquivo CSV
+        lista_propriedades (list): Propriedades em memória (recebem as colheitas)
+        destino (str): 'memoria' ou 'oracle' (grava no banco e em memória)
+        tamanho_lote (int): Linhas por lote (padrão: CONFIG_AVANCADA['tamanho_lote'])
+        caminho_rejeitados (str): Arquivo das linhas rejeitadas (padrão: ao lado do CSV)
+        rejeitar_suspeitas (bool): Rejeita linhas com produtividade fora do normal
+
+    Returns:
+        dict: Relatório com 'lidas', 'importadas', 'rejeitadas', 'suspeitas',
+              'tempo_segundos', 'linhas_por_segundo' e 'arquivo_rejeitados'
+              (None se nenhuma linha foi rejeitada)
+
+    Raises:
+        ValueError: Se o destino for inválido ou faltarem colunas no CSV
+    """
+    if destino not in DESTINOS_CSV:
+        raise ValueError(f"destino inválido: {destino}")
+
+    tamanho_lote = tamanho_lote or CONFIG_AVANCADA['tamanho_lote']
+    if caminho_rejeitados is None:
+        caminho_rejeitados = os.path.splitext(caminho_csv)[0] + SUFIXO_REJEITADOS
+    gravar_lote = _gravar_lote_oracle if destino == 'oracle' else _gravar_lote_memoria
+
+    inicio = time.perf_counter()
+    indice_propriedades = {propriedade.nome.strip().lower(): propriedade for propriedade in lista_propriedades}
+    lidas = 0
+    importadas = 0
+    suspeitas = 0
+    lote = []
+
+    with open(caminho_csv, 'r', newline='', encoding='utf-8-sig') as arquivo:
+        leitor = csv.DictReader(arquivo, delimiter=_detectar_delimitador(arquivo))
+        colunas = [coluna.strip().lower() for coluna in (leitor.fieldnames or [])]
+        faltando = [coluna for coluna in COLUNAS_CSV if coluna not in colunas]
+        if faltando:
+            raise ValueError(f"colunas ausentes no CSV: {', '.join(faltando)}")
+        leitor.fieldnames = colunas
+
+        rejeitados = _ArquivoRejeitados(caminho_rejeitados, colunas)
+        try:
+            # A linha 1 é o cabeçalho
+            for numero_linha, linha in enumerate(leitor, 2):
+                lidas += 1
+                propriedade, colheita, suspeita, motivo = validar_linha_csv(
+                    linha, indice_propriedades, rejeitar_suspeitas
+                )
+
+                if colheita is None:
+                    rejeitados.registrar(linha, numero_linha, motivo)
+                    continue
+                if destino == 'oracle' and not hasattr(propriedade, 'id'):
+                    rejeitados.registrar(linha, numero_linha, "Propriedade não está gravada no banco de dados")
+                    continue
+
+                suspeitas += suspeita
+                lote.append((propriedade, colheita, linha, numero_linha))
+
+                if len(lote) >= tamanho_lote:
+                    falhas = gravar_lote(lote)
+                    importadas += len(lote) - len(falhas)
+                    for falha in falhas:
+                        rejeitados.registrar(*falha)
+                    lote = []
+
+            if lote:
+                falhas = gravar_lote(lote)
+                importadas += len(lote) - len(falhas)
+                for falha in falhas:
+                    rejeitados.registrar(*falha)
+        finally:
+            rejeitados.fechar()
+
+    tempo = time.perf_counter() - inicio
+
+    return {
+        'lidas': lidas,
+        'importadas': importadas,
+        'rejeitadas': rejeitados.total,
+        'suspeitas': suspeitas,
+        'tempo_segundos': round(tempo, 3),
+        'linhas_por_segundo': round(lidas / tempo, 1) if tempo > 0 else 0.0,
+        'arquivo_rejeitados': caminho_rejeitados if rejeitados.total else None
+    }
+
+def exibir_relatorio_importacao_csv(relatorio):
+    """
+    Exibe o resultado de uma importação de CSV
+
+    Args:
+        relatorio (dict): Relatório gerado por importar_colheitas_csv
+    """
+    if relatorio['importadas']:
+        exibir_mensagem_sucesso(f"{relatorio['importadas']} de {relatorio['lidas']} colheita(s) importada(s)!")
+    else:
+        exibir_mensagem_erro(f"Nenhuma das {relatorio['lidas']} linha(s) foi importada.")
+
+    if relatorio['suspeitas']:
+        exibir_mensagem_info(f"{relatorio['suspeitas']} colheita(s) importada(s) com produtividade suspeita")
+    if relatorio['rejeitadas']:
+        exibir_mensagem_erro(f"{relatorio['rejeitadas']} linha(s) rejeitada(s). Motivos em: {relatorio['arquivo_rejeitados']}")
+
+    exibir_mensagem_info(f"Tempo: {relatorio['tempo_segundos']} s ({relatorio['linhas_por_segundo']} linhas/s)")
+
+def importar_csv_interativo(lista_propriedades, banco_disponivel=False):
+    """
+    Função interativa para importar colheitas de um arquivo CSV
+
+    Args:
+        lista_propriedades (list): Propriedades em memória
+        banco_disponivel (bool): Oferece gravar também no Oracle
+
+    Returns:
+        bool: True se alguma colheita foi importada
+    """
+    if not lista_propriedades:
+        exibir_mensagem_erro("Nenhuma propriedade cadastrada.")
+        exibir_mensagem_info("Cadastre as propriedades antes de importar colheitas.")
+        return False
+
+    exibir_mensagem_info(f"O CSV deve ter cabeçalho com as colunas: {', '.join(COLUNAS_CSV)}")
+    caminho_csv = input("Caminho do arquivo CSV: ").strip().strip('"')
+    if not caminho_csv:
+        exibir_mensagem_info("Importação cancelada.")
+        return False
+    if not os.path.isfile(caminho_csv):
+        exibir_mensagem_erro(f"Arquivo não encontrado: {caminho_csv}")
+        return False
+
+    destino = 'memoria'
+    if banco_disponivel and confirmar_acao("Gravar as colheitas também no banco de dados?"):
+        destino = 'oracle'
+    rejeitar_suspeitas = confirmar_acao("Rejeitar colheitas com produtividade suspeita?")
+
+    try:
+        relatorio = importar_colheitas_csv(caminho_csv, lista_propriedades, destino,
+                                           rejeitar_suspeitas=rejeitar_suspeitas)
+    except ValueError as e:
+        exibir_mensagem_erro(f"Arquivo CSV inválido: {e}")
+        return False
+    except (OSError, UnicodeDecodeError, csv.Error) as e:
+        exibir_mensagem_erro(f"Erro ao ler arquivo CSV: {e}")
+        return False
+
+    exibir_relatorio_importacao_csv(relatorio)
+    return relatorio['importadas'] > 0
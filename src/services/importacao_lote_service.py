@@ -0,0 +1,198 @@
+"""
+Módulo de importação de vários backups em paralelo
+Lê os arquivos enviados pelos escritórios em um pool de processos e mescla
+tudo em um único conjunto: propriedades unidas pelo nome (sem diferenciar
+maiúsculas, como em buscar_propriedade_por_nome) e colheitas idênticas descartadas.
+"""
+
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from src.models.propriedade import Propriedade
+from src.services.file_service import (
+    restaurar_backup,
+    listar_arquivos_backup,
+    obter_pasta_backup
+)
+from src.utils.menu_utils import (
+    exibir_mensagem_sucesso,
+    exibir_mensagem_erro,
+    exibir_mensagem_info
+)
+from src.utils.instrumentacao import medir
+
+def _ler_arquivo_backup(nome_arquivo):
+    """
+    Lê um backup por completo (executada nos processos do pool)
+
+    As colheitas são compactadas em colunas antes de voltar ao processo
+    principal: arrays são transferidos entre processos muito mais rápido
+    que um objeto Colheita por registro.
+
+    Args:
+        nome_arquivo (str): Nome do arquivo (ou caminho completo)
+
+    Returns:
+        tuple: (nome_arquivo, propriedades, erro) - propriedades é None se houver erro
+    """
+    try:
+        propriedades = restaurar_backup(nome_arquivo)
+    except Exception as e:
+        return nome_arquivo, None, str(e)
+
+    for propriedade in propriedades:
+        propriedade.compactar_colheitas()
+
+    return nome_arquivo, propriedades, None
+
+def _ler_arquivos(arquivos, processos):
+    """
+    Gera o resultado da leitura de cada arquivo, na ordem informada
+
+    Args:
+        arquivos (list): Nomes dos arquivos
+        processos (int): Processos do pool (1 = leitura no próprio processo)
+
+    Yields:
+        tuple: Resultado de _ler_arquivo_backup
+    """
+    if processos <= 1:
+        for nome_arquivo in arquivos:
+            yield _ler_arquivo_backup(nome_arquivo)
+        return
+
+    with ProcessPoolExecutor(max_workers=processos) as executor:
+        # map devolve na ordem dos arquivos; a mesclagem avança enquanto os demais são lidos
+        yield from executor.map(_ler_arquivo_backup, arquivos)
+
+@medir
+def mesclar_backups(arquivos, processos=None):
+    """
+    Lê vários backups em paralelo e mescla as propriedades em um único conjunto
+
+    Propriedades com o mesmo nome (sem diferenciar maiúsculas) viram uma só;
+    os dados cadastrais são os do primeiro arquivo em que ela aparece e as
+    colheitas são unidas, descartando as idênticas (mesma data, área,
+    quantidade e tipo).
+
+    Args:
+        arquivos (list): Nomes dos arquivos de backup (ou caminhos completos)
+        processos (int): Processos do pool (padrão: um por núcleo, limitado à quantidade de arquivos)
+
+    Returns:
+        tuple: (propriedades mescladas, relatório com 'arquivos', 'falhas',
+               'colheitas_lidas', 'colheitas_duplicadas', 'tempo_segundos'
+               e 'colheitas_por_segundo')
+    """
+    if processos is None:
+        processos = os.cpu_count() or 1
+    processos = max(1, min(processos, len(arquivos)))
+
+    inicio = time.perf_counter()
+    mescladas = {}
+    chaves_por_propriedade = {}
+    falhas = []
+    lidos = 0
+    colheitas_lidas = 0
+    duplicadas = 0
+
+    for nome_arquivo, propriedades, erro in _ler_arquivos(arquivos, processos):
+        if erro is not None:
+            falhas.append((nome_arquivo, erro))
+            continue
+        lidos += 1
+
+        for propriedade in propriedades:
+            chave_nome = propriedade.nome.lower()
+            destino = mescladas.get(chave_nome)
+            if destino is None:
+                destino = Propriedade(
+                    propriedade.nome,
+                    propriedade.area_total,
+                    propriedade.localizacao,
+                    propriedade.tipo_solo,
+                    armazenamento_colunar=True
+                )
+                mescladas[chave_nome] = destino
+                chaves_por_propriedade[chave_nome] = set()
+
+            vistas = chaves_por_propriedade[chave_nome]
+            origem = propriedade.colheitas
+            colunas = destino.colheitas
+            for indice, chave in enumerate(origem.chaves()):
+                if chave in vistas:
+                    duplicadas += 1
+                    continue
+                vistas.add(chave)
+                colunas.copiar_colheita(origem, indice)
+            colheitas_lidas += len(origem)
+
+    tempo = time.perf_counter() - inicio
+    relatorio = {
+        'arquivos': lidos,
+        'falhas': falhas,
+        'processos': processos,
+        'colheitas_lidas': colheitas_lidas,
+        'colheitas_duplicadas': duplicadas,
+        'tempo_segundos': round(tempo, 2),
+        'colheitas_por_segundo': round(colheitas_lidas / tempo) if tempo > 0 else 0
+    }
+
+    return list(mescladas.values()), relatorio
+
+def importar_backups_em_lote_interativo():
+    """
+    Função interativa para importar e mesclar vários backups da pasta scripts/data
+
+    Returns:
+        list: Propriedades mescladas ou None se cancelado/sem dados
+    """
+    arquivos = listar_arquivos_backup()
+
+    if not arquivos:
+        exibir_mensagem_erro("Nenhum arquivo de backup encontrado na pasta 'scripts/data'.")
+        return None
+
+    print("\nARQUIVOS DE BACKUP DISPONÍVEIS:")
+    print("-" * 60)
+    for i, arquivo in enumerate(arquivos, 1):
+        print(f"{i}. {arquivo['nome']}")
+
+    opcoes = input("\nNúmeros dos arquivos separados por vírgula, T para todos ou 0 para cancelar: ").strip()
+    if opcoes in ('', '0'):
+        exibir_mensagem_info("Importação cancelada.")
+        return None
+
+    if opcoes.upper() == 'T':
+        escolhidos = [arquivo['nome'] for arquivo in arquivos]
+    else:
+        try:
+            indices = [int(opcao) - 1 for opcao in opcoes.split(',') if opcao.strip()]
+        except ValueError:
+            exibir_mensagem_erro("Digite apenas números separados por vírgula.")
+            return None
+
+        if not all(0 <= indice < len(arquivos) for indice in indices):
+            exibir_mensagem_erro(f"Opção inválida. Digite números entre 1 e {len(arquivos)}")
+            return None
+
+        escolhidos = [arquivos[indice]['nome'] for indice in dict.fromkeys(indices)]
+
+    exibir_mensagem_info(f"Lendo {len(escolhidos)} arquivo(s) de {obter_pasta_backup()}...")
+    propriedades, relatorio = mesclar_backups(escolhidos)
+
+    for nome_arquivo, erro in relatorio['falhas']:
+        exibir_mensagem_erro(f"{nome_arquivo}: {erro}")
+
+    if not propriedades:
+        exibir_mensagem_erro("Nenhuma propriedade foi importada.")
+        return None
+
+    exibir_mensagem_sucesso(f"{relatorio['arquivos']} backup(s) mesclado(s) em {relatorio['processos']} processo(s)!")
+    exibir_mensagem_info(f"Propriedades: {len(propriedades)}")
+    exibir_mensagem_info(f"Colheitas: {relatorio['colheitas_lidas'] - relatorio['colheitas_duplicadas']} "
+                         f"({relatorio['colheitas_duplicadas']} duplicada(s) descartada(s))")
+    exibir_mensagem_info(f"Tempo: {relatorio['tempo_segundos']} s ({relatorio['colheitas_por_segundo']} colheitas/s)")
+
+    return propriedades
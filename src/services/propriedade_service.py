@@ -131,6 +131,33 @@ def buscar_propriedade_por_nome(lista_propriedades, nome):
             return propriedade
     return None
 
+def mesclar_propriedades(lista_propriedades, propriedades_importadas):
+    """
+    Substitui, pelo nome, as propriedades importadas na lista e acrescenta as novas
+    
+    Args:
+        lista_propriedades (list): Lista de propriedades (alterada no lugar)
+        propriedades_importadas (list): Propriedades vindas de um backup
+        
+    Returns:
+        tuple: (substituídas, adicionadas)
+    """
+    posicoes = {propriedade.nome.lower(): i for i, propriedade in enumerate(lista_propriedades)}
+    substituidas = 0
+    adicionadas = 0
+    
+    for propriedade in propriedades_importadas:
+        posicao = posicoes.get(propriedade.nome.lower())
+        if posicao is None:
+            posicoes[propriedade.nome.lower()] = len(lista_propriedades)
+            lista_propriedades.append(propriedade)
+            adicionadas += 1
+        else:
+            lista_propriedades[posicao] = propriedade
+            substituidas += 1
+    
+    return substituidas, adicionadas
+
 def verificar_nome_duplicado(lista_propriedades, nome):
     """
     Verifica se já existe uma propriedade com o mesmo nome
@@ -0,0 +1,169 @@
+"""
+Módulo de repositório em memória das propriedades e colheitas
+Mantém as marcas d'água usadas para buscar no Oracle apenas o que mudou
+"""
+
+from datetime import timedelta
+from src.services.armazenamento_service import (
+    obter_data_servidor,
+    buscar_historico_completo,
+    buscar_alteracoes_desde,
+    buscar_propriedades_oracle
+)
+from src.utils.instrumentacao import medir
+
+# Margem aplicada às marcas d'água: linhas inseridas pouco antes de uma leitura
+# e confirmadas depois dela ainda são buscadas (duplicatas são descartadas pelo ID)
+MARGEM_MARCA_DAGUA = timedelta(minutes=5)
+
+# Estado do repositório compartilhado pelas funções *_integrado
+_repositorio = {
+    'marca_propriedades': None,
+    'marca_colheitas': None
+}
+
+def repositorio_carregado():
+    """
+    Indica se o repositório já fez a carga completa do banco
+
+    Returns:
+        bool: True se as marcas d'água estão definidas
+    """
+    return _repositorio['marca_propriedades'] is not None
+
+def invalidar_repositorio():
+    """
+    Descarta as marcas d'água, forçando uma carga completa na próxima atualização
+    """
+    _repositorio['marca_propriedades'] = None
+    _repositorio['marca_colheitas'] = None
+
+@medir
+def carregar_repositorio():
+    """
+    Faz a carga completa do histórico e define as marcas d'água
+
+    Returns:
+        list: Lista de propriedades carregadas ou None se houver erro
+    """
+    # A marca é lida antes da carga: o que for gravado durante ela entra na próxima atualização
+    marca = obter_data_servidor()
+    if marca is None:
+        return None
+
+    propriedades = buscar_historico_completo()
+    if propriedades is None:
+        return None
+
+    _repositorio['marca_propriedades'] = marca - MARGEM_MARCA_DAGUA
+    _repositorio['marca_colheitas'] = marca - MARGEM_MARCA_DAGUA
+
+    return propriedades
+
+def _religar_propriedades_sem_id(lista_propriedades):
+    """
+    Associa o ID do banco às propriedades em memória que ainda não têm ID
+
+    Propriedades vindas de um backup importado não têm ID, mas podem já existir
+    no banco com o mesmo nome (sem diferenciar maiúsculas).
+
+    Args:
+        lista_propriedades (list): Lista de propriedades em memória (alterada no lugar)
+
+    Returns:
+        bool: False se houver erro ao consultar o banco
+    """
+    sem_id = {prop.nome.lower(): prop for prop in lista_propriedades if not hasattr(prop, 'id')}
+    if not sem_id:
+        return True
+
+    propriedades_banco = buscar_propriedades_oracle()
+    if propriedades_banco is None:
+        return False
+
+    for propriedade in propriedades_banco:
+        existente = sem_id.get(propriedade.nome.lower())
+        if existente is not None:
+            existente.id = propriedade.id
+
+    return True
+
+def atualizar_repositorio(lista_propriedades):
+    """
+    Atualiza a lista em memória com o que foi gravado no banco desde a última leitura
+
+    Na primeira chamada (ou após invalidar_repositorio) faz a carga completa.
+    Nas demais, busca apenas propriedades e colheitas novas, preservando
+    as colheitas já carregadas. Propriedades sem ID (importadas de backup)
+    que já existem no banco recebem o ID correspondente.
+
+    Args:
+        lista_propriedades (list): Lista de propriedades em memória (alterada no lugar)
+
+    Returns:
+        int: Quantidade de registros novos incorporados ou None se houver erro
+    """
+    if not repositorio_carregado():
+        propriedades = carregar_repositorio()
+        if propriedades is None:
+            return None
+        lista_propriedades.clear()
+        lista_propriedades.extend(propriedades)
+        return len(propriedades)
+
+    marca = obter_data_servidor()
+    if marca is None:
+        return None
+
+    alteracoes = buscar_alteracoes_desde(
+        _repositorio['marca_propriedades'],
+        _repositorio['marca_colheitas']
+    )
+    if alteracoes is None:
+        return None
+
+    propriedades_novas, colheitas_novas = alteracoes
+
+    if not _religar_propriedades_sem_id(lista_propriedades):
+        return None
+
+    por_id = {prop.id: prop for prop in lista_propriedades if hasattr(prop, 'id')}
+    por_nome = {prop.nome.lower(): prop for prop in lista_propriedades}
+    incorporados = 0
+
+    for propriedade in propriedades_novas:
+        if propriedade.id in por_id:
+            continue
+
+        # Propriedade já em memória (gravada por esta sessão): só associar o ID
+        existente = por_nome.get(propriedade.nome.lower())
+        if existente is not None:
+            existente.id = propriedade.id
+            por_id[propriedade.id] = existente
+            continue
+
+        lista_propriedades.append(propriedade)
+        por_id[propriedade.id] = propriedade
+        incorporados += 1
+
+    ids_conhecidos = {}
+    for propriedade_id, colheita in colheitas_novas:
+        propriedade = por_id.get(propriedade_id)
+        if propriedade is None:
+            continue
+
+        # IDs das colheitas da propriedade, montados só para as propriedades afetadas
+        if propriedade_id not in ids_conhecidos:
+            ids_conhecidos[propriedade_id] = propriedade.obter_ids_colheitas()
+
+        if colheita.id in ids_conhecidos[propriedade_id]:
+            continue
+
+        propriedade.adicionar_colheita(colheita)
+        ids_conhecidos[propriedade_id].add(colheita.id)
+        incorporados += 1
+
+    _repositorio['marca_propriedades'] = marca - MARGEM_MARCA_DAGUA
+    _repositorio['marca_colheitas'] = marca - MARGEM_MARCA_DAGUA
+
+    return incorporados
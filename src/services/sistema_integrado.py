@@ -2,18 +2,29 @@
 Módulo de integração entre banco de dados e funcionalidades do sistema
 Combina operações de banco com lógica de negócio
 """
-from src.services.database_service import (
+from src.services.armazenamento_service import (
     testar_conexao,
     criar_tabelas,
     salvar_propriedade_oracle,
     salvar_colheita_oracle,
-    buscar_propriedades_oracle,
-    buscar_historico_completo,
-    obter_estatisticas_banco
+    salvar_propriedades_lote_oracle,
+    salvar_colheitas_lote_oracle,
+    buscar_colheitas_por_propriedade,
+    obter_estatisticas_banco,
+    obter_relatorio_perdas_oracle,
+    obter_estatisticas_pool,
+    encerrar_pool,
+    obter_nome_backend,
+    backend_em_uso
+)
+from src.services.repositorio_service import (
+    carregar_repositorio,
+    atualizar_repositorio,
+    invalidar_repositorio
 )
 from src.services.propriedade_service import cadastrar_propriedade
 from src.services.colheita_service import registrar_colheita
-from src.services.calculation_service import gerar_relatorio_perdas
+from src.services.calculation_service import gerar_relatorio_perdas, exibir_relatorio_agregado
 from src.utils.menu_utils import (
     exibir_mensagem_sucesso,
     exibir_mensagem_erro,
@@ -21,13 +32,21 @@ from src.utils.menu_utils import (
     confirmar_acao,
     exibir_cabecalho
 )
+from src.utils.instrumentacao import (
+    medir,
+    instrumentacao_ativa,
+    ativar_instrumentacao,
+    zerar_metricas,
+    exibir_metricas,
+    exportar_trace_chrome
+)
 
 # Variável para controlar se o banco está disponível
 _banco_disponivel = None
 
 def verificar_banco_disponivel():
     """
-    Verifica se o banco Oracle está disponível
+    Verifica se o banco de dados (Oracle ou SQLite local) está disponível
     
     Returns:
         bool: True se banco está disponível, False caso contrário
@@ -48,21 +67,27 @@ def inicializar_sistema():
     """
     exibir_cabecalho("Inicializando Sistema")
     
-    # Verificar se Oracle está disponível
+    # Verificar se o banco (Oracle ou SQLite local) está disponível
     if verificar_banco_disponivel():
-        exibir_mensagem_sucesso("Banco Oracle conectado!")
+        exibir_mensagem_sucesso(f"Banco {obter_nome_backend()} conectado!")
         
         # Criar tabelas se não existirem
         if criar_tabelas():
-            exibir_mensagem_info("Sistema pronto para uso com Oracle")
+            exibir_mensagem_info(f"Sistema pronto para uso com o banco {obter_nome_backend()}")
             return True
         else:
-            exibir_mensagem_erro("Erro ao criar tabelas no Oracle")
+            exibir_mensagem_erro(f"Erro ao criar tabelas no banco {obter_nome_backend()}")
             return False
     else:
-        exibir_mensagem_info("Oracle não disponível. Sistema funcionará apenas com arquivos JSON.")
+        exibir_mensagem_info("Banco de dados não disponível. Sistema funcionará apenas com arquivos JSON.")
         return True
 
+def finalizar_sistema():
+    """
+    Libera os recursos do sistema (conexões com o banco)
+    """
+    encerrar_pool()
+
 def cadastrar_propriedade_integrado():
     """
     Cadastra propriedade integrando com banco de dados
@@ -74,13 +99,13 @@ def cadastrar_propriedade_integrado():
     propriedade = cadastrar_propriedade()
     
     if propriedade and verificar_banco_disponivel():
-        # Salvar no banco Oracle
+        # Salvar no banco
         propriedade_id = salvar_propriedade_oracle(propriedade)
         if propriedade_id:
             propriedade.id = propriedade_id
-            exibir_mensagem_info("Propriedade salva no banco Oracle")
+            exibir_mensagem_info(f"Propriedade salva no banco {obter_nome_backend()}")
         else:
-            exibir_mensagem_erro("Erro ao salvar no banco Oracle")
+            exibir_mensagem_erro(f"Erro ao salvar no banco {obter_nome_backend()}")
     
     return propriedade
 
@@ -94,65 +119,92 @@ def registrar_colheita_integrado(lista_propriedades):
     Returns:
         bool: True se colheita foi registrada, False caso contrário
     """
-    # Se banco disponível, carregar propriedades do banco
+    # Se banco disponível, trazer apenas o que mudou no banco desde a última leitura
     if verificar_banco_disponivel():
-        propriedades_banco = buscar_propriedades_oracle()
-        if propriedades_banco:
-            lista_propriedades.clear()
-            lista_propriedades.extend(propriedades_banco)
+        atualizar_repositorio(lista_propriedades)
+    
+    print("\n1. Registrar uma colheita")
+    print("2. Importar colheitas de arquivo CSV")
+    if input("Escolha (1-2, Enter = 1): ").strip() == '2':
+        from src.services.importacao_csv_service import importar_csv_interativo
+        return importar_csv_interativo(lista_propriedades, verificar_banco_disponivel())
+    
+    # Quantidade de colheitas antes do registro, para identificar a propriedade escolhida
+    totais_anteriores = [len(propriedade.colheitas) for propriedade in lista_propriedades]
     
     # Usar função existente para registro interativo
     sucesso = registrar_colheita(lista_propriedades)
     
     if sucesso and verificar_banco_disponivel():
-        # A última colheita adicionada
-        for propriedade in lista_propriedades:
-            if propriedade.colheitas:
+        # A propriedade que ganhou uma colheita é a que foi selecionada
+        for propriedade, total_anterior in zip(lista_propriedades, totais_anteriores):
+            if len(propriedade.colheitas) > total_anterior:
                 ultima_colheita = propriedade.colheitas[-1]
-                # Salvar no banco Oracle
+                # Propriedade importada de backup e ainda ausente do banco: gravá-la primeiro
+                if not hasattr(propriedade, 'id'):
+                    propriedade_id = salvar_propriedade_oracle(propriedade)
+                    if not propriedade_id:
+                        exibir_mensagem_erro(f"Erro ao salvar colheita no banco {obter_nome_backend()}")
+                        break
+                    propriedade.id = propriedade_id
+                # Salvar no banco (write-through: memória e banco na mesma operação)
                 colheita_id = salvar_colheita_oracle(ultima_colheita, propriedade.id, propriedade.tipo_solo)
                 if colheita_id:
-                    ultima_colheita.id = colheita_id
-                    exibir_mensagem_info("Colheita salva no banco Oracle")
+                    propriedade.definir_id_colheita(len(propriedade.colheitas) - 1, colheita_id)
+                    exibir_mensagem_info(f"Colheita salva no banco {obter_nome_backend()}")
                 else:
-                    exibir_mensagem_erro("Erro ao salvar colheita no banco Oracle")
+                    exibir_mensagem_erro(f"Erro ao salvar colheita no banco {obter_nome_backend()}")
                 break
     
     return sucesso
 
-def gerar_relatorio_integrado(lista_propriedades):
+@medir
+def gerar_relatorio_integrado(lista_propriedades, no_servidor=False, detalhado=True):
     """
     Gera relatório integrando dados do banco
     
     Args:
         lista_propriedades (list): Lista de propriedades (será atualizada se banco disponível)
+        no_servidor (bool): Calcula o resumo no Oracle (GROUP BY) sem trazer as colheitas
+        detalhado (bool): Exibe cada colheita (apenas no cálculo em memória)
     """
-    # Se banco disponível, carregar dados do banco
+    if no_servidor and verificar_banco_disponivel():
+        relatorio = obter_relatorio_perdas_oracle()
+        if relatorio is not None:
+            exibir_relatorio_agregado(relatorio)
+            return
+        exibir_mensagem_info("Relatório no banco indisponível. Calculando em memória.")
+    
+    # Se banco disponível, incorporar o que mudou no banco
     if verificar_banco_disponivel():
-        propriedades_banco = buscar_historico_completo()
-        if propriedades_banco:
-            lista_propriedades.clear()
-            lista_propriedades.extend(propriedades_banco)
-            exibir_mensagem_info("Dados carregados do banco Oracle")
+        novos = atualizar_repositorio(lista_propriedades)
+        if novos:
+            exibir_mensagem_info(f"{novos} registro(s) novo(s) carregado(s) do banco {obter_nome_backend()}")
     
     # Gerar relatório usando função existente
-    gerar_relatorio_perdas(lista_propriedades)
+    gerar_relatorio_perdas(lista_propriedades, detalhado=detalhado)
 
-def sincronizar_com_banco(lista_propriedades):
+@medir
+def sincronizar_com_banco(lista_propriedades, em_lote=False, tamanho_lote=None):
     """
     Sincroniza dados da memória com o banco Oracle
     
     Args:
         lista_propriedades (list): Lista de propriedades em memória
+        em_lote (bool): Usa inserção em lote (executemany), indicada para backups grandes
+        tamanho_lote (int): Linhas por lote/transação no modo em lote
         
     Returns:
         bool: True se sincronização foi bem-sucedida
     """
     if not verificar_banco_disponivel():
-        exibir_mensagem_erro("Banco Oracle não disponível para sincronização")
+        exibir_mensagem_erro("Banco de dados não disponível para sincronização")
         return False
     
-    exibir_mensagem_info("Sincronizando dados com banco Oracle...")
+    if em_lote:
+        return sincronizar_com_banco_em_lote(lista_propriedades, tamanho_lote)
+    
+    exibir_mensagem_info(f"Sincronizando dados com banco {obter_nome_backend()}...")
     
     try:
         for propriedade in lista_propriedades:
@@ -164,19 +216,135 @@ def sincronizar_com_banco(lista_propriedades):
                     propriedade.id = propriedade_id
                 
                 # Salvar colheitas da propriedade
-                for colheita in propriedade.colheitas:
+                for indice, colheita in enumerate(propriedade.colheitas):
                     if not hasattr(colheita, 'id'):
                         colheita_id = salvar_colheita_oracle(colheita, propriedade.id, propriedade.tipo_solo)
                         if colheita_id:
-                            colheita.id = colheita_id
+                            propriedade.definir_id_colheita(indice, colheita_id)
         
-        exibir_mensagem_sucesso("Sincronização com Oracle concluída!")
+        exibir_mensagem_sucesso(f"Sincronização com o banco {obter_nome_backend()} concluída!")
         return True
         
     except Exception as e:
         exibir_mensagem_erro(f"Erro durante sincronização: {e}")
         return False
 
+def _chave_colheita(colheita):
+    """
+    Chave que identifica colheitas idênticas (mesma data, área, quantidade e tipo)
+
+    Área e quantidade são arredondadas como no banco (NUMBER(10,2)).
+
+    Args:
+        colheita (Colheita): Colheita em memória ou lida do banco
+
+    Returns:
+        tuple: (data, área, quantidade, tipo)
+    """
+    return (
+        colheita.data_colheita or colheita.data,
+        round(colheita.area_colhida, 2),
+        round(colheita.quantidade_colhida, 2),
+        colheita.tipo_colheita
+    )
+
+@medir
+def sincronizar_com_banco_em_lote(lista_propriedades, tamanho_lote=None):
+    """
+    Sincroniza dados da memória com o Oracle usando inserção em lote
+    
+    Propriedades sem ID são gravadas primeiro; em seguida, todas as colheitas
+    ainda sem ID das propriedades com ID. Quando a propriedade já existia no
+    banco (ID reaproveitado), as colheitas que ele já tem não são reenviadas.
+    Ao final é exibida a taxa de gravação e a lista de linhas que falharam.
+    
+    Args:
+        lista_propriedades (list): Lista de propriedades em memória
+        tamanho_lote (int): Linhas por lote/transação
+        
+    Returns:
+        bool: True se todas as linhas foram gravadas
+    """
+    exibir_mensagem_info(f"Sincronizando dados com banco {obter_nome_backend()} (modo em lote)...")
+    
+    falhas = []
+    # Colheitas já gravadas das propriedades cujo ID foi reaproveitado (chave -> ID)
+    existentes_por_propriedade = {}
+    
+    # 1. Propriedades novas
+    novas_propriedades = [prop for prop in lista_propriedades if not hasattr(prop, 'id')]
+    if novas_propriedades:
+        relatorio = salvar_propriedades_lote_oracle(novas_propriedades, tamanho_lote)
+        if relatorio is None:
+            exibir_mensagem_erro(f"Erro ao sincronizar propriedades com o banco {obter_nome_backend()}")
+            return False
+        
+        for propriedade, propriedade_id in zip(novas_propriedades, relatorio['ids']):
+            if propriedade_id is not None:
+                propriedade.id = propriedade_id
+        for indice, mensagem in relatorio['falhas']:
+            falhas.append(f"Propriedade '{novas_propriedades[indice].nome}': {mensagem}")
+        for indice in relatorio.get('reaproveitados', []):
+            propriedade = novas_propriedades[indice]
+            colheitas_banco = buscar_colheitas_por_propriedade(propriedade.id)
+            if colheitas_banco is None:
+                exibir_mensagem_erro(f"Erro ao consultar colheitas de '{propriedade.nome}' no banco {obter_nome_backend()}")
+                return False
+            existentes_por_propriedade[propriedade.id] = {
+                _chave_colheita(colheita): colheita.id for colheita in colheitas_banco
+            }
+        
+        exibir_mensagem_info(f"Propriedades: {relatorio['inseridos']}/{relatorio['total']} "
+                             f"({relatorio['linhas_por_segundo']} linhas/s)")
+    
+    # 2. Colheitas ainda não gravadas
+    registros = []
+    posicoes = []
+    ja_presentes = 0
+    for propriedade in lista_propriedades:
+        if not hasattr(propriedade, 'id'):
+            continue
+        existentes = existentes_por_propriedade.get(propriedade.id)
+        for indice, colheita in enumerate(propriedade.colheitas):
+            if hasattr(colheita, 'id'):
+                continue
+            if existentes is not None:
+                colheita_id = existentes.get(_chave_colheita(colheita))
+                if colheita_id is not None:
+                    propriedade.definir_id_colheita(indice, colheita_id)
+                    ja_presentes += 1
+                    continue
+            registros.append((colheita, propriedade.id, propriedade.tipo_solo))
+            posicoes.append((propriedade, indice))
+    
+    if ja_presentes:
+        exibir_mensagem_info(f"{ja_presentes} colheita(s) já presente(s) no banco (não reenviadas)")
+    
+    if registros:
+        relatorio = salvar_colheitas_lote_oracle(registros, tamanho_lote)
+        if relatorio is None:
+            exibir_mensagem_erro(f"Erro ao sincronizar colheitas com o banco {obter_nome_backend()}")
+            return False
+        
+        for (propriedade, indice), colheita_id in zip(posicoes, relatorio['ids']):
+            if colheita_id is not None:
+                propriedade.definir_id_colheita(indice, colheita_id)
+        for indice, mensagem in relatorio['falhas']:
+            colheita = registros[indice][0]
+            falhas.append(f"Colheita de {colheita.data} (propriedade ID {registros[indice][1]}): {mensagem}")
+        
+        exibir_mensagem_info(f"Colheitas: {relatorio['inseridos']}/{relatorio['total']} "
+                             f"({relatorio['linhas_por_segundo']} linhas/s em {relatorio['tempo_segundos']} s)")
+    
+    if falhas:
+        exibir_mensagem_erro(f"{len(falhas)} linha(s) não foram sincronizadas:")
+        for falha in falhas:
+            print(f"  • {falha}")
+        return False
+    
+    exibir_mensagem_sucesso(f"Sincronização com o banco {obter_nome_backend()} concluída!")
+    return True
+
 def carregar_dados_banco():
     """
     Carrega todos os dados do banco Oracle
@@ -185,15 +353,15 @@ def carregar_dados_banco():
         list: Lista de propriedades carregadas ou lista vazia se erro
     """
     if not verificar_banco_disponivel():
-        exibir_mensagem_info("Banco Oracle não disponível. Usando dados em memória.")
+        exibir_mensagem_info("Banco de dados não disponível. Usando dados em memória.")
         return []
     
-    propriedades = buscar_historico_completo()
+    propriedades = carregar_repositorio()
     if propriedades:
-        exibir_mensagem_sucesso(f"Carregadas {len(propriedades)} propriedades do banco Oracle")
+        exibir_mensagem_sucesso(f"Carregadas {len(propriedades)} propriedades do banco {obter_nome_backend()}")
         return propriedades
     else:
-        exibir_mensagem_info("Nenhum dado encontrado no banco Oracle")
+        exibir_mensagem_info(f"Nenhum dado encontrado no banco {obter_nome_backend()}")
         return []
 
 def fazer_backup_integrado(lista_propriedades):
@@ -206,13 +374,11 @@ def fazer_backup_integrado(lista_propriedades):
     Returns:
         bool: True se backup foi realizado
     """
-    # Se banco disponível, carregar dados mais recentes
+    # Se banco disponível, incorporar os dados mais recentes
     if verificar_banco_disponivel():
-        propriedades_banco = buscar_historico_completo()
-        if propriedades_banco:
-            lista_propriedades.clear()
-            lista_propriedades.extend(propriedades_banco)
-            exibir_mensagem_info("Dados atualizados do banco Oracle para backup")
+        novos = atualizar_repositorio(lista_propriedades)
+        if novos:
+            exibir_mensagem_info(f"{novos} registro(s) novo(s) do banco {obter_nome_backend()} incluído(s) no backup")
     
     # Fazer backup usando função existente
     from src.services.file_service import fazer_backup_interativo
@@ -226,16 +392,22 @@ def importar_backup_integrado():
         list: Lista de propriedades importadas ou None se cancelado
     """
     from src.services.file_service import importar_backup_interativo
+    from src.services.importacao_lote_service import importar_backups_em_lote_interativo
     
-    propriedades_importadas = importar_backup_interativo()
+    print("\n1. Importar um backup")
+    print("2. Importar e mesclar vários backups (escritórios)")
+    if input("Escolha (1-2, Enter = 1): ").strip() == '2':
+        propriedades_importadas = importar_backups_em_lote_interativo()
+    else:
+        propriedades_importadas = importar_backup_interativo()
     
     if propriedades_importadas and verificar_banco_disponivel():
-        if confirmar_acao("Deseja sincronizar os dados importados com o banco Oracle?"):
-            sucesso = sincronizar_com_banco(propriedades_importadas)
+        if confirmar_acao(f"Deseja sincronizar os dados importados com o banco {obter_nome_backend()}?"):
+            sucesso = sincronizar_com_banco(propriedades_importadas, em_lote=True)
             if sucesso:
-                exibir_mensagem_sucesso("Dados importados e sincronizados com Oracle!")
+                exibir_mensagem_sucesso(f"Dados importados e sincronizados com o banco {obter_nome_backend()}!")
             else:
-                exibir_mensagem_erro("Dados importados, mas erro na sincronização com Oracle")
+                exibir_mensagem_erro(f"Dados importados, mas erro na sincronização com o banco {obter_nome_backend()}")
     
     return propriedades_importadas
 
@@ -247,7 +419,12 @@ def exibir_status_sistema():
     
     # Status do banco
     if verificar_banco_disponivel():
-        print("✓ Banco Oracle: CONECTADO")
+        print(f"✓ Banco {obter_nome_backend()}: CONECTADO")
+        if backend_em_uso() == 'sqlite':
+            from src.services.sqlite_service import obter_informacoes_sqlite
+            informacoes = obter_informacoes_sqlite()
+            print(f"  • Arquivo: {informacoes['arquivo']} ({informacoes['tamanho'] / 1024:.0f} KB, "
+                  f"journal {informacoes['journal_mode']})")
         
         # Estatísticas do banco
         stats = obter_estatisticas_banco()
@@ -256,10 +433,25 @@ def exibir_status_sistema():
             print(f"  • Colheitas: {stats['total_colheitas']}")
             print(f"  • Área total colhida: {stats['area_total_colhida']:.2f} ha")
             print(f"  • Produtividade média: {stats['produtividade_media']:.2f} t/ha")
+        
+        # Uso do pool de sessões
+        stats_pool = obter_estatisticas_pool()
+        if stats_pool:
+            print(f"  • Pool de conexões: {stats_pool['em_uso']} em uso / {stats_pool['abertas']} abertas "
+                  f"(mín. {stats_pool['minimo']}, máx. {stats_pool['maximo']})")
+            print(f"  • Timeout de sessões ociosas: {stats_pool['timeout_ocioso']} s")
+            print(f"  • Conexões fornecidas pelo pool: {stats_pool['total_aquisicoes']}")
     else:
-        print("✗ Banco Oracle: NÃO DISPONÍVEL")
+        print("✗ Banco de dados: NÃO DISPONÍVEL")
         print("  • Sistema funcionando apenas com arquivos JSON")
     
+    # Medições de desempenho (SMPC_INSTRUMENTACAO ou menu de configuração)
+    if instrumentacao_ativa():
+        print("\n✓ Instrumentação de desempenho: ATIVA")
+        exibir_metricas()
+    else:
+        print("\n• Instrumentação de desempenho: desligada (Configuração do Banco > Instrumentação)")
+    
     print("\nFuncionalidades disponíveis:")
     print("✓ Cadastro de propriedades")
     print("✓ Registro de colheitas")
@@ -267,27 +459,28 @@ def exibir_status_sistema():
     print("✓ Backup/restore JSON")
     
     if verificar_banco_disponivel():
-        print("✓ Persistência em Oracle")
+        print(f"✓ Persistência em {obter_nome_backend()}")
         print("✓ Sincronização automática")
     else:
         print("⚠ Dados apenas em memória (não persistentes)")
 
 def menu_configuracao_banco():
     """
-    Menu para configuração e teste do banco Oracle
+    Menu para configuração e teste do banco de dados
     """
     while True:
-        exibir_cabecalho("Configuração do Banco Oracle")
+        exibir_cabecalho("Configuração do Banco de Dados")
         
         print("1. Testar Conexão")
         print("2. Criar/Verificar Tabelas")
         print("3. Exibir Status do Sistema")
         print("4. Ver Referências Científicas")
         print("5. Limpar Dados do Banco (CUIDADO!)")
-        print("6. Voltar ao Menu Principal")
+        print("6. Instrumentação de Desempenho")
+        print("7. Voltar ao Menu Principal")
         
         try:
-            opcao = input("\nEscolha uma opção (1-6): ").strip()
+            opcao = input("\nEscolha uma opção (1-7): ").strip()
             
             if opcao == '1':
                 testar_conexao()
@@ -299,13 +492,16 @@ def menu_configuracao_banco():
                 from src.services.calculation_service import exibir_referencias_cientificas
                 exibir_referencias_cientificas()
             elif opcao == '5':
-                if confirmar_acao("ATENÇÃO: Isso removerá TODOS os dados do banco Oracle. Confirma?"):
-                    from src.services.database_service import limpar_dados_banco
-                    limpar_dados_banco()
+                if confirmar_acao(f"ATENÇÃO: Isso removerá TODOS os dados do banco {obter_nome_backend()}. Confirma?"):
+                    from src.services.armazenamento_service import limpar_dados_banco
+                    if limpar_dados_banco():
+                        invalidar_repositorio()
             elif opcao == '6':
+                menu_instrumentacao()
+            elif opcao == '7':
                 break
             else:
-                exibir_mensagem_erro("Opção inválida. Digite um número entre 1 e 6.")
+                exibir_mensagem_erro("Opção inválida. Digite um número entre 1 e 7.")
             
             input("\nPressione Enter para continuar...")
             
@@ -314,4 +510,44 @@ def menu_configuracao_banco():
             break
         except Exception as e:
             exibir_mensagem_erro(f"Erro inesperado: {e}")
-            input("\nPressione Enter para continuar...")
\ No newline at end of file
+            input("\nPressione Enter para continuar...")
+
+def menu_instrumentacao():
+    """
+    Liga/desliga a instrumentação de desempenho, exibe as métricas e exporta o trace
+    """
+    exibir_cabecalho("Instrumentação de Desempenho")
+    
+    if instrumentacao_ativa():
+        print("Status: ATIVA\n")
+        exibir_metricas()
+        print("\n1. Exportar trace do Chrome (chrome://tracing)")
+        print("2. Zerar métricas")
+        print("3. Desligar instrumentação")
+        print("0. Voltar")
+        opcao = input("\nEscolha uma opção: ").strip()
+        
+        if opcao == '1':
+            nome_arquivo = input("Arquivo de destino (padrão: trace_smpc.json): ").strip() or 'trace_smpc.json'
+            try:
+                eventos = exportar_trace_chrome(nome_arquivo)
+            except OSError as e:
+                exibir_mensagem_erro(f"Erro ao gravar trace: {e}")
+                return
+            if eventos:
+                exibir_mensagem_sucesso(f"Trace com {eventos} chamada(s) gravado em {nome_arquivo}")
+            else:
+                exibir_mensagem_info("Trace gravado sem chamadas: ligue a instrumentação com trace para registrá-las.")
+        elif opcao == '2':
+            zerar_metricas()
+            exibir_mensagem_sucesso("Métricas zeradas.")
+        elif opcao == '3':
+            ativar_instrumentacao(False)
+            exibir_mensagem_info("Instrumentação desligada.")
+    else:
+        print("Status: DESLIGADA")
+        print("Mede chamadas ao banco, relatórios e backups (tempo, round trips, linhas e bytes).\n")
+        if confirmar_acao("Ligar a instrumentação (com registro de trace)?"):
+            zerar_metricas()
+            ativar_instrumentacao(trace=True)
+            exibir_mensagem_sucesso("Instrumentação ligada. As métricas aparecem no Status do Sistema.")
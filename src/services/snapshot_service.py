@@ -0,0 +1,426 @@
+"""
+Módulo do snapshot binário colunar das propriedades e colheitas
+Formato de largura fixa lido via mmap: abrir um snapshot não converte nenhum
+registro, e as propriedades são montadas apenas quando acessadas.
+
+Layout (little-endian, seções alinhadas em 8 bytes):
+    cabeçalho        FORMATO_CABECALHO
+    propriedades     FORMATO_PROPRIEDADE por propriedade (índices na tabela de textos,
+                     área total, início/quantidade das colheitas, ID e totais colhidos)
+    colheitas        uma coluna por campo, com todas as colheitas em sequência:
+                     área (f64), quantidade (f64), ID (i64), data ordinal (i32), tipo (i8)
+    exceções         valores que não cabem nas colunas (data inválida ou tipo
+                     desconhecido, guardados como texto): posições das colheitas
+                     (u64, ordenadas) seguidas de pares campo/índice do texto (u32)
+    textos           deslocamentos (u64, n+1) seguidos dos textos UTF-8
+"""
+
+import mmap
+import os
+import struct
+import sys
+import time
+from array import array
+from bisect import bisect_left
+from datetime import datetime
+
+from src.models.colheitas_colunares import ColheitasColunares
+from src.models.propriedade import Propriedade
+
+ASSINATURA_SNAPSHOT = b'SMPCSNAP'
+VERSAO_SNAPSHOT = 1
+EXTENSAO_SNAPSHOT = '.snapshot'
+
+# assinatura, versão, data de criação (timestamp), nº de propriedades, colheitas,
+# exceções e textos, seguidos dos deslocamentos de cada seção
+FORMATO_CABECALHO = struct.Struct('<8sH6xqQQQQ' + 'Q' * 9)
+FORMATO_PROPRIEDADE = struct.Struct('<IIIxxxxdQQqdd')
+
+# Campos das exceções
+EXCECAO_DATA = 0
+EXCECAO_TIPO = 1
+
+# Colunas de colheita: (nome, typecode do array, tamanho em bytes)
+COLUNAS_COLHEITA = (
+    ('areas', 'd', 8),
+    ('quantidades', 'd', 8),
+    ('ids', 'q', 8),
+    ('datas', 'i', 4),
+    ('tipos', 'b', 1)
+)
+
+def _alinhar(posicao):
+    """
+    Arredonda uma posição para o próximo múltiplo de 8
+    """
+    return (posicao + 7) & ~7
+
+def gravar_snapshot(lista_propriedades, arquivo):
+    """
+    Grava as propriedades e colheitas em um snapshot binário colunar
+
+    Propriedades em armazenamento colunar têm as colunas copiadas direto,
+    sem criar objetos Colheita.
+
+    Args:
+        lista_propriedades (list): Lista de propriedades
+        arquivo: Arquivo binário aberto para escrita
+
+    Returns:
+        tuple: (total_propriedades, total_colheitas) gravados
+    """
+    if sys.byteorder != 'little':
+        raise ValueError("snapshot binário suportado apenas em plataformas little-endian")
+
+    textos = {}
+    def indice_texto(texto):
+        return textos.setdefault(texto, len(textos))
+
+    colunas = {nome: array(codigo) for nome, codigo, _ in COLUNAS_COLHEITA}
+    excecoes = []
+    registros = []
+
+    for propriedade in lista_propriedades:
+        inicio = len(colunas['areas'])
+        colheitas = propriedade.colheitas
+
+        if propriedade.usa_armazenamento_colunar():
+            for nome, _, _ in COLUNAS_COLHEITA:
+                colunas[nome].extend(getattr(colheitas, nome))
+            for (campo, posicao), texto in sorted(colheitas._textos.items(), key=lambda item: item[0][1]):
+                codigo_campo = EXCECAO_DATA if campo == 'data' else EXCECAO_TIPO
+                excecoes.append((inicio + posicao, codigo_campo, indice_texto(texto)))
+        else:
+            # Mesmo mapeamento de ColheitasColunares, feito coluna a coluna
+            temporario = ColheitasColunares(colheitas)
+            for nome, _, _ in COLUNAS_COLHEITA:
+                colunas[nome].extend(getattr(temporario, nome))
+            for (campo, posicao), texto in sorted(temporario._textos.items(), key=lambda item: item[0][1]):
+                codigo_campo = EXCECAO_DATA if campo == 'data' else EXCECAO_TIPO
+                excecoes.append((inicio + posicao, codigo_campo, indice_texto(texto)))
+
+        registros.append(FORMATO_PROPRIEDADE.pack(
+            indice_texto(propriedade.nome),
+            indice_texto(propriedade.localizacao),
+            indice_texto(propriedade.tipo_solo),
+            float(propriedade.area_total),
+            inicio,
+            len(colunas['areas']) - inicio,
+            getattr(propriedade, 'id', 0) or 0,
+            float(propriedade.obter_area_total_colhida()),
+            float(propriedade.obter_quantidade_total_colhida())
+        ))
+
+    excecoes.sort()
+    posicoes_excecoes = array('Q', [excecao[0] for excecao in excecoes])
+    valores_excecoes = array('I')
+    for _, campo, indice in excecoes:
+        valores_excecoes.extend((campo, indice))
+    textos_codificados = [texto.encode('utf-8') for texto in textos]
+    deslocamentos_textos = array('Q', [0])
+    for texto in textos_codificados:
+        deslocamentos_textos.append(deslocamentos_textos[-1] + len(texto))
+
+    # Seções na ordem do layout, cada uma começando em posição alinhada
+    secoes = [b''.join(registros)]
+    secoes.extend(colunas[nome].tobytes() for nome, _, _ in COLUNAS_COLHEITA)
+    secoes.append(posicoes_excecoes.tobytes() + valores_excecoes.tobytes())
+    secoes.append(deslocamentos_textos.tobytes())
+    secoes.append(b''.join(textos_codificados))
+
+    posicoes = []
+    posicao = _alinhar(FORMATO_CABECALHO.size)
+    for secao in secoes:
+        posicoes.append(posicao)
+        posicao = _alinhar(posicao + len(secao))
+
+    cabecalho = FORMATO_CABECALHO.pack(
+        ASSINATURA_SNAPSHOT, VERSAO_SNAPSHOT, int(time.time()),
+        len(registros), len(colunas['areas']), len(excecoes), len(textos),
+        *posicoes
+    )
+
+    arquivo.write(cabecalho)
+    gravados = len(cabecalho)
+    for posicao, secao in zip(posicoes, secoes):
+        arquivo.write(b'\0' * (posicao - gravados))
+        arquivo.write(secao)
+        gravados = posicao + len(secao)
+
+    return len(registros), len(colunas['areas'])
+
+def eh_snapshot(caminho_arquivo):
+    """
+    Verifica pela assinatura se um arquivo é um snapshot binário
+
+    Args:
+        caminho_arquivo (str): Caminho do arquivo
+
+    Returns:
+        bool: True se o arquivo começa com a assinatura do snapshot
+    """
+    with open(caminho_arquivo, 'rb') as arquivo:
+        return arquivo.read(len(ASSINATURA_SNAPSHOT)) == ASSINATURA_SNAPSHOT
+
+class SnapshotColunar:
+    """
+    Snapshot binário mapeado em memória
+
+    Comporta-se como uma sequência somente leitura de Propriedade (len,
+    índice, iteração): cada propriedade é montada quando acessada, com as
+    colheitas em ColheitasColunares copiadas direto das colunas do arquivo.
+    obter_colunas entrega as colunas à análise vetorizada sem criar objetos.
+
+    Attr:
+        versao (int): Versão do formato
+        data_criacao (datetime): Momento em que o snapshot foi gravado
+        total_propriedades (int): Quantidade de propriedades
+        total_colheitas (int): Quantidade de colheitas
+    """
+
+    def __init__(self, caminho_arquivo):
+        with open(caminho_arquivo, 'rb') as arquivo:
+            self._mmap = mmap.mmap(arquivo.fileno(), 0, access=mmap.ACCESS_READ)
+
+        try:
+            self._dados = memoryview(self._mmap)
+            self._ler_cabecalho()
+        except Exception:
+            self.fechar()
+            raise
+
+    def _ler_cabecalho(self):
+        """
+        Valida o cabeçalho e prepara as visões de cada seção (sem copiar dados)
+        """
+        if len(self._dados) < FORMATO_CABECALHO.size:
+            raise ValueError("snapshot truncado (cabeçalho incompleto)")
+
+        (assinatura, versao, criacao, self.total_propriedades, self.total_colheitas,
+         total_excecoes, total_textos, *posicoes) = FORMATO_CABECALHO.unpack_from(self._dados)
+
+        if assinatura != ASSINATURA_SNAPSHOT:
+            raise ValueError("arquivo não é um snapshot binário")
+        if versao != VERSAO_SNAPSHOT:
+            raise ValueError(f"versão de snapshot não suportada: {versao}")
+        self.versao = versao
+        self.data_criacao = datetime.fromtimestamp(criacao)
+        if sys.byteorder != 'little':
+            raise ValueError("snapshot binário suportado apenas em plataformas little-endian")
+
+        (self._posicao_propriedades, *posicoes_colunas, posicao_excecoes,
+         posicao_deslocamentos, self._posicao_textos) = posicoes
+
+        fim_textos = posicao_deslocamentos + (total_textos + 1) * 8
+        if fim_textos > len(self._dados):
+            raise ValueError("snapshot truncado")
+
+        self._colunas = {}
+        for (nome, codigo, tamanho), posicao in zip(COLUNAS_COLHEITA, posicoes_colunas):
+            fim = posicao + self.total_colheitas * tamanho
+            if fim > len(self._dados):
+                raise ValueError("snapshot truncado")
+            self._colunas[nome] = (self._dados[posicao:fim], codigo, tamanho)
+
+        self._deslocamentos_textos = self._dados[posicao_deslocamentos:fim_textos].cast('Q')
+        if self._posicao_textos + self._deslocamentos_textos[-1] > len(self._dados):
+            raise ValueError("snapshot truncado")
+
+        # Exceções: posições ordenadas (busca binária direto no arquivo) e pares campo/texto
+        fim_posicoes = posicao_excecoes + total_excecoes * 8
+        if fim_posicoes + total_excecoes * 8 > len(self._dados):
+            raise ValueError("snapshot truncado")
+        self._posicoes_excecoes = self._dados[posicao_excecoes:fim_posicoes].cast('Q')
+        self._valores_excecoes = self._dados[fim_posicoes:fim_posicoes + total_excecoes * 8].cast('I')
+
+    def fechar(self):
+        """
+        Libera o mapeamento do arquivo
+        """
+        if getattr(self, '_mmap', None) is None:
+            return
+        for visao, _, _ in getattr(self, '_colunas', {}).values():
+            visao.release()
+        for nome in ('_deslocamentos_textos', '_posicoes_excecoes', '_valores_excecoes', '_dados'):
+            visao = getattr(self, nome, None)
+            if visao is not None:
+                visao.release()
+            setattr(self, nome, None)
+        self._colunas = {}
+        try:
+            self._mmap.close()
+        except BufferError:
+            # Colunas entregues por obter_colunas ainda em uso: o mapeamento
+            # é liberado pelo coletor quando elas deixarem de existir
+            pass
+        self._mmap = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *_):
+        self.fechar()
+
+    def __len__(self):
+        return self.total_propriedades
+
+    def __iter__(self):
+        for indice in range(self.total_propriedades):
+            yield self._criar_propriedade(indice)
+
+    def __getitem__(self, indice):
+        if isinstance(indice, slice):
+            return [self._criar_propriedade(i) for i in range(*indice.indices(self.total_propriedades))]
+
+        if indice < 0:
+            indice += self.total_propriedades
+        if not 0 <= indice < self.total_propriedades:
+            raise IndexError("índice de propriedade fora do intervalo")
+
+        return self._criar_propriedade(indice)
+
+    def obter_texto(self, indice):
+        """
+        Retorna um texto da tabela de textos
+
+        Args:
+            indice (int): Posição na tabela
+
+        Returns:
+            str: Texto decodificado
+        """
+        inicio = self._posicao_textos + self._deslocamentos_textos[indice]
+        fim = self._posicao_textos + self._deslocamentos_textos[indice + 1]
+        return str(self._dados[inicio:fim], 'utf-8')
+
+    def obter_nomes(self):
+        """
+        Retorna os nomes das propriedades sem montar nenhuma delas
+
+        Returns:
+            list: Nomes na ordem do snapshot
+        """
+        return [self.obter_texto(self._ler_registro(indice)[0]) for indice in range(self.total_propriedades)]
+
+    def _ler_registro(self, indice):
+        """
+        Lê o registro de largura fixa de uma propriedade
+        """
+        return FORMATO_PROPRIEDADE.unpack_from(
+            self._dados, self._posicao_propriedades + indice * FORMATO_PROPRIEDADE.size
+        )
+
+    def _criar_propriedade(self, indice):
+        """
+        Monta a propriedade de uma posição, com as colheitas copiadas das colunas
+
+        Args:
+            indice (int): Posição da propriedade
+
+        Returns:
+            Propriedade: Propriedade com colheitas em ColheitasColunares
+        """
+        (nome, localizacao, tipo_solo, area_total, inicio, quantidade,
+         propriedade_id, area_colhida, quantidade_colhida) = self._ler_registro(indice)
+
+        propriedade = Propriedade(
+            self.obter_texto(nome),
+            area_total,
+            self.obter_texto(localizacao),
+            self.obter_texto(tipo_solo)
+        )
+        if propriedade_id:
+            propriedade.id = propriedade_id
+
+        arrays = {}
+        for nome_coluna, (visao, codigo, tamanho) in self._colunas.items():
+            coluna = array(codigo)
+            coluna.frombytes(visao[inicio * tamanho:(inicio + quantidade) * tamanho])
+            arrays[nome_coluna] = coluna
+
+        textos = {}
+        posicao = bisect_left(self._posicoes_excecoes, inicio)
+        while posicao < len(self._posicoes_excecoes) and self._posicoes_excecoes[posicao] < inicio + quantidade:
+            campo = self._valores_excecoes[2 * posicao]
+            chave = 'data' if campo == EXCECAO_DATA else 'tipo'
+            textos[(chave, self._posicoes_excecoes[posicao] - inicio)] = \
+                self.obter_texto(self._valores_excecoes[2 * posicao + 1])
+            posicao += 1
+
+        propriedade.colheitas = ColheitasColunares.de_colunas(
+            textos=textos,
+            area_total=area_colhida,
+            quantidade_total=quantidade_colhida,
+            **arrays
+        )
+
+        return propriedade
+
+    def obter_colunas(self):
+        """
+        Entrega as colunas no formato de analise_vetorizada.construir_colunas
+
+        Área, quantidade e tipo são visões NumPy sobre o próprio arquivo
+        (sem cópia); o solo de cada colheita é expandido a partir das propriedades.
+
+        Returns:
+            dict: Colunas para analisar_colunas / resumir_analise
+        """
+        import numpy as np
+        from src.services.calculation_service import (
+            PRODUTIVIDADE_ESPERADA_POR_SOLO,
+            calcular_produtividade_esperada
+        )
+
+        registros = np.frombuffer(
+            self._mmap,
+            dtype=np.dtype([
+                ('nome', '<u4'), ('localizacao', '<u4'), ('tipo_solo', '<u4'), ('_', 'V4'),
+                ('area_total', '<f8'), ('inicio', '<u8'), ('quantidade', '<u8'),
+                ('id', '<i8'), ('area_colhida', '<f8'), ('quantidade_colhida', '<f8')
+            ]),
+            count=self.total_propriedades,
+            offset=self._posicao_propriedades
+        )
+
+        # Um código por tipo de solo normalizado, na ordem em que aparecem
+        codigos_solo = {}
+        codigo_por_propriedade = np.empty(self.total_propriedades, dtype=np.intc)
+        for posicao, indice_texto in enumerate(registros['tipo_solo'].tolist()):
+            solo = self.obter_texto(indice_texto).lower().strip()
+            codigo_por_propriedade[posicao] = codigos_solo.setdefault(solo, len(codigos_solo))
+
+        esperada_por_solo = [
+            calcular_produtividade_esperada(0, solo) for solo in codigos_solo
+        ] or [PRODUTIVIDADE_ESPERADA_POR_SOLO['outros']]
+
+        def coluna(nome, dtype):
+            visao, _, _ = self._colunas[nome]
+            return np.frombuffer(visao, dtype=dtype)
+
+        return {
+            'area': coluna('areas', np.float64),
+            'quantidade': coluna('quantidades', np.float64),
+            'solo': np.repeat(codigo_por_propriedade, registros['quantidade'].astype(np.int64)),
+            'tipo': coluna('tipos', np.int8),
+            'inicios': registros['inicio'].astype(np.int64),
+            'esperada_por_solo': np.array(esperada_por_solo, dtype=np.float64),
+            'propriedades': self
+        }
+
+def abrir_snapshot(caminho_arquivo):
+    """
+    Abre um snapshot binário sem converter nenhum registro
+
+    Args:
+        caminho_arquivo (str): Caminho do arquivo
+
+    Returns:
+        SnapshotColunar: Snapshot mapeado em memória
+
+    Raises:
+        ValueError: Se o arquivo não for um snapshot válido
+    """
+    if os.path.getsize(caminho_arquivo) == 0:
+        raise ValueError("snapshot vazio")
+    return SnapshotColunar(caminho_arquivo)
@@ -0,0 +1,771 @@
+"""
+Módulo de serviços para o banco SQLite local
+Implementa as mesmas funções de database_service (inclusive os nomes, para
+que os dois backends sejam intercambiáveis em armazenamento_service) sobre
+um arquivo SQLite em modo WAL, com o esquema de SQL_CREATE_TABLES e índices.
+Indicado para notebooks de campo sem acesso ao Oracle.
+"""
+
+import os
+import sqlite3
+import time
+from contextlib import contextmanager
+from datetime import date, datetime
+
+from config.database_config import (
+    obter_config_armazenamento,
+    obter_periodo,
+    CONFIG_AVANCADA,
+    CONFIG_SQLITE,
+    SQL_CREATE_TABLES_SQLITE,
+    SQL_INSERT_SQLITE,
+    SQL_SELECT_SQLITE
+)
+from src.utils.menu_utils import (
+    exibir_mensagem_sucesso,
+    exibir_mensagem_erro,
+    exibir_mensagem_info
+)
+from src.utils.instrumentacao import medir, contar
+from src.models.propriedade import Propriedade, LIMITE_COLHEITAS_COLUNAR
+from src.models.colheita import Colheita
+from src.services.database_service import montar_relatorio_lote
+
+# Formato das colunas de data/hora (datetime('now', 'localtime') do SQLite)
+FORMATO_DATA_HORA = '%Y-%m-%d %H:%M:%S'
+
+# Conexão única do processo: o SQLite é embarcado, não há pool a gerenciar
+_sqlite = {
+    'conexao': None,
+    'arquivo': None
+}
+
+def obter_arquivo_sqlite():
+    """
+    Retorna o caminho do arquivo do banco local
+
+    Returns:
+        str: Caminho absoluto do arquivo SQLite
+    """
+    return os.path.abspath(obter_config_armazenamento()['arquivo_sqlite'])
+
+def _criar_esquema(conexao):
+    """
+    Cria tabelas e índices que ainda não existem (idempotente)
+
+    Args:
+        conexao (sqlite3.Connection): Conexão aberta
+    """
+    conexao.execute(SQL_CREATE_TABLES_SQLITE['propriedades'])
+    conexao.execute(SQL_CREATE_TABLES_SQLITE['colheitas'])
+    for nome, comando in SQL_CREATE_TABLES_SQLITE['indices'].items():
+        try:
+            conexao.execute(comando)
+        except sqlite3.IntegrityError:
+            # Banco antigo com nomes que só diferem em maiúsculas: índice sem unicidade
+            if nome != 'idx_propriedades_nome_upper':
+                raise
+            exibir_mensagem_info("Nomes repetidos em maiúsculas/minúsculas: índice sem unicidade")
+            conexao.execute(SQL_CREATE_TABLES_SQLITE['indice_nome_sem_unicidade'])
+
+    # Totais por propriedade mantidos por gatilhos; bancos antigos recebem a carga inicial
+    nova = conexao.execute("SELECT 1 FROM sqlite_master WHERE type = 'table' "
+                           "AND name = 'estatisticas_propriedades'").fetchone() is None
+    for comando in SQL_CREATE_TABLES_SQLITE['estatisticas'].values():
+        conexao.execute(comando)
+    if nova:
+        conexao.execute(SQL_CREATE_TABLES_SQLITE['estatisticas_carga'])
+    conexao.commit()
+
+@medir
+def conectar_sqlite():
+    """
+    Obtém a conexão com o banco local, criando o arquivo e o esquema na primeira chamada
+
+    Returns:
+        sqlite3.Connection: Conexão ou None se falhar
+    """
+    arquivo = obter_arquivo_sqlite()
+    if _sqlite['conexao'] is not None and _sqlite['arquivo'] == arquivo:
+        return _sqlite['conexao']
+
+    encerrar_pool()
+    try:
+        os.makedirs(os.path.dirname(arquivo), exist_ok=True)
+        conexao = sqlite3.connect(arquivo, timeout=CONFIG_SQLITE['busy_timeout'] / 1000)
+        for pragma in ('journal_mode', 'synchronous', 'busy_timeout', 'cache_size', 'temp_store', 'foreign_keys'):
+            conexao.execute(f"PRAGMA {pragma} = {CONFIG_SQLITE[pragma]}")
+        _criar_esquema(conexao)
+    except sqlite3.Error as e:
+        exibir_mensagem_erro(f"Erro ao abrir banco local {arquivo}: {e}")
+        return None
+
+    _sqlite['conexao'] = conexao
+    _sqlite['arquivo'] = arquivo
+    contar('conexoes_obtidas')
+    return conexao
+
+def fechar_conexao(conexao):
+    """
+    Mantida pela compatibilidade com database_service: a conexão local fica
+    aberta até encerrar_pool
+
+    Args:
+        conexao: Conexão obtida em conectar_sqlite
+    """
+
+@contextmanager
+def obter_conexao():
+    """
+    Gerenciador de contexto com a conexão local (mesmo uso de database_service.obter_conexao)
+
+    Yields:
+        sqlite3.Connection: Conexão ou None se o banco não puder ser aberto
+    """
+    yield conectar_sqlite()
+
+def obter_estatisticas_pool():
+    """
+    O SQLite não usa pool de sessões
+
+    Returns:
+        None
+    """
+    return None
+
+def obter_informacoes_sqlite():
+    """
+    Informações do arquivo local para a tela de status
+
+    Returns:
+        dict: Arquivo, tamanho em bytes (banco + WAL) e modo de journal, ou None se não abriu
+    """
+    conexao = conectar_sqlite()
+    if conexao is None:
+        return None
+
+    arquivo = _sqlite['arquivo']
+    tamanho = sum(os.path.getsize(caminho) for caminho in (arquivo, arquivo + '-wal') if os.path.exists(caminho))
+    return {
+        'arquivo': arquivo,
+        'tamanho': tamanho,
+        'journal_mode': conexao.execute("PRAGMA journal_mode").fetchone()[0]
+    }
+
+def encerrar_pool():
+    """
+    Fecha a conexão com o banco local (o nome acompanha database_service)
+    """
+    conexao = _sqlite['conexao']
+    if conexao is None:
+        return
+
+    try:
+        # Atualiza as estatísticas usadas pelo planejador de consultas
+        conexao.execute("PRAGMA optimize")
+        conexao.close()
+    except sqlite3.Error as e:
+        exibir_mensagem_erro(f"Erro ao fechar banco local: {e}")
+    finally:
+        _sqlite['conexao'] = None
+        _sqlite['arquivo'] = None
+
+@medir
+def testar_conexao():
+    """
+    Testa a abertura do banco local
+
+    Returns:
+        bool: True se o banco pôde ser aberto e consultado
+    """
+    conexao = conectar_sqlite()
+    if conexao is None:
+        return False
+
+    try:
+        resultado = conexao.execute("SELECT 'Conexão OK'").fetchone()
+        exibir_mensagem_sucesso("Banco SQLite local aberto com sucesso!")
+        exibir_mensagem_info(f"Arquivo: {_sqlite['arquivo']}")
+        exibir_mensagem_info(f"Resultado do teste: {resultado[0]}")
+        return True
+    except sqlite3.Error as e:
+        exibir_mensagem_erro(f"Erro no teste do banco local: {e}")
+        return False
+
+@medir
+def criar_tabelas():
+    """
+    Cria as tabelas e índices no banco local (se ainda não existirem)
+
+    Returns:
+        bool: True se o esquema está pronto
+    """
+    conexao = conectar_sqlite()
+    if conexao is None:
+        return False
+
+    try:
+        _criar_esquema(conexao)
+        exibir_mensagem_info("Tabelas e índices do banco local verificados.")
+        return True
+    except sqlite3.Error as e:
+        exibir_mensagem_erro(f"Erro ao criar tabelas no banco local: {e}")
+        conexao.rollback()
+        return False
+
+def _linha_propriedade(propriedade):
+    """
+    Binds do INSERT de uma propriedade
+
+    Args:
+        propriedade (Propriedade): Propriedade a gravar
+
+    Returns:
+        dict: Binds de SQL_INSERT_SQLITE['propriedade']
+    """
+    return {
+        'nome': propriedade.nome,
+        'area_total': propriedade.area_total,
+        'localizacao': propriedade.localizacao,
+        'tipo_solo': propriedade.tipo_solo
+    }
+
+def _linha_colheita(colheita, propriedade_id, tipo_solo):
+    """
+    Binds do INSERT de uma colheita, com a data em AAAA-MM-DD e a perda calculada
+
+    Args:
+        colheita (Colheita): Colheita a gravar
+        propriedade_id (int): ID da propriedade
+        tipo_solo (str): Tipo de solo (para a perda)
+
+    Returns:
+        dict: Binds de SQL_INSERT_SQLITE['colheita']
+    """
+    from src.services.calculation_service import calcular_produtividade_esperada, calcular_percentual_perda
+
+    produtividade_esperada = calcular_produtividade_esperada(colheita.area_colhida, tipo_solo)
+    data_colheita = colheita.data_colheita
+    return {
+        'propriedade_id': propriedade_id,
+        'data_colheita': data_colheita.isoformat() if data_colheita else None,
+        'area_colhida': colheita.area_colhida,
+        'quantidade_colhida': colheita.quantidade_colhida,
+        'tipo_colheita': colheita.tipo_colheita,
+        'produtividade': colheita.produtividade,
+        'percentual_perda': calcular_percentual_perda(colheita.produtividade, produtividade_esperada)
+    }
+
+def _criar_propriedade(row):
+    """
+    Cria a propriedade a partir das primeiras colunas de uma linha do banco
+
+    Args:
+        row (tuple): (id, nome, area_total, localizacao, tipo_solo, ...)
+
+    Returns:
+        Propriedade: Propriedade com o ID do banco
+    """
+    propriedade = Propriedade(
+        nome=row[1],
+        area_total=float(row[2]),
+        localizacao=row[3],
+        tipo_solo=row[4]
+    )
+    propriedade.id = row[0]
+    return propriedade
+
+def _criar_colheita(colheita_id, data_colheita, area, quantidade, tipo):
+    """
+    Cria a colheita a partir das colunas lidas do banco (data em AAAA-MM-DD)
+
+    Args:
+        colheita_id (int): ID da colheita ou None (linhas sem ID, como as do relatório)
+        data_colheita (str): Data em AAAA-MM-DD
+        area (float): Área colhida (ha)
+        quantidade (float): Quantidade colhida (t)
+        tipo (str): 'manual' ou 'mecanica'
+
+    Returns:
+        Colheita: Colheita criada
+    """
+    colheita = Colheita(
+        data=date.fromisoformat(data_colheita),
+        area_colhida=float(area),
+        quantidade_colhida=float(quantidade),
+        tipo_colheita=tipo
+    )
+    if colheita_id is not None:
+        colheita.id = colheita_id
+    return colheita
+
+@medir
+def salvar_propriedade_oracle(propriedade):
+    """
+    Salva uma propriedade no banco local
+
+    Args:
+        propriedade (Propriedade): Objeto propriedade a ser salvo
+
+    Returns:
+        int: ID da propriedade salva ou None se houver erro
+    """
+    conexao = conectar_sqlite()
+    if conexao is None:
+        return None
+
+    try:
+        existente = conexao.execute(SQL_SELECT_SQLITE['propriedade_por_nome'], {'nome': propriedade.nome}).fetchone()
+        if existente:
+            exibir_mensagem_erro(f"Propriedade '{propriedade.nome}' já existe no banco de dados")
+            return None
+
+        propriedade_id = conexao.execute(SQL_INSERT_SQLITE['propriedade'], _linha_propriedade(propriedade)).lastrowid
+        conexao.commit()
+
+        exibir_mensagem_sucesso(f"Propriedade '{propriedade.nome}' salva no banco local!")
+        exibir_mensagem_info(f"ID gerado: {propriedade_id}")
+        return propriedade_id
+
+    except sqlite3.Error as e:
+        exibir_mensagem_erro(f"Erro ao salvar propriedade: {e}")
+        conexao.rollback()
+        return None
+
+@medir
+def salvar_colheita_oracle(colheita, propriedade_id, tipo_solo):
+    """
+    Salva uma colheita no banco local
+
+    Args:
+        colheita (Colheita): Objeto colheita a ser salvo
+        propriedade_id (int): ID da propriedade associada
+        tipo_solo (str): Tipo de solo da propriedade para calcular perda
+
+    Returns:
+        int: ID da colheita salva ou None se houver erro
+    """
+    conexao = conectar_sqlite()
+    if conexao is None:
+        return None
+
+    try:
+        colheita_id = conexao.execute(
+            SQL_INSERT_SQLITE['colheita'], _linha_colheita(colheita, propriedade_id, tipo_solo)
+        ).lastrowid
+        conexao.commit()
+
+        exibir_mensagem_sucesso("Colheita salva no banco local!")
+        exibir_mensagem_info(f"ID gerado: {colheita_id}")
+        return colheita_id
+
+    except sqlite3.Error as e:
+        exibir_mensagem_erro(f"Erro ao salvar colheita: {e}")
+        conexao.rollback()
+        return None
+
+@medir
+def _inserir_em_lotes(conexao, sql, linhas, tamanho_lote):
+    """
+    Insere as linhas em lotes, uma transação por lote
+
+    Como no executemany com batch errors do Oracle, uma linha que viola uma
+    restrição é registrada como falha sem desfazer as demais do lote.
+
+    Args:
+        conexao (sqlite3.Connection): Conexão local
+        sql (str): Comando INSERT
+        linhas (list): Lista de dicionários com os binds de cada linha
+        tamanho_lote (int): Quantidade de linhas por lote
+
+    Returns:
+        tuple: (ids, falhas) - lista de IDs alinhada com as linhas (None se falhou)
+               e lista de tuplas (indice, mensagem)
+    """
+    ids = [None] * len(linhas)
+    falhas = []
+    cursor = conexao.cursor()
+
+    try:
+        for inicio in range(0, len(linhas), tamanho_lote):
+            lote = linhas[inicio:inicio + tamanho_lote]
+            try:
+                for i, linha in enumerate(lote, inicio):
+                    try:
+                        cursor.execute(sql, linha)
+                        ids[i] = cursor.lastrowid
+                    except sqlite3.IntegrityError as e:
+                        falhas.append((i, str(e)))
+                conexao.commit()
+                contar('linhas_gravadas', len(lote))
+
+            except sqlite3.Error as e:
+                conexao.rollback()
+                falhas = [falha for falha in falhas if falha[0] < inicio]
+                for i in range(inicio, inicio + len(lote)):
+                    ids[i] = None
+                    falhas.append((i, str(e)))
+    finally:
+        cursor.close()
+
+    return ids, falhas
+
+@medir
+def salvar_propriedades_lote_oracle(propriedades, tamanho_lote=None):
+    """
+    Salva várias propriedades no banco local em lotes
+
+    Propriedades que já existem (mesmo nome) não são duplicadas: o ID
+    existente é reaproveitado e a posição é listada em 'reaproveitados'.
+
+    Args:
+        propriedades (list): Lista de objetos Propriedade
+        tamanho_lote (int): Linhas por lote (padrão: CONFIG_AVANCADA['tamanho_lote'])
+
+    Returns:
+        dict: Relatório da gravação (ver database_service.montar_relatorio_lote) ou None se não conectou
+    """
+    tamanho_lote = tamanho_lote or CONFIG_AVANCADA['tamanho_lote']
+    inicio = time.perf_counter()
+
+    conexao = conectar_sqlite()
+    if conexao is None:
+        return None
+
+    linhas = [_linha_propriedade(propriedade) for propriedade in propriedades]
+    ids, falhas = _inserir_em_lotes(conexao, SQL_INSERT_SQLITE['propriedade'], linhas, tamanho_lote)
+
+    # Violação de UNIQUE: propriedade já cadastrada, reaproveitar ID
+    falhas_restantes = []
+    reaproveitados = []
+    for indice, mensagem in falhas:
+        if mensagem.startswith('UNIQUE constraint failed'):
+            existente = conexao.execute(SQL_SELECT_SQLITE['propriedade_por_nome'],
+                                        {'nome': linhas[indice]['nome']}).fetchone()
+            if existente:
+                ids[indice] = existente[0]
+                reaproveitados.append(indice)
+                continue
+        falhas_restantes.append((indice, mensagem))
+
+    relatorio = montar_relatorio_lote(ids, falhas_restantes, inicio)
+    relatorio['reaproveitados'] = reaproveitados
+    return relatorio
+
+@medir
+def salvar_colheitas_lote_oracle(registros, tamanho_lote=None):
+    """
+    Salva várias colheitas no banco local em lotes
+
+    Args:
+        registros (list): Lista de tuplas (colheita, propriedade_id, tipo_solo)
+        tamanho_lote (int): Linhas por lote (padrão: CONFIG_AVANCADA['tamanho_lote'])
+
+    Returns:
+        dict: Relatório da gravação (ver database_service.montar_relatorio_lote) ou None se não conectou
+    """
+    tamanho_lote = tamanho_lote or CONFIG_AVANCADA['tamanho_lote']
+    inicio = time.perf_counter()
+
+    conexao = conectar_sqlite()
+    if conexao is None:
+        return None
+
+    linhas = [_linha_colheita(colheita, propriedade_id, tipo_solo)
+              for colheita, propriedade_id, tipo_solo in registros]
+    ids, falhas = _inserir_em_lotes(conexao, SQL_INSERT_SQLITE['colheita'], linhas, tamanho_lote)
+
+    return montar_relatorio_lote(ids, falhas, inicio)
+
+@medir
+def buscar_propriedades_oracle():
+    """
+    Busca todas as propriedades do banco local
+
+    Returns:
+        list: Lista de objetos Propriedade ou None se houver erro
+    """
+    conexao = conectar_sqlite()
+    if conexao is None:
+        return None
+
+    try:
+        linhas = conexao.execute(SQL_SELECT_SQLITE['todas_propriedades']).fetchall()
+        contar('linhas_lidas', len(linhas))
+        return [_criar_propriedade(row) for row in linhas]
+    except sqlite3.Error as e:
+        exibir_mensagem_erro(f"Erro ao buscar propriedades: {e}")
+        return None
+
+@medir
+def buscar_colheitas_por_propriedade(propriedade_id):
+    """
+    Busca colheitas de uma propriedade específica
+
+    Args:
+        propriedade_id (int): ID da propriedade
+
+    Returns:
+        list: Lista de objetos Colheita ou None se houver erro
+    """
+    conexao = conectar_sqlite()
+    if conexao is None:
+        return None
+
+    try:
+        linhas = conexao.execute(SQL_SELECT_SQLITE['colheitas_por_propriedade'],
+                                 {'propriedade_id': propriedade_id}).fetchall()
+        contar('linhas_lidas', len(linhas))
+        return [_criar_colheita(row[0], row[2], row[3], row[4], row[5]) for row in linhas]
+    except sqlite3.Error as e:
+        exibir_mensagem_erro(f"Erro ao buscar colheitas: {e}")
+        return None
+
+def _binds_periodo(data_inicio, data_fim):
+    """
+    Binds :data_inicio/:data_fim em AAAA-MM-DD (mesmo formato gravado em data_colheita)
+
+    Args:
+        data_inicio (date): Primeiro dia incluído (None = sem limite)
+        data_fim (date): Último dia incluído (None = sem limite)
+
+    Returns:
+        dict: Binds do período
+    """
+    inicio, fim = obter_periodo(data_inicio, data_fim)
+    return {'data_inicio': inicio.isoformat(), 'data_fim': fim.isoformat()}
+
+@medir
+@medir
+def buscar_historico_completo(data_inicio=None, data_fim=None):
+    """
+    Busca histórico completo de propriedades e colheitas
+
+    Mesma consulta (LEFT JOIN ordenado por propriedade) e agrupamento em
+    uma passada de database_service.buscar_historico_completo.
+
+    Args:
+        data_inicio (date): Carrega apenas colheitas a partir deste dia (None = todas)
+        data_fim (date): Carrega apenas colheitas até este dia, inclusive (None = todas)
+
+    Returns:
+        list: Lista de propriedades com colheitas carregadas ou None se houver erro
+    """
+    conexao = conectar_sqlite()
+    if conexao is None:
+        return None
+
+    try:
+        propriedades = []
+        propriedade = None
+        lidas = 0
+
+        for row in conexao.execute(SQL_SELECT_SQLITE['historico_completo'],
+                                   _binds_periodo(data_inicio, data_fim)):
+            lidas += 1
+            if propriedade is None or propriedade.id != row[0]:
+                propriedade = _criar_propriedade(row)
+                propriedades.append(propriedade)
+
+            # Propriedade sem colheitas (lado direito do LEFT JOIN vazio)
+            if row[6] is None:
+                continue
+
+            propriedade.adicionar_colheita(_criar_colheita(row[6], row[7], row[8], row[9], row[10]))
+
+        contar('linhas_lidas', lidas)
+
+        # Propriedades com muitas colheitas passam para o armazenamento colunar
+        for propriedade in propriedades:
+            propriedade.compactar_colheitas(LIMITE_COLHEITAS_COLUNAR)
+
+        return propriedades
+
+    except sqlite3.Error as e:
+        exibir_mensagem_erro(f"Erro ao buscar histórico: {e}")
+        return None
+
+@medir
+def obter_data_servidor():
+    """
+    Obtém a data/hora atual do banco local (mesmo relógio das colunas data_cadastro/data_registro)
+
+    Returns:
+        datetime: Data/hora local ou None se houver erro
+    """
+    conexao = conectar_sqlite()
+    if conexao is None:
+        return None
+
+    try:
+        texto = conexao.execute(SQL_SELECT_SQLITE['data_servidor']).fetchone()[0]
+        return datetime.strptime(texto, FORMATO_DATA_HORA)
+    except sqlite3.Error as e:
+        exibir_mensagem_erro(f"Erro ao obter data do banco local: {e}")
+        return None
+
+@medir
+def buscar_alteracoes_desde(desde_propriedades, desde_colheitas):
+    """
+    Busca propriedades e colheitas gravadas a partir das marcas informadas
+
+    Args:
+        desde_propriedades (datetime): Marca para propriedades
+        desde_colheitas (datetime): Marca para colheitas
+
+    Returns:
+        tuple: (propriedades, colheitas) - lista de Propriedade e lista de tuplas
+               (propriedade_id, Colheita), ou None se houver erro
+    """
+    conexao = conectar_sqlite()
+    if conexao is None:
+        return None
+
+    try:
+        linhas = conexao.execute(SQL_SELECT_SQLITE['propriedades_desde'],
+                                 {'desde': desde_propriedades.strftime(FORMATO_DATA_HORA)}).fetchall()
+        propriedades = [_criar_propriedade(row) for row in linhas]
+
+        linhas_colheitas = conexao.execute(SQL_SELECT_SQLITE['colheitas_desde'],
+                                           {'desde': desde_colheitas.strftime(FORMATO_DATA_HORA)}).fetchall()
+        colheitas = [(row[1], _criar_colheita(row[0], row[2], row[3], row[4], row[5])) for row in linhas_colheitas]
+
+        contar('linhas_lidas', len(linhas) + len(linhas_colheitas))
+        return propriedades, colheitas
+
+    except sqlite3.Error as e:
+        exibir_mensagem_erro(f"Erro ao buscar alterações: {e}")
+        return None
+
+@medir
+def obter_estatisticas_banco(exato=False):
+    """
+    Obtém estatísticas gerais do banco local
+
+    Args:
+        exato (bool): Agregar todas as colheitas em vez de ler os totais
+                      mantidos pelos gatilhos (estatisticas_propriedades)
+
+    Returns:
+        dict: Dicionário com estatísticas ou None se houver erro
+    """
+    conexao = conectar_sqlite()
+    if conexao is None:
+        return None
+
+    try:
+        consulta = 'estatisticas_gerais' if exato else 'estatisticas_resumo'
+        row = conexao.execute(SQL_SELECT_SQLITE[consulta]).fetchone()
+    except sqlite3.Error as e:
+        exibir_mensagem_erro(f"Erro ao obter estatísticas: {e}")
+        return None
+
+    return {
+        'total_propriedades': int(row[0] or 0),
+        'total_colheitas': int(row[1] or 0),
+        'area_total_colhida': float(row[2] or 0.0),
+        'quantidade_total_colhida': float(row[3] or 0.0),
+        'produtividade_media': float(row[4] or 0.0),
+        'perda_media': float(row[5] or 0.0)
+    }
+
+@medir
+def obter_relatorio_perdas_oracle(limite_criticas=100, data_inicio=None, data_fim=None):
+    """
+    Calcula o relatório de perdas no banco local (GROUP BY / CASE)
+
+    Args:
+        limite_criticas (int): Quantidade máxima de perdas críticas listadas
+        data_inicio (date): Considera apenas colheitas a partir deste dia (None = todas)
+        data_fim (date): Considera apenas colheitas até este dia, inclusive (None = todas)
+
+    Returns:
+        dict: {'resumo': dict no formato de calcular_resumo_geral,
+               'criticas': lista de dicionários} ou None se houver erro
+    """
+    conexao = conectar_sqlite()
+    if conexao is None:
+        return None
+
+    try:
+        periodo = _binds_periodo(data_inicio, data_fim)
+        row = conexao.execute(SQL_SELECT_SQLITE['relatorio_perdas_resumo'], periodo).fetchone()
+        total = int(row[0] or 0)
+        contagens = zip(('Baixa', 'Média', 'Alta', 'Crítica'), row[4:8]) if total else []
+
+        resumo = {
+            'total_colheitas': total,
+            'perda_media': float(row[1]) if total else 0.0,
+            'perda_minima': float(row[2]) if total else 0.0,
+            'perda_maxima': float(row[3]) if total else 0.0,
+            'distribuicao': {classe: int(qtd) for classe, qtd in contagens if qtd},
+            'comparacao': {
+                'manual': {
+                    'quantidade': int(row[8] or 0) if total else 0,
+                    'perda_media': float(row[9]) if total and row[9] is not None else None
+                },
+                'mecanica': {
+                    'quantidade': int(row[10] or 0) if total else 0,
+                    'perda_media': float(row[11]) if total and row[11] is not None else None
+                }
+            }
+        }
+
+        criticas = []
+        for row in conexao.execute(SQL_SELECT_SQLITE['relatorio_perdas_criticas'],
+                                   dict(periodo, limite=limite_criticas)):
+            colheita = _criar_colheita(None, row[2], row[3], row[4], row[5])
+            criticas.append({
+                'propriedade': row[0],
+                'tipo_solo': row[1],
+                'colheita': colheita,
+                'produtividade_real': float(row[6]) if row[6] is not None else colheita.produtividade,
+                'percentual_perda': float(row[7])
+            })
+
+        return {'resumo': resumo, 'criticas': criticas}
+
+    except sqlite3.Error as e:
+        exibir_mensagem_erro(f"Erro ao gerar relatório no banco local: {e}")
+        return None
+
+def arquivar_particoes_colheitas(data_limite):
+    """
+    Arquivamento por troca de partições (não disponível no banco local)
+
+    Args:
+        data_limite (date): Ver database_service.arquivar_particoes_colheitas
+
+    Returns:
+        None: O banco local não tem partições
+    """
+    exibir_mensagem_info("O arquivamento de partições está disponível apenas no Oracle particionado.")
+    return None
+
+@medir
+def limpar_dados_banco():
+    """
+    Remove todos os dados das tabelas (apenas para desenvolvimento/teste)
+
+    Returns:
+        bool: True se dados foram removidos, False caso contrário
+    """
+    conexao = conectar_sqlite()
+    if conexao is None:
+        return False
+
+    try:
+        # Remover colheitas primeiro (devido à foreign key)
+        colheitas_removidas = conexao.execute("DELETE FROM colheitas").rowcount
+        propriedades_removidas = conexao.execute("DELETE FROM propriedades").rowcount
+        conexao.commit()
+
+        exibir_mensagem_sucesso("Dados removidos do banco local!")
+        exibir_mensagem_info(f"Colheitas removidas: {colheitas_removidas}")
+        exibir_mensagem_info(f"Propriedades removidas: {propriedades_removidas}")
+        return True
+
+    except sqlite3.Error as e:
+        exibir_mensagem_erro(f"Erro ao limpar dados do banco local: {e}")
+        conexao.rollback()
+        return False
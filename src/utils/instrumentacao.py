@@ -0,0 +1,302 @@
+"""
+Módulo de instrumentação de desempenho (opcional)
+Mede as funções marcadas com @medir (chamadas, erros, histograma de latência)
+e acumula contadores (conexões, round trips, linhas lidas, bytes gravados).
+Desligada por padrão: com ela desligada, cada função medida custa apenas uma
+consulta ao dicionário de estado. Liga com SMPC_INSTRUMENTACAO=1 (ou =trace,
+que também guarda cada chamada para exportar como trace do Chrome) ou pela
+função ativar_instrumentacao.
+"""
+
+import functools
+import json
+import os
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+
+# Limites superiores (ms) das faixas do histograma de latência; a última faixa é "acima de 5 s"
+LIMITES_HISTOGRAMA_MS = (1, 5, 10, 50, 100, 500, 1000, 5000)
+
+# Rótulos dos contadores registrados pelos serviços (os demais são exibidos pelo nome)
+ROTULOS_CONTADORES = {
+    'conexoes_obtidas': 'Conexões obtidas do pool',
+    'round_trips': 'Round trips ao banco',
+    'linhas_lidas': 'Linhas lidas do banco',
+    'linhas_gravadas': 'Linhas enviadas ao banco',
+    'bytes_gravados': 'Bytes gravados em backups'
+}
+
+# Máximo de eventos guardados para o trace (os mais antigos são descartados)
+MAXIMO_EVENTOS_TRACE = 200000
+
+_modo = os.getenv('SMPC_INSTRUMENTACAO', '').strip().lower()
+
+_instrumentacao = {
+    'ativa': _modo not in ('', '0', 'false', 'nao', 'não'),
+    'trace': _modo == 'trace',
+    'inicio_ns': time.perf_counter_ns()
+}
+
+# Nome da função -> estatísticas de chamadas
+_metricas = {}
+
+# Contadores livres (conexoes_obtidas, round_trips, linhas_lidas, bytes_gravados...)
+_contadores = {}
+
+_eventos = deque(maxlen=MAXIMO_EVENTOS_TRACE)
+_trava = threading.Lock()
+
+def instrumentacao_ativa():
+    """
+    Indica se as medições estão sendo registradas
+
+    Returns:
+        bool: True se a instrumentação está ligada
+    """
+    return _instrumentacao['ativa']
+
+def ativar_instrumentacao(ativa=True, trace=False):
+    """
+    Liga ou desliga a instrumentação
+
+    Args:
+        ativa (bool): Registra chamadas e contadores
+        trace (bool): Guarda também cada chamada para exportar_trace_chrome
+    """
+    _instrumentacao['ativa'] = ativa
+    _instrumentacao['trace'] = ativa and trace
+
+def zerar_metricas():
+    """
+    Descarta as métricas, contadores e eventos acumulados
+    """
+    with _trava:
+        _metricas.clear()
+        _contadores.clear()
+        _eventos.clear()
+        _instrumentacao['inicio_ns'] = time.perf_counter_ns()
+
+def _faixa_histograma(duracao_ms):
+    for indice, limite in enumerate(LIMITES_HISTOGRAMA_MS):
+        if duracao_ms <= limite:
+            return indice
+    return len(LIMITES_HISTOGRAMA_MS)
+
+def _registrar(nome, inicio_ns, fim_ns, erro):
+    """
+    Acumula uma chamada nas métricas (e no trace, se ligado)
+
+    Args:
+        nome (str): Nome da função medida
+        inicio_ns (int): Início (time.perf_counter_ns)
+        fim_ns (int): Fim (time.perf_counter_ns)
+        erro (bool): A chamada terminou com exceção
+    """
+    duracao_ms = (fim_ns - inicio_ns) / 1e6
+
+    with _trava:
+        metrica = _metricas.get(nome)
+        if metrica is None:
+            metrica = _metricas[nome] = {
+                'chamadas': 0,
+                'erros': 0,
+                'tempo_total_ms': 0.0,
+                'tempo_maximo_ms': 0.0,
+                'histograma': [0] * (len(LIMITES_HISTOGRAMA_MS) + 1)
+            }
+
+        metrica['chamadas'] += 1
+        metrica['erros'] += erro
+        metrica['tempo_total_ms'] += duracao_ms
+        if duracao_ms > metrica['tempo_maximo_ms']:
+            metrica['tempo_maximo_ms'] = duracao_ms
+        metrica['histograma'][_faixa_histograma(duracao_ms)] += 1
+
+        if _instrumentacao['trace']:
+            _eventos.append((nome, inicio_ns, fim_ns, threading.get_ident(), erro))
+
+def medir(funcao=None, nome=None):
+    """
+    Decorador que mede as chamadas da função quando a instrumentação está ligada
+
+    Uso:
+        @medir
+        def buscar_historico_completo(): ...
+
+        @medir(nome='backup.salvar')
+        def salvar_backup_json(...): ...
+
+    Args:
+        funcao (callable): Função decorada (quando usado sem parênteses)
+        nome (str): Nome exibido nas métricas (padrão: modulo.funcao)
+
+    Returns:
+        callable: Função decorada
+    """
+    def decorar(alvo):
+        rotulo = nome or f"{alvo.__module__.rsplit('.', 1)[-1]}.{alvo.__name__}"
+
+        @functools.wraps(alvo)
+        def medida(*args, **kwargs):
+            if not _instrumentacao['ativa']:
+                return alvo(*args, **kwargs)
+
+            inicio = time.perf_counter_ns()
+            erro = True
+            try:
+                resultado = alvo(*args, **kwargs)
+                erro = False
+                return resultado
+            finally:
+                _registrar(rotulo, inicio, time.perf_counter_ns(), erro)
+
+        return medida
+
+    if funcao is not None:
+        return decorar(funcao)
+    return decorar
+
+@contextmanager
+def medir_trecho(nome):
+    """
+    Gerenciador de contexto que mede um trecho de código como se fosse uma função
+
+    Uso:
+        with medir_trecho('relatorio.montar_linhas'):
+            ...
+
+    Args:
+        nome (str): Nome exibido nas métricas
+    """
+    if not _instrumentacao['ativa']:
+        yield
+        return
+
+    inicio = time.perf_counter_ns()
+    erro = True
+    try:
+        yield
+        erro = False
+    finally:
+        _registrar(nome, inicio, time.perf_counter_ns(), erro)
+
+def contar(nome, quantidade=1):
+    """
+    Soma uma quantidade a um contador (ex: linhas_lidas, bytes_gravados)
+
+    Args:
+        nome (str): Nome do contador
+        quantidade (int): Valor a somar
+    """
+    if not _instrumentacao['ativa']:
+        return
+
+    with _trava:
+        _contadores[nome] = _contadores.get(nome, 0) + quantidade
+
+def obter_metricas():
+    """
+    Cópia das métricas acumuladas
+
+    Returns:
+        dict: 'ativa', 'trace', 'duracao_segundos', 'contadores' e 'funcoes'
+              (nome -> chamadas, erros, tempo total/médio/máximo em ms e histograma)
+    """
+    with _trava:
+        funcoes = {}
+        for nome, metrica in _metricas.items():
+            funcoes[nome] = dict(metrica, histograma=list(metrica['histograma']))
+            funcoes[nome]['tempo_medio_ms'] = metrica['tempo_total_ms'] / metrica['chamadas']
+
+        return {
+            'ativa': _instrumentacao['ativa'],
+            'trace': _instrumentacao['trace'],
+            'eventos_trace': len(_eventos),
+            'duracao_segundos': (time.perf_counter_ns() - _instrumentacao['inicio_ns']) / 1e9,
+            'contadores': dict(_contadores),
+            'funcoes': funcoes
+        }
+
+def _rotulos_histograma():
+    rotulos = [f"≤{limite}ms" for limite in LIMITES_HISTOGRAMA_MS]
+    rotulos.append(f">{LIMITES_HISTOGRAMA_MS[-1]}ms")
+    return rotulos
+
+def exibir_metricas(limite=15):
+    """
+    Exibe as funções mais custosas (tempo total), os contadores e o histograma de latência
+
+    Args:
+        limite (int): Quantidade máxima de funções listadas
+    """
+    metricas = obter_metricas()
+    if not metricas['funcoes'] and not metricas['contadores']:
+        print("  • Nenhuma medição registrada ainda")
+        return
+
+    print(f"  • Período medido: {metricas['duracao_segundos']:.1f} s")
+    for nome, valor in sorted(metricas['contadores'].items()):
+        rotulo = ROTULOS_CONTADORES.get(nome, nome.replace('_', ' ').capitalize())
+        print(f"  • {rotulo}: {valor:,}".replace(',', '.'))
+
+    funcoes = sorted(metricas['funcoes'].items(), key=lambda item: item[1]['tempo_total_ms'], reverse=True)
+    if not funcoes:
+        return
+
+    print(f"\n  {'Função':<52}{'Chamadas':>9}{'Erros':>7}{'Total ms':>11}{'Média ms':>10}{'Máx. ms':>10}")
+    for nome, metrica in funcoes[:limite]:
+        print(f"  {nome[:51]:<52}{metrica['chamadas']:>9}{metrica['erros']:>7}"
+              f"{metrica['tempo_total_ms']:>11.1f}{metrica['tempo_medio_ms']:>10.2f}{metrica['tempo_maximo_ms']:>10.1f}")
+
+    print("\n  Distribuição de latência (chamadas por faixa):")
+    rotulos = _rotulos_histograma()
+    for nome, metrica in funcoes[:limite]:
+        faixas = [f"{rotulo} {quantidade}" for rotulo, quantidade in zip(rotulos, metrica['histograma']) if quantidade]
+        print(f"  {nome[:51]:<52}{' | '.join(faixas)}")
+
+def exportar_trace_chrome(caminho_arquivo):
+    """
+    Grava as chamadas registradas no formato Trace Event (chrome://tracing, Perfetto)
+
+    Cada chamada vira um evento completo ('X') com início e duração em
+    microssegundos; os contadores entram como evento 'C' no final do trace.
+    Só há eventos se a instrumentação foi ligada com trace.
+
+    Args:
+        caminho_arquivo (str): Arquivo JSON de destino
+
+    Returns:
+        int: Quantidade de eventos de chamada gravados
+    """
+    pid = os.getpid()
+    with _trava:
+        inicio_ns = _instrumentacao['inicio_ns']
+        chamadas = list(_eventos)
+        contadores = dict(_contadores)
+
+    eventos = [{'name': 'process_name', 'ph': 'M', 'pid': pid, 'args': {'name': 'smpc'}}]
+    fim_us = 0.0
+    for nome, inicio, fim, thread, erro in chamadas:
+        evento = {
+            'name': nome,
+            'cat': nome.split('.', 1)[0],
+            'ph': 'X',
+            'ts': (inicio - inicio_ns) / 1000,
+            'dur': (fim - inicio) / 1000,
+            'pid': pid,
+            'tid': thread
+        }
+        if erro:
+            evento['args'] = {'erro': True}
+        eventos.append(evento)
+        fim_us = max(fim_us, evento['ts'] + evento['dur'])
+
+    if contadores:
+        eventos.append({'name': 'contadores', 'ph': 'C', 'ts': fim_us, 'pid': pid, 'args': contadores})
+
+    with open(caminho_arquivo, 'w', encoding='utf-8') as arquivo:
+        json.dump({'traceEvents': eventos, 'displayTimeUnit': 'ms'}, arquivo)
+
+    return len(chamadas)
@@ -3,11 +3,50 @@ Módulo de utilitários para o menu do sistema
 Contém funções para exibir menus e interagir com o usuário
 """
 
+import sys
+
 from colorama import init, Fore, Back, Style
 from .validation import validar_opcao_menu
 
-# Inicializar colorama para Windows
-init(autoreset=True)
+
+# Modo não interativo (linha de comando): mensagens vão para stderr, em texto simples,
+# deixando stdout apenas para o resultado; confirmações são recusadas sem perguntar
+_modo_nao_interativo = {
+    'ativo': False,
+    'silencioso': False
+}
+
+def definir_modo_nao_interativo(ativo=True, silencioso=False):
+    """
+    Liga ou desliga o modo não interativo das mensagens
+    
+    Args:
+        ativo (bool): Mensagens em stderr, sem caixas, e confirmar_acao sempre False
+        silencioso (bool): Omite as mensagens de sucesso e informação (erros continuam)
+    """
+    _modo_nao_interativo['ativo'] = ativo
+    _modo_nao_interativo['silencioso'] = silencioso
+
+def inicializar_terminal():
+    """
+    Inicializa o colorama (cores no terminal do Windows) para o menu interativo
+    
+    Chamada pelo menu, e não na importação do módulo, para que a linha de
+    comando escreva direto no stdout, sem o filtro de cores.
+    """
+    init(autoreset=True)
+
+def _exibir_mensagem_simples(titulo, mensagem, erro=False):
+    """
+    Escreve uma mensagem em uma linha no stderr (modo não interativo)
+    
+    Args:
+        titulo (str): Tipo da mensagem (ERRO, SUCESSO, INFO)
+        mensagem (str): Texto da mensagem
+        erro (bool): Mensagens de erro são exibidas mesmo no modo silencioso
+    """
+    if erro or not _modo_nao_interativo['silencioso']:
+        print(f"{titulo}: {mensagem}", file=sys.stderr)
 
 def exibir_menu_principal():
     """
@@ -117,6 +156,10 @@ def exibir_mensagem_sucesso(mensagem):
     Args:
         mensagem (str): Mensagem de sucesso a ser exibida
     """
+    if _modo_nao_interativo['ativo']:
+        _exibir_mensagem_simples("SUCESSO", mensagem)
+        return
+    
     largura = 70
     titulo = "SUCESSO"
     tracejado = "─" * (largura - len(titulo) - 4)
@@ -140,6 +183,10 @@ def exibir_mensagem_erro(mensagem):
     Args:
         mensagem (str): Mensagem de erro a ser exibida
     """
+    if _modo_nao_interativo['ativo']:
+        _exibir_mensagem_simples("ERRO", mensagem, erro=True)
+        return
+    
     largura = 70
     titulo = "ERRO"
     tracejado = "─" * (largura - len(titulo) - 4)
@@ -163,6 +210,10 @@ def exibir_mensagem_info(mensagem):
     Args:
         mensagem (str): Mensagem informativa a ser exibida
     """
+    if _modo_nao_interativo['ativo']:
+        _exibir_mensagem_simples("INFO", mensagem)
+        return
+    
     largura = 70
     titulo = "INFORMAÇÃO"
     tracejado = "─" * (largura - len(titulo) - 4)
@@ -201,6 +252,10 @@ def confirmar_acao(mensagem):
     Returns:
         bool: True se o usuário confirmar, False caso contrário
     """
+    if _modo_nao_interativo['ativo']:
+        _exibir_mensagem_simples("INFO", f"{mensagem} (não confirmado: execução não interativa)")
+        return False
+    
     while True:
         resposta = input(f"\n{Fore.YELLOW}❓ {mensagem} {Fore.GREEN}(s/n){Style.RESET_ALL}: ").strip().lower()
         